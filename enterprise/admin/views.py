@@ -37,7 +37,7 @@ from enterprise.admin.utils import (
 from enterprise.api_client.discovery import get_course_catalog_api_service_client
 from enterprise.api_client.ecommerce import EcommerceApiClient
 from enterprise.api_client.sso_orchestrator import EnterpriseSSOOrchestratorApiClient, SsoOrchestratorClientError
-from enterprise.constants import DJANGO_ADMIN_MANAGE_LEARNERS_LIMIT, PAGE_SIZE
+from enterprise.constants import DJANGO_ADMIN_MANAGE_LEARNERS_LIMIT, PAGE_SIZE, EnterpriseCustomerUserLinkOutcomes
 from enterprise.errors import LinkUserToEnterpriseError
 from enterprise.models import (
     EnrollmentNotificationEmailTemplate,
@@ -523,64 +523,112 @@ class EnterpriseCustomerManageLearnersView(BaseEnterpriseCustomerView):
         return all_processable_emails
 
     @classmethod
-    def _handle_bulk_upload(cls, enterprise_customer, manage_learners_form, request, email_list=None):
+    def _validate_bulk_upload_rows(cls, enterprise_customer, rows):
         """
-        Bulk link users by email.
+        Validate the (email, course id) rows of a bulk upload.
 
         Arguments:
             enterprise_customer (EnterpriseCustomer): learners will be linked to this Enterprise Customer instance
-            manage_learners_form (ManageLearnersForm): bound ManageLearners form instance
-            request (django.http.request.HttpRequest): HTTP Request instance
-            email_list (iterable): A list of pre-processed email addresses to handle using the form
+            rows (list): (email, course id) tuples, the course id being None when the row has none
+
+        Returns:
+            tuple: the validation errors, the set of emails to link, the (email, enterprise customer) tuples of
+                already linked emails, the duplicate emails, and a dict of the emails to enroll by course id
         """
         errors = []
         emails = set()
         course_id_with_emails = {}
         already_linked_emails = []
         duplicate_emails = []
+        # look up the existing links of all the emails, and validate each distinct course, only once
+        existing_links = EnterpriseCustomerUser.objects.get_links_by_emails(
+            [email for email, __ in rows], enterprise_customer
+        )
+        validated_courses = {}
+        for index, (email, course_id) in enumerate(rows):
+            course_details = None
+            try:
+                already_linked = validate_email_to_link(
+                    email, enterprise_customer, raise_exception=False, existing_links=existing_links
+                )
+                if course_id:
+                    if course_id not in validated_courses:
+                        try:
+                            validated_courses[course_id] = validate_course_exists_for_enterprise(
+                                enterprise_customer, course_id
+                            )
+                        except ValidationError as exc:
+                            validated_courses[course_id] = exc
+                    course_details = validated_courses[course_id]
+                    if isinstance(course_details, ValidationError):
+                        raise course_details
+            except ValidationError as exc:
+                message = _("Error at line {line}: {message}\n").format(line=index + 1, message=exc)
+                errors.append(message)
+            else:
+                if already_linked:
+                    already_linked_emails.append((email, already_linked.enterprise_customer))
+                elif email in emails:
+                    duplicate_emails.append(email)
+                else:
+                    emails.add(email)
+
+                # course column exists for row, is a valid course id, and exists in the enterprise's catalog(s).
+                if course_details:
+                    if course_details['course_id'] not in course_id_with_emails:
+                        course_id_with_emails[course_details['course_id']] = {email}
+                    else:
+                        course_id_with_emails[course_details['course_id']].add(email)
+        return errors, emails, already_linked_emails, duplicate_emails, course_id_with_emails
+
+    @classmethod
+    def _handle_bulk_upload(cls, enterprise_customer, manage_learners_form, request, email_list=None):
+        """
+        Bulk link users by email.
+
+        Arguments:
+            enterprise_customer (EnterpriseCustomer): learners will be linked to this Enterprise Customer instance
+            manage_learners_form (ManageLearnersForm): bound ManageLearners form instance
+            request (django.http.request.HttpRequest): HTTP Request instance
+            email_list (iterable): A list of pre-processed email addresses to handle using the form
+        """
         csv_file = manage_learners_form.cleaned_data[ManageLearnersForm.Fields.BULK_UPLOAD]
         if email_list:
             parsed_csv = [{ManageLearnersForm.CsvColumns.EMAIL: email} for email in email_list]
         else:
             parsed_csv = parse_csv(csv_file, expected_columns={ManageLearnersForm.CsvColumns.EMAIL})
 
+        rows = []
+        parse_error = None
         try:
-            for index, row in enumerate(parsed_csv):
+            for row in parsed_csv:
                 email = row[ManageLearnersForm.CsvColumns.EMAIL]
                 course_id = row.get(ManageLearnersForm.CsvColumns.COURSE_ID, None)  # optional column
-                course_details = None
-                try:
-                    already_linked = validate_email_to_link(email, enterprise_customer, raise_exception=False)
-                    if course_id:
-                        course_details = validate_course_exists_for_enterprise(enterprise_customer, course_id)
-                except ValidationError as exc:
-                    message = _("Error at line {line}: {message}\n").format(line=index + 1, message=exc)
-                    errors.append(message)
-                else:
-                    if already_linked:
-                        already_linked_emails.append((email, already_linked.enterprise_customer))
-                    elif email in emails:
-                        duplicate_emails.append(email)
-                    else:
-                        emails.add(email)
-
-                    # course column exists for row, is a valid course id, and exists in the enterprise's catalog(s).
-                    if course_details:
-                        if course_details['course_id'] not in course_id_with_emails:
-                            course_id_with_emails[course_details['course_id']] = {email}
-                        else:
-                            course_id_with_emails[course_details['course_id']].add(email)
+                rows.append((email, course_id))
         except ValidationError as exc:
-            errors.append(exc)
+            parse_error = exc
+
+        errors, emails, already_linked_emails, duplicate_emails, course_id_with_emails = (
+            cls._validate_bulk_upload_rows(enterprise_customer, rows)
+        )
+        if parse_error:
+            errors.append(parse_error)
 
         # do the actual linking if there are no errors at this point:
         if not errors:
-            try:
-                with transaction.atomic():
-                    for email in emails:
-                        EnterpriseCustomerUser.all_objects.link_user(enterprise_customer, email)
-            except LinkUserToEnterpriseError as exc:
-                errors.append(exc)
+            with transaction.atomic():
+                link_outcomes = EnterpriseCustomerUser.all_objects.link_users(enterprise_customer, emails)
+                not_relinkable_emails = [
+                    email for email, outcome in link_outcomes.items()
+                    if outcome == EnterpriseCustomerUserLinkOutcomes.NOT_RELINKABLE
+                ]
+                if not_relinkable_emails:
+                    # link all the emails or none of them
+                    transaction.set_rollback(True)
+            for user in User.objects.filter(email__in=not_relinkable_emails):
+                errors.append(LinkUserToEnterpriseError(
+                    "User {} cannot be relinked to {}.".format(user, enterprise_customer)
+                ))
 
         if errors:
             cls._handle_bulk_upload_errors(cls, manage_learners_form=manage_learners_form, errors=errors)
@@ -0,0 +1,169 @@
+"""
+Streaming export helpers for enterprise api.
+"""
+
+import csv
+import json
+
+from rest_framework.exceptions import ValidationError
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+
+EXPORT_FORMAT_QUERY_PARAM = 'export_format'
+EXPORT_CHUNK_SIZE = getattr(settings, 'ENTERPRISE_API_EXPORT_CHUNK_SIZE', 1000)
+
+
+class ExportFormats:
+    """
+    Formats an API listing can be streamed in.
+    """
+    CSV = 'csv'
+    NDJSON = 'ndjson'
+
+    CONTENT_TYPES = {
+        CSV: 'text/csv',
+        NDJSON: 'application/x-ndjson',
+    }
+
+
+def get_export_format(request):
+    """
+    Return the export format requested through the ``export_format`` query param, or None for a regular listing.
+
+    Raises:
+        (ValidationError): If the requested export format is not supported.
+    """
+    export_format = request.query_params.get(EXPORT_FORMAT_QUERY_PARAM)
+    if export_format and export_format not in ExportFormats.CONTENT_TYPES:
+        raise ValidationError({
+            EXPORT_FORMAT_QUERY_PARAM: 'Supported export formats are: {}.'.format(
+                ', '.join(ExportFormats.CONTENT_TYPES)
+            )
+        })
+    return export_format
+
+
+def iterate_in_keyset_chunks(queryset, chunk_size=None):
+    """
+    Yield the objects of the queryset in lists of at most ``chunk_size`` objects, ordered by primary key.
+
+    Each chunk is fetched with its own ``pk > last pk`` query, so the database never has to skip over rows already
+    exported and memory stays bounded by the chunk size however large the queryset is.
+    """
+    chunk_size = chunk_size or EXPORT_CHUNK_SIZE
+    queryset = queryset.order_by('pk')
+    last_pk = None
+    while True:
+        chunk_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        chunk = list(chunk_queryset[:chunk_size].iterator(chunk_size=chunk_size))
+        if chunk:
+            yield chunk
+        if len(chunk) < chunk_size:
+            return
+        last_pk = chunk[-1].pk
+
+
+def serialize_in_chunks(objects, serializer_class, context=None, chunk_size=None):
+    """
+    Yield the serialized representation of each object, serializing ``chunk_size`` objects at a time.
+
+    Arguments:
+        objects (QuerySet, list or iterator): A queryset, read in keyset chunks, an already fetched list of objects,
+            or an iterator yielding lists of objects, which are serialized as they are yielded.
+        serializer_class (class): The serializer used by the regular listing of the objects.
+        context (dict): Context passed to the serializer.
+        chunk_size (int): Number of objects serialized at once, defaults to ``ENTERPRISE_API_EXPORT_CHUNK_SIZE``.
+    """
+    chunk_size = chunk_size or EXPORT_CHUNK_SIZE
+    if isinstance(objects, list):
+        chunks = (objects[index:index + chunk_size] for index in range(0, len(objects), chunk_size))
+    elif isinstance(objects, QuerySet):
+        chunks = iterate_in_keyset_chunks(objects, chunk_size)
+    else:
+        chunks = objects
+    for chunk in chunks:
+        yield from serializer_class(chunk, many=True, context=context or {}).data
+
+
+def flatten_row(row, prefix=''):
+    """
+    Flatten nested dictionaries of a serialized row into dotted keys, e.g. ``member_details.user_email``.
+    """
+    flattened_row = {}
+    for key, value in row.items():
+        if isinstance(value, dict):
+            flattened_row.update(flatten_row(value, prefix='{}{}.'.format(prefix, key)))
+        elif isinstance(value, list):
+            flattened_row[prefix + key] = json.dumps(value, cls=DjangoJSONEncoder)
+        else:
+            flattened_row[prefix + key] = value
+    return flattened_row
+
+
+def get_export_columns(serializer_class, nested_fields=None):
+    """
+    Return the CSV columns of the rows of a serializer, in the order its fields are declared.
+
+    Rows don't all carry the same nested keys, e.g. a pending group member has no ``user_name``, so the columns are
+    taken from the serializer rather than from the rows themselves.
+
+    Arguments:
+        serializer_class (class): The serializer the exported rows come from.
+        nested_fields (dict): Keys of the dictionaries returned by nested fields, keyed by field name. Each nested
+            field is exported as one dotted column per key, e.g. ``member_details.user_email``.
+    """
+    nested_fields = nested_fields or {}
+    columns = []
+    for field_name in serializer_class().fields:
+        if field_name in nested_fields:
+            columns.extend('{}.{}'.format(field_name, key) for key in nested_fields[field_name])
+        else:
+            columns.append(field_name)
+    return columns
+
+
+class _EchoBuffer:
+    """
+    File-like object handing back what is written to it, so csv.writer can produce lines one at a time.
+    """
+
+    def write(self, value):
+        return value
+
+
+def _csv_lines(rows, columns):
+    """
+    Yield the header then one CSV line per row, leaving empty the columns a row has no value for.
+    """
+    writer = csv.writer(_EchoBuffer())
+    yield writer.writerow(columns)
+    for row in rows:
+        row = flatten_row(row)
+        yield writer.writerow([row.get(column) for column in columns])
+
+
+def _ndjson_lines(rows):
+    """
+    Yield one JSON document per row.
+    """
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+
+
+def streaming_export_response(rows, export_format, filename, columns):
+    """
+    Return a response streaming the serialized rows as a CSV or NDJSON attachment.
+
+    Arguments:
+        rows (iterable): Serialized rows, e.g. from ``serialize_in_chunks``.
+        export_format (str): One of the ``ExportFormats``.
+        filename (str): Name of the attachment, without extension.
+        columns (list): CSV columns, e.g. from ``get_export_columns``.
+    """
+    lines = _csv_lines(rows, columns) if export_format == ExportFormats.CSV else _ndjson_lines(rows)
+    response = StreamingHttpResponse(lines, content_type=ExportFormats.CONTENT_TYPES[export_format])
+    response['Content-Disposition'] = 'attachment; filename="{}.{}"'.format(filename, export_format)
+    return response
@@ -18,7 +18,11 @@ from slumber.exceptions import HttpClientError
 from django.contrib import auth
 from django.contrib.sites.models import Site
 from django.core import exceptions as django_exceptions
+from django.core.cache import cache
 from django.db import IntegrityError, transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value, prefetch_related_objects
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from enterprise import models, utils  # pylint: disable=cyclic-import
@@ -50,6 +54,7 @@ from enterprise.utils import (
     CourseEnrollmentPermissionError,
     get_active_sso_configurations_for_customer,
     get_integrations_for_customers,
+    get_integrations_for_customers_in_bulk,
     get_last_course_run_end_date,
     has_course_run_available_for_enrollment,
     track_enrollment,
@@ -266,7 +271,9 @@ class EnterpriseCustomerSerializer(serializers.ModelSerializer):
     active_integrations = serializers.SerializerMethodField()
 
     def get_active_integrations(self, obj):
-        return get_integrations_for_customers(obj.uuid)
+        if obj.uuid not in self.integrations_by_enterprise_uuid:
+            return get_integrations_for_customers(obj.uuid)
+        return self.integrations_by_enterprise_uuid[obj.uuid]
 
     def get_branding_configuration(self, obj):
         """
@@ -294,20 +301,151 @@ class EnterpriseCustomerSerializer(serializers.ModelSerializer):
 
         return admin_users_by_enterprise_uuid
 
+    def _get_integrations_by_enterprise_customer_uuid(self, enterprise_customers):
+        """
+        Get active integrations for each enterprise customer.
+        """
+        enterprise_customer_uuids = [enterprise_customer.uuid for enterprise_customer in enterprise_customers]
+        integrations_by_enterprise_uuid = {
+            enterprise_customer_uuid: [] for enterprise_customer_uuid in enterprise_customer_uuids
+        }
+        integrations_by_enterprise_uuid.update(get_integrations_for_customers_in_bulk(enterprise_customer_uuids))
+        return integrations_by_enterprise_uuid
+
+    def _get_active_notification_snapshot(self):
+        """
+        Get the serialized active admin notification along with its filter names, or None if there is none.
+
+        The snapshot is cached until the end of the day, or until an admin notification or one of its filters changes.
+        """
+        today = timezone.localdate()
+        cache_key = utils.get_active_admin_notification_cache_key(today)
+        snapshot = cache.get(cache_key)
+        if snapshot is None:
+            notification = AdminNotification.objects.filter(
+                start_date__lte=today,
+                expiration_date__gte=today,
+                is_active=True
+            ).prefetch_related('admin_notification_filter').first()
+            snapshot = {}
+            if notification:
+                snapshot = {
+                    'id': notification.id,
+                    'modified': notification.modified,
+                    'banner': dict(AdminNotificationSerializer(notification).data),
+                    'filters': [
+                        notification_filter.filter
+                        for notification_filter in notification.admin_notification_filter.all()
+                    ],
+                }
+            cache.set(cache_key, snapshot, utils.ADMIN_NOTIFICATION_CACHE_TIMEOUT)
+        return snapshot or None
+
+    def _get_notification_read_states(self, notification, enterprise_customers, user_id):
+        """
+        Get whether the user read the notification for each enterprise customer the user is linked to.
+
+        Read states are cached per user and enterprise customer, enterprise customers the user is not linked to
+        are left out.
+        """
+        cache_keys = {
+            enterprise_customer.uuid: utils.get_admin_notification_read_cache_key(
+                notification['id'], notification['modified'], user_id, enterprise_customer.uuid
+            )
+            for enterprise_customer in enterprise_customers
+        }
+        cached_read_states = cache.get_many(list(cache_keys.values()))
+        read_states = {
+            enterprise_customer_uuid: cached_read_states[cache_key]
+            for enterprise_customer_uuid, cache_key in cache_keys.items()
+            if cache_key in cached_read_states
+        }
+
+        uncached_enterprise_customer_uuids = [
+            enterprise_customer_uuid for enterprise_customer_uuid in cache_keys
+            if enterprise_customer_uuid not in read_states
+        ]
+        if uncached_enterprise_customer_uuids:
+            enterprise_customer_users = EnterpriseCustomerUser.objects.filter(
+                enterprise_customer__in=uncached_enterprise_customer_uuids,
+                user_id=user_id,
+            )
+            read_enterprise_customer_user_ids = set(AdminNotificationRead.objects.filter(
+                enterprise_customer_user__in=enterprise_customer_users,
+                is_read=True,
+                admin_notification_id=notification['id'],
+            ).values_list('enterprise_customer_user_id', flat=True))
+            uncached_read_states = {
+                enterprise_customer_user.enterprise_customer_id:
+                    enterprise_customer_user.id in read_enterprise_customer_user_ids
+                for enterprise_customer_user in enterprise_customer_users
+            }
+            cache.set_many(
+                {
+                    cache_keys[enterprise_customer_uuid]: is_read
+                    for enterprise_customer_uuid, is_read in uncached_read_states.items()
+                },
+                utils.ADMIN_NOTIFICATION_CACHE_TIMEOUT,
+            )
+            read_states.update(uncached_read_states)
+
+        return read_states
+
+    def _get_notification_banners_by_enterprise_customer_uuid(self, enterprise_customers, user_id):
+        """
+        Get the serialized notification banner to show to the user for each enterprise customer.
+        """
+        notification = self._get_active_notification_snapshot()
+        empty_banner = AdminNotificationSerializer(None).data
+        if not notification:
+            return {enterprise_customer.uuid: empty_banner for enterprise_customer in enterprise_customers}
+
+        read_states = self._get_notification_read_states(notification, enterprise_customers, user_id)
+
+        notification_banners_by_enterprise_uuid = {}
+        for enterprise_customer in enterprise_customers:
+            banner = empty_banner
+            if enterprise_customer.uuid not in read_states:
+                error_message = ('[Admin Notification API] EnterpriseCustomerUser does not exist for User: {}, '
+                                 ' EnterpriseCustomer:{}').format(user_id, enterprise_customer.slug)
+                LOGGER.error(error_message)
+            # verify that user didn't read the notification
+            elif not read_states[enterprise_customer.uuid]:
+                # if a filter is not checked in enterprise_customer then return None
+                if all(getattr(enterprise_customer, name, None) for name in notification['filters']):
+                    banner = notification['banner']
+            notification_banners_by_enterprise_uuid[enterprise_customer.uuid] = banner
+        return notification_banners_by_enterprise_uuid
+
     def __init__(self, instance=None, data=empty, **kwargs):
         """
-        Compute admin users for for all EnterpriseCustomer(s) during initialization
+        Compute admin users, integrations and related objects for all EnterpriseCustomer(s) during initialization
         to prevent making queries for each instance.
         """
 
         super().__init__(instance=instance, data=data, **kwargs)
 
         if instance:
+            self.enterprise_customers = list(instance) if isinstance(instance, Iterable) else [instance]
+            prefetch_related_objects(
+                self.enterprise_customers,
+                'site',
+                'branding_configuration',
+                'enterprise_customer_catalogs',
+                'enterprise_customer_identity_providers',
+            )
             self.admin_users_by_enterprise_uuid = self._get_admin_users_by_enterprise_customer_uuid(
-                instance if isinstance(instance, Iterable) else [instance]
+                self.enterprise_customers
+            )
+            self.integrations_by_enterprise_uuid = self._get_integrations_by_enterprise_customer_uuid(
+                self.enterprise_customers
             )
         else:
+            self.enterprise_customers = []
             self.admin_users_by_enterprise_uuid = defaultdict(list)
+            self.integrations_by_enterprise_uuid = {}
+        # notification banners depend on the requesting user, they are computed on first use
+        self.notification_banners_by_enterprise_uuid = None
 
     def get_admin_users(self, obj):
         return self.admin_users_by_enterprise_uuid[obj.uuid]
@@ -336,41 +474,16 @@ class EnterpriseCustomerSerializer(serializers.ModelSerializer):
             LOGGER.error('[Admin Notification API] Failed to retrieve user_id for notification banner,'
                          ' Enterprise Customer :{} Exception: {}'.format(obj.slug, exc))
             return None
-        now = datetime.datetime.now(pytz.UTC)
-        read = True
-        notification_queryset = None
-
-        notification = AdminNotification.objects.filter(
-            start_date__lte=now,
-            expiration_date__gte=now,
-            is_active=True
-        ).first()
-        if notification:
-            try:
-                # verify that user didn't read the notification
-                enterprise_customer_user = EnterpriseCustomerUser.objects.get(
-                    enterprise_customer=obj,
-                    user_id=user_id,
-                )
-                read = AdminNotificationRead.objects.filter(
-                    enterprise_customer_user=enterprise_customer_user,
-                    is_read=True,
-                    admin_notification=notification
-                ).exists()
-            except (TypeError, ValueError, EnterpriseCustomerUser.DoesNotExist):
-                error_message = ('[Admin Notification API] EnterpriseCustomerUser does not exist for User: {}, '
-                                 ' EnterpriseCustomer:{}').format(user_id, obj.slug)
-                LOGGER.error(error_message)
 
-        if not read:
-            notification_queryset = notification
-            filters = notification.admin_notification_filter.all()
-            for notification_filter in filters:
-                # if filter didn't match to filters in enterprise_customer OR filter is not checked in
-                # enterprise_customer then return None
-                if not getattr(obj, notification_filter.filter, None):
-                    notification_queryset = None
-        return AdminNotificationSerializer(notification_queryset).data
+        if self.notification_banners_by_enterprise_uuid is None:
+            self.notification_banners_by_enterprise_uuid = self._get_notification_banners_by_enterprise_customer_uuid(
+                self.enterprise_customers, user_id
+            )
+        if obj.uuid not in self.notification_banners_by_enterprise_uuid:
+            self.notification_banners_by_enterprise_uuid.update(
+                self._get_notification_banners_by_enterprise_customer_uuid([obj], user_id)
+            )
+        return self.notification_banners_by_enterprise_uuid[obj.uuid]
 
 
 class EnterpriseCustomerSupportToolSerializer(EnterpriseCustomerSerializer):
@@ -895,6 +1008,74 @@ class EnterpriseGroupMembershipSerializer(serializers.ModelSerializer):
         return 0
 
 
+# pylint: disable=abstract-method
+class EnterpriseGroupMembershipExportListSerializer(serializers.ListSerializer):
+    """
+    Serializes a chunk of exported group memberships, loading the users of the whole chunk at once.
+
+    Meant to be used in conjunction with EnterpriseGroupMembershipExportSerializer.
+    """
+
+    def to_representation(self, data):
+        """
+        Load the users, with their profile when available, of the memberships in a single query before serializing.
+        """
+        memberships = list(data)
+        users = User.objects.filter(pk__in={
+            membership.enterprise_customer_user.user_id
+            for membership in memberships if membership.enterprise_customer_user
+        })
+        if hasattr(User, 'profile'):
+            users = users.select_related('profile')
+        self._context['users_by_id'] = {user.pk: user for user in users}
+        return super().to_representation(memberships)
+
+
+class EnterpriseGroupMembershipExportSerializer(EnterpriseGroupMembershipSerializer):
+    """
+    Serializer for streaming exports of EnterpriseGroupMembership records.
+
+    Produces the same rows as EnterpriseGroupMembershipSerializer from the users loaded for each chunk and the
+    ``enrollment_count`` annotation of ``get_export_queryset``, instead of querying them for every membership.
+    """
+
+    class Meta(EnterpriseGroupMembershipSerializer.Meta):
+        list_serializer_class = EnterpriseGroupMembershipExportListSerializer
+
+    @staticmethod
+    def get_export_queryset(memberships):
+        """
+        Return the memberships with the related records and enrollment count read by this serializer.
+        """
+        enrollment_count = models.EnterpriseCourseEnrollment.objects.filter(
+            enterprise_customer_user=OuterRef('enterprise_customer_user'),
+        ).order_by().values('enterprise_customer_user').annotate(count=Count('pk')).values('count')
+        return memberships.select_related(
+            'enterprise_customer_user', 'pending_enterprise_customer_user', 'group',
+        ).annotate(
+            enrollment_count=Coalesce(Subquery(enrollment_count, output_field=IntegerField()), Value(0)),
+        )
+
+    def get_member_details(self, obj):
+        """
+        Return either the member's name and email if it's the case that the member is realized, otherwise just email
+        """
+        if enterprise_customer_user := obj.enterprise_customer_user:
+            user = self.context['users_by_id'].get(enterprise_customer_user.user_id)
+            if user is None:
+                return {"user_email": None, "user_name": None}
+            profile = getattr(user, 'profile', None)
+            user_name = f"{profile.name}" if profile is not None else f"{user.first_name} {user.last_name}"
+            return {"user_email": user.email, "user_name": user_name}
+        return {"user_email": obj.pending_enterprise_customer_user.user_email}
+
+    def get_enrollments(self, obj):
+        """
+        Return the number of enterprise enrollments of the member
+        """
+        return obj.enrollment_count
+
+
 class EnterpriseCustomerUserReadOnlySerializer(serializers.ModelSerializer):
     """
     Serializer for EnterpriseCustomerUser model.
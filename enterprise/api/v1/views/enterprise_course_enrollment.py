@@ -14,6 +14,7 @@ from django.shortcuts import get_object_or_404
 from django.utils.functional import cached_property
 
 from enterprise import models
+from enterprise.api.export import get_export_columns, get_export_format, serialize_in_chunks, streaming_export_response
 from enterprise.api.filters import EnterpriseCourseEnrollmentFilterBackend
 from enterprise.api.utils import CourseRunProgressStatuses  # pylint: disable=cyclic-import
 from enterprise.api.v1 import serializers
@@ -97,6 +98,27 @@ class EnterpriseCourseEnrollmentViewSet(EnterpriseReadWriteModelViewSet):
             return serializers.EnterpriseCourseEnrollmentWithAdditionalFieldsReadOnlySerializer
         return serializers.EnterpriseCourseEnrollmentWriteSerializer
 
+    def list(self, request, *args, **kwargs):
+        """
+        List enterprise course enrollments a page at a time.
+
+        When the ``export_format`` query param is ``csv`` or ``ndjson``, all the filtered enrollments are streamed in
+        that format instead, ordered by id.
+        """
+        export_format = get_export_format(request)
+        if not export_format:
+            return super().list(request, *args, **kwargs)
+
+        serializer_class = self.get_serializer_class()
+        rows = serialize_in_chunks(
+            self.filter_queryset(self.get_queryset()),
+            serializer_class,
+            context=self.get_serializer_context(),
+        )
+        return streaming_export_response(
+            rows, export_format, 'enterprise_course_enrollments', get_export_columns(serializer_class),
+        )
+
 
 class EnterpriseCourseEnrollmentAdminPagination(PageNumberPagination):
     """
@@ -22,6 +22,7 @@ from rest_framework.status import (
 
 from django.contrib import auth
 from django.core import exceptions
+from django.core.validators import validate_email
 from django.db import transaction
 from django.db.models import Q
 from django.shortcuts import get_object_or_404
@@ -38,15 +39,12 @@ from enterprise.api.v1.views.base_views import EnterpriseReadWriteModelViewSet
 from enterprise.constants import (
     ENTERPRISE_CUSTOMER_PROVISIONING_ADMIN_ACCESS_PERMISSION,
     PATHWAY_CUSTOMER_ADMIN_ENROLLMENT,
+    EnterpriseCustomerUserLinkOutcomes,
 )
-from enterprise.errors import LinkUserToEnterpriseError, UnlinkUserFromEnterpriseError
+from enterprise.content_metadata.api import get_and_cache_catalog_contains_content_items
+from enterprise.errors import UnlinkUserFromEnterpriseError
 from enterprise.logging import getEnterpriseLogger
-from enterprise.utils import (
-    enroll_subsidy_users_in_courses,
-    get_best_mode_from_course_key,
-    track_enrollment,
-    validate_email_to_link,
-)
+from enterprise.utils import enroll_subsidy_users_in_courses, get_best_modes, track_enrollment
 
 User = auth.get_user_model()
 
@@ -174,10 +172,9 @@ class EnterpriseCustomerViewSet(EnterpriseReadWriteModelViewSet):
         course_run_ids = [unquote(quote_plus(course_run_id)) for course_run_id in course_run_ids]
 
         contains_content_items = False
-        for catalog in enterprise_customer.enterprise_customer_catalogs.all():
-            contains_course_runs = not course_run_ids or catalog.contains_courses(course_run_ids)
-            contains_program_uuids = not program_uuids or catalog.contains_programs(program_uuids)
-            if contains_course_runs and contains_program_uuids:
+        catalogs = enterprise_customer.enterprise_customer_catalogs.select_related('enterprise_catalog_query')
+        for catalog in catalogs:
+            if get_and_cache_catalog_contains_content_items(catalog, course_run_ids, program_uuids):
                 contains_content_items = True
                 break
 
@@ -289,15 +286,14 @@ class EnterpriseCustomerViewSet(EnterpriseReadWriteModelViewSet):
         discount = serialized_data.get('discount', 100.00)
 
         # Retrieve and store course modes for each unique course provided
-        course_runs_modes = {enrollment_info['course_run_key']: None for enrollment_info in enrollments_info}
-        for course_run in course_runs_modes:
-            course_runs_modes[course_run] = get_best_mode_from_course_key(course_run)
+        course_runs_modes = get_best_modes(enrollment_info['course_run_key'] for enrollment_info in enrollments_info)
 
         emails = set()
+        users_by_id = User.objects.in_bulk([info['user_id'] for info in enrollments_info if 'user_id' in info])
 
         for info in enrollments_info:
             if 'user_id' in info:
-                user = User.objects.filter(id=info['user_id']).first()
+                user = users_by_id.get(info['user_id'])
                 if user:
                     info['email'] = user.email
                     emails.add(user.email)
@@ -309,15 +305,15 @@ class EnterpriseCustomerViewSet(EnterpriseReadWriteModelViewSet):
 
         for email in emails:
             try:
-                validate_email_to_link(email, enterprise_customer, raise_exception=False)
+                validate_email(email)
             except exceptions.ValidationError:
                 email_errors.append(email)
 
-        for email in emails:
-            try:
-                models.EnterpriseCustomerUser.all_objects.link_user(enterprise_customer, email)
-            except LinkUserToEnterpriseError:
-                email_errors.append(email)
+        link_outcomes = models.EnterpriseCustomerUser.all_objects.link_users(enterprise_customer, emails)
+        email_errors.extend(
+            email for email, outcome in link_outcomes.items()
+            if outcome == EnterpriseCustomerUserLinkOutcomes.NOT_RELINKABLE
+        )
 
         # Remove the bad emails and bad user_ids from enrollments_info; don't attempt to enroll or link them.
         enrollments_info = [
@@ -471,20 +467,20 @@ class EnterpriseCustomerViewSet(EnterpriseReadWriteModelViewSet):
         emails_to_unlink = serializer.data.get('user_emails', [])
         is_relinkable = serializer.data.get('is_relinkable', True)
 
-        with transaction.atomic():
-            for email in emails_to_unlink:
-                try:
-                    models.EnterpriseCustomerUser.objects.unlink_user(
-                        enterprise_customer=enterprise_customer,
-                        user_email=email,
-                        is_relinkable=is_relinkable
-                    )
-                except (models.EnterpriseCustomerUser.DoesNotExist, models.PendingEnterpriseCustomerUser.DoesNotExist):
-                    msg = "User with email {} does not exist in enterprise {}.".format(email, enterprise_customer)
-                    LOGGER.warning(msg)
-                except Exception as exc:
-                    msg = "Could not unlink {} from {}".format(email, enterprise_customer)
-                    raise UnlinkUserFromEnterpriseError(msg) from exc
+        try:
+            with transaction.atomic():
+                unlink_outcomes = models.EnterpriseCustomerUser.objects.unlink_users(
+                    enterprise_customer=enterprise_customer,
+                    user_emails=emails_to_unlink,
+                    is_relinkable=is_relinkable
+                )
+        except Exception as exc:
+            msg = "Could not unlink {} from {}".format(", ".join(emails_to_unlink), enterprise_customer)
+            raise UnlinkUserFromEnterpriseError(msg) from exc
+        for email, outcome in unlink_outcomes.items():
+            if outcome == EnterpriseCustomerUserLinkOutcomes.NOT_FOUND:
+                msg = "User with email {} does not exist in enterprise {}.".format(email, enterprise_customer)
+                LOGGER.warning(msg)
 
         return Response(status=HTTP_200_OK)
 
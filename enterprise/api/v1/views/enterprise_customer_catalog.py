@@ -6,6 +6,7 @@ from urllib.parse import quote_plus, unquote
 from edx_rbac.decorators import permission_required
 from rest_framework import permissions, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework_xml.renderers import XMLRenderer
@@ -21,6 +22,7 @@ from enterprise.api.v1 import serializers
 from enterprise.api.v1.decorators import require_at_least_one_query_parameter
 from enterprise.api.v1.views.base_views import EnterpriseReadOnlyModelViewSet, EnterpriseWriteOnlyModelViewSet
 from enterprise.constants import COURSE_KEY_URL_PATTERN
+from enterprise.content_metadata.api import get_and_cache_catalog_contains_content_items
 from enterprise.logging import getEnterpriseLogger
 
 LOGGER = getEnterpriseLogger(__name__)
@@ -145,7 +147,8 @@ class EnterpriseCustomerCatalogViewSet(EnterpriseReadOnlyModelViewSet):
         return serializers.EnterpriseCustomerCatalogSerializer
 
     @method_decorator(require_at_least_one_query_parameter('course_run_ids', 'program_uuids'))
-    @action(detail=True)
+    # The POST variant only reads the catalog, so it must not require the model's add permission.
+    @action(detail=True, permission_classes=(permissions.IsAuthenticated,))
     # pylint: disable=unused-argument
     def contains_content_items(self, request, pk, course_run_ids, program_uuids):
         """
@@ -155,20 +158,42 @@ class EnterpriseCustomerCatalogViewSet(EnterpriseReadOnlyModelViewSet):
         for their existence in the EnterpriseCustomerCatalog. At least one course run key
         or program UUID value must be included in the request.
         """
-        enterprise_customer_catalog = self.get_object()
-
         # Maintain plus characters in course key.
         course_run_ids = [unquote(quote_plus(course_run_id)) for course_run_id in course_run_ids]
 
-        contains_content_items = True
-        if course_run_ids:
-            contains_content_items = enterprise_customer_catalog.contains_courses(course_run_ids)
-        if program_uuids:
-            contains_content_items = (
-                contains_content_items and
-                enterprise_customer_catalog.contains_programs(program_uuids)
+        return self._contains_content_items_response(course_run_ids, program_uuids)
+
+    @contains_content_items.mapping.post
+    # pylint: disable=unused-argument
+    def post_contains_content_items(self, request, pk):
+        """
+        Return whether or not the EnterpriseCustomerCatalog contains the specified content.
+
+        Same as the GET variant, for key sets too large for a query string. The course_run_ids and/or
+        program_uuids lists are sent in the request body and at least one value must be included.
+        """
+        course_run_ids = request.data.get('course_run_ids') or []
+        program_uuids = request.data.get('program_uuids') or []
+        if not isinstance(course_run_ids, list) or not isinstance(program_uuids, list):
+            raise ValidationError(detail='course_run_ids and program_uuids must be lists.')
+        if not course_run_ids and not program_uuids:
+            raise ValidationError(
+                detail='You must provide at least one of the following parameters: course_run_ids, program_uuids.'
             )
 
+        return self._contains_content_items_response(course_run_ids, program_uuids)
+
+    def _contains_content_items_response(self, course_run_ids, program_uuids):
+        """
+        Return whether or not the requested catalog contains all of the given course runs and programs.
+        """
+        enterprise_customer_catalog = self.get_object()
+        contains_content_items = get_and_cache_catalog_contains_content_items(
+            enterprise_customer_catalog,
+            course_run_ids,
+            program_uuids,
+        )
+
         return Response({'contains_content_items': contains_content_items})
 
     @action(detail=True, url_path='courses/{}'.format(COURSE_KEY_URL_PATTERN))
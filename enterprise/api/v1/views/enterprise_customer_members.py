@@ -13,6 +13,13 @@ from django.db import connection
 from django.db.utils import OperationalError
 
 from enterprise import models
+from enterprise.api.export import (
+    EXPORT_CHUNK_SIZE,
+    get_export_columns,
+    get_export_format,
+    serialize_in_chunks,
+    streaming_export_response,
+)
 from enterprise.api.v1 import serializers
 from enterprise.api.v1.views.base_views import EnterpriseReadOnlyModelViewSet
 from enterprise.logging import getEnterpriseLogger
@@ -20,6 +27,65 @@ from enterprise.logging import getEnterpriseLogger
 LOGGER = getEnterpriseLogger(__name__)
 
 
+# On logistration, the name field of auth_userprofile is populated, but if it's not
+# filled in, we check the auth_user model for it's first/last name fields
+# https://2u-internal.atlassian.net/wiki/spaces/ENGAGE/pages/747143186/Use+of+full+name+in+edX#Data-on-Name-Field
+MEMBERS_QUERY = """
+    WITH users AS (
+        SELECT
+            au.id,
+            au.email,
+            au.date_joined,
+            coalesce(NULLIF(aup.name, ''), au.username) as full_name
+        FROM enterprise_enterprisecustomeruser ecu
+        INNER JOIN auth_user as au on ecu.user_id = au.id
+        LEFT JOIN auth_userprofile as aup on au.id = aup.user_id
+        INNER JOIN enterprise_systemwideenterpriseuserroleassignment swra
+            on swra.user_id = au.id
+            and swra.enterprise_customer_id = ecu.enterprise_customer_id
+        INNER JOIN enterprise_systemwideenterpriserole sr
+            on sr.id = swra.role_id
+        WHERE
+            ecu.enterprise_customer_id = %s
+        AND
+            ecu.linked = 1
+        AND
+            ecu.active = 1
+        AND
+            sr.name = 'enterprise_learner'
+    ) SELECT * FROM users {user_query_filter} ORDER BY {order_by} {limit};
+"""
+MEMBERS_QUERY_WITHOUT_PROFILE = """
+    WITH users AS (
+        SELECT
+            au.id,
+            au.email,
+            au.date_joined,
+            au.username as full_name
+        FROM enterprise_enterprisecustomeruser ecu
+        INNER JOIN auth_user as au on ecu.user_id = au.id
+        INNER JOIN enterprise_systemwideenterpriseuserroleassignment swra
+            on swra.user_id = au.id
+            and swra.enterprise_customer_id = ecu.enterprise_customer_id
+        INNER JOIN enterprise_systemwideenterpriserole sr
+            on sr.id = swra.role_id
+        WHERE
+            ecu.enterprise_customer_id = %s
+        AND
+            ecu.linked = 1
+        AND
+            ecu.active = 1
+        AND
+            sr.name = 'enterprise_learner'
+    ) SELECT * FROM users {user_query_filter} ORDER BY {order_by} {limit};
+"""
+# column of the members query exports are ordered by for each ``sort_by`` value, with its index in a member row
+EXPORT_SORT_COLUMNS = {
+    'name': ('full_name', 3),
+    'joined_org': ('date_joined', 2),
+}
+
+
 class EnterpriseCustomerMembersPaginator(PageNumberPagination):
     """Custom paginator for the enterprise customer members."""
 
@@ -78,6 +144,8 @@ class EnterpriseCustomerMembersViewSet(EnterpriseReadOnlyModelViewSet):
         returned are in ascending order.
         - ``user_id`` (string, optional): Specify a user_id in order to fetch a single enterprise customer member,
         cannot be passed in conjuction with a user_query
+        - ``export_format`` (string, optional): Either `csv` or `ndjson`, to stream all the matching members in that
+        format instead of a page of them.
         """
         query_params = self.request.query_params
         param_serializers = serializers.EnterpriseCustomerMembersRequestQuerySerializer(
@@ -85,92 +153,36 @@ class EnterpriseCustomerMembersViewSet(EnterpriseReadOnlyModelViewSet):
         )
         if not param_serializers.is_valid():
             return Response(param_serializers.errors, status=400)
+        export_format = get_export_format(request)
         enterprise_uuid = kwargs.get("enterprise_uuid", None)
-        # Raw sql is picky about uuid format
-        uuid_no_dashes = str(enterprise_uuid).replace("-", "")
-        users = []
         user_query = param_serializers.validated_data.get('user_query')
         is_reversed = param_serializers.validated_data.get('is_reversed', False)
         sort_by = param_serializers.validated_data.get('sort_by')
         user_id = param_serializers.validated_data.get('user_id')
-        # On logistration, the name field of auth_userprofile is populated, but if it's not
-        # filled in, we check the auth_user model for it's first/last name fields
-        # https://2u-internal.atlassian.net/wiki/spaces/ENGAGE/pages/747143186/Use+of+full+name+in+edX#Data-on-Name-Field
-        query = """
-            WITH users AS (
-                SELECT
-                    au.id,
-                    au.email,
-                    au.date_joined,
-                    coalesce(NULLIF(aup.name, ''), au.username) as full_name
-                FROM enterprise_enterprisecustomeruser ecu
-                INNER JOIN auth_user as au on ecu.user_id = au.id
-                LEFT JOIN auth_userprofile as aup on au.id = aup.user_id
-                INNER JOIN enterprise_systemwideenterpriseuserroleassignment swra
-                    on swra.user_id = au.id
-                    and swra.enterprise_customer_id = ecu.enterprise_customer_id
-                INNER JOIN enterprise_systemwideenterpriserole sr
-                    on sr.id = swra.role_id
-                WHERE
-                    ecu.enterprise_customer_id = %s
-                AND
-                    ecu.linked = 1
-                AND
-                    ecu.active = 1
-                AND
-                    sr.name = 'enterprise_learner'
-            ) SELECT * FROM users {user_query_filter} ORDER BY full_name;
-        """
-        query_without_profile = """
-            WITH users AS (
-                SELECT
-                    au.id,
-                    au.email,
-                    au.date_joined,
-                    au.username as full_name
-                FROM enterprise_enterprisecustomeruser ecu
-                INNER JOIN auth_user as au on ecu.user_id = au.id
-                INNER JOIN enterprise_systemwideenterpriseuserroleassignment swra
-                    on swra.user_id = au.id
-                    and swra.enterprise_customer_id = ecu.enterprise_customer_id
-                INNER JOIN enterprise_systemwideenterpriserole sr
-                    on sr.id = swra.role_id
-                WHERE
-                    ecu.enterprise_customer_id = %s
-                AND
-                    ecu.linked = 1
-                AND
-                    ecu.active = 1
-                AND
-                    sr.name = 'enterprise_learner'
-            ) SELECT * FROM users {user_query_filter} ORDER BY full_name;
-        """
-        try:
-            with connection.cursor() as cursor:
-                if user_query:
-                    like_user_query = f"%{user_query}%"
-                    user_query_filter = "WHERE full_name LIKE %s OR email LIKE %s"
-                    sql_params = [uuid_no_dashes, like_user_query, like_user_query]
-                elif user_id:
-                    user_query_filter = "WHERE id = %s"
-                    sql_params = [uuid_no_dashes, user_id]
-                else:
-                    user_query_filter = ""
-                    sql_params = [uuid_no_dashes]
-
-                def _execute(sql_template):
-                    sql_to_execute = sql_template.format(user_query_filter=user_query_filter)
-                    cursor.execute(sql_to_execute, sql_params)
-
-                try:
-                    _execute(query)
-                except OperationalError as exc:
-                    if 'no such table: auth_userprofile' not in str(exc):
-                        raise
-                    _execute(query_without_profile)
-
-                users.extend(cursor.fetchall())
+        if user_query:
+            like_user_query = f"%{user_query}%"
+            member_filters = ["(full_name LIKE %s OR email LIKE %s)"]
+            member_filter_params = [like_user_query, like_user_query]
+        elif user_id:
+            member_filters, member_filter_params = ["id = %s"], [user_id]
+        else:
+            member_filters, member_filter_params = [], []
+
+        if export_format:
+            member_chunks = self._iter_member_chunks(
+                enterprise_uuid, member_filters, member_filter_params, sort_by, is_reversed,
+            )
+            rows = serialize_in_chunks(member_chunks, serializers.EnterpriseMembersSerializer)
+            columns = get_export_columns(
+                serializers.EnterpriseMembersSerializer,
+                nested_fields={'enterprise_customer_user': ('user_id', 'email', 'joined_org', 'name')},
+            )
+            return streaming_export_response(
+                rows, export_format, f'enterprise_customer_{enterprise_uuid}_members', columns,
+            )
 
+        try:
+            users = self._fetch_members(enterprise_uuid, member_filters, member_filter_params)
         except ValidationError:
             # did not find UUID match in either EnterpriseCustomerUser
             return response.Response(
@@ -192,3 +204,65 @@ class EnterpriseCustomerMembersViewSet(EnterpriseReadOnlyModelViewSet):
         # serialize the paged dataset
         serializer = serializers.EnterpriseMembersSerializer(users_page, many=True)
         return self.paginator.get_paginated_response(serializer.data)
+
+    def _fetch_members(self, enterprise_uuid, member_filters, member_filter_params, order_by='full_name', limit=None):
+        """
+        Return the ``(id, email, date_joined, full_name)`` rows of the learners of the enterprise customer.
+
+        Arguments:
+            enterprise_uuid (str): The uuid of the enterprise customer.
+            member_filters (list): SQL conditions on the member rows, joined with ``AND``.
+            member_filter_params (list): Parameters of the conditions.
+            order_by (str): SQL ordering of the member rows.
+            limit (int): Maximum number of member rows to return, all of them by default.
+        """
+        # Raw sql is picky about uuid format
+        sql_params = [str(enterprise_uuid).replace("-", ""), *member_filter_params]
+        user_query_filter = "WHERE {}".format(" AND ".join(member_filters)) if member_filters else ""
+        limit_clause = ""
+        if limit:
+            limit_clause = "LIMIT %s"
+            sql_params.append(limit)
+
+        with connection.cursor() as cursor:
+            def _execute(sql_template):
+                sql_to_execute = sql_template.format(
+                    user_query_filter=user_query_filter, order_by=order_by, limit=limit_clause,
+                )
+                cursor.execute(sql_to_execute, sql_params)
+
+            try:
+                _execute(MEMBERS_QUERY)
+            except OperationalError as exc:
+                if 'no such table: auth_userprofile' not in str(exc):
+                    raise
+                _execute(MEMBERS_QUERY_WITHOUT_PROFILE)
+
+            return cursor.fetchall()
+
+    def _iter_member_chunks(self, enterprise_uuid, member_filters, member_filter_params, sort_by, is_reversed):
+        """
+        Yield the member rows of the enterprise customer in lists of at most ``EXPORT_CHUNK_SIZE`` rows.
+
+        Rows are ordered by the ``sort_by`` column then by user id in the database, and each chunk is fetched with
+        its own query resuming after the last row of the previous one, so memory stays bounded by the chunk size.
+        """
+        sort_column, sort_index = EXPORT_SORT_COLUMNS[sort_by or 'name']
+        direction, comparison = ('DESC', '<') if sort_by and is_reversed else ('ASC', '>')
+        order_by = f'{sort_column} {direction}, id {direction}'
+        keyset_filters, keyset_params = [], []
+        while True:
+            chunk = self._fetch_members(
+                enterprise_uuid,
+                member_filters + keyset_filters,
+                member_filter_params + keyset_params,
+                order_by=order_by,
+                limit=EXPORT_CHUNK_SIZE,
+            )
+            if chunk:
+                yield chunk
+            if len(chunk) < EXPORT_CHUNK_SIZE:
+                return
+            last_row = chunk[-1]
+            keyset_filters = [f'({sort_column} {comparison} %s OR ({sort_column} = %s AND id {comparison} %s))']
+            keyset_params = [last_row[sort_index], last_row[sort_index], last_row[0]]
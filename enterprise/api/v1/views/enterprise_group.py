@@ -2,6 +2,8 @@
 Views for the ``enterprise-group`` API endpoint.
 """
 
+from uuid import uuid4
+
 from django_filters.rest_framework import DjangoFilterBackend
 from edx_rbac.decorators import permission_required
 from rest_framework import filters, permissions
@@ -13,6 +15,7 @@ from django.db.models import Q
 from django.http import Http404
 
 from enterprise import constants, models, rules, utils
+from enterprise.api.export import get_export_columns, get_export_format, serialize_in_chunks, streaming_export_response
 from enterprise.api.utils import get_enterprise_customer_from_enterprise_group_id
 from enterprise.api.v1 import serializers
 from enterprise.api.v1.views.base_views import EnterpriseReadWriteModelViewSet
@@ -49,11 +52,13 @@ def remove_group_membership_records(group, catalog_uuid=None, user_emails=None):
     try:
         records_to_delete.delete()
         if catalog_uuid:
+            removal_run_id = str(uuid4())
             for records_to_delete_uuids_batch in utils.batch(records_to_delete_uuids, batch_size=200):
                 send_group_membership_removal_notification.delay(
                     group.enterprise_customer.uuid,
                     records_to_delete_uuids_batch,
-                    catalog_uuid
+                    catalog_uuid,
+                    invitation_run_id=removal_run_id,
                 )
         # Woohoo! Records removed! Now to update the soft deleted records
         deleted_records = models.EnterpriseGroupMembership.all_objects.filter(
@@ -63,6 +68,7 @@ def remove_group_membership_records(group, catalog_uuid=None, user_emails=None):
             status=constants.GROUP_MEMBERSHIP_REMOVED_STATUS,
             removed_at=localized_utcnow()
         )
+        models.EnterpriseGroupMembership.refresh_sortable_fields(deleted_records)
         return len(deleted_records)
     # This will error out all records even if only one failed.
     except Exception as exc:
@@ -73,6 +79,7 @@ def remove_group_membership_records(group, catalog_uuid=None, user_emails=None):
             status=constants.GROUP_MEMBERSHIP_INTERNAL_API_ERROR_STATUS,
             errored_at=localized_utcnow()
         )
+        models.EnterpriseGroupMembership.refresh_sortable_fields(failed_deleted_records)
         LOGGER.exception(f'Failed to remove group membership records for group {group} with exception {exc}')
         raise exc
 
@@ -197,6 +204,7 @@ class EnterpriseGroupViewSet(EnterpriseReadWriteModelViewSet):
                 status=request_data.get("status"),
                 errored_at=localized_utcnow(),
             )
+            models.EnterpriseGroupMembership.refresh_sortable_fields(learner_to_update)
             return Response(f'Successfully updated learner record for learner email {learner}', status=201)
         except models.EnterpriseGroup.DoesNotExist as exc:
             LOGGER.warning(f"group_uuid {group_uuid} does not exist")
@@ -225,6 +233,8 @@ class EnterpriseGroupViewSet(EnterpriseReadWriteModelViewSet):
         - ``is_reversed`` (bool, optional): Include to reverse the order of returned records.
         - ``learners`` (list[ email strings ], optional): Include to only return member records that are associated
         with provided emails.
+        - ``export_format`` (string, optional): Either `csv` or `ndjson`, to stream all the matching learners in that
+        format instead of a page of them. Exported learners are ordered by membership uuid.
 
         Returns: Paginated list of learners that are associated with the enterprise group uuid::
 
@@ -273,11 +283,20 @@ class EnterpriseGroupViewSet(EnterpriseReadWriteModelViewSet):
                                                     fetch_removed=show_removed)
 
             if learners := param_serializers.validated_data.get('learners'):
-                specified_members = []
-                for member in members:
-                    if member.member_email in learners:
-                        specified_members.append(member)
-                members = specified_members
+                members = members.filter(sortable_member_email__in=learners)
+
+            if export_format := get_export_format(request):
+                export_serializer_class = serializers.EnterpriseGroupMembershipExportSerializer
+                rows = serialize_in_chunks(
+                    export_serializer_class.get_export_queryset(members), export_serializer_class,
+                )
+                columns = get_export_columns(
+                    export_serializer_class,
+                    nested_fields={'member_details': ('user_email', 'user_name')},
+                )
+                return streaming_export_response(
+                    rows, export_format, f'enterprise_group_{group_uuid}_learners', columns,
+                )
 
             page = self.paginate_queryset(members)
             serializer = serializers.EnterpriseGroupMembershipSerializer(page, many=True)
@@ -337,6 +356,7 @@ class EnterpriseGroupViewSet(EnterpriseReadWriteModelViewSet):
         total_non_org_rejected = 0
         user_emails_to_create = []
         memberships_to_create = []
+        revived_membership_uuids = []
         for user_email_batch in utils.batch(learner_emails[: 1000], batch_size=200):
             # Gather all existing User objects associated with the email batch
             existing_users = User.objects.filter(filter_in_case_insensitive('email', user_email_batch))
@@ -347,6 +367,7 @@ class EnterpriseGroupViewSet(EnterpriseReadWriteModelViewSet):
                 is_removed=True,
                 group=group,
             )
+            revived_membership_uuids.extend(previously_removed_ecu_learners.values_list('uuid', flat=True))
             previously_removed_ecu_learners.update(
                 status=constants.GROUP_MEMBERSHIP_ACCEPTED_STATUS,
                 removed_at=None,
@@ -398,6 +419,7 @@ class EnterpriseGroupViewSet(EnterpriseReadWriteModelViewSet):
                 is_removed=True,
                 group=group,
             )
+            revived_membership_uuids.extend(previously_removed_pecu_learners.values_list('uuid', flat=True))
             previously_removed_pecu_learners.update(
                 status=constants.GROUP_MEMBERSHIP_PENDING_STATUS,
                 removed_at=None,
@@ -435,6 +457,12 @@ class EnterpriseGroupViewSet(EnterpriseReadWriteModelViewSet):
             memberships_to_create, ignore_conflicts=True
         )
         total_records_processed += len(memberships)
+        # Bulk creates and updates skip model signals, so fill in the denormalized sorting columns ourselves.
+        models.EnterpriseGroupMembership.refresh_sortable_fields(
+            models.EnterpriseGroupMembership.all_objects.filter(
+                uuid__in=[membership.uuid for membership in memberships] + revived_membership_uuids,
+            )
+        )
         data = {
             'records_processed': total_records_processed,
             'new_learners': total_new_users_processed,
@@ -443,12 +471,14 @@ class EnterpriseGroupViewSet(EnterpriseReadWriteModelViewSet):
         }
         membership_uuids = [membership.uuid for membership in memberships]
         if act_by_date and catalog_uuid:
+            invitation_run_id = str(uuid4())
             for membership_uuid_batch in utils.batch(membership_uuids, batch_size=200):
                 send_group_membership_invitation_notification.delay(
                     customer.uuid,
                     membership_uuid_batch,
                     act_by_date,
-                    catalog_uuid
+                    catalog_uuid,
+                    invitation_run_id=invitation_run_id,
                 )
         return Response(data, status=201)
 
@@ -15,6 +15,8 @@ except ImportError:
 ENTERPRISE_BRAZE_ALIAS_LABEL = 'Enterprise'  # Do Not change this, this is consistent with other uses across edX repos.
 # https://www.braze.com/docs/api/endpoints/user_data/post_user_identify/
 MAX_NUM_IDENTIFY_USERS_ALIASES = 50
+# Braze accepts at most 50 recipients per API-triggered campaign send request.
+MAX_NUM_CAMPAIGN_RECIPIENTS = 50
 
 
 class BrazeAPIClient(BrazeClient or object):
@@ -111,14 +111,17 @@ class NoAuthAPIClient(APIClientMixin):
     def __init__(self):
         self.client = requests.Session()
 
-    def get_health(self):
+    def get_health(self, timeout=None):
         """
         Retrieve health details for the service.
 
+        Arguments:
+            timeout (float): Seconds to wait for the service to respond.
+
         Returns:
             dict: Response containing the service health.
         """
         api_url = self.get_api_url("health")
-        response = self.client.get(api_url)
+        response = self.client.get(api_url, timeout=timeout)
         response.raise_for_status()
         return response.json()
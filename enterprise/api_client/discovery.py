@@ -49,6 +49,11 @@ class CourseCatalogApiClient(UserAPIClient):
     PROGRAMS_ENDPOINT = 'programs'
     PROGRAM_TYPES_ENDPOINT = 'program_types'
 
+    # Maximum number of course run keys sent in a single ``keys`` filter so the query string stays a sane length.
+    COURSE_RUN_KEYS_BATCH_SIZE = 100
+    # Course runs never move between courses, so the run key -> course key mapping never needs to expire.
+    COURSE_RUN_COURSE_KEY_CACHE_TIMEOUT = None
+
     DEFAULT_VALUE_SAFEGUARD = object()
 
     def __init__(self, user, site=None):
@@ -212,6 +217,88 @@ class CourseCatalogApiClient(UserAPIClient):
         )
         return None
 
+    def get_course_ids(self, course_identifiers):
+        """
+        Return the course id for each of the given course identifiers.
+
+        This is the bulk counterpart of `get_course_id`. Course ids are returned as-is; course run ids are first
+        looked up in the cache and the remaining ones are resolved with batched `course_runs` requests filtered
+        by key, instead of one request per course run.
+
+        Arguments:
+            course_identifiers (iterable): Course ids and/or course run ids.
+
+        Returns:
+            (dict): Mapping of each given course identifier to its course id, or None if it could not be resolved.
+        """
+        course_ids = {}
+        course_run_ids = []
+        for course_identifier in course_identifiers:
+            try:
+                CourseKey.from_string(course_identifier)
+            except InvalidKeyError:
+                course_ids[course_identifier] = course_identifier
+            else:
+                course_run_ids.append(course_identifier)
+
+        if not course_run_ids:
+            return course_ids
+
+        cache_keys = {
+            utils.get_cache_key(resource=self.COURSE_RUNS_ENDPOINT, course_run_key=course_run_id): course_run_id
+            for course_run_id in set(course_run_ids)
+        }
+        cached_course_keys = cache.get_many(list(cache_keys))
+        for cache_key, course_key in cached_course_keys.items():
+            course_ids[cache_keys[cache_key]] = course_key
+
+        uncached_course_run_ids = [
+            course_run_id for cache_key, course_run_id in cache_keys.items() if cache_key not in cached_course_keys
+        ]
+        if uncached_course_run_ids:
+            resolved_course_keys = self._get_course_keys_for_course_runs(uncached_course_run_ids)
+            cache.set_many(
+                {
+                    cache_key: resolved_course_keys[course_run_id]
+                    for cache_key, course_run_id in cache_keys.items()
+                    if course_run_id in resolved_course_keys
+                },
+                self.COURSE_RUN_COURSE_KEY_CACHE_TIMEOUT,
+            )
+            for course_run_id in uncached_course_run_ids:
+                course_ids[course_run_id] = resolved_course_keys.get(course_run_id)
+                if course_ids[course_run_id] is None:
+                    LOGGER.info(
+                        "Could not find course_key for course identifier [%s].", course_run_id
+                    )
+
+        return course_ids
+
+    def _get_course_keys_for_course_runs(self, course_run_ids):
+        """
+        Return a mapping of course run key to course key for the given course runs, as reported by discovery.
+
+        Arguments:
+            course_run_ids (list): Course run ids.
+
+        Returns:
+            (dict): Mapping of course run key to course key for every course run discovery knows about.
+        """
+        course_keys = {}
+        for index in range(0, len(course_run_ids), self.COURSE_RUN_KEYS_BATCH_SIZE):
+            batch = course_run_ids[index:index + self.COURSE_RUN_KEYS_BATCH_SIZE]
+            course_runs = self._load_data(
+                self.COURSE_RUNS_ENDPOINT,
+                default=[],
+                querystring={'keys': ','.join(batch)},
+                many=True,
+                traverse_pagination=True,
+            )
+            for course_run in course_runs:
+                if course_run.get('key') and course_run.get('course'):
+                    course_keys[course_run['key']] = course_run['course']
+        return course_keys
+
     def get_course_run_identifiers(self, course_run_id):
         """
         Return all course and course run keys and uuids for the specified course run id
@@ -309,6 +309,50 @@ class ThirdPartyAuthApiClient(UserAPIClient):
     """
 
     API_BASE_URL = urljoin(f"{settings.LMS_INTERNAL_ROOT_URL}/", "api/third_party_auth/v0/")
+    REMOTE_IDS_BATCH_SIZE = getattr(settings, "ENTERPRISE_THIRD_PARTY_AUTH_REMOTE_IDS_BATCH_SIZE", 100)
+
+    @UserAPIClient.refresh_token
+    def get_remote_ids(self, identity_provider, usernames, remote_id_field_name=None):
+        """
+        Retrieve the remote identifiers of many usernames, requesting them in batches.
+
+        Args:
+        * ``identity_provider`` (str): identifier slug for the third-party authentication service used during SSO.
+        * ``usernames`` (iterable): The usernames identifying the users for which to retrieve the remote names.
+        * ``remote_id_field_name`` (str) (optional): The field name to use for the remote id lookup.
+
+        Returns:
+            dict: the remote names of the given users which have one, keyed by username.
+        """
+        api_url = self.get_api_url(f"providers/{identity_provider}/users")
+        usernames = list(dict.fromkeys(usernames))
+        remote_ids = {}
+        for batch_start in range(0, len(usernames), self.REMOTE_IDS_BATCH_SIZE):
+            batch_usernames = usernames[batch_start:batch_start + self.REMOTE_IDS_BATCH_SIZE]
+            params = {'username': batch_usernames, 'page_size': len(batch_usernames)}
+            if remote_id_field_name:
+                params['remote_id_field_name'] = remote_id_field_name
+            next_url = api_url
+            while next_url:
+                try:
+                    response = self.client.get(next_url, params=params)
+                    response.raise_for_status()
+                except HTTPError as err:
+                    if err.response.status_code != 404:
+                        raise
+                    LOGGER.error(
+                        'Usernames not found for third party provider={%s}, {%s} usernames',
+                        identity_provider,
+                        len(batch_usernames),
+                    )
+                    break
+                response_json = response.json()
+                for row in response_json.get('results', []):
+                    if row.get('username') in batch_usernames and row.get('remote_id') is not None:
+                        remote_ids.setdefault(row['username'], row['remote_id'])
+                # the next page url carries the query parameters
+                next_url, params = response_json.get('next'), None
+        return remote_ids
 
     @UserAPIClient.refresh_token
     def get_remote_id(self, identity_provider, username, remote_id_field_name=None):
@@ -521,14 +565,17 @@ class NoAuthLMSClient(NoAuthAPIClient):
     API_BASE_URL = settings.LMS_INTERNAL_ROOT_URL
     APPEND_SLASH = False
 
-    def get_health(self):
+    def get_health(self, timeout=None):
         """
         Retrieve health details for LMS service.
 
+        Arguments:
+            timeout (float): Seconds to wait for the service to respond.
+
         Returns:
             dict: Response containing LMS service health.
         """
         api_url = self.get_api_url("heartbeat")
-        response = self.client.get(api_url)
+        response = self.client.get(api_url, timeout=timeout)
         response.raise_for_status()
         return response.json()
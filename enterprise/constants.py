@@ -194,6 +194,18 @@ EDX_ORG_NAME = 'edX, Inc'
 USE_ENTERPRISE_CATALOG = 'use_enterprise_catalog'
 
 
+class EnterpriseCustomerUserLinkOutcomes:
+    """
+    Outcomes of linking or unlinking an email with ``EnterpriseCustomerUserManager.link_users`` or ``unlink_users``.
+    """
+    LINKED = 'linked'
+    ALREADY_LINKED = 'already linked'
+    PENDING = 'pending'
+    NOT_RELINKABLE = 'not relinkable'
+    UNLINKED = 'unlinked'
+    NOT_FOUND = 'not found'
+
+
 class AdminInviteStatus:
     """
     Status constants for enterprise admin invitations.
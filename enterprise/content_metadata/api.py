@@ -140,3 +140,37 @@ def get_and_cache_enterprise_contains_content_items(enterprise_customer_uuid, co
     )
     TieredCache.set_all_tiers(cache_key, result, timeout or DEFAULT_CACHE_TIMEOUT)
     return result
+
+
+def get_and_cache_catalog_contains_content_items(enterprise_customer_catalog, course_run_ids, program_uuids,
+                                                 timeout=None):
+    """
+    Returns whether the provided course runs and programs are all present in
+    the provided enterprise customer catalog.
+
+    The response, positive or negative, is cached in a ``TieredCache``. The
+    cache key includes when the catalog and its catalog query were last
+    modified, so saving either of them invalidates the cached response.
+
+    Returns: True if the catalog contains all of the content items else False.
+    """
+    enterprise_catalog_query = enterprise_customer_catalog.enterprise_catalog_query
+    cache_key = versioned_cache_key(
+        'get_catalog_contains_content_items',
+        enterprise_customer_catalog.uuid,
+        enterprise_customer_catalog.modified,
+        enterprise_catalog_query.modified if enterprise_catalog_query else None,
+        sorted(set(course_run_ids)),
+        sorted(set(program_uuids)),
+    )
+    cached_response = TieredCache.get_cached_response(cache_key)
+    if cached_response.is_found:
+        logger.info(f'cache hit for enterprise customer catalog {enterprise_customer_catalog.uuid} content items')
+        return cached_response.value
+
+    result = (
+        (not course_run_ids or enterprise_customer_catalog.contains_courses(course_run_ids)) and
+        (not program_uuids or enterprise_customer_catalog.contains_programs(program_uuids))
+    )
+    TieredCache.set_all_tiers(cache_key, result, timeout or DEFAULT_CACHE_TIMEOUT)
+    return result
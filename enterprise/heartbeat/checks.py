@@ -22,10 +22,13 @@ from enterprise.heartbeat.exceptions import (
 )
 
 
-def check_lms():
+def check_lms(timeout=None):
     """
     Check if LMS service is up and running and accessible via API.
 
+    Arguments:
+        timeout (float): Seconds to wait for the service to respond, ``None`` waits indefinitely.
+
     Raises:
         (LMSNotAvailable): raised if LMS service is not accessible for some reason.
 
@@ -34,7 +37,7 @@ def check_lms():
     """
     client = NoAuthLMSClient()
     try:
-        client.get_health()
+        client.get_health(timeout=timeout)
     except HTTPError as error:
         raise LMSNotAvailable('Service is down.', traceback.format_exc()) from error
     except (ConnectionError, Timeout) as error:
@@ -47,10 +50,13 @@ def check_lms():
     return 'Learning Management System (LMS)', 'Service is up and running.'
 
 
-def check_ecommerce():
+def check_ecommerce(timeout=None):
     """
     Check if E-Commerce service is up and running and accessible via API.
 
+    Arguments:
+        timeout (float): Seconds to wait for the service to respond, ``None`` waits indefinitely.
+
     Raises:
         (EcommerceNotAvailable): raised if LMS service is not accessible for some reason.
 
@@ -59,7 +65,7 @@ def check_ecommerce():
     """
     client = NoAuthEcommerceClient()
     try:
-        client.get_health()
+        client.get_health(timeout=timeout)
     except HTTPError as error:
         raise EcommerceNotAvailable('Service is down.', traceback.format_exc()) from error
     except (ConnectionError, Timeout) as error:
@@ -72,10 +78,13 @@ def check_ecommerce():
     return 'E-Commerce', 'Service is up and running.'
 
 
-def check_discovery():
+def check_discovery(timeout=None):
     """
     Check if course discovery service is up and running and accessible via API.
 
+    Arguments:
+        timeout (float): Seconds to wait for the service to respond, ``None`` waits indefinitely.
+
     Raises:
         (DiscoveryNotAvailable): raised if LMS service is not accessible for some reason.
 
@@ -84,7 +93,7 @@ def check_discovery():
     """
     client = NoAuthDiscoveryClient()
     try:
-        client.get_health()
+        client.get_health(timeout=timeout)
     except HTTPError as error:
         raise DiscoveryNotAvailable('Service is down.', traceback.format_exc()) from error
     except (ConnectionError, Timeout) as error:
@@ -97,10 +106,13 @@ def check_discovery():
     return 'Course Discovery', 'Service is up and running.'
 
 
-def check_enterprise_catalog():
+def check_enterprise_catalog(timeout=None):
     """
     Check if enterprise catalog service is up and running and accessible via API.
 
+    Arguments:
+        timeout (float): Seconds to wait for the service to respond, ``None`` waits indefinitely.
+
     Raises:
         (EnterpriseCatalogNotAvailable): raised if LMS service is not accessible for some reason.
 
@@ -109,7 +121,7 @@ def check_enterprise_catalog():
     """
     client = NoAuthEnterpriseCatalogClient()
     try:
-        client.get_health()
+        client.get_health(timeout=timeout)
     except HTTPError as error:
         raise EnterpriseCatalogNotAvailable('Service is down.', traceback.format_exc()) from error
     except (ConnectionError, Timeout) as error:
@@ -2,6 +2,11 @@
 Run health checks on all the services enterprise service is dependant on.
 """
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
 
 from enterprise.heartbeat import checks
 from enterprise.heartbeat.exceptions import ServiceNotAvailable
@@ -16,6 +21,11 @@ CHECKS = (
 
 LOGGER = logging.getLogger(__name__)
 
+# Seconds each service is given to answer its health request.
+HEARTBEAT_CHECK_TIMEOUT = getattr(settings, 'ENTERPRISE_HEARTBEAT_CHECK_TIMEOUT', 5)
+# Seconds the result of a service check is reused for, so frequent probes do not multiply upstream traffic.
+HEARTBEAT_CACHE_TIMEOUT = getattr(settings, 'ENTERPRISE_HEARTBEAT_CACHE_TIMEOUT', 10)
+
 
 class Status:
     """
@@ -25,10 +35,51 @@ class Status:
     UNAVAILABLE = 'UNAVAILABLE'
 
 
+def _get_check_cache_key(check_func):
+    """
+    Return the cache key under which the result of the given check is stored.
+    """
+    return 'enterprise.heartbeat.{}'.format(check_func.__name__)
+
+
+def _run_check(check_func):
+    """
+    Run a single health check and return the status of its service.
+
+    Returns:
+        (dict): service name, message, status and the time taken by the check in milliseconds.
+    """
+    start = time.monotonic()
+    try:
+        service_name, message = check_func(timeout=HEARTBEAT_CHECK_TIMEOUT)
+    except ServiceNotAvailable as error:
+        LOGGER.exception(
+            '{error.service_name} service health check failed with message "{error.message}"'.format(error=error)
+        )
+        service = {
+            'service': error.service_name,
+            'message': error.message,
+            'status': Status.UNAVAILABLE,
+        }
+    else:
+        service = {
+            'service': service_name,
+            'message': message,
+            'status': Status.OK,
+        }
+
+    service['latency_ms'] = round((time.monotonic() - start) * 1000)
+    cache.set(_get_check_cache_key(check_func), service, HEARTBEAT_CACHE_TIMEOUT)
+    return service
+
+
 def run_checks():
     """
     Run health checks on all the services and return the status of each service.
 
+    Checks are run concurrently, each bounded by ``ENTERPRISE_HEARTBEAT_CHECK_TIMEOUT``, and the status of each
+    service is reused for ``ENTERPRISE_HEARTBEAT_CACHE_TIMEOUT`` seconds.
+
     Returns:
         (bool, dict): first boolean un the tuple tells of all services are up and running or not,
             Dictionary containing the following key value pairs status: 'OK' if all the services are up
@@ -39,26 +90,18 @@ def run_checks():
         'services': [],
     }
 
-    for check_func in CHECKS:
-        try:
-            service_name, message = check_func()
-        except ServiceNotAvailable as error:
-            LOGGER.exception(
-                '{error.service_name} service health check failed with message "{error.message}"'.format(error=error)
-            )
+    cached_services = cache.get_many([_get_check_cache_key(check_func) for check_func in CHECKS])
+    stale_checks = [check_func for check_func in CHECKS if _get_check_cache_key(check_func) not in cached_services]
+    checked_services = {}
+    if stale_checks:
+        with ThreadPoolExecutor(max_workers=len(stale_checks)) as executor:
+            checked_services = dict(zip(stale_checks, executor.map(_run_check, stale_checks)))
 
+    for check_func in CHECKS:
+        service = checked_services.get(check_func) or cached_services[_get_check_cache_key(check_func)]
+        if service['status'] != Status.OK:
             response['status'] = Status.UNAVAILABLE
             response['message'] = 'Some or all of the dependant services are down.'
-            response['services'].append({
-                'service': error.service_name,
-                'message': error.message,
-                'status': Status.UNAVAILABLE,
-            })
-        else:
-            response['services'].append({
-                'service': service_name,
-                'message': message,
-                'status': Status.OK,
-            })
+        response['services'].append(service)
 
     return response['status'] == Status.OK, response
@@ -4,10 +4,11 @@ to existing linked enterprise users that are missing them.
 """
 
 import logging
-from time import sleep
+from time import monotonic, sleep
 
 from django.contrib import auth
 from django.core.management.base import BaseCommand
+from django.db.models import Exists, OuterRef
 
 from enterprise.constants import ENTERPRISE_LEARNER_ROLE
 from enterprise.models import EnterpriseCustomerUser, SystemWideEnterpriseRole, SystemWideEnterpriseUserRoleAssignment
@@ -23,6 +24,8 @@ class Command(BaseCommand):
 
     Example usage:
         $ ./manage.py backfill_learner_role_assignments
+        # Set-based mode, resuming after the last EnterpriseCustomerUser pk reported by a previous run
+        $ ./manage.py backfill_learner_role_assignments --set-based --start-pk 123456
     """
     help = 'Assigns enterprise_learner role to linked enterprise users missing them.'
 
@@ -48,6 +51,28 @@ class Command(BaseCommand):
             type=int,
         )
 
+        parser.add_argument(
+            '--set-based',
+            action='store_true',
+            dest='set_based',
+            help=(
+                'Compute the missing role assignments of each batch with a single query and bulk create them, '
+                'instead of looking up each enterprise user one at a time.'
+            ),
+        )
+
+        parser.add_argument(
+            '--start-pk',
+            action='store',
+            dest='start_pk',
+            default=0,
+            help=(
+                'Only process EnterpriseCustomerUser records with a greater pk. Used with --set-based to resume '
+                'from the checkpoint logged by a previous run.'
+            ),
+            type=int,
+        )
+
     def backfill_learner_role_assignments(self, options):
         """
         Assigns enterprise_learner role to users.
@@ -81,12 +106,84 @@ class Command(BaseCommand):
 
             sleep(batch_sleep)
 
+    def backfill_learner_role_assignments_set_based(self, options):
+        """
+        Assigns enterprise_learner role to users, one set-based query and bulk insert per batch.
+
+        Each batch holds the next ``batch_limit`` linked enterprise users, in pk order after the checkpoint,
+        that have no learner role assignment for their enterprise customer. Since every enterprise user up to
+        the last pk of a batch is then assigned, that pk is logged as the checkpoint to resume from.
+        """
+        batch_limit = options['batch_limit']
+        batch_sleep = options['batch_sleep']
+        checkpoint_pk = options['start_pk']
+
+        role = SystemWideEnterpriseRole.objects.get(name=ENTERPRISE_LEARNER_ROLE)
+        missing_assignments = EnterpriseCustomerUser.objects.filter(
+            linked=True,
+            user_id__in=User.objects.values('id'),
+        ).exclude(
+            Exists(
+                SystemWideEnterpriseUserRoleAssignment.objects.filter(
+                    user_id=OuterRef('user_id'),
+                    role=role,
+                    enterprise_customer_id=OuterRef('enterprise_customer_id'),
+                )
+            )
+        ).order_by('pk')
+
+        total_assigned = 0
+        started_at = monotonic()
+        while True:
+            ecu_batch = list(
+                missing_assignments.filter(pk__gt=checkpoint_pk).values_list(
+                    'pk', 'user_id', 'enterprise_customer_id',
+                )[:batch_limit]
+            )
+            if not ecu_batch:
+                break
+
+            # bulk_create returns every object it is given when conflicts are ignored, so the role assignments
+            # created by this batch are counted with a query before and after the insert instead.
+            batch_assignments = SystemWideEnterpriseUserRoleAssignment.objects.filter(
+                role=role,
+                user_id__in={user_id for _, user_id, _ in ecu_batch},
+                enterprise_customer_id__in={enterprise_customer_id for _, _, enterprise_customer_id in ecu_batch},
+            )
+            assigned_before = batch_assignments.count()
+            SystemWideEnterpriseUserRoleAssignment.objects.bulk_create(
+                [
+                    SystemWideEnterpriseUserRoleAssignment(
+                        user_id=user_id,
+                        role=role,
+                        enterprise_customer_id=enterprise_customer_id,
+                    )
+                    for _, user_id, enterprise_customer_id in ecu_batch
+                ],
+                ignore_conflicts=True,
+            )
+            total_assigned += batch_assignments.count() - assigned_before
+            checkpoint_pk = ecu_batch[-1][0]
+            elapsed = monotonic() - started_at
+            log.info(
+                'Assigned %d learner roles so far (%.1f per second). '
+                'Checkpoint: resume with --start-pk %d.',
+                total_assigned, total_assigned / elapsed if elapsed else total_assigned, checkpoint_pk,
+            )
+
+            sleep(batch_sleep)
+
+        log.info('Assigned %d learner roles in %.1f seconds.', total_assigned, monotonic() - started_at)
+
     def handle(self, *args, **options):
         """
         Entry point for management command execution.
         """
         log.info('Starting assigning enterprise_learner roles to users!')
 
-        self.backfill_learner_role_assignments(options)
+        if options['set_based']:
+            self.backfill_learner_role_assignments_set_based(options)
+        else:
+            self.backfill_learner_role_assignments(options)
 
         log.info('Successfully finished assigning enterprise_learner roles to users!')
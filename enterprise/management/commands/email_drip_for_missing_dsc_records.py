@@ -7,15 +7,18 @@ from datetime import timedelta
 from urllib.parse import urljoin
 
 from django.conf import settings
+from django.contrib import auth
+from django.core.exceptions import ImproperlyConfigured
 from django.core.management import BaseCommand
+from django.db.models import Exists, OuterRef, Subquery
 from django.urls import reverse
 from django.utils import timezone
 
-from consent.models import DataSharingConsent, ProxyDataSharingConsent
+from consent.models import DataSharingConsent
 from enterprise import utils
-from enterprise.api_client.discovery import CourseCatalogApiClient
+from enterprise.api_client.discovery import CourseCatalogApiClient, get_course_catalog_api_service_client
 from enterprise.models import EnterpriseCourseEnrollment
-from enterprise.utils import get_configuration_value, parse_lms_api_datetime
+from enterprise.utils import NotConnectedToOpenEdX, get_configuration_value, parse_lms_api_datetime
 
 try:
     from openedx.features.enterprise_support.utils import is_course_accessed
@@ -23,12 +26,20 @@ except ImportError:
     is_course_accessed = None
 
 LOGGER = logging.getLogger(__name__)
+User = auth.get_user_model()
 
 
 class Command(BaseCommand):
     """
     Django management command for sending an email to learners with missing DataSharingConsent records
+
+    The command runs as a three stage pipeline, so that its remote calls scale with the number of distinct
+    courses instead of the number of enrollments:
+        1. find the enrollments without a consent record with an anti-join,
+        2. resolve the course properties once per course,
+        3. emit the Segment events in batches.
     """
+    event_batch_size = 500
 
     def _get_course_properties(self, user, course_id, enterprise_customer):
         """
@@ -97,35 +108,99 @@ class Command(BaseCommand):
 
         return enrollments_with_dsc_enabled
 
-    def emit_event(self, ec_user, course_id, enterprise_customer, greeting_name):
+    def get_enrollments_missing_consent(self, enterprise_course_enrollments):
+        """
+        Return the given enrollments that have no DataSharingConsent record for their course run nor their course.
+
+        Consent given for the course run is excluded with an anti-join. Consent given for the parent course is
+        looked up with one query, once the course runs of the remaining enrollments are resolved in bulk.
+        """
+        enrollments = list(
+            enterprise_course_enrollments.select_related(
+                'enterprise_customer_user__enterprise_customer__site',
+            ).annotate(
+                dsc_username=Subquery(
+                    User.objects.filter(pk=OuterRef('enterprise_customer_user__user_id')).values('username')[:1]
+                ),
+            ).exclude(
+                Exists(
+                    DataSharingConsent.objects.filter(
+                        enterprise_customer=OuterRef('enterprise_customer_user__enterprise_customer'),
+                        username=OuterRef('dsc_username'),
+                        course_id=OuterRef('course_id'),
+                    )
+                )
+            )
+        )
+
+        course_keys = self._get_course_keys(enrollments)
+        course_consents = set(
+            DataSharingConsent.objects.filter(
+                username__in={enrollment.dsc_username for enrollment in enrollments},
+                course_id__in=set(course_keys.values()),
+            ).values_list('enterprise_customer_id', 'username', 'course_id')
+        )
+        return [
+            enrollment for enrollment in enrollments
+            if (
+                enrollment.enterprise_customer_user.enterprise_customer_id,
+                enrollment.dsc_username,
+                course_keys.get(enrollment.course_id),
+            ) not in course_consents
+        ]
+
+    def _get_course_keys(self, enrollments):
+        """
+        Return a mapping of the course runs of the given enrollments to their course keys.
+        """
+        course_runs_by_site = {}
+        for enrollment in enrollments:
+            site = enrollment.enterprise_customer_user.enterprise_customer.site
+            course_runs_by_site.setdefault(site, set()).add(enrollment.course_id)
+
+        course_keys = {}
+        for site, course_runs in course_runs_by_site.items():
+            try:
+                course_keys.update(get_course_catalog_api_service_client(site=site).get_course_ids(course_runs))
+            except (ImproperlyConfigured, NotConnectedToOpenEdX):
+                LOGGER.warning('CourseCatalogApiServiceClient is improperly configured.')
+        return course_keys
+
+    def build_event_properties(self, user, course_id, enterprise_customer, greeting_name, course_properties):
         """
-         Emit the Segment event which will be used by Braze to send the email
+        Build the properties of the Segment event which will be used by Braze to send the email
         """
-        next_url, course_title = self._get_course_properties(ec_user.user, course_id, enterprise_customer)
-        failure_url = urljoin(settings.LMS_ROOT_URL, '/dashboard')
-        grant_data_sharing_url = reverse('grant_data_sharing_permissions')
-        utils.track_event(ec_user.user_id, 'edx.bi.user.consent.absent', {
+        next_url, course_title = course_properties
+        return {
             'course_id': course_id,
-            'username': ec_user.username,
+            'username': user.username,
             'enterprise_name': enterprise_customer.name,
             'enterprise_uuid': str(enterprise_customer.uuid),
             'next_url': next_url,
             'course_title': course_title,
-            'user_email': ec_user.user_email,
+            'user_email': user.email,
             'greeting_name': greeting_name,
-            'failure_url': failure_url,
+            'failure_url': urljoin(settings.LMS_ROOT_URL, '/dashboard'),
             'lms_root_url': settings.LMS_ROOT_URL,
-            'grant_data_sharing_url': grant_data_sharing_url,
+            'grant_data_sharing_url': reverse('grant_data_sharing_permissions'),
             'source': 'missing-dsc-email-drip-command',
-        })
-        LOGGER.info(
-            '[Absent DSC Email] Segment event fired for missing data sharing consent. '
-            'User: [%s], Course: [%s], Enterprise: [%s], DSC Next Url: [%s]',
-            ec_user.username,
-            course_id,
-            str(enterprise_customer.uuid),
-            next_url
-        )
+        }
+
+    def emit_events(self, events):
+        """
+         Emit the Segment events which will be used by Braze to send the emails, in batches
+        """
+        for events_batch in utils.batch(events, batch_size=self.event_batch_size):
+            for user_id, properties in events_batch:
+                utils.track_event(user_id, 'edx.bi.user.consent.absent', properties)
+            LOGGER.info(
+                '[Absent DSC Email] Segment events fired for missing data sharing consent. Events: [%s]',
+                [
+                    f"User: {properties['username']}, Course: {properties['course_id']}, "
+                    f"Enterprise: {properties['enterprise_uuid']}, DSC Next Url: {properties['next_url']}"
+                    for __, properties in events_batch
+                ],
+            )
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -164,53 +239,63 @@ class Command(BaseCommand):
         """
         should_commit = not options['no_commit']
         email_sent_records = []
+        events = []
+        course_properties = {}
         enterprise_course_enrollments = self.get_enterprise_course_enrollments(options)
-        for enterprise_enrollment in enterprise_course_enrollments:
+        enrollments_missing_consent = self.get_enrollments_missing_consent(enterprise_course_enrollments)
+        users = User.objects.in_bulk(
+            {enrollment.enterprise_customer_user.user_id for enrollment in enrollments_missing_consent}
+        )
+        for enterprise_enrollment in enrollments_missing_consent:
             ec_user = enterprise_enrollment.enterprise_customer_user
-            username = ec_user.username
-            user_email = ec_user.user_email
-            greeting_name = user_email
-            if hasattr(ec_user, 'first_name') and ec_user.first_name:
-                greeting_name = ec_user.first_name
+            user = users.get(ec_user.user_id)
+            if user is None:
+                continue
+            username = user.username
+            greeting_name = user.email
             course_id = enterprise_enrollment.course_id
             enterprise_customer = ec_user.enterprise_customer
-            consent = DataSharingConsent.objects.proxied_get(
-                username=username,
-                course_id=course_id,
-                enterprise_customer=enterprise_customer
-            )
-            if isinstance(consent, ProxyDataSharingConsent):
-                course_accessed = False
-                try:
-                    if is_course_accessed and is_course_accessed(ec_user.user, course_id):
-                        course_accessed = True
-                except Exception as exc:  # pylint: disable=broad-except
-                    LOGGER.exception('[Absent DSC Email] Error in {course} for user {user}. Error detail: {exc}'.format(
-                        course=course_id,
-                        user=username,
-                        exc=str(exc)
-                    ))
-                # Emit the Segment event which will be used by Braze to send the email
-                if course_accessed:
-                    if should_commit:
-                        self.emit_event(ec_user, course_id, enterprise_customer, greeting_name)
-                    email_sent_records.append(
-                        f'User: {username}, Course: {course_id}, Enterprise: {enterprise_customer.uuid}'
-                    )
-                else:
-                    LOGGER.info(
-                        f'[Absent DSC Email] User has not accessed the course yet. User: [{username}], Course: '
-                        f'[{course_id}], Enterprise: [{enterprise_customer.uuid}]'
-                    )
+            course_accessed = False
+            try:
+                if is_course_accessed and is_course_accessed(user, course_id):
+                    course_accessed = True
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.exception('[Absent DSC Email] Error in {course} for user {user}. Error detail: {exc}'.format(
+                    course=course_id,
+                    user=username,
+                    exc=str(exc)
+                ))
+            # Emit the Segment event which will be used by Braze to send the email
+            if course_accessed:
+                if should_commit:
+                    properties_key = (course_id, enterprise_customer.uuid)
+                    if properties_key not in course_properties:
+                        course_properties[properties_key] = self._get_course_properties(
+                            user, course_id, enterprise_customer,
+                        )
+                    events.append((user.id, self.build_event_properties(
+                        user, course_id, enterprise_customer, greeting_name, course_properties[properties_key],
+                    )))
+                email_sent_records.append(
+                    f'User: {username}, Course: {course_id}, Enterprise: {enterprise_customer.uuid}'
+                )
             else:
                 LOGGER.info(
-                    f'[Absent DSC Email] Consent already given. User: [{username}], Course: [{course_id}], '
-                    f'Enterprise: [{enterprise_customer.uuid}]'
+                    f'[Absent DSC Email] User has not accessed the course yet. User: [{username}], Course: '
+                    f'[{course_id}], Enterprise: [{enterprise_customer.uuid}]'
                 )
 
+        self.emit_events(events)
+
+        enrollments_count = enterprise_course_enrollments.count()
+        LOGGER.info(
+            '[Absent DSC Email] Consent already given for [%s] enrollments out of [%s] enrollments.',
+            enrollments_count - len(enrollments_missing_consent),
+            enrollments_count,
+        )
         LOGGER.info(
             '[Absent DSC Email] Emails sent for [%s] enrollments out of [%s] enrollments. DSC records sent to: [%s]',
             len(email_sent_records),
-            enterprise_course_enrollments.count(),
+            enrollments_count,
             email_sent_records
         )
@@ -9,7 +9,8 @@ from edx_django_utils.cache import TieredCache, get_cache_key
 from django.contrib import auth
 from django.core.management import BaseCommand
 
-from enterprise.models import EnterpriseCustomer, EnterpriseCustomerUser, PendingEnterpriseCustomerUser
+from enterprise.constants import EnterpriseCustomerUserLinkOutcomes
+from enterprise.models import EnterpriseCustomer, EnterpriseCustomerUser
 
 LOGGER = logging.getLogger(__name__)
 
@@ -65,18 +66,21 @@ class Command(BaseCommand):
             rows = list(csv.DictReader(csv_file))
         csv_file.close()
 
+        unlink_outcomes = {}
+        if not skip_unlink:
+            # Unlink the users.
+            unlink_outcomes = EnterpriseCustomerUser.objects.unlink_users(
+                enterprise_customer=enterprise_customer, user_emails=[row['email'] for row in rows]
+            )
+
         for row in rows:
             email = row['email']
             results[email] = {'Unlinked': None, 'Removed_DSC': None}
 
-            if not skip_unlink:
-                # Unlink the user.
-                try:
-                    EnterpriseCustomerUser.objects.unlink_user(
-                        enterprise_customer=enterprise_customer, user_email=email
-                    )
+            if email in unlink_outcomes:
+                if unlink_outcomes[email] == EnterpriseCustomerUserLinkOutcomes.UNLINKED:
                     results[email]['Unlinked'] = 'Success'
-                except (EnterpriseCustomerUser.DoesNotExist, PendingEnterpriseCustomerUser.DoesNotExist):
+                else:
                     message = 'Email {email} is not associated with Enterprise Customer {ec_name}'.format(
                         email=email, ec_name=enterprise_customer.name
                     )
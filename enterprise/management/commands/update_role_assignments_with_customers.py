@@ -221,7 +221,7 @@ class Command(BaseCommand):
             return
 
         SystemWideEnterpriseUserRoleAssignment.objects.bulk_create(
-            assignments_to_create, batch_size=100
+            assignments_to_create, batch_size=100, ignore_conflicts=True,
         )
 
     def _get_all_enterprise_customer_user_ids(self, enterprise_customer_uuid=None):
@@ -242,7 +242,7 @@ class Command(BaseCommand):
         """
         queryset = EnterpriseCustomerUser.objects.filter(
             id__in=enterprise_customer_user_ids
-        )
+        ).select_related('enterprise_customer')
         customers_by_user_id = defaultdict(set)
         for ecu in queryset:
             customers_by_user_id[ecu.user_id].add(ecu.enterprise_customer)
@@ -261,7 +261,10 @@ class Command(BaseCommand):
         }
 
         assignments_by_user_id_role = defaultdict(set)
-        for assignment in SystemWideEnterpriseUserRoleAssignment.objects.filter(**role_assignment_kwargs):
+        assignments = SystemWideEnterpriseUserRoleAssignment.objects.filter(
+            **role_assignment_kwargs
+        ).select_related('role', 'enterprise_customer')
+        for assignment in assignments:
             assignments_by_user_id_role[
                 (assignment.user_id, assignment.role.name)
             ].add(assignment)
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('enterprise', '0249_enterprisecustomer_enable_people_management_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='enterprisegroupmembership',
+            name='sortable_member_email',
+            field=models.EmailField(blank=True, default=None, editable=False, help_text='Denormalized email of the member, used to search and sort group members.', max_length=254, null=True),
+        ),
+        migrations.AddField(
+            model_name='enterprisegroupmembership',
+            name='sortable_recent_action',
+            field=models.DateTimeField(blank=True, default=None, editable=False, help_text='Denormalized timestamp of the most recent action relating to the membership, used to sort group members.', null=True),
+        ),
+        migrations.AddField(
+            model_name='historicalenterprisegroupmembership',
+            name='sortable_member_email',
+            field=models.EmailField(blank=True, default=None, editable=False, help_text='Denormalized email of the member, used to search and sort group members.', max_length=254, null=True),
+        ),
+        migrations.AddField(
+            model_name='historicalenterprisegroupmembership',
+            name='sortable_recent_action',
+            field=models.DateTimeField(blank=True, default=None, editable=False, help_text='Denormalized timestamp of the most recent action relating to the membership, used to sort group members.', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='enterprisegroupmembership',
+            index=models.Index(fields=['group', 'sortable_member_email'], name='idx_group_member_email'),
+        ),
+        migrations.AddIndex(
+            model_name='enterprisegroupmembership',
+            index=models.Index(fields=['group', 'sortable_recent_action'], name='idx_group_member_recent_action'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_sortable_fields(apps, schema_editor):
+    """
+    Populate the denormalized sortable columns of existing group memberships, one group at a time.
+    """
+    EnterpriseGroup = apps.get_model('enterprise', 'EnterpriseGroup')
+    EnterpriseGroupMembership = apps.get_model('enterprise', 'EnterpriseGroupMembership')
+    EnterpriseCustomerUser = apps.get_model('enterprise', 'EnterpriseCustomerUser')
+    PendingEnterpriseCustomerUser = apps.get_model('enterprise', 'PendingEnterpriseCustomerUser')
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+
+    user_id = models.Subquery(
+        EnterpriseCustomerUser.objects.filter(
+            pk=models.OuterRef(models.OuterRef('enterprise_customer_user_id')),
+        ).values('user_id')[:1]
+    )
+    for group_uuid in EnterpriseGroup.objects.values_list('uuid', flat=True):
+        EnterpriseGroupMembership.objects.filter(group_id=group_uuid).update(
+            sortable_member_email=Coalesce(
+                models.Subquery(User.objects.filter(pk=user_id).values('email')[:1]),
+                models.Subquery(
+                    PendingEnterpriseCustomerUser.objects.filter(
+                        pk=models.OuterRef('pending_enterprise_customer_user_id'),
+                    ).values('user_email')[:1]
+                ),
+            ),
+            sortable_recent_action=models.Case(
+                models.When(errored_at__isnull=False, then=models.F('errored_at')),
+                models.When(is_removed=True, then=models.F('removed_at')),
+                models.When(
+                    enterprise_customer_user__isnull=False,
+                    activated_at__isnull=False,
+                    then=models.F('activated_at'),
+                ),
+                default=models.F('created'),
+                output_field=models.DateTimeField(),
+            ),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('enterprise', '0250_enterprisegroupmembership_sortable_fields'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_sortable_fields, migrations.RunPython.noop),
+    ]
@@ -19,6 +19,7 @@ from jsonfield.fields import JSONField
 from multi_email_field.fields import MultiEmailField
 from requests.exceptions import HTTPError
 from simple_history.models import HistoricalRecords
+from simple_history.utils import bulk_create_with_history, bulk_update_with_history
 from slumber.exceptions import HttpClientError
 
 from django.apps import apps
@@ -29,6 +30,7 @@ from django.core.exceptions import NON_FIELD_ERRORS, ObjectDoesNotExist, Validat
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import IntegrityError, models, transaction
 from django.db.models import Q
+from django.db.models.functions import Coalesce, NullIf
 from django.template import Context, Template
 from django.urls import reverse
 from django.utils import timezone
@@ -58,6 +60,7 @@ from enterprise.constants import (
     GROUP_TYPE_FLEX,
     MAX_INVITE_KEYS,
     DefaultColors,
+    EnterpriseCustomerUserLinkOutcomes,
     FulfillmentTypes,
     json_serialized_course_modes,
 )
@@ -87,6 +90,7 @@ from enterprise.utils import (
     logo_path,
     serialize_notification_content,
     track_enrollment,
+    unset_enterprise_learners_language,
 )
 from enterprise.validators import (
     validate_content_filter_fields,
@@ -97,9 +101,10 @@ from enterprise.validators import (
 )
 
 try:
-    from common.djangoapps.student.models import CourseEnrollment
+    from common.djangoapps.student.models import CourseEnrollment, UserProfile
 except ImportError:
     CourseEnrollment = None
+    UserProfile = None
 
 try:
     from common.djangoapps.entitlements.models import CourseEntitlement
@@ -991,6 +996,129 @@ class EnterpriseCustomerUserManager(models.Manager):
 
         return None
 
+    def get_links_by_emails(self, user_emails, enterprise_customer):
+        """
+        Return links by email and enterprise_customer for many emails, in a fixed number of queries.
+
+        Returns:
+            dict: the link of each email which has one, like ``get_link_by_email`` would return it.
+        """
+        user_emails = set(user_emails)
+        users_by_email = {
+            user.email.lower(): user for user in User.objects.filter(email__in=user_emails)
+        }
+        enterprise_customer_users_by_user_id = {}
+        for enterprise_customer_user in self.filter(
+                enterprise_customer=enterprise_customer,
+                user_id__in=[user.id for user in users_by_email.values()],
+        ).select_related('enterprise_customer'):
+            enterprise_customer_users_by_user_id.setdefault(enterprise_customer_user.user_id, enterprise_customer_user)
+        pending_links_by_email = {}
+        for pending_link in PendingEnterpriseCustomerUser.objects.filter(
+                user_email__in=user_emails,
+                enterprise_customer=enterprise_customer
+        ).select_related('enterprise_customer'):
+            pending_links_by_email.setdefault(pending_link.user_email.lower(), pending_link)
+
+        links = {}
+        for user_email in user_emails:
+            user = users_by_email.get(user_email.lower())
+            link = user and enterprise_customer_users_by_user_id.get(user.id)
+            link = link or pending_links_by_email.get(user_email.lower())
+            if link:
+                links[user_email] = link
+        return links
+
+    def link_users(self, enterprise_customer, user_emails):
+        """
+        Link many user emails to Enterprise Customer, in a fixed number of queries.
+
+        Bulk version of ``link_user``: records are created and updated in bulk, so instead of the save signals,
+        the learner role assignments and language preferences of the linked learners are updated in bulk too.
+
+        Returns:
+            dict: the ``EnterpriseCustomerUserLinkOutcomes`` value of each email.
+        """
+        user_emails = list(dict.fromkeys(user_emails))
+        users_by_email = {
+            user.email.lower(): user for user in User.objects.filter(email__in=user_emails)
+        }
+        existing_links = {
+            enterprise_customer_user.user_id: enterprise_customer_user
+            for enterprise_customer_user in EnterpriseCustomerUser.all_objects.filter(
+                enterprise_customer=enterprise_customer,
+                user_id__in=[user.id for user in users_by_email.values()],
+            )
+        }
+
+        outcomes = {}
+        new_links, updated_links, linked_users, pending_emails = [], [], [], []
+        now = localized_utcnow()
+        for user_email in user_emails:
+            user = users_by_email.get(user_email.lower())
+            if user is None:
+                pending_emails.append(user_email)
+                outcomes[user_email] = EnterpriseCustomerUserLinkOutcomes.PENDING
+                continue
+
+            enterprise_customer_user = existing_links.get(user.id)
+            if enterprise_customer_user is None:
+                enterprise_customer_user = EnterpriseCustomerUser(
+                    enterprise_customer=enterprise_customer,
+                    user_id=user.id,
+                    user_fk=user,
+                )
+                new_links.append(enterprise_customer_user)
+                outcomes[user_email] = EnterpriseCustomerUserLinkOutcomes.LINKED
+            elif not enterprise_customer_user.linked and not enterprise_customer_user.is_relinkable:
+                LOGGER.error("User {} cannot be relinked to {}.".format(user, enterprise_customer))
+                outcomes[user_email] = EnterpriseCustomerUserLinkOutcomes.NOT_RELINKABLE
+                continue
+            else:
+                outcomes[user_email] = (
+                    EnterpriseCustomerUserLinkOutcomes.ALREADY_LINKED if enterprise_customer_user.linked
+                    else EnterpriseCustomerUserLinkOutcomes.LINKED
+                )
+                enterprise_customer_user.active = True
+                enterprise_customer_user.linked = True
+                enterprise_customer_user.user_fk = user
+                enterprise_customer_user.modified = now
+                updated_links.append(enterprise_customer_user)
+            linked_users.append(user)
+
+        # like ``EnterpriseCustomerUser.save``, make the linked learners inactive in their other enterprise customers
+        EnterpriseCustomerUser.objects.filter(user_id__in=[
+            enterprise_customer_user.user_id for enterprise_customer_user in new_links + updated_links
+            if enterprise_customer_user.should_inactivate_other_customers
+        ]).exclude(enterprise_customer=enterprise_customer).update(active=False)
+        bulk_create_with_history(new_links, EnterpriseCustomerUser)
+        bulk_update_with_history(
+            updated_links,
+            EnterpriseCustomerUser,
+            ['active', 'linked', 'user_fk', 'modified'],
+            manager=EnterpriseCustomerUser.all_objects,
+        )
+
+        existing_pending_emails = set(PendingEnterpriseCustomerUser.objects.filter(
+            enterprise_customer=enterprise_customer,
+            user_email__in=pending_emails,
+        ).values_list('user_email', flat=True))
+        bulk_create_with_history(
+            [
+                PendingEnterpriseCustomerUser(enterprise_customer=enterprise_customer, user_email=user_email)
+                for user_email in pending_emails if user_email not in existing_pending_emails
+            ],
+            PendingEnterpriseCustomerUser,
+        )
+
+        from enterprise import roles_api  # pylint: disable=import-outside-toplevel
+        roles_api.assign_learner_roles(linked_users, enterprise_customer)
+        if enterprise_customer.default_language:
+            unset_enterprise_learners_language(
+                [enterprise_customer_user.user_id for enterprise_customer_user in new_links]
+            )
+        return outcomes
+
     def link_user(self, enterprise_customer, user_email):
         """
         Link user email to Enterprise Customer.
@@ -1063,6 +1191,77 @@ class EnterpriseCustomerUserManager(models.Manager):
             enterprise_customer.name
         )
 
+    def unlink_users(self, enterprise_customer, user_emails, is_relinkable=True):
+        """
+        Unlink many user emails from Enterprise Customer, in a fixed number of queries.
+
+        Bulk version of ``unlink_user``: emails which are neither linked nor pending get the ``NOT_FOUND`` outcome
+        instead of raising ``DoesNotExist``. Records are updated in bulk, so instead of the save signals, the
+        learner role assignments of the unlinked learners are deleted in bulk too.
+
+        Returns:
+            dict: the ``EnterpriseCustomerUserLinkOutcomes`` value of each email.
+        """
+        user_emails = list(dict.fromkeys(user_emails))
+        users_by_email = {
+            user.email.lower(): user for user in User.objects.filter(email__in=user_emails)
+        }
+        links = {
+            enterprise_customer_user.user_id: enterprise_customer_user
+            for enterprise_customer_user in self.filter(
+                enterprise_customer=enterprise_customer,
+                user_id__in=[user.id for user in users_by_email.values()],
+            )
+        }
+        pending_links = {
+            pending_link.user_email.lower(): pending_link
+            for pending_link in PendingEnterpriseCustomerUser.objects.filter(
+                enterprise_customer=enterprise_customer,
+                user_email__in=[
+                    user_email for user_email in user_emails if user_email.lower() not in users_by_email
+                ],
+            )
+        }
+
+        outcomes = {}
+        unlinked_links, unlinked_users, deleted_pending_link_ids = [], [], []
+        now = localized_utcnow()
+        for user_email in user_emails:
+            user = users_by_email.get(user_email.lower())
+            enterprise_customer_user = user and links.pop(user.id, None)
+            pending_link = None if user else pending_links.get(user_email.lower())
+            if enterprise_customer_user:
+                enterprise_customer_user.linked = False
+                enterprise_customer_user.active = False
+                # If is_relinkable = False, user will be permanently be unlinked from the enterprise
+                enterprise_customer_user.is_relinkable = is_relinkable
+                enterprise_customer_user.modified = now
+                unlinked_links.append(enterprise_customer_user)
+                unlinked_users.append(user)
+            elif pending_link:
+                deleted_pending_link_ids.append(pending_link.id)
+            else:
+                outcomes[user_email] = EnterpriseCustomerUserLinkOutcomes.NOT_FOUND
+                continue
+            outcomes[user_email] = EnterpriseCustomerUserLinkOutcomes.UNLINKED
+
+        bulk_update_with_history(
+            unlinked_links,
+            EnterpriseCustomerUser,
+            ['linked', 'active', 'is_relinkable', 'modified'],
+            manager=EnterpriseCustomerUser.all_objects,
+        )
+        PendingEnterpriseCustomerUser.objects.filter(id__in=deleted_pending_link_ids).delete()
+
+        from enterprise import roles_api  # pylint: disable=import-outside-toplevel
+        roles_api.delete_learner_role_assignments(unlinked_users, enterprise_customer)
+        LOGGER.info(
+            '%s enterprise learners successfully unlinked from Enterprise Customer {%s}',
+            len(unlinked_links) + len(deleted_pending_link_ids),
+            enterprise_customer.name
+        )
+        return outcomes
+
 
 class EnterpriseCustomerUser(TimeStampedModel):
     """
@@ -1591,6 +1790,9 @@ class PendingEnterpriseCustomerUser(TimeStampedModel):
             enterprise_customer_user=enterprise_customer_user,
             status=GROUP_MEMBERSHIP_ACCEPTED_STATUS
         )
+        EnterpriseGroupMembership.refresh_sortable_fields(
+            EnterpriseGroupMembership.all_objects.filter(enterprise_customer_user=enterprise_customer_user)
+        )
 
     def fulfill_pending_course_enrollments(self, enterprise_customer_user):
         """
@@ -3096,7 +3298,7 @@ class EnterpriseCustomerCatalog(TimeStampedModel):
         """
         # Translate any provided course run IDs to course keys.
         catalog_client = get_course_catalog_api_service_client(self.enterprise_customer.site)
-        course_keys = {catalog_client.get_course_id(k) for k in content_ids}
+        course_keys = set(catalog_client.get_course_ids(content_ids).values())
 
         # Remove `None` from set of course_keys if present
         course_keys = course_keys.difference({None})
@@ -4814,35 +5016,27 @@ class EnterpriseGroup(TimeStampedModel, SoftDeletableModel):
         except (ValidationError, ValueError):
             pass
 
-    def _get_filtered_ecu_ids(self, user_query):
-        """
-        Filter a group's enterprise customer user members by their User email.
-        """
-        # Unfortunately, user (and by extension email) is a property not a field on the ecu model. In order to
-        # filter ecu's by email,  we have to select from the Users table. To make this efficient, we join the user
-        # table on ecu table where the ecu is associated with the enterprise customer on the group. This limits how
-        # many User records we're calling `where email like %` on.
-        # Parameterizing the query makes this raw sql safe from sql injects re the Django docs-
-        # https://docs.djangoproject.com/en/5.0/topics/security/
-        var_q = f"%{user_query}%"
-        sql_string = """
-            with users as (
-                select ecu.id,
-                au.email,
-                coalesce(NULLIF(aup.name, ''), au.username) as full_name
-                from enterprise_enterprisecustomeruser ecu
-                inner join auth_user au on ecu.user_id = au.id
-                left join auth_userprofile aup on au.id = aup.user_id
-                where
-                    ecu.enterprise_customer_id = %s
-                and
-                    ecu.linked = 1
-            ) select id from users where email like %s or full_name like %s;
-        """
-        # Raw sql is picky about uuid format
-        customer_id = str(self.enterprise_customer.pk).replace("-", "")
-        ecus = EnterpriseCustomerUser.objects.raw(sql_string, (customer_id, var_q, var_q))
-        return [ecu.id for ecu in ecus]
+    def _get_member_search_filter(self, user_query):
+        """
+        Build a filter matching a group's members by email, or by the name of their linked User.
+        """
+        # Realized members are matched on their linked User's email and full name, falling back on the username when
+        # the profile name is blank, the same way the admin portal displays them. Pending members only have an email.
+        user_id = models.OuterRef('enterprise_customer_user__user_id')
+        full_name = models.Subquery(User.objects.filter(pk=user_id).values('username')[:1])
+        if UserProfile is not None:  # pragma: no cover
+            profile_name = models.Subquery(UserProfile.objects.filter(user_id=user_id).values('name')[:1])
+            full_name = Coalesce(NullIf(profile_name, models.Value('')), full_name, output_field=models.CharField())
+
+        ecu_ids = self.enterprise_customer.enterprise_customer_users.filter(linked=True).values('id')
+        realized_member_q = Q(enterprise_customer_user__in=ecu_ids) & (
+            Q(sortable_member_email__icontains=user_query) | Q(member_full_name__icontains=user_query)
+        )
+        pending_member_q = Q(
+            enterprise_customer_user__isnull=True,
+            sortable_member_email__icontains=user_query,
+        )
+        return full_name, realized_member_q | pending_member_q
 
     def _get_explicit_group_members(self, user_query=None, fetch_removed=False, pending_users_only=False,):
         """
@@ -4854,11 +5048,8 @@ class EnterpriseGroup(TimeStampedModel, SoftDeletableModel):
         if not fetch_removed:
             members = members.filter(is_removed=False)
         if user_query:
-            # filter the ecu's by joining the ecu table with the User table and selecting `where email like user_query`
-            ecu_filter = Q(enterprise_customer_user__id__in=self._get_filtered_ecu_ids(user_query))
-            # pecu has user_email as a field, so we can filter directly through the ORM with the user_query
-            pecu_filter = Q(pending_enterprise_customer_user__user_email__icontains=user_query)
-            members = members.filter(ecu_filter | pecu_filter)
+            full_name, search_filter = self._get_member_search_filter(user_query)
+            members = members.annotate(member_full_name=full_name).filter(search_filter)
         if pending_users_only:
             members = members.filter(is_removed=False, enterprise_customer_user_id__isnull=True)
         return members
@@ -4873,6 +5064,9 @@ class EnterpriseGroup(TimeStampedModel, SoftDeletableModel):
         Returns all users associated with the group, whether the group specifies the entire org else all associated
         membership records.
 
+        Searching and sorting happen in the database, on the denormalized ``sortable_member_email`` and
+        ``sortable_recent_action`` membership columns, so the result is a queryset that can be paginated cheaply.
+
         Params:
             q (optional): filter the returned members list by user email and name with a provided sub-string
             sort_by (optional): specify how the list of returned members should be ordered. Supported sorting values
@@ -4881,12 +5075,15 @@ class EnterpriseGroup(TimeStampedModel, SoftDeletableModel):
         """
         members = self._get_explicit_group_members(user_query, fetch_removed, pending_users_only)
         if sort_by:
-            lambda_keys = {
-                'member_details': lambda t: t.member_email,
-                'status': lambda t: t.status,
-                'recent_action': lambda t: t.recent_action,
+            sort_fields = {
+                'member_details': 'sortable_member_email',
+                'status': 'status',
+                'recent_action': 'sortable_recent_action',
             }
-            members = sorted(members, key=lambda_keys.get(sort_by), reverse=desc_order)
+            sort_field = sort_fields.get(sort_by)
+            if desc_order:
+                sort_field = f'-{sort_field}'
+            members = members.order_by(sort_field, 'uuid')
         return members
 
 
@@ -4894,8 +5091,17 @@ class EnterpriseGroupMembership(TimeStampedModel, SoftDeletableModel):
     """
     Enterprise Group Membership model
 
-    .. no_pii:
+    ``sortable_member_email`` and ``sortable_recent_action`` denormalize ``member_email`` and ``recent_action`` so
+    group listings can be searched, sorted and paginated in the database. They are kept in sync by
+    ``enterprise.signals`` on save, and by ``refresh_sortable_fields`` after bulk updates.
+
+    .. pii: The sortable_member_email field contains PII. It is kept in sync with the email of the linked User, so it
+       is retired along with the User email, and pending member emails are deleted with the pending user.
+    .. pii_types: email_address
+    .. pii_retirement: local_api
     """
+    SORTABLE_FIELDS_REFRESH_BATCH_SIZE = 1000
+
     uuid = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     group = models.ForeignKey(
         EnterpriseGroup,
@@ -4950,6 +5156,24 @@ class EnterpriseGroupMembership(TimeStampedModel, SoftDeletableModel):
         help_text=_(
             "The last time the membership action was in an error state. Null means the membership is not errored."),
     )
+    sortable_member_email = models.EmailField(
+        default=None,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_(
+            "Denormalized email of the member, used to search and sort group members."
+        ),
+    )
+    sortable_recent_action = models.DateTimeField(
+        default=None,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_(
+            "Denormalized timestamp of the most recent action relating to the membership, used to sort group members."
+        ),
+    )
     history = HistoricalRecords()
 
     class Meta:
@@ -4959,6 +5183,65 @@ class EnterpriseGroupMembership(TimeStampedModel, SoftDeletableModel):
         # ie no issue if multiple fields have: group = A and pending_enterprise_customer_user = NULL
         unique_together = (("group", "enterprise_customer_user"), ("group", "pending_enterprise_customer_user"))
         ordering = ['-modified']
+        indexes = [
+            models.Index(fields=['group', 'sortable_member_email'], name='idx_group_member_email'),
+            models.Index(fields=['group', 'sortable_recent_action'], name='idx_group_member_recent_action'),
+        ]
+
+    @classmethod
+    def refresh_sortable_fields(cls, memberships):
+        """
+        Recompute ``sortable_member_email`` and ``sortable_recent_action`` for the given memberships.
+
+        Bulk creates and queryset updates don't send model signals, so callers performing them must refresh the
+        denormalized columns of the affected memberships themselves.
+
+        The primary keys of the memberships are fetched first and the memberships updated in batches of
+        ``SORTABLE_FIELDS_REFRESH_BATCH_SIZE``, as MySQL rejects an update filtered by a subquery on the same table.
+
+        Arguments:
+            memberships (QuerySet): The EnterpriseGroupMembership records to refresh.
+
+        Returns:
+            (int): The number of refreshed memberships.
+        """
+        membership_pks = list(memberships.values_list('pk', flat=True))
+        refreshed_count = 0
+        for membership_pks_batch in utils.batch(membership_pks, batch_size=cls.SORTABLE_FIELDS_REFRESH_BATCH_SIZE):
+            refreshed_count += cls._refresh_sortable_fields(membership_pks_batch)
+        return refreshed_count
+
+    @classmethod
+    def _refresh_sortable_fields(cls, membership_pks):
+        """
+        Recompute the denormalized sorting columns of the memberships with the given primary keys in one query.
+        """
+        user_id = models.Subquery(
+            EnterpriseCustomerUser.objects.filter(
+                pk=models.OuterRef(models.OuterRef('enterprise_customer_user_id')),
+            ).values('user_id')[:1]
+        )
+        return cls.all_objects.filter(pk__in=membership_pks).update(
+            sortable_member_email=Coalesce(
+                models.Subquery(User.objects.filter(pk=user_id).values('email')[:1]),
+                models.Subquery(
+                    PendingEnterpriseCustomerUser.objects.filter(
+                        pk=models.OuterRef('pending_enterprise_customer_user_id'),
+                    ).values('user_email')[:1]
+                ),
+            ),
+            sortable_recent_action=models.Case(
+                models.When(errored_at__isnull=False, then=models.F('errored_at')),
+                models.When(is_removed=True, then=models.F('removed_at')),
+                models.When(
+                    enterprise_customer_user__isnull=False,
+                    activated_at__isnull=False,
+                    then=models.F('activated_at'),
+                ),
+                default=models.F('created'),
+                output_field=models.DateTimeField(),
+            ),
+        )
 
     @cached_property
     def membership_user(self):
@@ -4977,7 +5260,7 @@ class EnterpriseGroupMembership(TimeStampedModel, SoftDeletableModel):
             return self.enterprise_customer_user.user_email
         return self.pending_enterprise_customer_user.user_email
 
-    @cached_property
+    @property
     def recent_action(self):
         """
         Return the timestamp of the most recent action relating to the membership
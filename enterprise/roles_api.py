@@ -2,6 +2,7 @@
 Python API for doing CRUD operations on roles and user role assignments.
 """
 from cache_memoize import cache_memoize
+from simple_history.utils import bulk_create_with_history
 
 from django.contrib.auth.base_user import AbstractBaseUser
 
@@ -131,6 +132,26 @@ def assign_admin_role(user, enterprise_customer=None, applies_to_all_contexts=Fa
     )
 
 
+def assign_learner_roles(users, enterprise_customer):
+    """
+    Assigns the given users the `enterprise_learner` role in the given customer, with a fixed number of queries.
+    """
+    role = learner_role()
+    users_with_role = set(SystemWideEnterpriseUserRoleAssignment.objects.filter(
+        user__in=users,
+        role=role,
+        enterprise_customer=enterprise_customer,
+    ).values_list('user_id', flat=True))
+    bulk_create_with_history(
+        [
+            SystemWideEnterpriseUserRoleAssignment(user=user, role=role, enterprise_customer=enterprise_customer)
+            for user in {user.id: user for user in users}.values()
+            if user.id not in users_with_role
+        ],
+        SystemWideEnterpriseUserRoleAssignment,
+    )
+
+
 def delete_role_assignment(user, role, enterprise_customer=None):
     """
     Deletes the given role assignment for the given user in the given enterprise customer.
@@ -157,6 +178,17 @@ def delete_learner_role_assignment(user, enterprise_customer=None):
     delete_role_assignment(user, learner_role(), enterprise_customer)
 
 
+def delete_learner_role_assignments(users, enterprise_customer):
+    """
+    Deletes the learner role assignments of the given users in the given enterprise customer with a single query.
+    """
+    SystemWideEnterpriseUserRoleAssignment.objects.filter(
+        user__in=users,
+        role=learner_role(),
+        enterprise_customer=enterprise_customer,
+    ).delete()
+
+
 def delete_admin_role_assignment(user, enterprise_customer=None):
     """
     Deletes the admin role assignment for the given user in the given enterprise customer.
@@ -9,8 +9,9 @@ from social_core.backends.saml import SAMLAuth
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.db import transaction
-from django.db.models.signals import post_delete, post_save, pre_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.http import HttpRequest
 
@@ -21,7 +22,11 @@ from enterprise.decorators import disable_for_loaddata
 from enterprise.tasks import create_enterprise_enrollment
 from enterprise.utils import (
     NotConnectedToOpenEdX,
+    get_admin_notification_read_cache_key,
     get_default_catalog_content_filter,
+    invalidate_active_admin_notification_cache,
+    invalidate_best_mode_cache,
+    invalidate_identity_provider_descriptors_cache,
     unset_enterprise_learner_language,
     unset_language_of_all_enterprise_learners,
 )
@@ -45,6 +50,11 @@ except ImportError:
     COURSE_UNENROLLMENT_COMPLETED = None
     USER_RETIRE_LMS_CRITICAL = None
 
+try:
+    from common.djangoapps.course_modes.models import CourseMode
+except ImportError:
+    CourseMode = None
+
 try:
     from common.djangoapps.third_party_auth.provider import Registry
 except ImportError:
@@ -117,6 +127,16 @@ def handle_user_post_save(sender, **kwargs):  # pylint: disable=unused-argument
         # activate admin permissions for an existing EnterpriseCustomerUser(s), if applicable
         activate_admin_permissions(enterprise_customer_user)
 
+    # keep the denormalized email of the user's group memberships in sync with the user's email, skipping saves
+    # which can't change it such as the ``last_login`` update on every login
+    update_fields = kwargs.get("update_fields")
+    if update_fields is None or 'email' in update_fields:
+        models.EnterpriseGroupMembership.all_objects.filter(
+            enterprise_customer_user__user_id=user_instance.id,
+        ).exclude(
+            sortable_member_email=user_instance.email,
+        ).update(sortable_member_email=user_instance.email)
+
 
 @receiver(pre_save, sender=models.EnterpriseCustomer)
 def update_lang_pref_of_all_learners(sender, instance, **kwargs):  # pylint: disable=unused-argument
@@ -256,6 +276,16 @@ def delete_pending_enterprise_admin_user(sender, instance, **kwargs):  # pylint:
     ).delete()
 
 
+@receiver(pre_save, sender=models.EnterpriseGroupMembership)
+def update_group_membership_sortable_fields(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Keep the denormalized sortable columns of an EnterpriseGroupMembership in sync with the record being saved.
+    """
+    membership_user = instance.enterprise_customer_user or instance.pending_enterprise_customer_user
+    instance.sortable_member_email = membership_user.user_email if membership_user else None
+    instance.sortable_recent_action = instance.recent_action
+
+
 @receiver(post_save, sender=models.EnterpriseCatalogQuery)
 def update_enterprise_catalog_query(sender, instance, **kwargs):     # pylint: disable=unused-argument
     """
@@ -368,6 +398,42 @@ def delete_enterprise_catalog_data(sender, instance, **kwargs):     # pylint: di
             break
 
 
+@receiver(post_save, sender=models.AdminNotification)
+@receiver(post_delete, sender=models.AdminNotification)
+@receiver(post_save, sender=models.AdminNotificationFilter)
+@receiver(post_delete, sender=models.AdminNotificationFilter)
+@receiver(m2m_changed, sender=models.AdminNotification.admin_notification_filter.through)
+def invalidate_active_admin_notification(sender, **kwargs):     # pylint: disable=unused-argument
+    """
+    Drop the cached active admin notification snapshot when a notification or its filters change.
+    """
+    invalidate_active_admin_notification_cache()
+
+
+@receiver(post_save, sender=models.AdminNotificationRead)
+@receiver(post_delete, sender=models.AdminNotificationRead)
+def invalidate_admin_notification_read(sender, instance, **kwargs):     # pylint: disable=unused-argument
+    """
+    Drop the cached read state of the admin notification for the enterprise customer user who read it.
+    """
+    enterprise_customer_user = instance.enterprise_customer_user
+    cache.delete(get_admin_notification_read_cache_key(
+        instance.admin_notification_id,
+        instance.admin_notification.modified,
+        enterprise_customer_user.user_id,
+        enterprise_customer_user.enterprise_customer_id,
+    ))
+
+
+@receiver(post_save, sender=models.EnterpriseCustomerIdentityProvider)
+@receiver(post_delete, sender=models.EnterpriseCustomerIdentityProvider)
+def invalidate_identity_provider_descriptors(sender, instance, **kwargs):     # pylint: disable=unused-argument
+    """
+    Drop the cached identity provider descriptors of the enterprise customer whose identity providers changed.
+    """
+    invalidate_identity_provider_descriptors_cache(instance.enterprise_customer_id)
+
+
 def course_enrollment_changed_receiver(sender, **kwargs):     # pylint: disable=unused-argument
     """
     Handle when a course enrollment is (de/re)activated.
@@ -463,6 +529,21 @@ def generate_default_orchestration_record_display_name(sender, instance, **kwarg
 if CourseEnrollment is not None:
     post_save.connect(create_enterprise_enrollment_receiver, sender=CourseEnrollment)
 
+
+def invalidate_best_mode_cache_receiver(sender, instance, **kwargs):     # pylint: disable=unused-argument
+    """
+    Watches for post_save and post_delete signals on the CourseMode table.
+
+    Drop the cached best enrollment mode of the course run whose modes changed.
+    """
+    invalidate_best_mode_cache(instance.course_id)
+
+
+# Don't connect this receiver if we dont have access to CourseMode model
+if CourseMode is not None:
+    post_save.connect(invalidate_best_mode_cache_receiver, sender=CourseMode)
+    post_delete.connect(invalidate_best_mode_cache_receiver, sender=CourseMode)
+
 if COURSE_UNENROLLMENT_COMPLETED is not None:
     COURSE_UNENROLLMENT_COMPLETED.connect(enterprise_unenrollment_receiver)
 
@@ -482,11 +563,16 @@ def retire_user_from_pending_enterprise_customer_user(sender, user, retired_emai
             user.email,
             retired_email,
         )
-    models.PendingEnterpriseCustomerUser.objects.filter(
+    pending_users = models.PendingEnterpriseCustomerUser.objects.filter(
         user_email=user.email,
     ).exclude(
         user_email=retired_email,
-    ).update(user_email=retired_email)
+    )
+    pending_user_ids = list(pending_users.values_list('id', flat=True))
+    pending_users.update(user_email=retired_email)
+    models.EnterpriseGroupMembership.all_objects.filter(
+        pending_enterprise_customer_user_id__in=pending_user_ids,
+    ).update(sortable_member_email=retired_email)
 
 
 if USER_RETIRE_LMS_CRITICAL is not None:
@@ -2,10 +2,12 @@
 Django tasks.
 """
 
+from collections import defaultdict
 from datetime import timedelta
 from logging import getLogger
 
 from celery import shared_task
+from edx_django_utils.cache import TieredCache
 from edx_django_utils.monitoring import set_code_owner_attribute
 
 from django.apps import apps
@@ -16,10 +18,22 @@ from django.db import IntegrityError, transaction
 from django.db.models.functions import Lower
 
 from enterprise import constants
-from enterprise.api_client.braze import ENTERPRISE_BRAZE_ALIAS_LABEL, MAX_NUM_IDENTIFY_USERS_ALIASES, BrazeAPIClient
+from enterprise.api_client.braze import (
+    ENTERPRISE_BRAZE_ALIAS_LABEL,
+    MAX_NUM_CAMPAIGN_RECIPIENTS,
+    MAX_NUM_IDENTIFY_USERS_ALIASES,
+    BrazeAPIClient,
+)
 from enterprise.api_client.enterprise_catalog import EnterpriseCatalogApiClient
+from enterprise.cache_utils import versioned_cache_key
 from enterprise.constants import SSO_BRAZE_CAMPAIGN_ID
-from enterprise.utils import batch_dict, get_enterprise_customer, localized_utcnow, send_email_notification_message
+from enterprise.utils import (
+    batch,
+    batch_dict,
+    get_enterprise_customer,
+    localized_utcnow,
+    send_email_notification_message,
+)
 
 LOGGER = getLogger(__name__)
 User = get_user_model()
@@ -638,75 +652,140 @@ def send_enterprise_admin_invite_reminders():
     return {'processed': len(candidate_invite_ids), **counters}
 
 
-def _recipients_for_identified_users(
-    user_id_by_email,
-    maximum_aliases_per_batch=MAX_NUM_IDENTIFY_USERS_ALIASES,
-    alias_label=ENTERPRISE_BRAZE_ALIAS_LABEL
-):
+GROUP_MEMBERSHIP_CATALOG_CONTENT_COUNT_CACHE_TIMEOUT = 60 * 60
+
+
+def _get_group_membership_catalog_content_count(catalog_uuid, invitation_run_id=None):
     """
-    Helper function for create_recipients that takes a dictionary of user_email keys and
-    user_id values, batches them in groups of the maximum number of users alias based
-    on the braze documentation, and destructures the individual recipient values from
-    recipients_by_email and returns a list of recipients.
+    Return the content count of a catalog, fetched at most once per catalog and group invitation/removal run.
 
-    Arguments:
-        * user_id_by_email (dict): A dictionary of user_email key and user_id values
-        * maximum_aliases_per_batch (int):  An integer denoting the max allowable aliases to identify
-                                            per create_recipients call to braze.
-                                            Default is MAX_NUM_IDENTIFY_USERS_ALIASES
-        * alias_label (string): A string denoting the alias label requried by braze.
-                                Default is ENTERPRISE_BRAZE_ALIAS_LABEL
-
-    Return:
-        * recipients (list): A list of dictionary recipients
-
-    Example:
-        Input:
-        user_id_by_email = {
-        'test@gmail.com': 12345
-        }
-        maximum_aliases_per_batch: 50
-        alias_label: Titans
-        Output: [
-            {
-                'external_user_id: 12345,
-                'attributes: {
-                    'user_alias': {
-                        'external_id': 12345,
-                        'alias_label': 'Titans'
-                    },
-                },
-            },
-        ]
+    ``assign_learners`` and ``remove_learners`` fan out into one notification task per batch of memberships, all
+    of which share the same catalog, so the count is cached under the run identifier shared by those tasks.
+    Without a run identifier the count is always fetched.
     """
-    braze_client_instance = BrazeAPIClient()
-    recipients = []
-    LOGGER.info(
-        '_recipients_for_identified_users_1: user_id_by_email: {%s}, '
-        'maximum_aliases_per_batch: {%s}, alias_label: {%s} ',
-        user_id_by_email,
-        maximum_aliases_per_batch,
-        alias_label
+    if invitation_run_id is None:
+        return EnterpriseCatalogApiClient().get_catalog_content_count(catalog_uuid)
+
+    cache_key = versioned_cache_key('group_membership_catalog_content_count', catalog_uuid, invitation_run_id)
+    cached_response = TieredCache.get_cached_response(cache_key)
+    if cached_response.is_found:
+        return cached_response.value
+
+    catalog_content_count = EnterpriseCatalogApiClient().get_catalog_content_count(catalog_uuid)
+    TieredCache.set_all_tiers(cache_key, catalog_content_count, GROUP_MEMBERSHIP_CATALOG_CONTENT_COUNT_CACHE_TIMEOUT)
+    return catalog_content_count
+
+
+def _get_group_membership_recipients(braze_client_instance, membership_records):
+    """
+    Resolve the Braze recipients of the given group membership records.
+
+    Memberships are loaded along with their (pending) enterprise customer users in one query, and the emails of
+    the linked users in a second one, instead of two ``User`` lookups per realized member.
+
+    Returns:
+        * recipients_by_email (dict): Braze recipient payloads keyed by member email, pending members first.
+        * membership_uuids_by_email (dict): The uuids of the membership records associated with each email.
+    """
+    memberships = list(
+        membership_records.select_related('enterprise_customer_user', 'pending_enterprise_customer_user')
     )
-    for user_id_by_email_chunk in batch_dict(user_id_by_email, maximum_aliases_per_batch):
-        LOGGER.info(
-            '_recipients_for_identified_users_2: user_id_by_email_chunk: {%s} ',
-            user_id_by_email_chunk
-        )
-        recipients_by_email = braze_client_instance.create_recipients(
-            alias_label,
-            user_id_by_email=user_id_by_email_chunk
+    email_by_user_id = dict(
+        User.objects.filter(
+            id__in=[
+                membership.enterprise_customer_user.user_id
+                for membership in memberships
+                if membership.pending_enterprise_customer_user is None and membership.enterprise_customer_user
+            ],
+        ).values_list('id', 'email')
+    )
+
+    pecu_emails = []
+    user_id_by_email = {}
+    membership_uuids_by_email = defaultdict(list)
+    for group_membership in memberships:
+        if group_membership.pending_enterprise_customer_user is not None:
+            member_email = group_membership.pending_enterprise_customer_user.user_email
+            pecu_emails.append(member_email)
+        elif group_membership.enterprise_customer_user is not None:
+            user_id = group_membership.enterprise_customer_user.user_id
+            member_email = email_by_user_id.get(user_id)
+            if member_email is None:
+                continue
+            user_id_by_email[member_email] = user_id
+        else:
+            continue
+        membership_uuids_by_email[member_email].append(group_membership.uuid)
+
+    recipients_by_email = {
+        pecu_email: braze_client_instance.create_recipient_no_external_id(pecu_email)
+        for pecu_email in pecu_emails
+    }
+    if pecu_emails:
+        braze_client_instance.create_braze_alias(
+            pecu_emails,
+            ENTERPRISE_BRAZE_ALIAS_LABEL,
         )
-        LOGGER.info(
-            '_recipients_for_identified_users_3: recipients_by_email: {%s} ',
-            recipients_by_email
+    for user_id_by_email_chunk in batch_dict(user_id_by_email, MAX_NUM_IDENTIFY_USERS_ALIASES):
+        recipients_by_email.update(
+            braze_client_instance.create_recipients(
+                ENTERPRISE_BRAZE_ALIAS_LABEL,
+                user_id_by_email=user_id_by_email_chunk,
+            )
         )
-        recipients.extend(recipients_by_email.values())
+    return recipients_by_email, membership_uuids_by_email
+
+
+def _send_group_membership_campaign(
+    braze_client_instance,
+    campaign_id,
+    membership_records,
+    trigger_properties,
+    error_message,
+):
+    """
+    Send a Braze campaign to the members of the given group membership records.
+
+    Recipients are sent in the largest batches Braze accepts. Memberships whose batch could not be sent are
+    marked as errored, and the last Braze error is re-raised once every batch has been attempted.
+    """
+    recipients_by_email, membership_uuids_by_email = _get_group_membership_recipients(
+        braze_client_instance,
+        membership_records,
+    )
     LOGGER.info(
-        '_recipients_for_identified_users_4: recipients: {%s} ',
-        recipients
+        '_send_group_membership_campaign: campaign_id: {%s}, recipients: {%s} ',
+        campaign_id,
+        list(recipients_by_email.values()),
     )
-    return recipients
+    errored_membership_uuids = []
+    braze_error = None
+    for email_batch in batch(list(recipients_by_email), batch_size=MAX_NUM_CAMPAIGN_RECIPIENTS):
+        recipients = [recipients_by_email[email] for email in email_batch]
+        try:
+            braze_client_instance.send_campaign_message(
+                campaign_id,
+                recipients=recipients,
+                trigger_properties=trigger_properties,
+            )
+        except BrazeClientError as exc:
+            LOGGER.exception(f"{error_message} Recipients: {recipients}.")
+            errored_membership_uuids.extend(
+                membership_uuid
+                for email in email_batch
+                for membership_uuid in membership_uuids_by_email.get(email, [])
+            )
+            braze_error = exc
+
+    if braze_error is not None:
+        errored_memberships = enterprise_group_membership_model().all_objects.filter(
+            uuid__in=errored_membership_uuids,
+        )
+        errored_memberships.update(
+            status=constants.GROUP_MEMBERSHIP_EMAIL_ERROR_STATUS,
+            errored_at=localized_utcnow())
+        enterprise_group_membership_model().refresh_sortable_fields(errored_memberships)
+        raise braze_error
 
 
 @shared_task
@@ -715,7 +794,8 @@ def send_group_membership_invitation_notification(
     enterprise_customer_uuid,
     membership_uuids,
     act_by_date,
-    catalog_uuid
+    catalog_uuid,
+    invitation_run_id=None,
 ):
     """
     Send braze email notification when member is invited to a group.
@@ -725,138 +805,63 @@ def send_group_membership_invitation_notification(
         * memberships (list)
         * act_by_date (datetime)
         * catalog_uuid (string)
+        * invitation_run_id (string): Identifier shared by the tasks of a single invitation request, used to fetch
+          the catalog content count once for the whole request.
     """
     enterprise_customer = get_enterprise_customer(enterprise_customer_uuid)
     braze_client_instance = BrazeAPIClient()
-    enterprise_catalog_client = EnterpriseCatalogApiClient()
     braze_trigger_properties = {}
     contact_email = enterprise_customer.contact_email
     enterprise_customer_name = enterprise_customer.name
     braze_trigger_properties['contact_admin_link'] = braze_client_instance.generate_mailto_link(contact_email)
     braze_trigger_properties['enterprise_customer_name'] = enterprise_customer_name
-    braze_trigger_properties[
-        'catalog_content_count'
-    ] = enterprise_catalog_client.get_catalog_content_count(catalog_uuid)
+    braze_trigger_properties['catalog_content_count'] = _get_group_membership_catalog_content_count(
+        catalog_uuid,
+        invitation_run_id,
+    )
 
     braze_trigger_properties['act_by_date'] = act_by_date.strftime('%B %d, %Y')
-    pecu_emails = []
-    user_id_by_email = {}
-    membership_records = enterprise_group_membership_model().objects.filter(uuid__in=membership_uuids)
-    for group_membership in membership_records:
-        if group_membership.pending_enterprise_customer_user is not None:
-            pecu_emails.append(group_membership.pending_enterprise_customer_user.user_email)
-        else:
-            LOGGER.info(
-                'send_group_membership_invitation_notification_1: user_email: {%s}, user_id: {%s} ',
-                group_membership.enterprise_customer_user.user_email,
-                group_membership.enterprise_customer_user.user_id
-            )
-            user_id_by_email[
-                group_membership.enterprise_customer_user.user_email
-            ] = group_membership.enterprise_customer_user.user_id
-    recipients = []
-    for pecu_email in pecu_emails:
-        recipients.append(braze_client_instance.create_recipient_no_external_id(pecu_email))
-    if pecu_emails:
-        braze_client_instance.create_braze_alias(
-            pecu_emails,
-            ENTERPRISE_BRAZE_ALIAS_LABEL,
-        )
-    LOGGER.info(
-        'send_group_membership_invitation_notification_2: user_id_by_email: {%s} ',
-        user_id_by_email,
+    _send_group_membership_campaign(
+        braze_client_instance,
+        settings.BRAZE_GROUPS_INVITATION_EMAIL_CAMPAIGN_ID,
+        enterprise_group_membership_model().objects.filter(uuid__in=membership_uuids),
+        braze_trigger_properties,
+        f"Groups learner invitation email could not be sent for enterprise {enterprise_customer_name}.",
     )
-    recipients.extend(_recipients_for_identified_users(user_id_by_email))
-    LOGGER.info(
-        'send_group_membership_invitation_notification_3: recipients: {%s} ',
-        recipients
-    )
-    try:
-        braze_client_instance.send_campaign_message(
-            settings.BRAZE_GROUPS_INVITATION_EMAIL_CAMPAIGN_ID,
-            recipients=recipients,
-            trigger_properties=braze_trigger_properties,
-        )
-    except BrazeClientError as exc:
-        message = (
-            "Groups learner invitation email could not be sent "
-            f"to {recipients} for enterprise {enterprise_customer_name}."
-        )
-        membership_records.update(
-            status=constants.GROUP_MEMBERSHIP_EMAIL_ERROR_STATUS,
-            errored_at=localized_utcnow())
-        LOGGER.exception(message)
-        raise exc
 
 
 @shared_task
 @set_code_owner_attribute
-def send_group_membership_removal_notification(enterprise_customer_uuid, membership_uuids, catalog_uuid):
+def send_group_membership_removal_notification(
+    enterprise_customer_uuid,
+    membership_uuids,
+    catalog_uuid,
+    invitation_run_id=None,
+):
     """
     Send braze email notification when learner is removed from a group.
 
     Arguments:
         * enterprise_customer_uuid (string)
         * group_membership_uuid (string)
+        * invitation_run_id (string): Identifier shared by the tasks of a single removal request, used to fetch
+          the catalog content count once for the whole request.
     """
     enterprise_customer = get_enterprise_customer(enterprise_customer_uuid)
     braze_client_instance = BrazeAPIClient()
-    enterprise_catalog_client = EnterpriseCatalogApiClient()
     braze_trigger_properties = {}
     contact_email = enterprise_customer.contact_email
     enterprise_customer_name = enterprise_customer.name
     braze_trigger_properties['contact_admin_link'] = braze_client_instance.generate_mailto_link(contact_email)
     braze_trigger_properties['enterprise_customer_name'] = enterprise_customer_name
-    braze_trigger_properties[
-        'catalog_content_count'
-    ] = enterprise_catalog_client.get_catalog_content_count(catalog_uuid)
-    pecu_emails = []
-    user_id_by_email = {}
-    membership_records = enterprise_group_membership_model().all_objects.filter(uuid__in=membership_uuids)
-    for group_membership in membership_records:
-        if group_membership.pending_enterprise_customer_user is not None:
-            pecu_emails.append(group_membership.pending_enterprise_customer_user.user_email)
-        else:
-            LOGGER.info(
-                'send_group_membership_removal_notification_1: user_email: {%s}, user_id: {%s} ',
-                group_membership.enterprise_customer_user.user_email,
-                group_membership.enterprise_customer_user.user_id
-            )
-            user_id_by_email[
-                group_membership.enterprise_customer_user.user_email
-            ] = group_membership.enterprise_customer_user.user_id
-
-    recipients = []
-
-    for pecu_email in pecu_emails:
-        recipients.append(braze_client_instance.create_recipient_no_external_id(pecu_email))
-    if pecu_emails:
-        braze_client_instance.create_braze_alias(
-            pecu_emails,
-            ENTERPRISE_BRAZE_ALIAS_LABEL,
-        )
-    LOGGER.info(
-        'send_group_membership_invitation_notification_2: user_id_by_email: {%s} ',
-        user_id_by_email,
+    braze_trigger_properties['catalog_content_count'] = _get_group_membership_catalog_content_count(
+        catalog_uuid,
+        invitation_run_id,
     )
-    recipients.extend(_recipients_for_identified_users(user_id_by_email))
-    LOGGER.info(
-        'send_group_membership_removal_notification_3: recipients: {%s} ',
-        recipients
+    _send_group_membership_campaign(
+        braze_client_instance,
+        settings.BRAZE_GROUPS_REMOVAL_EMAIL_CAMPAIGN_ID,
+        enterprise_group_membership_model().all_objects.filter(uuid__in=membership_uuids),
+        braze_trigger_properties,
+        f"Groups learner removal email could not be sent for enterprise {enterprise_customer_name}.",
     )
-    try:
-        braze_client_instance.send_campaign_message(
-            settings.BRAZE_GROUPS_REMOVAL_EMAIL_CAMPAIGN_ID,
-            recipients=recipients,
-            trigger_properties=braze_trigger_properties,
-        )
-    except BrazeClientError as exc:
-        message = (
-            "Groups learner removal email could not be sent "
-            f"to {recipients} for enterprise {enterprise_customer_name}."
-        )
-        membership_records.update(
-            status=constants.GROUP_MEMBERSHIP_EMAIL_ERROR_STATUS,
-            errored_at=localized_utcnow())
-        LOGGER.exception(message)
-        raise exc
@@ -4,9 +4,11 @@ Module provides elements to be used in third-party auth pipeline.
 
 import logging
 import re
+from collections import namedtuple
 from datetime import datetime
 from logging import getLogger
 
+from edx_django_utils.cache import TieredCache
 from social_core.pipeline.partial import partial
 from social_core.pipeline.social_auth import associate_by_email
 from social_django.models import UserSocialAuth
@@ -15,7 +17,13 @@ from django.conf import settings
 from django.urls import reverse
 
 from enterprise.models import EnterpriseCustomer, EnterpriseCustomerIdentityProvider, EnterpriseCustomerUser
-from enterprise.utils import get_identity_provider, get_social_auth_from_idp, get_user_from_email
+from enterprise.utils import (
+    IDENTITY_PROVIDER_DESCRIPTORS_CACHE_TIMEOUT,
+    get_identity_provider,
+    get_identity_provider_descriptors_cache_key,
+    get_social_auth_from_idp,
+    get_user_from_email,
+)
 
 try:
     from common.djangoapps.third_party_auth.provider import Registry
@@ -27,6 +35,8 @@ except ImportError:
 LOGGER = getLogger(__name__)
 log = logging.getLogger(__name__)
 
+IdentityProviderDescriptor = namedtuple('IdentityProviderDescriptor', ['backend_name', 'provider_slug', 'is_default'])
+
 
 def _is_enterprise_customer_user(provider_id, user):
     """
@@ -209,6 +219,47 @@ def handle_enterprise_logistration(backend, user, **kwargs):
     enterprise_customer_user.update_session(request)
 
 
+def _get_identity_provider_descriptor(provider_id, is_default=False):
+    """
+    Return the descriptor of the third party auth provider with the given id, or None if it is not registered.
+    """
+    tpa_provider = get_identity_provider(provider_id)
+    if not tpa_provider:
+        return None
+    # We attach the auth type to the slug at some point in this flow,
+    # so to match the original slug, we need to chop off that backend name.
+    # We only use saml here, so we are removing the first 5 characters, ie 'saml-'
+    return IdentityProviderDescriptor(tpa_provider.backend_name, tpa_provider.provider_id[5:], is_default)
+
+
+def get_identity_provider_descriptors(enterprise_customer):
+    """
+    Return the backend name, social auth uid prefix and default flag of each identity provider of the enterprise.
+
+    Descriptors are cached per enterprise customer for ``ENTERPRISE_IDENTITY_PROVIDER_DESCRIPTORS_CACHE_TIMEOUT``
+    seconds, and dropped whenever one of its identity providers changes, so social auth lookups do not go through
+    the third party auth registry for every learner.
+
+    Arguments:
+        enterprise_customer (EnterpriseCustomer): Instance of the enterprise customer.
+
+    Returns:
+        dict: ``IdentityProviderDescriptor`` keyed by provider id, leaving out the providers not registered.
+    """
+    cache_key = get_identity_provider_descriptors_cache_key(enterprise_customer.uuid)
+    cached_response = TieredCache.get_cached_response(cache_key)
+    if cached_response.is_found:
+        return cached_response.value
+
+    descriptors = {}
+    for idp in enterprise_customer.identity_providers:
+        descriptor = _get_identity_provider_descriptor(idp.provider_id, idp.default_provider)
+        if descriptor:
+            descriptors[idp.provider_id] = descriptor
+    TieredCache.set_all_tiers(cache_key, descriptors, IDENTITY_PROVIDER_DESCRIPTORS_CACHE_TIMEOUT)
+    return descriptors
+
+
 def get_user_from_social_auth(tpa_providers, user_id, enterprise_customer):
     """
     Find the LMS user from the LMS model `UserSocialAuth`.
@@ -219,29 +270,59 @@ def get_user_from_social_auth(tpa_providers, user_id, enterprise_customer):
         enterprise_customer (EnterpriseCustomer): Instance of the enterprise customer.
 
     """
-    # Give the priority to default IDP of given enterprise when getting social auth entry of user. If found then
-    # return it otherwise check social auth entry with other connected IDP's of enterprise.
-    default_idp_user_social_auth = get_default_idp_user_social_auth(enterprise_customer, user_idp_id=user_id)
-    if default_idp_user_social_auth:
-        return default_idp_user_social_auth.user
-    providers_backend_names = []
-    social_auth_uids = []
-    for idp in tpa_providers:
-        tpa_provider = get_identity_provider(idp.provider_id)
-        # We attach the auth type to the slug at some point in this flow,
-        # so to match the original slug, we need to chop off that backend name.
-        # We only use saml here, so we are removing the first 5 characters, ie 'saml-'
-        provider_slug = tpa_provider.provider_id[5:]
-        social_auth_uid = '{}:{}'.format(provider_slug, user_id)
-        providers_backend_names.append(tpa_provider.backend_name)
-        social_auth_uids.append(social_auth_uid)
+    return get_users_from_social_auth(tpa_providers, [user_id], enterprise_customer).get(str(user_id))
+
+
+def get_users_from_social_auth(tpa_providers, user_ids, enterprise_customer):
+    """
+    Find the LMS users of many third party LMS user ids from the LMS model `UserSocialAuth` with a single query.
+
+    The social auth entry of the enterprise default IDP is given the priority, otherwise the entry of any other
+    connected IDP is used.
+
+    Arguments:
+        tpa_providers (third_party_auth.provider): list of third party auth provider objects, or None to use all the
+            identity providers of the enterprise customer
+        user_ids (iterable): User ids of users in third party LMS
+        enterprise_customer (EnterpriseCustomer): Instance of the enterprise customer.
+
+    Returns:
+        dict: LMS users keyed by the third party LMS user ids which have a social auth entry.
+    """
+    user_ids = {str(user_id) for user_id in user_ids}
+    descriptors = get_identity_provider_descriptors(enterprise_customer)
+    if tpa_providers is None:
+        idp_descriptors = list(descriptors.values())
+    else:
+        idp_descriptors = [descriptor for descriptor in descriptors.values() if descriptor.is_default] + [
+            descriptors.get(idp.provider_id) or _get_identity_provider_descriptor(idp.provider_id)
+            for idp in tpa_providers
+        ]
+    # map the (backend name, provider slug) of each IDP to whether it is the default one
+    providers = {}
+    for descriptor in filter(None, idp_descriptors):
+        provider_key = (descriptor.backend_name, descriptor.provider_slug)
+        providers[provider_key] = providers.get(provider_key, False) or descriptor.is_default
+    if not providers or not user_ids:
+        return {}
+
     # we are filtering by both `provider` and `uid` to make use of provider,uid composite index
     # filtering only on `uid` makes query extremely slow since we don't have index on `uid`
-    user_social_auth = UserSocialAuth.objects.select_related('user').filter(
-        provider__in=providers_backend_names, uid__in=social_auth_uids
-    ).first()
-
-    return user_social_auth.user if user_social_auth else None
+    user_social_auths = UserSocialAuth.objects.select_related('user').filter(
+        provider__in={backend_name for backend_name, __ in providers},
+        uid__in={f'{provider_slug}:{user_id}' for __, provider_slug in providers for user_id in user_ids},
+    )
+    users, default_idp_user_ids = {}, set()
+    for user_social_auth in user_social_auths:
+        provider_slug, __, user_id = user_social_auth.uid.partition(':')
+        is_default_idp = providers.get((user_social_auth.provider, provider_slug))
+        if is_default_idp is None or user_id not in user_ids or user_id in default_idp_user_ids:
+            continue
+        if is_default_idp or user_id not in users:
+            users[user_id] = user_social_auth.user
+        if is_default_idp:
+            default_idp_user_ids.add(user_id)
+    return users
 
 
 def get_user_social_auth(user, enterprise_customer):
@@ -253,17 +334,23 @@ def get_user_social_auth(user, enterprise_customer):
         enterprise_customer (EnterpriseCustomer): Instance of the enterprise customer.
 
     """
+    descriptors = list(get_identity_provider_descriptors(enterprise_customer).values())
+    if not descriptors:
+        return None
+    user_social_auths = UserSocialAuth.objects.filter(
+        provider__in={descriptor.backend_name for descriptor in descriptors}, user=user
+    )
     # Give the priority to default IDP of given enterprise when getting social auth entry of user. If found then
-    # return it otherwise check social auth entry with other connected IDP's of enterprise.
-    default_idp_user_social_auth = get_default_idp_user_social_auth(enterprise_customer, user=user)
-    if default_idp_user_social_auth:
-        return default_idp_user_social_auth
-    provider_backend_names = []
-    for idp in enterprise_customer.identity_providers:
-        tpa_provider = get_identity_provider(idp.provider_id)
-        provider_backend_names.append(tpa_provider.backend_name)
-    user_social_auth = UserSocialAuth.objects.filter(provider__in=provider_backend_names, user=user).first()
-
+    # return it otherwise return the social auth entry with other connected IDP's of enterprise.
+    default_idp = next((descriptor for descriptor in descriptors if descriptor.is_default), None)
+    user_social_auth = None
+    for candidate in user_social_auths:
+        if (
+            default_idp and candidate.provider == default_idp.backend_name and
+            default_idp.provider_slug in candidate.uid
+        ):
+            return candidate
+        user_social_auth = user_social_auth or candidate
     return user_social_auth
 
 
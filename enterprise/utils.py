@@ -13,7 +13,7 @@ import hashlib
 import json
 import os
 import re
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 from functools import reduce
 from itertools import islice
 from typing import TYPE_CHECKING
@@ -32,6 +32,7 @@ from django.conf import settings
 from django.contrib import auth
 from django.contrib.auth.models import AbstractUser
 from django.core import mail
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.core.validators import validate_email
 from django.db import utils
@@ -41,6 +42,7 @@ from django.forms.models import model_to_dict
 from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 from django.utils.html import format_html
 from django.utils.text import slugify
@@ -115,6 +117,12 @@ except ImportError:
 SELF_ENROLL_EMAIL_TEMPLATE_TYPE = 'SELF_ENROLL'
 ADMIN_ENROLL_EMAIL_TEMPLATE_TYPE = 'ADMIN_ENROLL'
 
+COURSE_MODES_CACHE_TIMEOUT = getattr(settings, 'ENTERPRISE_COURSE_MODES_CACHE_TIMEOUT', 60 * 60)
+ADMIN_NOTIFICATION_CACHE_TIMEOUT = getattr(settings, 'ENTERPRISE_ADMIN_NOTIFICATION_CACHE_TIMEOUT', 60 * 60)
+IDENTITY_PROVIDER_DESCRIPTORS_CACHE_TIMEOUT = getattr(
+    settings, 'ENTERPRISE_IDENTITY_PROVIDER_DESCRIPTORS_CACHE_TIMEOUT', 60 * 5
+)
+
 LOGGER = getEnterpriseLogger(__name__)
 
 User = auth.get_user_model()
@@ -264,6 +272,23 @@ def get_social_auth_from_idp(idp, user=None, user_idp_id=None):
     return None
 
 
+def get_identity_provider_descriptors_cache_key(enterprise_customer_uuid):
+    """
+    Return the cache key holding the identity provider descriptors of the given enterprise customer.
+    """
+    return get_cache_key(
+        resource='identity_provider_descriptors',
+        enterprise_customer_uuid=str(enterprise_customer_uuid),
+    )
+
+
+def invalidate_identity_provider_descriptors_cache(enterprise_customer_uuid):
+    """
+    Drop the cached identity provider descriptors of the enterprise customer, e.g. after one of its IDPs changed.
+    """
+    TieredCache.delete_all_tiers(get_identity_provider_descriptors_cache_key(enterprise_customer_uuid))
+
+
 def get_user_valid_idp(user, enterprise_customer):
     """
     Return the default idp if it has user social auth record else it
@@ -1679,7 +1704,14 @@ def delete_data_sharing_consent(course_id, customer_uuid, user_email):
     TieredCache.delete_all_tiers(consent_cache_key)
 
 
-def validate_email_to_link(email, enterprise_customer, raw_email=None, message_template=None, raise_exception=True):
+def validate_email_to_link(
+        email,
+        enterprise_customer,
+        raw_email=None,
+        message_template=None,
+        raise_exception=True,
+        existing_links=None,
+):
     """
     Validate email to be linked to Enterprise Customer.
 
@@ -1693,6 +1725,7 @@ def validate_email_to_link(email, enterprise_customer, raw_email=None, message_t
         raw_email (str): raw value as it was passed by user - used in error message.
         message_template (str): Validation error template string.
         raise_exception (bool): whether to raise an exception when an email is invalidated
+        existing_links (dict): links of many emails already retrieved with ``get_links_by_emails``, if any
 
     Raises:
         ValidationError: if email is invalid or already linked to Enterprise Customer.
@@ -1707,7 +1740,10 @@ def validate_email_to_link(email, enterprise_customer, raw_email=None, message_t
     except ValidationError as validation_error:
         raise ValidationError(message_template.format(argument=raw_email)) from validation_error
 
-    existing_record = enterprise_customer_user_model().objects.get_link_by_email(email, enterprise_customer)
+    if existing_links is not None:
+        existing_record = existing_links.get(email)
+    else:
+        existing_record = enterprise_customer_user_model().objects.get_link_by_email(email, enterprise_customer)
     if existing_record and raise_exception:
         raise ValidationError(ValidationMessages.USER_ALREADY_REGISTERED.format(
             email=email, ec_name=existing_record.enterprise_customer.name
@@ -1801,6 +1837,8 @@ def enroll_user(enterprise_customer, user, course_mode, *course_ids, **kwargs):
         course_mode: The string representation of the mode with which the enrollment should be created
         *course_ids: An iterable containing any number of course IDs to eventually enroll the user in.
         kwargs: Should contain enrollment_client if it's already been instantiated and should be passed in.
+            May also contain the user's enterprise_customer_user and the enrollment_source to record,
+            when the caller already looked them up.
 
     Returns:
         Boolean: Whether or not enrollment succeeded for all courses specified
@@ -1809,10 +1847,18 @@ def enroll_user(enterprise_customer, user, course_mode, *course_ids, **kwargs):
     if not enrollment_client:
         from enterprise.api_client.lms import EnrollmentApiClient  # pylint: disable=import-outside-toplevel
         enrollment_client = EnrollmentApiClient()
-    enterprise_customer_user, __ = enterprise_customer_user_model().objects.get_or_create(
-        enterprise_customer=enterprise_customer,
-        user_id=user.id
-    )
+    enterprise_customer_user = kwargs.pop('enterprise_customer_user', None)
+    if not enterprise_customer_user:
+        enterprise_customer_user, __ = enterprise_customer_user_model().objects.get_or_create(
+            enterprise_customer=enterprise_customer,
+            user_id=user.id
+        )
+    if 'enrollment_source' in kwargs:
+        enrollment_source = kwargs.pop('enrollment_source')
+    else:
+        enrollment_source = enterprise_enrollment_source_model().get_source(
+            enterprise_enrollment_source_model().MANUAL
+        )
     succeeded = True
     for course_id in course_ids:
         try:
@@ -1820,7 +1866,7 @@ def enroll_user(enterprise_customer, user, course_mode, *course_ids, **kwargs):
                 user.username,
                 course_id,
                 course_mode,
-                enterprise_uuid=str(enterprise_customer_user.enterprise_customer.uuid)
+                enterprise_uuid=str(enterprise_customer.uuid)
             )
         except HttpClientError as exc:
             # Check if user is already enrolled then we should ignore exception
@@ -1841,11 +1887,7 @@ def enroll_user(enterprise_customer, user, course_mode, *course_ids, **kwargs):
             __, created = enterprise_course_enrollment_model().objects.get_or_create(
                 enterprise_customer_user=enterprise_customer_user,
                 course_id=course_id,
-                defaults={
-                    'source': enterprise_enrollment_source_model().get_source(
-                        enterprise_enrollment_source_model().MANUAL
-                    )
-                }
+                defaults={'source': enrollment_source}
             )
             if created:
                 track_enrollment('admin-enrollment', user.id, course_id)
@@ -2256,14 +2298,38 @@ def enroll_users_in_course(
 
         failures: A list of users who could not be enrolled in the course.
     """
+    from enterprise.api_client.lms import EnrollmentApiClient  # pylint: disable=import-outside-toplevel
+
     existing_users, unregistered_emails = get_users_by_email(emails)
 
     successes = []
     pending = []
     failures = []
 
+    # The LMS enrollment API enrolls one learner per request, so share a single client and look up
+    # the enterprise customer users and the enrollment source once for all the learners.
+    enrollment_client = EnrollmentApiClient()
+    enrollment_source = enterprise_enrollment_source_model().get_source(
+        enterprise_enrollment_source_model().MANUAL
+    )
+    enterprise_customer_users = {
+        enterprise_customer_user.user_id: enterprise_customer_user
+        for enterprise_customer_user in enterprise_customer_user_model().objects.filter(
+            enterprise_customer=enterprise_customer,
+            user_id__in=[user.id for user in existing_users],
+        )
+    }
+
     for user in existing_users:
-        succeeded = enroll_user(enterprise_customer, user, course_mode, course_id)
+        succeeded = enroll_user(
+            enterprise_customer,
+            user,
+            course_mode,
+            course_id,
+            enrollment_client=enrollment_client,
+            enterprise_customer_user=enterprise_customer_users.get(user.id),
+            enrollment_source=enrollment_source,
+        )
         if succeeded:
             successes.append(user)
             if enrollment_requester and enrollment_reason:
@@ -2366,6 +2432,25 @@ def unset_enterprise_learner_language(enterprise_customer_user):
         )
 
 
+def unset_enterprise_learners_language(user_ids):
+    """
+    Unset the language preference of the given enterprise learners, with a fixed number of queries.
+
+    Arguments:
+        user_ids (list): ids of the learners' users.
+    """
+    if UserPreference:
+        users_with_preference = set(UserPreference.objects.filter(
+            key=LANGUAGE_KEY,
+            user_id__in=user_ids,
+        ).values_list('user_id', flat=True))
+        UserPreference.objects.filter(key=LANGUAGE_KEY, user_id__in=users_with_preference).update(value='')
+        UserPreference.objects.bulk_create([
+            UserPreference(key=LANGUAGE_KEY, user_id=user_id, value='')
+            for user_id in set(user_ids) - users_with_preference
+        ])
+
+
 def validate_course_exists_for_enterprise(enterprise_customer, course_id, **kwargs):
     """
     Validates that a specified course id exists within the LMS and within the enterprise_customer's catalog(s).
@@ -2421,15 +2506,93 @@ def batch_dict(dict_data, chunk_size=1):
         yield dict(islice(it, chunk_size))
 
 
+def get_best_mode_cache_key(course_key):
+    """
+    Return the cache key holding the best mode to enroll an enterprise learner in for the given course run.
+    """
+    return get_cache_key(resource='best_course_mode', course_key=str(course_key))
+
+
+def invalidate_best_mode_cache(course_key):
+    """
+    Drop the cached best mode of the given course run, e.g. after one of its course modes changed.
+    """
+    TieredCache.delete_all_tiers(get_best_mode_cache_key(course_key))
+
+
+def get_best_modes(course_keys):
+    """
+    Select the course mode most applicable to enroll an enterprise learner in for each of the given course runs.
+
+    Best modes are cached per course run for ``ENTERPRISE_COURSE_MODES_CACHE_TIMEOUT`` seconds and the course modes
+    of all the runs missing from the cache are fetched in a single query.
+
+    Arguments:
+        course_keys (iterable): Course run keys to resolve the best mode of.
+
+    Returns:
+        (dict): Best course mode slug keyed by course run key.
+    """
+    best_modes = {}
+    uncached_course_keys = []
+    for course_key in dict.fromkeys(course_keys):
+        cached_response = TieredCache.get_cached_response(get_best_mode_cache_key(course_key))
+        if cached_response.is_found:
+            best_modes[course_key] = cached_response.value
+        else:
+            uncached_course_keys.append(course_key)
+
+    if uncached_course_keys:
+        course_modes = defaultdict(set)
+        for mode in CourseMode.objects.filter(course_id__in=uncached_course_keys):
+            course_modes[str(mode.course_id)].add(mode.slug)
+
+        for course_key in uncached_course_keys:
+            best_modes[course_key] = next(
+                (mode for mode in COURSE_MODE_SORT_ORDER if mode in course_modes[str(course_key)]),
+                CourseModes.AUDIT,
+            )
+            TieredCache.set_all_tiers(
+                get_best_mode_cache_key(course_key), best_modes[course_key], COURSE_MODES_CACHE_TIMEOUT
+            )
+
+    return best_modes
+
+
 def get_best_mode_from_course_key(course_key):
     """
     Helper method to retrieve a list of enrollments for a given course and select the one most applicable to enroll an
     enterprise learner in.
     """
-    course_modes = [mode.slug for mode in CourseMode.objects.filter(course_id=course_key)]
-    if best_mode := [mode for mode in COURSE_MODE_SORT_ORDER if mode in course_modes]:
-        return best_mode[0]
-    return CourseModes.AUDIT
+    return get_best_modes([course_key])[course_key]
+
+
+def get_active_admin_notification_cache_key(today=None):
+    """
+    Return the cache key holding the snapshot of the admin notification active on the given (or current) date.
+    """
+    return get_cache_key(resource='active_admin_notification', date=str(today or timezone.localdate()))
+
+
+def invalidate_active_admin_notification_cache():
+    """
+    Drop the cached snapshot of the active admin notification, e.g. after a notification or its filters changed.
+    """
+    cache.delete(get_active_admin_notification_cache_key())
+
+
+def get_admin_notification_read_cache_key(admin_notification_id, admin_notification_modified, user_id,
+                                          enterprise_customer_uuid):
+    """
+    Return the cache key holding whether the user read the admin notification for the given enterprise customer.
+    """
+    return get_cache_key(
+        resource='admin_notification_read',
+        admin_notification_id=admin_notification_id,
+        admin_notification_modified=str(admin_notification_modified),
+        user_id=user_id,
+        enterprise_customer_uuid=str(enterprise_customer_uuid),
+    )
 
 
 def parse_lms_api_datetime(datetime_string, datetime_format=LMS_API_DATETIME_FORMAT):
@@ -2603,23 +2766,42 @@ def get_integrations_for_customers(customer_uuid):
     Returns:
         list: a list of integrations.
     """
-    unique_integrations = []
+    integrations_by_customer_uuid = get_integrations_for_customers_in_bulk([customer_uuid])
+    return next(iter(integrations_by_customer_uuid.values()), [])
+
+
+def get_integrations_for_customers_in_bulk(customer_uuids):
+    """
+    Helper method to return active integrations code for many enterprise customers, with one query per channel.
+
+    Arguments:
+        customer_uuids (list): uuids of enterprise customers
+    Returns:
+        dict: lists of integrations keyed by enterprise customer uuid, only for customers with integrations.
+    """
+    integrations_by_customer_uuid = OrderedDict()
     # This is a temporary change while we transition from integrated_channels to channel_integrations
     if getattr(settings, 'ENABLE_LEGACY_INTEGRATED_CHANNELS', True):
         integrated_channel_choices = get_integrated_channel_choices()
     else:
         integrated_channel_choices = get_channel_integrations_choices()
     for code, choice in integrated_channel_choices.items():
-        integration = choice.objects.filter(enterprise_customer__uuid=customer_uuid, active=True).values().first()
-        if integration is not None:
-            unique_integrations.append({
+        integrations = choice.objects.filter(enterprise_customer__uuid__in=customer_uuids, active=True)
+        if not integrations.ordered:
+            integrations = integrations.order_by('pk')
+        for integration in integrations.values():
+            customer_integrations = integrations_by_customer_uuid.setdefault(integration['enterprise_customer_id'], [])
+            # only report the first active integration of each channel, like ``QuerySet.first`` would
+            if customer_integrations and customer_integrations[-1]['channel_code'] == code:
+                continue
+            customer_integrations.append({
                 'channel_code': code,
                 'created': integration.get('created').isoformat(),
                 'modified': integration.get('modified').isoformat(),
                 'display_name': integration.get('display_name'),
                 'active': integration.get('active'),
             })
-    return unique_integrations
+    return integrations_by_customer_uuid
 
 
 def get_active_sso_configurations_for_customer(customer_uuid):
@@ -59,6 +59,12 @@ class BlackboardAPIClient(IntegratedChannelApiClient):
         self.config = apps.get_app_config('blackboard')
         self.session = None
         self.expires_at = None
+        # Lookups memoized for the lifetime of the client, i.e. for one transmission run, so that learner data
+        # transmissions resolve each course, grade column and course roster once instead of once per learner.
+        self._course_ids_by_external_id = {}
+        self._grade_column_ids = {}
+        self._user_ids_by_email_by_course = {}
+        self._refreshed_rosters = set()
 
     def create_content_metadata(self, serialized_data):
         """
@@ -205,7 +211,7 @@ class BlackboardAPIClient(IntegratedChannelApiClient):
         learner_data = json.loads(payload)
         external_id = learner_data.get('courseID')
 
-        course_id = self._resolve_blackboard_course_id(external_id)
+        course_id = self._get_blackboard_course_id(external_id)
         BlackboardAPIClient._validate_course_id(course_id, external_id)
 
         blackboard_user_id = self._get_bb_user_id_from_enrollments(user_id, course_id)
@@ -248,7 +254,7 @@ class BlackboardAPIClient(IntegratedChannelApiClient):
         learner_data = json.loads(payload)
         external_id = learner_data.get('courseID')
 
-        course_id = self._resolve_blackboard_course_id(external_id)
+        course_id = self._get_blackboard_course_id(external_id)
         BlackboardAPIClient._validate_course_id(course_id, external_id)
 
         blackboard_user_id = self._get_bb_user_id_from_enrollments(user_id, course_id)
@@ -269,6 +275,34 @@ class BlackboardAPIClient(IntegratedChannelApiClient):
         )
         return submission_response.status_code, success_body
 
+    def create_course_completions(self, completions):
+        """
+        Post the final course grades of several learners, grouped by course.
+
+        The Blackboard course, its grade column and its roster are looked up once per course, after which one
+        grade is submitted per learner.
+
+        Parameters:
+        -----------
+            completions (list): ``(user_id, payload)`` tuples, as accepted by ``create_course_completion``.
+
+        Returns:
+        --------
+            list: For each completion, either its ``(status_code, body)`` or the ``ClientError`` raised for it.
+        """
+        results = [None] * len(completions)
+        indexes_by_course = {}
+        for index, (__, payload) in enumerate(completions):
+            indexes_by_course.setdefault(json.loads(payload).get('courseID'), []).append(index)
+
+        for indexes in indexes_by_course.values():
+            for index in indexes:
+                try:
+                    results[index] = self.create_course_completion(*completions[index])
+                except ClientError as error:
+                    results[index] = error
+        return results
+
     def delete_course_completion(self, user_id, payload):
         """TODO: course completion deletion is currently not easily supported"""
 
@@ -681,23 +715,53 @@ class BlackboardAPIClient(IntegratedChannelApiClient):
             raise ClientError(response.text, response.status_code)
         return response
 
+    def _get_bb_user_ids_by_email(self, course_id):
+        """
+        Helper method to build an index of the emails of the students enrolled in a Blackboard class to their
+        Blackboard IDs, traversing every page of enrollments.
+
+        Parameters:
+        -----------
+            course_id (str): The Blackboard course ID of which to index enrollments.
+        """
+        user_ids_by_email = {}
+        enrollment_url = self.generate_enrollment_url(course_id)
+        current_page_count = 0
+        while enrollment_url and current_page_count <= PAGE_TRAVERSAL_LIMIT:
+            enrollments_response = self._get(enrollment_url).json()
+            for enrollment in enrollments_response.get('results'):
+                # No point in checking non-students
+                if enrollment.get('courseRoleId') == 'Student':
+                    contact = enrollment.get('user').get('contact')
+                    user_ids_by_email.setdefault(contact.get('email'), enrollment.get('userId'))
+            next_page = (enrollments_response.get('paging') or {}).get('nextPage')
+            enrollment_url = next_page and '{}{}'.format(self.enterprise_configuration.blackboard_base_url, next_page)
+            current_page_count += 1
+        return user_ids_by_email
+
     def _get_bb_user_id_from_enrollments(self, user_email, course_id):
         """
         Helper method to retrieve a user's Blackboard ID from a list of enrollments in a
         Blackboard class.
 
+        The enrollments of a course are indexed once per client, and indexed again at most once if the user is
+        missing from them, e.g. because they enrolled after the index was built.
+
         Parameters:
         -----------
             user_email (str): The shared email of the user for both Blackboard and edX
             course_id (str): The Blackboard course ID of which to search enrollments.
         """
-        enrollments_response = self._get(self.generate_enrollment_url(course_id)).json()
-        for enrollment in enrollments_response.get('results'):
-            # No point in checking non-students
-            if enrollment.get('courseRoleId') == 'Student':
-                contact = enrollment.get('user').get('contact')
-                if contact.get('email') == user_email:
-                    return enrollment.get('userId')
+        user_ids_by_email = self._user_ids_by_email_by_course.get(course_id)
+        if user_ids_by_email is None or (
+            user_email not in user_ids_by_email and course_id not in self._refreshed_rosters
+        ):
+            if user_ids_by_email is not None:
+                self._refreshed_rosters.add(course_id)
+            user_ids_by_email = self._get_bb_user_ids_by_email(course_id)
+            self._user_ids_by_email_by_course[course_id] = user_ids_by_email
+        if user_email in user_ids_by_email:
+            return user_ids_by_email[user_email]
         raise ClientError(
             'Could not find user={} enrolled in Blackboard course={}'.format(user_email, course_id),
             HTTPStatus.NOT_FOUND.value
@@ -714,6 +778,18 @@ class BlackboardAPIClient(IntegratedChannelApiClient):
             bb_course_id (str): The Blackboard course ID in which to search for the edX final grade,
             grade column.
         """
+        cache_key = (bb_course_id, external_id)
+        if cache_key not in self._grade_column_ids:
+            self._grade_column_ids[cache_key] = self._find_or_create_integrated_grade_column(
+                bb_course_id, grade_column_name, external_id, points_possible, include_in_calculations,
+            )
+        return self._grade_column_ids[cache_key]
+
+    def _find_or_create_integrated_grade_column(self, bb_course_id, grade_column_name, external_id, points_possible,
+                                                include_in_calculations):
+        """
+        Search the gradebook of a Blackboard course for an edX integrated grade column, creating it if not found.
+        """
         gradebook_column_url = self.generate_gradebook_url(bb_course_id)
         grade_column_id = None
         more_pages_present = True
@@ -811,6 +887,17 @@ class BlackboardAPIClient(IntegratedChannelApiClient):
 
         return response
 
+    def _get_blackboard_course_id(self, external_id):
+        """
+        Return the blackboard course id of an externalId, resolved once per client.
+        """
+        if external_id not in self._course_ids_by_external_id:
+            course_id = self._resolve_blackboard_course_id(external_id)
+            if not course_id:
+                return course_id
+            self._course_ids_by_external_id[external_id] = course_id
+        return self._course_ids_by_external_id[external_id]
+
     def _resolve_blackboard_course_id(self, external_id):
         """
         Extract course id from blackboard, given it's externalId
@@ -12,6 +12,8 @@ class BlackboardLearnerTransmitter(LearnerTransmitter):
     sent to Blackboard.
     """
 
+    TRANSMIT_COMPLETIONS_IN_BULK = True
+
     def __init__(self, enterprise_configuration, client=BlackboardAPIClient):
         """
         By default, use the ``BlackboardAPIClient`` for learner data transmission to Blackboard.
@@ -26,6 +26,11 @@ LOGGER = logging.getLogger(__name__)
 
 
 MESSAGE_WHEN_COURSE_WAS_DELETED = 'Course was deleted previously, skipping create/update'
+COURSE_COMPLETION_ASSIGNMENT_NAME = '(Edx integration) Final Grade'
+# Canvas reports asynchronous bulk grade updates through a Progress object which is polled until it settles.
+BULK_GRADE_PROGRESS_POLL_INTERVAL_SECONDS = 1
+BULK_GRADE_PROGRESS_MAX_POLLS = 60
+BULK_GRADE_PROGRESS_PENDING_STATES = ('queued', 'running')
 
 
 class CanvasAPIClient(IntegratedChannelApiClient):
@@ -68,6 +73,10 @@ class CanvasAPIClient(IntegratedChannelApiClient):
         self.IntegratedChannelAPIRequestLogs = apps.get_model(
             "integrated_channel", "IntegratedChannelAPIRequestLogs"
         )
+        # Lookups resolved during a transmission run, reused across learners sharing a user, course or assignment.
+        self._canvas_user_ids_by_email = {}
+        self._canvas_user_courses = {}
+        self._assignment_ids = {}
 
     def create_content_metadata(self, serialized_data):
         """
@@ -217,14 +226,14 @@ class CanvasAPIClient(IntegratedChannelApiClient):
 
         # Retrieve the Canvas user ID from the user's edx email (it is assumed that the learner's Edx
         # and Canvas emails will match).
-        canvas_user_id = self._search_for_canvas_user_by_email(user_id)
+        canvas_user_id = self._get_canvas_user_id(user_id)
 
         canvas_course_id = self._handle_get_user_canvas_course(canvas_user_id, learner_data['courseID'])
 
         # Depending on if the assignment already exists, either retrieve or create it.
         # Assessment level reporting Canvas assignments use the subsection ID as the primary identifier, whereas
         # course level reporting assignments rely on the course run key.
-        assignment_id = self._handle_canvas_assignment_retrieval(
+        assignment_id = self._get_canvas_assignment_id(
             learner_data['subsectionID'],
             canvas_course_id,
             learner_data['subsection_name'],
@@ -247,17 +256,9 @@ class CanvasAPIClient(IntegratedChannelApiClient):
         learner_data = json.loads(payload)
         self._create_session()
 
-        # Retrieve the Canvas user ID from the user's edx email (it is assumed that the learner's Edx
-        # and Canvas emails will match).
-        canvas_user_id = self._search_for_canvas_user_by_email(user_id)
-
-        canvas_course_id = self._handle_get_user_canvas_course(canvas_user_id, learner_data['courseID'])
-
-        # Depending on if the assignment already exists, either retrieve or create it.
-        assignment_id = self._handle_canvas_assignment_retrieval(
+        canvas_user_id, canvas_course_id, assignment_id = self._resolve_course_completion_target(
+            user_id,
             learner_data['courseID'],
-            canvas_course_id,
-            '(Edx integration) Final Grade'
         )
 
         # Course completion percentage grades are exported as decimals but reported to Canvas as integer percents.
@@ -270,6 +271,50 @@ class CanvasAPIClient(IntegratedChannelApiClient):
 
         return update_grade_response.status_code, update_grade_response.text
 
+    def create_course_completions(self, completions):
+        """
+        Send a batch of course completions to Canvas.
+
+        Learners are resolved to their Canvas user, course and final grade assignment, then every grade targeting
+        the same assignment is posted through a single asynchronous ``update_grades`` request whose progress is
+        polled until Canvas reports it as completed or failed.
+
+        Args:
+            completions (list): ``(user_id, payload)`` tuples, as accepted by ``create_course_completion``.
+
+        Returns:
+            list: per completion, either a ``(status_code, body)`` tuple or the ``ClientError`` raised for it.
+        """
+        self._create_session()
+        results = [None] * len(completions)
+        grades_by_assignment = {}
+        for index, (user_id, payload) in enumerate(completions):
+            learner_data = json.loads(payload)
+            try:
+                canvas_user_id, canvas_course_id, assignment_id = self._resolve_course_completion_target(
+                    user_id,
+                    learner_data['courseID'],
+                )
+            except ClientError as error:
+                results[index] = error
+                continue
+            grades_by_assignment.setdefault((canvas_course_id, assignment_id), []).append(
+                (index, canvas_user_id, learner_data['grade'] * 100)
+            )
+
+        for (canvas_course_id, assignment_id), grades in grades_by_assignment.items():
+            try:
+                result = self._handle_canvas_bulk_assignment_submission(
+                    canvas_course_id,
+                    assignment_id,
+                    {canvas_user_id: grade for __, canvas_user_id, grade in grades},
+                )
+            except ClientError as error:
+                result = error
+            for index, __, __ in grades:
+                results[index] = result
+        return results
+
     def delete_course_completion(self, user_id, payload):
         # Todo: There isn't a great way for users to delete course completion data
         pass
@@ -655,6 +700,50 @@ class CanvasAPIClient(IntegratedChannelApiClient):
 
         return integration_id
 
+    def _resolve_course_completion_target(self, user_email, learner_data_course_id):
+        """
+        Resolve the Canvas user, course and final grade assignment a course completion should be reported against.
+        """
+        # Retrieve the Canvas user ID from the user's edx email (it is assumed that the learner's Edx
+        # and Canvas emails will match).
+        canvas_user_id = self._get_canvas_user_id(user_email)
+
+        canvas_course_id = self._handle_get_user_canvas_course(canvas_user_id, learner_data_course_id)
+
+        # Depending on if the assignment already exists, either retrieve or create it.
+        assignment_id = self._get_canvas_assignment_id(
+            learner_data_course_id,
+            canvas_course_id,
+            COURSE_COMPLETION_ASSIGNMENT_NAME
+        )
+        return canvas_user_id, canvas_course_id, assignment_id
+
+    def _get_canvas_user_id(self, user_email):
+        """
+        Return the Canvas user ID for ``user_email``, searching Canvas only the first time an email is seen.
+        """
+        canvas_user_id = self._canvas_user_ids_by_email.get(user_email)
+        if canvas_user_id is None:
+            canvas_user_id = self._search_for_canvas_user_by_email(user_email)
+            if canvas_user_id is not None:
+                self._canvas_user_ids_by_email[user_email] = canvas_user_id
+        return canvas_user_id
+
+    def _get_canvas_assignment_id(self, integration_id, course_id, *args, **kwargs):
+        """
+        Return the ID of the Canvas assignment for ``integration_id`` under ``course_id``, retrieving or creating it
+        only the first time the pair is seen.
+        """
+        cache_key = (course_id, integration_id)
+        if cache_key not in self._assignment_ids:
+            self._assignment_ids[cache_key] = self._handle_canvas_assignment_retrieval(
+                integration_id,
+                course_id,
+                *args,
+                **kwargs
+            )
+        return self._assignment_ids[cache_key]
+
     def _search_for_canvas_user_by_email(self, user_email):  # pylint: disable=inconsistent-return-statements
         """
         Helper method to make an api call to Canvas using the user's email as a search term.
@@ -911,12 +1000,129 @@ class CanvasAPIClient(IntegratedChannelApiClient):
             )
         return submission_response
 
+    def _handle_canvas_bulk_assignment_submission(self, course_id, assignment_id, grades_by_canvas_user_id):
+        """
+        Helper method to post grades for several learners to a single Canvas assignment.
+
+        Canvas queues bulk grade updates as a background job, so the returned Progress object is polled until the
+        job completes or fails.
+
+        Args:
+            course_id (str): the Canvas course ID the assignment belongs to.
+            assignment_id (str): the Canvas assignment ID to grade.
+            grades_by_canvas_user_id (dict): Canvas user ID -> posted grade.
+
+        Returns:
+            tuple: the status code and body of the final Progress response.
+        """
+        path = f'/api/v1/courses/{course_id}/assignments/{assignment_id}/submissions/update_grades'
+        update_grades_url = urljoin(self.enterprise_configuration.canvas_base_url, path)
+        grade_data = {
+            'grade_data': {
+                str(canvas_user_id): {'posted_grade': grade}
+                for canvas_user_id, grade in grades_by_canvas_user_id.items()
+            }
+        }
+        start_time = time.time()
+        update_grades_response = self.session.post(update_grades_url, json=grade_data)
+        duration_seconds = time.time() - start_time
+        stringify_and_store_api_record(
+            enterprise_customer=self.enterprise_configuration.enterprise_customer,
+            enterprise_customer_configuration_id=self.enterprise_configuration.id,
+            endpoint=update_grades_url,
+            data=grade_data,
+            time_taken=duration_seconds,
+            status_code=update_grades_response.status_code,
+            response_body=update_grades_response.text,
+            channel_name=self.enterprise_configuration.channel_code()
+        )
+
+        if update_grades_response.status_code >= 400:
+            raise ClientError(
+                "Something went wrong while posting bulk grades to Canvas assignment: {} under Canvas course: {}."
+                " Received response {} with the status code: {}".format(
+                    assignment_id,
+                    course_id,
+                    update_grades_response.text,
+                    update_grades_response.status_code
+                ),
+                update_grades_response.status_code
+            )
+
+        try:
+            progress_url = update_grades_response.json()['url']
+        except (ValueError, KeyError, TypeError) as error:
+            raise ClientError(
+                "Unexpected response while posting bulk grades to Canvas assignment: {}. Got response: {}".format(
+                    assignment_id,
+                    update_grades_response.text,
+                ),
+                update_grades_response.status_code
+            ) from error
+
+        return self._wait_for_canvas_progress(progress_url)
+
+    def _wait_for_canvas_progress(self, progress_url):
+        """
+        Poll a Canvas Progress object until it leaves the queued/running states.
+
+        Raises:
+            ClientError: if the job failed, the response could not be parsed or the job did not settle in time.
+        """
+        for __ in range(BULK_GRADE_PROGRESS_MAX_POLLS):
+            start_time = time.time()
+            progress_response = self.session.get(progress_url)
+            duration_seconds = time.time() - start_time
+            self.IntegratedChannelAPIRequestLogs.store_api_call(
+                enterprise_customer=self.enterprise_configuration.enterprise_customer,
+                enterprise_customer_configuration_id=self.enterprise_configuration.id,
+                endpoint=progress_url,
+                payload='',
+                time_taken=duration_seconds,
+                status_code=progress_response.status_code,
+                response_body=progress_response.text,
+                channel_name=self.enterprise_configuration.channel_code()
+            )
+            if progress_response.status_code >= 400:
+                raise ClientError(progress_response.text, progress_response.status_code)
+
+            try:
+                workflow_state = progress_response.json()['workflow_state']
+            except (ValueError, KeyError, TypeError) as error:
+                raise ClientError(
+                    "Unexpected response while polling Canvas progress: {}".format(progress_response.text),
+                    progress_response.status_code
+                ) from error
+
+            if workflow_state == 'completed':
+                return progress_response.status_code, progress_response.text
+            if workflow_state not in BULK_GRADE_PROGRESS_PENDING_STATES:
+                raise ClientError(
+                    "Canvas bulk grade update {} ended in state: {}. Got response: {}".format(
+                        progress_url,
+                        workflow_state,
+                        progress_response.text,
+                    ),
+                    HTTPStatus.INTERNAL_SERVER_ERROR.value
+                )
+            time.sleep(BULK_GRADE_PROGRESS_POLL_INTERVAL_SECONDS)
+
+        raise ClientError(
+            "Canvas bulk grade update {} did not complete after {} polls.".format(
+                progress_url,
+                BULK_GRADE_PROGRESS_MAX_POLLS,
+            ),
+            HTTPStatus.GATEWAY_TIMEOUT.value
+        )
+
     def _handle_get_user_canvas_course(self, canvas_user_id, learner_data_course_id):
         """
         Helper method to take the Canvas user ID and edX course ID to find the matching Canvas course information.
         """
-        # With the Canvas user ID, retrieve all courses for the user.
-        user_courses = self._get_canvas_user_courses_by_id(canvas_user_id)
+        # With the Canvas user ID, retrieve all courses for the user, once per transmission run.
+        if canvas_user_id not in self._canvas_user_courses:
+            self._canvas_user_courses[canvas_user_id] = self._get_canvas_user_courses_by_id(canvas_user_id)
+        user_courses = self._canvas_user_courses[canvas_user_id]
 
         # Find the course who's integration ID matches the learner data course ID. This integration ID can be either
         # an edX course run ID or course ID. Raise if no course found.
@@ -12,6 +12,8 @@ class CanvasLearnerTransmitter(LearnerTransmitter):
     sent to Canvas.
     """
 
+    TRANSMIT_COMPLETIONS_IN_BULK = True
+
     def __init__(self, enterprise_configuration, client=CanvasAPIClient):
         """
         By default, use the ``CanvasAPIClient`` for learner data transmission to Canvas.
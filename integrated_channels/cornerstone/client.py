@@ -7,13 +7,13 @@ import json
 import logging
 import time
 
-import requests
-
 from django.apps import apps
+from django.conf import settings
+from django.utils.functional import cached_property
 
-from integrated_channels.cornerstone.utils import get_or_create_key_pair
+from integrated_channels.cornerstone.utils import get_or_create_key_pair, get_or_create_key_pairs
 from integrated_channels.integrated_channel.client import IntegratedChannelApiClient
-from integrated_channels.utils import generate_formatted_log
+from integrated_channels.utils import generate_formatted_log, get_pooled_session
 
 LOGGER = logging.getLogger(__name__)
 
@@ -26,6 +26,8 @@ class CornerstoneAPIClient(IntegratedChannelApiClient):
     and posting user's course completion status to progress endpoints.
     """
 
+    COMPLETION_BATCH_SIZE = getattr(settings, "ENTERPRISE_CORNERSTONE_COMPLETION_BATCH_SIZE", 100)
+
     def __init__(self, enterprise_configuration):
         """
         Instantiate a new client.
@@ -36,9 +38,16 @@ class CornerstoneAPIClient(IntegratedChannelApiClient):
         """
         super().__init__(enterprise_configuration)
         self.global_cornerstone_config = apps.get_model('cornerstone', 'CornerstoneGlobalConfiguration').current()
-        self.session = None
+        # pooled keep-alive connections, shared with the other clients of this process using the same host
+        self.session = get_pooled_session(self.enterprise_configuration.cornerstone_base_url)
         self.expires_at = None
 
+    def get_connection_metrics(self):
+        """
+        Return the per-host request and connection reuse counts of the pooled HTTP session.
+        """
+        return self.session.connection_metrics()
+
     def create_content_metadata(self, serialized_data):
         """
         Create content metadata using the Cornerstone course content API.
@@ -88,10 +97,49 @@ class CornerstoneAPIClient(IntegratedChannelApiClient):
         Raises:
             HTTPError: if we received a failure response code from Cornerstone
         """
-        IntegratedChannelAPIRequestLogs = apps.get_model(
-            "integrated_channel", "IntegratedChannelAPIRequestLogs"
-        )
-        json_payload = json.loads(payload)
+        url, data = self._prepare_course_completion(payload)
+        return self._post_course_completions(url, [data])
+
+    def create_course_completions(self, completions):
+        """
+        Send a batch of completion status payloads to the Cornerstone Completion Status endpoint.
+
+        The endpoint accepts a list of completions, so completions sharing a callback URL and session token are
+        posted together in requests of at most ``COMPLETION_BATCH_SIZE`` elements. Course key mappings for the
+        whole batch are resolved with a single query.
+
+        Args:
+            completions (list): ``(user_id, payload)`` tuples, as accepted by ``create_course_completion``.
+
+        Returns:
+            list: a ``(status_code, body)`` tuple per completion.
+        """
+        payloads = [json.loads(payload) for __, payload in completions]
+        key_mappings = get_or_create_key_pairs(json_payload['data'].get('courseId') for json_payload in payloads)
+
+        completions_by_url = {}
+        for index, json_payload in enumerate(payloads):
+            url, data = self._prepare_course_completion(json_payload, key_mappings)
+            completions_by_url.setdefault(url, []).append((index, data))
+
+        results = [None] * len(completions)
+        for url, url_completions in completions_by_url.items():
+            for start in range(0, len(url_completions), self.COMPLETION_BATCH_SIZE):
+                batch = url_completions[start:start + self.COMPLETION_BATCH_SIZE]
+                status_code, body = self._post_course_completions(url, [data for __, data in batch])
+                for (index, __), element_body in zip(batch, self._split_completion_response(body, len(batch))):
+                    results[index] = status_code, element_body
+        return results
+
+    def _prepare_course_completion(self, payload, key_mappings=None):
+        """
+        Build the completion status URL and request element for a serialized (or already parsed) payload.
+
+        Args:
+            payload (str|dict): the learner data payload.
+            key_mappings (dict): optional internal course id -> ``CornerstoneCourseKey`` mappings resolved upfront.
+        """
+        json_payload = json.loads(payload) if isinstance(payload, str) else payload
         callback_url = json_payload['data'].pop('callbackUrl')
         session_token = self.enterprise_configuration.session_token
         if not session_token:
@@ -100,7 +148,7 @@ class CornerstoneAPIClient(IntegratedChannelApiClient):
         # When exporting content metadata, we encode course keys that contain invalid chars or
         # set them to uuids to comply with Cornerstone standards
         course_id = json_payload['data'].get('courseId')
-        key_mapping = get_or_create_key_pair(course_id)
+        key_mapping = (key_mappings or {}).get(course_id) or get_or_create_key_pair(course_id)
         json_payload['data']['courseId'] = key_mapping.external_course_id
         url = '{base_url}{callback_url}{completion_path}?sessionToken={session_token}'.format(
             base_url=self.enterprise_configuration.cornerstone_base_url,
@@ -108,10 +156,19 @@ class CornerstoneAPIClient(IntegratedChannelApiClient):
             completion_path=self.global_cornerstone_config.completion_status_api_path,
             session_token=session_token,
         )
+        return url, json_payload['data']
+
+    def _post_course_completions(self, url, completion_data):
+        """
+        POST a list of completion elements to a Cornerstone completion status URL.
+        """
+        IntegratedChannelAPIRequestLogs = apps.get_model(
+            "integrated_channel", "IntegratedChannelAPIRequestLogs"
+        )
         start_time = time.time()
-        response = requests.post(
+        response = self.session.post(
             url,
-            json=[json_payload['data']],
+            json=completion_data,
             headers={
                 'Authorization': self.authorization_header,
                 'Content-Type': 'application/json'
@@ -122,7 +179,7 @@ class CornerstoneAPIClient(IntegratedChannelApiClient):
             enterprise_customer=self.enterprise_configuration.enterprise_customer,
             enterprise_customer_configuration_id=self.enterprise_configuration.id,
             endpoint=url,
-            payload=json.dumps(json_payload["data"]),
+            payload=json.dumps(completion_data[0] if len(completion_data) == 1 else completion_data),
             time_taken=duration_seconds,
             status_code=response.status_code,
             response_body=response.text,
@@ -130,12 +187,28 @@ class CornerstoneAPIClient(IntegratedChannelApiClient):
         )
         return response.status_code, response.text
 
+    @staticmethod
+    def _split_completion_response(body, count):
+        """
+        Split a completion status response body into one body per posted element.
+
+        When Cornerstone answers with a list holding one entry per posted element, each element gets its own entry;
+        otherwise every element shares the whole response body.
+        """
+        try:
+            elements = json.loads(body)
+        except ValueError:
+            elements = None
+        if isinstance(elements, list) and len(elements) == count:
+            return [json.dumps(element) for element in elements]
+        return [body] * count
+
     def create_assessment_reporting(self, user_id, payload):
         """
         Not implemented yet
         """
 
-    @property
+    @cached_property
     def authorization_header(self):
         """
         Authorization header for authenticating requests to cornerstone progress API.
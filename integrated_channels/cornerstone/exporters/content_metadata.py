@@ -10,6 +10,7 @@ import pytz
 from django.apps import apps
 from django.conf import settings
 
+from enterprise.constants import TRANSMISSION_MARK_CREATE, TRANSMISSION_MARK_DELETE, TRANSMISSION_MARK_UPDATE
 from enterprise.utils import get_closest_course_run, get_language_code
 from integrated_channels.cornerstone.utils import convert_invalid_course_id
 from integrated_channels.integrated_channel.constants import ISO_8601_DATE_FORMAT
@@ -50,32 +51,32 @@ class CornerstoneContentMetadataExporter(ContentMetadataExporter):
     SKIP_KEY_IF_NONE = True
     MAX_PAYLOAD_COUNT = getattr(settings, "ENTERPRISE_CORNERSTONE_MAX_CONTENT_PAYLOAD_COUNT", 1000)
 
-    def export_for_web_polling(self, max_payload_count=MAX_PAYLOAD_COUNT):  # pylint: disable=unused-argument
+    def export_for_web_polling(self, max_payload_count=MAX_PAYLOAD_COUNT):
         """
-        Return the exported and transformed content metadata as a dictionary for CSDO web pull.
+        Return the next content metadata items waiting for a CSOD web pull, as dictionaries of the items marked for
+        creation, update and deletion keyed by content id.
+
+        At most ``max_payload_count`` items are returned, least recently modified first. Transmitting them clears
+        their mark, so the items left over are picked up by the following polls.
         """
         ContentMetadataItemTransmission = apps.get_model(
             'integrated_channel',
             'ContentMetadataItemTransmission'
         )
-        create_payload = ContentMetadataItemTransmission.objects.filter(
-            marked_for='create',
-            enterprise_customer=self.enterprise_configuration.enterprise_customer,
-            plugin_configuration_id=self.enterprise_configuration.id,
-        )
-        update_payload = ContentMetadataItemTransmission.objects.filter(
-            marked_for='update',
+        pending_items = ContentMetadataItemTransmission.objects.filter(
+            marked_for__in=[TRANSMISSION_MARK_CREATE, TRANSMISSION_MARK_UPDATE, TRANSMISSION_MARK_DELETE],
             enterprise_customer=self.enterprise_configuration.enterprise_customer,
             plugin_configuration_id=self.enterprise_configuration.id,
-        )
-        delete_payload = ContentMetadataItemTransmission.objects.filter(
-            marked_for='delete',
-            enterprise_customer=self.enterprise_configuration.enterprise_customer,
-            plugin_configuration_id=self.enterprise_configuration.id,
-        )
-        created = {record.content_id: record for record in create_payload}
-        updated = {record.content_id: record for record in update_payload}
-        deleted = {record.content_id: record for record in delete_payload}
+        ).select_related('api_record').order_by('modified', 'id')[:max(max_payload_count, 0)]
+
+        created, updated, deleted = {}, {}, {}
+        payloads = {
+            TRANSMISSION_MARK_CREATE: created,
+            TRANSMISSION_MARK_UPDATE: updated,
+            TRANSMISSION_MARK_DELETE: deleted,
+        }
+        for record in pending_items:
+            payloads[record.marked_for][record.content_id] = record
         return created, updated, deleted
 
     def transform_courserun_key(self, content_metadata_item):
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cornerstone', '0035_rename_cornerstonelearnerdatatransmissionaudit_enterprise_customer_uuid_plugin_configuration_id_corn'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cornerstoneenterprisecustomerconfiguration',
+            name='learner_data_transmission_burst',
+            field=models.PositiveIntegerField(default=1, help_text='The number of learner completion requests which may be sent back to back before the rate limit applies.'),
+        ),
+        migrations.AddField(
+            model_name='cornerstoneenterprisecustomerconfiguration',
+            name='learner_data_transmission_concurrency',
+            field=models.PositiveIntegerField(default=1, help_text='The maximum number of learner completions transmitted to the integrated channel at the same time. 1 transmits them one after another.'),
+        ),
+        migrations.AddField(
+            model_name='cornerstoneenterprisecustomerconfiguration',
+            name='learner_data_transmission_rate_limit',
+            field=models.FloatField(blank=True, help_text='The maximum number of learner completion requests per second sent to the integrated channel when transmitting concurrently. Leave empty to not limit the request rate.', null=True),
+        ),
+    ]
@@ -12,6 +12,8 @@ class CornerstoneLearnerTransmitter(LearnerTransmitter):
     sent to Cornerstone.
     """
 
+    TRANSMIT_COMPLETIONS_IN_BULK = True
+
     def __init__(self, enterprise_configuration, client=CornerstoneAPIClient):
         """
         By default, use the ``CornerstoneAPIClient`` for learner data transmission to Cornerstone.
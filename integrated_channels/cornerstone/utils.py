@@ -88,3 +88,25 @@ def get_or_create_key_pair(course_id):
         internal_course_id=course_id, defaults={
             'external_course_id': str(uuid4())})
     return key_mapping
+
+
+def get_or_create_key_pairs(course_ids):
+    """
+        bulk variant of ``get_or_create_key_pair``: return a dict of internal course id -> CornerstoneCourseKey,
+        creating the missing mappings with a single insert
+    """
+    course_key_model = cornerstone_course_key_model()
+    course_ids = {course_id for course_id in course_ids if course_id}
+    key_mappings = course_key_model.objects.in_bulk(course_ids)
+    missing_course_ids = course_ids - set(key_mappings)
+    if missing_course_ids:
+        course_key_model.objects.bulk_create(
+            [
+                course_key_model(internal_course_id=course_id, external_course_id=str(uuid4()))
+                for course_id in missing_course_ids
+            ],
+            ignore_conflicts=True,
+        )
+        # re-read rather than trusting the instances above, a concurrent writer may have won the insert
+        key_mappings.update(course_key_model.objects.in_bulk(missing_course_ids))
+    return key_mappings
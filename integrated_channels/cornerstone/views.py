@@ -56,6 +56,9 @@ class CornerstoneCoursesListView(BaseViewSet):
             * ciid: Filters the result to courses available in catalogs corresponding to the
               given ciid where value of ciid should be uuid of any enterprise customer.
 
+            * count: The maximum number of courses returned, items left over are returned by the following
+              requests.
+
         **Response Values**
 
             If the request for information about the course list is successful, an HTTP 200 "OK" response
@@ -144,7 +147,16 @@ class CornerstoneCoursesListView(BaseViewSet):
         exporter = enterprise_config.get_content_metadata_exporter(worker_user)
         transmitter = enterprise_config.get_content_metadata_transmitter()
 
-        get_count = int(request.GET.get('count', exporter.MAX_PAYLOAD_COUNT))
+        try:
+            get_count = int(request.GET.get('count', exporter.MAX_PAYLOAD_COUNT))
+        except ValueError:
+            return Response(
+                status=status.HTTP_400_BAD_REQUEST,
+                data={
+                    "message": (
+                        "Cornerstone course list API expects an integer count parameter."
+                    )
+                })
         content_item_count = min(get_count, exporter.MAX_PAYLOAD_COUNT)
         # Remove content records `marked for transmission` flags
         created, updated, deleted = transmitter.transmit_for_web(
@@ -163,18 +175,20 @@ class CornerstoneCoursesListView(BaseViewSet):
         # our CSOD imp. only supports creates/updates, no deletes
         # fib and make it appear like all creates/updates are past if-modified-since
         if if_modified_since:
+            if_modified_since_utc = datetime.datetime.fromtimestamp(if_modified_since).strftime(ISO_8601_DATE_FORMAT)
+            fixed_course_keys = []
             for item in data:
                 this_last_modified = parser.parse(item['LastModifiedUTC'])
                 if if_modified_since > int(this_last_modified.timestamp()):
-                    # log when we find an incorrect modified date, then "fix" it
-                    logger.info(f'integrated_channel=CSOD, '
-                                f'integrated_channel_enterprise_customer_uuid={enterprise_customer_uuid}, '
-                                f'If-Modified-Since={request.headers.get("If-Modified-Since")}, '
-                                f'integrated_channel_course_key={item["ID"]}, '
-                                f'LastModifiedUTC={item["LastModifiedUTC"]} '
-                                f'fixing modified/header mismatch')
-                    if_modified_since_dt = datetime.datetime.fromtimestamp(if_modified_since)
-                    item['LastModifiedUTC'] = if_modified_since_dt.strftime(ISO_8601_DATE_FORMAT)
+                    item['LastModifiedUTC'] = if_modified_since_utc
+                    fixed_course_keys.append(item['ID'])
+            if fixed_course_keys:
+                # log the items found with an incorrect modified date once they have been "fixed"
+                logger.info(f'integrated_channel=CSOD, '
+                            f'integrated_channel_enterprise_customer_uuid={enterprise_customer_uuid}, '
+                            f'If-Modified-Since={request.headers.get("If-Modified-Since")}, '
+                            f'integrated_channel_course_keys={fixed_course_keys}, '
+                            f'fixing modified/header mismatch')
         duration_seconds = time.time() - start_time
         headers_dict = dict(request.headers)
         headers_json = json.dumps(headers_dict)
@@ -185,7 +199,8 @@ class CornerstoneCoursesListView(BaseViewSet):
             payload=f"Request Headers: {headers_json}",
             time_taken=duration_seconds,
             status_code=200,
-            response_body=json.dumps(data),
+            # the items are already stored on their transmission records, only log which ones were pulled
+            response_body=json.dumps([item.get('ID') for item in data]),
             channel_name=enterprise_config.channel_code()
         )
         return Response(data)
@@ -38,6 +38,11 @@ class Degreed2APIClient(IntegratedChannelApiClient):
     SESSION_TIMEOUT = getattr(settings, "ENTERPRISE_DEGREED2_SESSION_TIMEOUT", 60)
     MAX_RETRIES = getattr(settings, "ENTERPRISE_DEGREED2_MAX_RETRIES", 4)
     BACKOFF_FACTOR = getattr(settings, "ENTERPRISE_DEGREED2_BACKOFF_FACTOR", 2)
+    # course attribute carrying the exported skill names, stripped before a course is sent to Degreed
+    SKILL_NAMES_ATTRIBUTE = 'skill-names'
+    COURSE_ID_CACHE_TIMEOUT = 60 * 60 * 24  # 1 day
+    COURSE_LISTING_PAGE_SIZE = 1000
+    COURSE_LISTING_PAGE_LIMIT = getattr(settings, "ENTERPRISE_DEGREED2_COURSE_LISTING_PAGE_LIMIT", 100)
 
     def __init__(self, enterprise_configuration):
         """
@@ -67,6 +72,7 @@ class Degreed2APIClient(IntegratedChannelApiClient):
         self.IntegratedChannelAPIRequestLogs = apps.get_model(
             "integrated_channel", "IntegratedChannelAPIRequestLogs"
         )
+        self.degreed_course_ids_prefetched = False
 
     def get_oauth_url(self):
         config = self.enterprise_configuration
@@ -189,10 +195,7 @@ class Degreed2APIClient(IntegratedChannelApiClient):
         Fetch the 'id' of a course from cache first and if not found then send a request to Degreed2,
         given the external-id as a search param 'external-id' is the edX course key.
         """
-        cache_key = get_cache_key(
-            resource='degreed2_course_id',
-            resource_id=external_id,
-        )
+        cache_key = self._get_degreed_course_id_cache_key(external_id)
         cached_course_id = TieredCache.get_cached_response(cache_key)
         if cached_course_id.is_found:
             LOGGER.info(self.make_log_msg(external_id, f'Found cached course id: {cached_course_id.value}'))
@@ -215,13 +218,62 @@ class Degreed2APIClient(IntegratedChannelApiClient):
         if response_json['data']:
             # cache the course id with a 1 day expiration
             response_course_id = response_json['data'][0]['id']
-            expires_in = 60 * 60 * 24  # 1 day
-            TieredCache.set_all_tiers(cache_key, response_course_id, expires_in)
+            TieredCache.set_all_tiers(cache_key, response_course_id, self.COURSE_ID_CACHE_TIMEOUT)
             return response_course_id
         raise ClientError(
             f'Degreed2: Attempted to find degreed course id but failed, external id was {external_id}'
             f', Response from Degreed was {response_body}')
 
+    def prefetch_degreed_course_ids(self):
+        """
+        Page through the Degreed2 course listing once and cache the Degreed 'id' of every course by its
+        external-id, so subsequent ``fetch_degreed_course_id`` calls in the run are served from the cache
+        instead of issuing one course search per item.
+
+        Returns:
+            int: the number of course ids cached.
+
+        Raises:
+            ClientError: If a Degreed2 listing request fails.
+        """
+        if self.degreed_course_ids_prefetched:
+            return 0
+
+        num_cached = 0
+        next_page_url = f'{self.get_courses_url()}?limit={self.COURSE_LISTING_PAGE_SIZE}'
+        for __ in range(self.COURSE_LISTING_PAGE_LIMIT):
+            status_code, response_body = self._get(next_page_url, self.ALL_DESIRED_SCOPES)
+            if status_code >= 400:
+                raise ClientError(
+                    f'Degreed2: course listing request failed: url={next_page_url}, '
+                    f'received status_code={status_code}',
+                    status_code=status_code
+                )
+            response_json = json.loads(response_body)
+            for course in response_json.get('data') or []:
+                external_id = (course.get('attributes') or {}).get('external-id')
+                if external_id and course.get('id'):
+                    TieredCache.set_all_tiers(
+                        self._get_degreed_course_id_cache_key(external_id),
+                        course['id'],
+                        self.COURSE_ID_CACHE_TIMEOUT,
+                    )
+                    num_cached += 1
+            next_page_url = (response_json.get('links') or {}).get('next')
+            if not next_page_url:
+                break
+
+        self.degreed_course_ids_prefetched = True
+        LOGGER.info(self.make_log_msg(None, f'Prefetched {num_cached} Degreed course ids'))
+        return num_cached
+
+    @staticmethod
+    def _get_degreed_course_id_cache_key(external_id):
+        return get_cache_key(
+            resource='degreed2_course_id',
+            resource_id=external_id,
+        )
+
     def assign_course_skills(self, course_id, serialized_data):  # pylint: disable=inconsistent-return-statements
         """
         Assign skills to a course.
@@ -278,6 +330,7 @@ class Degreed2APIClient(IntegratedChannelApiClient):
         # only expect one course in this array as of now (chunk size is 1)
         a_course = channel_metadata_item['courses'][0]
         external_id = a_course.get('external-id')
+        skill_names = a_course.pop(self.SKILL_NAMES_ATTRIBUTE, None)
         status_code, response_body = self._sync_content_metadata(a_course, 'post', self.get_courses_url())
         if status_code == 409:
             # course already exists, don't raise failure, but try to mark it as active on Degreed side
@@ -290,6 +343,8 @@ class Degreed2APIClient(IntegratedChannelApiClient):
             )
             try:
                 channel_metadata_item['courses'][0]['obsolete'] = False
+                if skill_names is not None:
+                    channel_metadata_item['courses'][0][self.SKILL_NAMES_ATTRIBUTE] = skill_names
                 return self.update_content_metadata(json.dumps(channel_metadata_item).encode('utf-8'))
             except requests.exceptions.RequestException as exc:
                 raise ClientError(
@@ -303,7 +358,7 @@ class Degreed2APIClient(IntegratedChannelApiClient):
                 f'Degreed2APIClient create_content_metadata failed with status {status_code}: {response_body}',
                 status_code=status_code
             )
-        self._fetch_and_assign_skills_to_course(external_id)
+        self._fetch_and_assign_skills_to_course(external_id, skill_names)
 
         return status_code, response_body
 
@@ -320,6 +375,7 @@ class Degreed2APIClient(IntegratedChannelApiClient):
         channel_metadata_item = json.loads(serialized_data.decode('utf-8'))
         course_item = channel_metadata_item['courses'][0]
         external_id = course_item.get('external-id')
+        skill_names = course_item.pop(self.SKILL_NAMES_ATTRIBUTE, None)
 
         course_id = self.fetch_degreed_course_id(external_id)
         if not course_id:
@@ -334,36 +390,38 @@ class Degreed2APIClient(IntegratedChannelApiClient):
             course_id
         )
 
-        self._fetch_and_assign_skills_to_course(external_id)
+        self._fetch_and_assign_skills_to_course(external_id, skill_names)
 
         return patch_status_code, patch_response_body
 
-    def _fetch_and_assign_skills_to_course(self, external_id):
+    def _fetch_and_assign_skills_to_course(self, external_id, skills=None):
         """
         Fetches content metadata(skills) from enterprise catalog API
         and transmits them to Degreed2 against given external_id(course_id)
 
         Args:
             external_id: Course id that is assigned to a course on Degreed side
+            skills: skill names already exported with the course, if any; the enterprise catalog is only
+              queried when these were not carried in the payload
         """
         # We need to do 2 steps here:
-        # 1. Fetch skills from enterprise-catalog
-
-        metadata = self.enterprise_catalog_api_client.get_customer_content_metadata_content_identifier(
-            enterprise_uuid=self.enterprise_configuration.enterprise_customer.uuid,
-            content_id=external_id)
-        LOGGER.info(
-            generate_formatted_log(
-                self.enterprise_configuration.channel_code(),
-                self.enterprise_configuration.enterprise_customer.uuid,
-                None,
-                None,
-                f"[Degreed2Client] metadata: {metadata}",
+        # 1. Fetch skills from enterprise-catalog, unless the exporter already provided them
+        if skills is None:
+            metadata = self.enterprise_catalog_api_client.get_customer_content_metadata_content_identifier(
+                enterprise_uuid=self.enterprise_configuration.enterprise_customer.uuid,
+                content_id=external_id)
+            LOGGER.info(
+                generate_formatted_log(
+                    self.enterprise_configuration.channel_code(),
+                    self.enterprise_configuration.enterprise_customer.uuid,
+                    None,
+                    None,
+                    f"[Degreed2Client] metadata: {metadata}",
+                )
             )
-        )
+            skills = metadata.get("skill_names", [])
 
         # 2. Transmit to degreed
-        skills = metadata.get("skill_names", [])
         if skills:
             try:
                 self.assign_course_skills(external_id, skills)
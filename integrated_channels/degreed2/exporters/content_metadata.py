@@ -46,6 +46,7 @@ class Degreed2ContentMetadataExporter(ContentMetadataExporter):
         'cost-unit-type': 'currency',
         'difficulty': 'level_type',
         'video-url': 'video_url',
+        'skill-names': 'skill_names',
     }
 
     def transform_duration_type(self, content_metadata_item):  # pylint: disable=unused-argument
@@ -204,3 +205,9 @@ class Degreed2ContentMetadataExporter(ContentMetadataExporter):
             video_url = video.get('src')
 
         return video_url
+
+    def transform_skill_names(self, content_metadata_item):
+        """
+        Return the skill names of the content item, which the client assigns to the course once it is transmitted.
+        """
+        return content_metadata_item.get('skill_names') or []
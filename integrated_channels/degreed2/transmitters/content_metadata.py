@@ -3,7 +3,10 @@
 Class for transmitting content metadata to Degreed.
 """
 
+import requests
+
 from integrated_channels.degreed2.client import Degreed2APIClient
+from integrated_channels.exceptions import ClientError
 from integrated_channels.integrated_channel.transmitters.content_metadata import ContentMetadataTransmitter
 
 
@@ -21,6 +24,18 @@ class Degreed2ContentMetadataTransmitter(ContentMetadataTransmitter):
             client=client
         )
 
+    def transmit(self, create_payload, update_payload, delete_payload):
+        """
+        Prefetch the Degreed course ids once per run when courses are updated or deleted, so each item does not
+        need its own course search.
+        """
+        if (update_payload or delete_payload) and not self.enterprise_configuration.dry_run_mode_enabled:
+            try:
+                self.client.prefetch_degreed_course_ids()
+            except (ClientError, requests.exceptions.RequestException) as exc:
+                self._log_error(f'Failed to prefetch Degreed course ids, falling back to per course lookups: {exc}')
+        return super().transmit(create_payload, update_payload, delete_payload)
+
     def _prepare_items_for_transmission(self, channel_metadata_items):
         # similar to canvas, we can't create courses in bulk hence limiting to size 1
         # this of course only is accurate if transmission chunk size is 1
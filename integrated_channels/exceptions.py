@@ -7,8 +7,12 @@ class ClientError(Exception):
     """
     Indicate a problem when interacting with an integrated channel.
     """
-    def __init__(self, message, status_code=500):
-        """Save the status code and message raised from the client."""
+    def __init__(self, message, status_code=500, retry_after=None):
+        """
+        Save the status code and message raised from the client, along with the number of seconds the integrated
+        channel asked to wait before retrying, if any.
+        """
         self.status_code = status_code
         self.message = message
+        self.retry_after = retry_after
         super().__init__(message)
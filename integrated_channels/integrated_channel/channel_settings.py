@@ -17,3 +17,7 @@ class ChannelSettingsMixin:
     # a channel should override this to False if they don't want grade changes to
     # cause retransmission of completion records
     INCLUDE_GRADE_FOR_COMPLETION_AUDIT_CHECK = True
+
+    # a channel should override this to True if its client implements ``create_course_completions`` with a
+    # bulk API, so completions are sent together instead of one request per learner
+    TRANSMIT_COMPLETIONS_IN_BULK = False
@@ -4,6 +4,8 @@ Base API client for integrated channels.
 
 from enum import Enum
 
+from integrated_channels.exceptions import ClientError
+
 
 class IntegratedChannelHealthStatus(Enum):
     """
@@ -44,6 +46,25 @@ class IntegratedChannelApiClient:
         """
         raise NotImplementedError('Implement in concrete subclass.')
 
+    def create_course_completions(self, completions):
+        """
+        Update the completion status of several users.
+
+        By default each completion is sent with ``create_course_completion``; channels with a bulk completion API
+        override this method.
+
+        :param completions: A list of ``(user_id, payload)`` tuples, as accepted by ``create_course_completion``.
+        :return: A list holding, for each completion in order, either the ``(status_code, body)`` of its
+            transmission or the ``ClientError`` raised while transmitting it.
+        """
+        results = []
+        for user_id, payload in completions:
+            try:
+                results.append(self.create_course_completion(user_id, payload))
+            except ClientError as exc:
+                results.append(exc)
+        return results
+
     def delete_course_completion(self, user_id, payload):
         """
         Make a DELETE request to the integrated channel's completion API to update completion status for a user.
@@ -359,6 +359,13 @@ class LearnerExporter(ChannelSettingsMixin, Exporter):
 
         return incomplete_count
 
+    def prepare_enrollments_for_export(self, enrollments):
+        """
+        Hook called once with all the enrollments about to be exported, before any learner data record is built.
+
+        Channels may override this to fetch data for all the enrollments at once, e.g. remote user ids.
+        """
+
     def export(self, **kwargs):
         """
         Collect learner data for the ``EnterpriseCustomer`` where data sharing consent is granted.
@@ -397,6 +404,7 @@ class LearnerExporter(ChannelSettingsMixin, Exporter):
             grade,
         )
         enrollment_ids_to_export = [enrollment.id for enrollment in enrollments_permitted]
+        self.prepare_enrollments_for_export(enrollments_permitted)
 
         for enterprise_enrollment in enrollments_permitted:
             lms_user_id = enterprise_enrollment.enterprise_customer_user.user_id
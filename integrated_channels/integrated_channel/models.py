@@ -155,6 +155,30 @@ class EnterpriseCustomerPluginConfiguration(SoftDeletionModel):
         help_text=_("The maximum number of data items to transmit to the integrated channel with each request.")
     )
 
+    learner_data_transmission_concurrency = models.PositiveIntegerField(
+        default=1,
+        help_text=_(
+            "The maximum number of learner completions transmitted to the integrated channel at the same time. "
+            "1 transmits them one after another."
+        )
+    )
+
+    learner_data_transmission_rate_limit = models.FloatField(
+        blank=True,
+        null=True,
+        help_text=_(
+            "The maximum number of learner completion requests per second sent to the integrated channel when "
+            "transmitting concurrently. Leave empty to not limit the request rate."
+        )
+    )
+
+    learner_data_transmission_burst = models.PositiveIntegerField(
+        default=1,
+        help_text=_(
+            "The number of learner completion requests which may be sent back to back before the rate limit applies."
+        )
+    )
+
     channel_worker_username = models.CharField(
         max_length=255,
         blank=True,
@@ -3,9 +3,13 @@ Generic learner data transmitter for integrated channels.
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 
 from django.apps import apps
+from django.db import connection
 
 from enterprise.utils import localized_utcnow
 from integrated_channels.exceptions import ClientError
@@ -13,7 +17,12 @@ from integrated_channels.integrated_channel.channel_settings import ChannelSetti
 from integrated_channels.integrated_channel.client import IntegratedChannelApiClient
 from integrated_channels.integrated_channel.exporters.learner_data import LearnerExporterUtility
 from integrated_channels.integrated_channel.transmitters import Transmitter
-from integrated_channels.utils import encode_data_for_logging, generate_formatted_log, is_already_transmitted
+from integrated_channels.utils import (
+    TokenBucket,
+    encode_data_for_logging,
+    generate_formatted_log,
+    is_already_transmitted,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -26,6 +35,11 @@ class LearnerTransmitter(Transmitter, ChannelSettingsMixin):
     each integrated channel's particular learner data transmission requirements and expectations.
     """
 
+    # retries of a completion status call rejected with a 429 when transmitting concurrently
+    RATE_LIMIT_MAX_RETRIES = 3
+    RATE_LIMIT_BACKOFF_SECONDS = 1
+    RATE_LIMIT_MAX_RETRY_AFTER_SECONDS = 60
+
     def __init__(self, enterprise_configuration, client=IntegratedChannelApiClient):
         """
         By default, use the abstract integrated channel API client which raises an error when used if not subclassed.
@@ -297,6 +311,24 @@ class LearnerTransmitter(Transmitter, ChannelSettingsMixin):
         # If the transmission with the course key succeeds, the next one will get skipped.
         # If it fails, the one with the course run id will be attempted and (presumably) succeed.
 
+        completions = self._completions_to_transmit(payload, enterprise_customer_uuid, **kwargs)
+        if self.TRANSMIT_COMPLETIONS_IN_BULK:
+            self._transmit_completions_in_bulk(completions, app_label, enterprise_customer_uuid)
+        elif (self.enterprise_configuration.learner_data_transmission_concurrency or 1) > 1:
+            self._transmit_completions_concurrently(completions, app_label, enterprise_customer_uuid)
+        else:
+            for completion in completions:
+                self._transmit_completion(completion, app_label, enterprise_customer_uuid)
+
+    def _completions_to_transmit(self, payload, enterprise_customer_uuid, **kwargs):
+        """
+        Yield the completions of the exported learner data that should be sent to the integrated channel.
+
+        Each completion is a ``(learner_data, remote_user_id, serialized_payload, lms_user_id)`` tuple. Learner data
+        is checked against the transmission audit lazily, so a record whose enrollment was transmitted by a
+        previously yielded record is skipped.
+        """
+        TransmissionAudit = kwargs['TransmissionAudit']
         for learner_data in payload.export(**kwargs):
             serialized_payload = learner_data.serialize(enterprise_configuration=self.enterprise_configuration)
 
@@ -309,8 +341,6 @@ class LearnerTransmitter(Transmitter, ChannelSettingsMixin):
                     not getattr(self.enterprise_configuration, 'enable_incomplete_progress_transmission', False)):
                 # The user has not completed the course and enable_incomplete_progress_transmission is not set,
                 # so we shouldn't send a completion status call
-                remote_id = getattr(learner_data, kwargs.get('remote_user_id'))
-                encoded_serialized_payload = encode_data_for_logging(serialized_payload)
                 continue
 
             grade = getattr(learner_data, 'grade', None)
@@ -324,8 +354,8 @@ class LearnerTransmitter(Transmitter, ChannelSettingsMixin):
                 # We've already sent a completion status for this enrollment
                 continue
 
+            remote_id = getattr(learner_data, kwargs.get('remote_user_id'))
             if self.enterprise_configuration.dry_run_mode_enabled:
-                remote_id = getattr(learner_data, kwargs.get('remote_user_id'))
                 encoded_serialized_payload = encode_data_for_logging(serialized_payload)
                 LOGGER.info(generate_formatted_log(
                     self.enterprise_configuration.channel_code(),
@@ -339,53 +369,223 @@ class LearnerTransmitter(Transmitter, ChannelSettingsMixin):
                 ))
                 continue
 
-            try:
-                code, body = self.client.create_course_completion(
-                    getattr(learner_data, kwargs.get('remote_user_id')),
-                    serialized_payload
-                )
-                if code >= HTTPStatus.BAD_REQUEST.value:
-                    raise ClientError(f'Client create_course_completion failed: {body}', code)
+            yield learner_data, remote_id, serialized_payload, lms_user_id
 
-                LOGGER.info(generate_formatted_log(
-                    self.enterprise_configuration.channel_code(),
-                    enterprise_customer_uuid,
-                    lms_user_id,
-                    learner_data.course_id,
-                    'Successfully sent completion status call for enterprise enrollment '
-                    f'integrated_channel_enterprise_enrollment_id={enterprise_enrollment_id}'
-                ))
-            except ClientError as client_error:
-                code = client_error.status_code
-                body = client_error.message
-                self.process_transmission_error(
-                    learner_data,
-                    client_error,
-                    app_label,
-                    enterprise_customer_uuid,
-                    lms_user_id,
-                    learner_data.course_id
-                )
+    def _transmit_completion(self, completion, app_label, enterprise_customer_uuid):
+        """
+        Send a single completion status call to the integrated channel and save its result.
+        """
+        learner_data, remote_id, serialized_payload, lms_user_id = completion
+        try:
+            code, body = self.client.create_course_completion(remote_id, serialized_payload)
+            if code >= HTTPStatus.BAD_REQUEST.value:
+                raise ClientError(f'Client create_course_completion failed: {body}', code)
+        except ClientError as client_error:
+            code, body = client_error.status_code, client_error.message
+            self.process_transmission_error(
+                learner_data,
+                client_error,
+                app_label,
+                enterprise_customer_uuid,
+                lms_user_id,
+                learner_data.course_id
+            )
+        except Exception:
+            # Log additional data to help debug failures but have Exception bubble
+            self._log_exception_supplemental_data(
+                learner_data,
+                'create_assessment_reporting',
+                app_label,
+                enterprise_customer_uuid,
+                lms_user_id,
+                learner_data.course_id
+            )
+            raise
+        self._save_completion_result(completion, code, body, enterprise_customer_uuid)
 
+    def _transmit_completions_in_bulk(self, completions, app_label, enterprise_customer_uuid):
+        """
+        Send completion status calls to the integrated channel through the client's bulk API, and save their results.
+        """
+        def send_round(completions_round):
+            try:
+                return self.client.create_course_completions([
+                    (remote_id, serialized_payload)
+                    for __, remote_id, serialized_payload, __ in completions_round
+                ])
             except Exception:
-                # Log additional data to help debug failures but have Exception bubble
-                self._log_exception_supplemental_data(
-                    learner_data,
-                    'create_assessment_reporting',
-                    app_label,
-                    enterprise_customer_uuid,
-                    lms_user_id,
-                    learner_data.course_id
-                )
+                for learner_data, __, __, lms_user_id in completions_round:
+                    self._log_exception_supplemental_data(
+                        learner_data,
+                        'create_course_completions',
+                        app_label,
+                        enterprise_customer_uuid,
+                        lms_user_id,
+                        learner_data.course_id
+                    )
                 raise
 
-            action_happened_at = localized_utcnow()
-            was_successful = code < 300
-            learner_data.status = str(code)
-            learner_data.error_message = body if not was_successful else ''
-            learner_data.is_transmitted = was_successful
-            learner_data.save()
-            self.enterprise_configuration.update_learner_synced_at(action_happened_at, was_successful)
+        self._transmit_completions_in_rounds(completions, send_round, app_label, enterprise_customer_uuid)
+
+    def _transmit_completions_concurrently(self, completions, app_label, enterprise_customer_uuid):
+        """
+        Send completion status calls to the integrated channel from a pool of threads, and save their results.
+
+        The pool size, request rate and burst come from the customer's configuration. Results are saved from the
+        calling thread, in the order the completions were exported.
+        """
+        rate_limiter = TokenBucket(
+            self.enterprise_configuration.learner_data_transmission_rate_limit,
+            self.enterprise_configuration.learner_data_transmission_burst,
+        )
+        concurrency = self.enterprise_configuration.learner_data_transmission_concurrency
+        workers = []
+        with ThreadPoolExecutor(
+            max_workers=concurrency,
+            initializer=lambda: workers.append(threading.get_ident()),
+        ) as executor:
+            def send_round(completions_round):
+                return list(executor.map(
+                    lambda completion: self._send_completion(completion[1], completion[2], rate_limiter),
+                    completions_round,
+                ))
+
+            try:
+                self._transmit_completions_in_rounds(completions, send_round, app_label, enterprise_customer_uuid)
+            finally:
+                # worker threads open their own database connection when the client stores API call records. Close
+                # it once per worker when the pool shuts down, holding every worker on a barrier so each of them
+                # runs exactly one of the close tasks.
+                worker_count = len(workers)
+                if worker_count:
+                    close_barrier = threading.Barrier(worker_count)
+                    for __ in range(worker_count):
+                        executor.submit(self._close_worker_connection, close_barrier)
+
+    @staticmethod
+    def _close_worker_connection(close_barrier):
+        """
+        Close the database connection of the calling worker thread, once every worker of the pool runs this task.
+        """
+        close_barrier.wait()
+        connection.close()
+
+    def _send_completion(self, remote_id, serialized_payload, rate_limiter):
+        """
+        Send a completion status call from a worker thread, backing off and retrying while it is rate limited.
+
+        Returns the ``(code, body)`` of the call, or the exception it raised.
+        """
+        attempts = 0
+        try:
+            while True:
+                attempts += 1
+                rate_limiter.acquire()
+                try:
+                    result = self.client.create_course_completion(remote_id, serialized_payload)
+                    retry_after = None
+                except ClientError as client_error:
+                    result = client_error
+                    retry_after = client_error.retry_after
+                code = result.status_code if isinstance(result, ClientError) else result[0]
+                if code != HTTPStatus.TOO_MANY_REQUESTS.value or attempts > self.RATE_LIMIT_MAX_RETRIES:
+                    return result
+                if retry_after is None:
+                    retry_after = self.RATE_LIMIT_BACKOFF_SECONDS * (2 ** (attempts - 1))
+                time.sleep(min(retry_after, self.RATE_LIMIT_MAX_RETRY_AFTER_SECONDS))
+        except Exception as exc:  # pylint: disable=broad-except
+            return exc
+
+    def _transmit_completions_in_rounds(self, completions, send_round, app_label, enterprise_customer_uuid):
+        """
+        Send completion status calls to the integrated channel in rounds, and save their results.
+
+        Exporters yield one record per course key and one per course run for the same enrollment, and the record
+        by course run must only be sent if the one by course key failed. Completions are therefore sent in
+        rounds, holding at most one record per enrollment, until every enrollment has succeeded or run out of
+        records.
+
+        ``send_round`` is called with the completions of a round and returns, for each of them, either the
+        ``(code, body)`` of its call, a ``ClientError`` or any other exception it raised. Other exceptions are
+        raised once the results of the round have been saved.
+        """
+        pending_completions = list(completions)
+        while pending_completions:
+            completions_round, deferred_completions, round_enrollment_ids = [], [], set()
+            for completion in pending_completions:
+                enrollment_id = completion[0].enterprise_course_enrollment_id
+                if enrollment_id in round_enrollment_ids:
+                    deferred_completions.append(completion)
+                else:
+                    round_enrollment_ids.add(enrollment_id)
+                    completions_round.append(completion)
+
+            results = send_round(completions_round)
+
+            transmitted_enrollment_ids, unexpected_error = set(), None
+            for completion, result in zip(completions_round, results):
+                learner_data, __, __, lms_user_id = completion
+                if isinstance(result, Exception) and not isinstance(result, ClientError):
+                    # Log additional data to help debug failures but have Exception bubble
+                    self._log_exception_supplemental_data(
+                        learner_data,
+                        'create_course_completion',
+                        app_label,
+                        enterprise_customer_uuid,
+                        lms_user_id,
+                        learner_data.course_id
+                    )
+                    unexpected_error = unexpected_error or result
+                    continue
+                client_error = result if isinstance(result, ClientError) else None
+                if client_error is None and result[0] >= HTTPStatus.BAD_REQUEST.value:
+                    client_error = ClientError(f'Client create_course_completion failed: {result[1]}', result[0])
+                if client_error is not None:
+                    code, body = client_error.status_code, client_error.message
+                    self.process_transmission_error(
+                        learner_data,
+                        client_error,
+                        app_label,
+                        enterprise_customer_uuid,
+                        lms_user_id,
+                        learner_data.course_id
+                    )
+                else:
+                    code, body = result
+                self._save_completion_result(completion, code, body, enterprise_customer_uuid)
+                if code < HTTPStatus.MULTIPLE_CHOICES.value:
+                    transmitted_enrollment_ids.add(completion[0].enterprise_course_enrollment_id)
+
+            if unexpected_error is not None:
+                raise unexpected_error
+
+            pending_completions = [
+                completion for completion in deferred_completions
+                if completion[0].enterprise_course_enrollment_id not in transmitted_enrollment_ids
+            ]
+
+    def _save_completion_result(self, completion, code, body, enterprise_customer_uuid):
+        """
+        Save the result of a completion status call on the learner data transmission audit.
+        """
+        learner_data, __, __, lms_user_id = completion
+        if code < HTTPStatus.BAD_REQUEST.value:
+            LOGGER.info(generate_formatted_log(
+                self.enterprise_configuration.channel_code(),
+                enterprise_customer_uuid,
+                lms_user_id,
+                learner_data.course_id,
+                'Successfully sent completion status call for enterprise enrollment '
+                f'integrated_channel_enterprise_enrollment_id={learner_data.enterprise_course_enrollment_id}'
+            ))
+
+        action_happened_at = localized_utcnow()
+        was_successful = code < 300
+        learner_data.status = str(code)
+        learner_data.error_message = body if not was_successful else ''
+        learner_data.is_transmitted = was_successful
+        learner_data.save()
+        self.enterprise_configuration.update_learner_synced_at(action_happened_at, was_successful)
 
     def deduplicate_assignment_records_transmit(self, exporter, **kwargs):
         """
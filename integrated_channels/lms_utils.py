@@ -4,6 +4,8 @@ If integrated_channels calls LMS APIs, put them here for better tracking.
 """
 from opaque_keys.edx.keys import CourseKey
 
+from django.contrib import auth
+
 try:
     from lms.djangoapps.certificates.api import get_certificate_for_user
     from lms.djangoapps.grades.course_grade_factory import CourseGradeFactory
@@ -20,7 +22,17 @@ try:
 except ImportError:
     get_course_blocks_completion_summary = None
 
-from enterprise.utils import NotConnectedToOpenEdX
+try:
+    from common.djangoapps.third_party_auth.provider import Registry
+    from social_django.models import UserSocialAuth
+except ImportError:
+    Registry = None
+    UserSocialAuth = None
+
+from enterprise.api_client.lms import ThirdPartyAuthApiClient
+from enterprise.utils import NotConnectedToOpenEdX, get_enterprise_worker_user, get_user_valid_idp
+
+User = auth.get_user_model()
 
 
 def get_persistent_grade(course_key, user):
@@ -129,3 +141,106 @@ def get_completion_summary(course_key, user):
         )
     course_id = CourseKey.from_string(course_key)
     return get_course_blocks_completion_summary(course_id, user)
+
+
+def get_remote_ids_from_social_auth(identity_provider, users):
+    """
+    Fetch the remote ids of users in a third party auth provider from their social auth entries, in a single query.
+    Args:
+        identity_provider (string): identifier slug of the third party auth provider
+        users (list): django.contrib.auth.User instances
+    Returns:
+        dict: the remote ids of the users which have one, keyed by user id
+
+    If there is a problem loading the third party auth provider Registry, throws NotConnectedToOpenEdX
+    """
+    if not Registry:
+        raise NotConnectedToOpenEdX(
+            'To use get_remote_ids_from_social_auth() function, this package must be '
+            'installed in an Open edX environment.'
+        )
+    provider = Registry.get(identity_provider)
+    if provider is None:
+        return {}
+    user_social_auths = UserSocialAuth.objects.filter(provider=provider.backend_name, user__in=users)
+    return {
+        user_social_auth.user_id: provider.get_remote_id_from_social_auth(user_social_auth)
+        for user_social_auth in user_social_auths
+        if provider.match_social_auth(user_social_auth)
+    }
+
+
+class RemoteIdResolver:
+    """
+    Resolve the remote ids of many enterprise learners, caching them for the lifetime of the resolver.
+
+    Identity providers are chosen like ``EnterpriseCustomerUser.get_remote_id`` does. Remote ids are read from
+    the social auth entries in process when running inside the LMS, and otherwise requested in batches from the
+    LMS third party auth API, which is also used when a remote id field name is given.
+    """
+
+    def __init__(self, enterprise_customer, idp_id=None, remote_id_field_name=None):
+        self.enterprise_customer = enterprise_customer
+        self.idp_id = idp_id
+        self.remote_id_field_name = remote_id_field_name
+        self._remote_ids = {}
+        self._api_client = None
+        self._identity_provider_ids = None
+
+    def prefetch(self, enterprise_customer_users):
+        """
+        Resolve the remote ids of the learners which have not been resolved yet.
+        """
+        user_ids = {
+            enterprise_customer_user.user_id for enterprise_customer_user in enterprise_customer_users
+            if enterprise_customer_user.user_id not in self._remote_ids
+        }
+        if not user_ids:
+            return
+        self._remote_ids.update(dict.fromkeys(user_ids))
+
+        users_by_identity_provider = {}
+        for user in User.objects.filter(id__in=user_ids):
+            identity_provider = self._get_identity_provider(user)
+            if identity_provider:
+                users_by_identity_provider.setdefault(identity_provider, []).append(user)
+        for identity_provider, users in users_by_identity_provider.items():
+            self._remote_ids.update(self._get_remote_ids(identity_provider, users))
+
+    def get_remote_id(self, enterprise_customer_user):
+        """
+        Return the remote id of the learner, or None if it cannot be found.
+        """
+        self.prefetch([enterprise_customer_user])
+        return self._remote_ids[enterprise_customer_user.user_id]
+
+    def _get_identity_provider(self, user):
+        """
+        Return the identifier slug of the identity provider holding the remote id of the user.
+        """
+        if self.idp_id:
+            return self.idp_id
+        if self._identity_provider_ids is None:
+            self._identity_provider_ids = list(
+                self.enterprise_customer.enterprise_customer_identity_providers.values_list('provider_id', flat=True)
+            )
+        if len(self._identity_provider_ids) > 1:
+            identity_provider = get_user_valid_idp(user, self.enterprise_customer)
+            if identity_provider:
+                return identity_provider.provider_id
+        return self._identity_provider_ids[0] if self._identity_provider_ids else None
+
+    def _get_remote_ids(self, identity_provider, users):
+        """
+        Return the remote ids of users in the identity provider, keyed by user id.
+        """
+        if Registry and not self.remote_id_field_name:
+            return get_remote_ids_from_social_auth(identity_provider, users)
+        if self._api_client is None:
+            self._api_client = ThirdPartyAuthApiClient(get_enterprise_worker_user())
+        remote_ids = self._api_client.get_remote_ids(
+            identity_provider,
+            [user.username for user in users],
+            self.remote_id_field_name,
+        )
+        return {user.id: remote_ids.get(user.username) for user in users}
@@ -14,7 +14,7 @@ from django.apps import apps
 
 from integrated_channels.exceptions import ClientError
 from integrated_channels.integrated_channel.client import IntegratedChannelApiClient
-from integrated_channels.utils import generate_formatted_log, stringify_and_store_api_record
+from integrated_channels.utils import generate_formatted_log, get_pooled_session, stringify_and_store_api_record
 
 LOGGER = logging.getLogger(__name__)
 
@@ -43,6 +43,10 @@ class MoodleResponse:
         self.text = text
 
 
+# Wrapped methods posting to ``core_grades_update_grades``, which replies with a bare ``0`` on success.
+GRADE_UPDATE_METHODS = ('_wrapped_create_course_completion', '_wrapped_update_grades')
+
+
 def moodle_request_wrapper(method):
     """
     Wraps requests to Moodle's API in a token check.
@@ -73,7 +77,7 @@ def moodle_request_wrapper(method):
             # This only happens for grades AFAICT. Zero also doesn't necessarily mean success,
             # but we have nothing else to go on
             if body == 0:
-                if method.__name__ == "_wrapped_create_course_completion" and response.status_code == 200:
+                if method.__name__ in GRADE_UPDATE_METHODS and response.status_code == 200:
                     return MoodleResponse(status_code=200, text='')
                 return 200, ''
             raise ClientError('Moodle API Grade Update failed with int code: {code}'.format(code=body), 500)
@@ -135,11 +139,22 @@ class MoodleAPIClient(IntegratedChannelApiClient):
         """
         super().__init__(enterprise_configuration)
         self.config = apps.get_app_config('moodle')
+        # pooled keep-alive connections, shared with the other clients of this process using the same host
+        self.session = get_pooled_session(self.enterprise_configuration.moodle_base_url)
         self.token = enterprise_configuration.decrypted_token or self._get_access_token()
         self.api_url = urljoin(self.enterprise_configuration.moodle_base_url, self.MOODLE_API_PATH)
         self.IntegratedChannelAPIRequestLogs = apps.get_model(
             "integrated_channel", "IntegratedChannelAPIRequestLogs"
         )
+        # Moodle course id, final grade module and enrolled users index, resolved once per course key
+        # for the lifetime of the client, i.e. for one transmission run.
+        self._course_resolutions = {}
+
+    def get_connection_metrics(self):
+        """
+        Return the per-host request and connection reuse counts of the pooled HTTP session.
+        """
+        return self.session.connection_metrics()
 
     def _post(self, additional_params):
         """
@@ -155,7 +170,7 @@ class MoodleAPIClient(IntegratedChannelApiClient):
         params.update(additional_params)
 
         start_time = time.time()
-        response = requests.post(
+        response = self.session.post(
             url=self.api_url,
             data=params,
             headers=headers
@@ -197,7 +212,7 @@ class MoodleAPIClient(IntegratedChannelApiClient):
             "username": self.enterprise_configuration.decrypted_username,
             "password": self.enterprise_configuration.decrypted_password,
         }
-        response = requests.post(
+        response = self.session.post(
             url,
             params=querystring,
             headers={
@@ -240,19 +255,22 @@ class MoodleAPIClient(IntegratedChannelApiClient):
         }
         return self._post(params)
 
-    def get_creds_of_user_in_course(self, course_id, user_email):
+    def _get_enrolled_user_ids_by_email(self, course_id):
         """
-        Sort through a list of users in a Moodle course and find the ID matching a student's email.
+        Return a mapping of the emails of the users enrolled in a Moodle course to their Moodle user ids.
         """
-        response = self._get_enrolled_users(course_id)
-        parsed_response = response.json()
-        user_id = None
-
+        parsed_response = self._get_enrolled_users(course_id).json()
+        user_ids_by_email = {}
         if isinstance(parsed_response, list):
             for enrollment in parsed_response:
-                if enrollment.get('email') == user_email:
-                    user_id = enrollment.get('id')
-                    break
+                user_ids_by_email.setdefault(enrollment.get('email'), enrollment.get('id'))
+        return user_ids_by_email
+
+    def get_creds_of_user_in_course(self, course_id, user_email):
+        """
+        Sort through a list of users in a Moodle course and find the ID matching a student's email.
+        """
+        user_id = self._get_enrolled_user_ids_by_email(course_id).get(user_email)
         if not user_id:
             raise ClientError(
                 "MoodleAPIClient request failed: 404 User enrollment not found under user={} in course={}.".format(
@@ -276,7 +294,7 @@ class MoodleAPIClient(IntegratedChannelApiClient):
         }
         complete_url = "{}?{}".format(self.api_url, urlencode(params))
         start_time = time.time()
-        response = requests.get(
+        response = self.session.get(
             self.api_url,
             params=params
         )
@@ -337,7 +355,7 @@ class MoodleAPIClient(IntegratedChannelApiClient):
         }
         complete_url = "{}?{}".format(self.api_url, urlencode(params))
         start_time = time.time()
-        response = requests.get(
+        response = self.session.get(
             self.api_url,
             params=params
         )
@@ -378,31 +396,89 @@ class MoodleAPIClient(IntegratedChannelApiClient):
             )
         return course_id
 
-    @moodle_request_wrapper
-    def _wrapped_create_course_completion(self, user_id, payload):
+    def _get_course_resolution(self, key):
         """
-        Wrapped method to request and use Moodle course and user information in order
-        to post a final course grade for the user.
+        Resolve, once per client, the Moodle course id, final grade module and enrolled users of a course key.
+
+        Returns:
+            dict: With the ``course_id``, ``course_module_id``, ``module_name`` and ``user_ids_by_email``
+            of the course.
         """
-        completion_data = json.loads(payload)
+        if key not in self._course_resolutions:
+            course_id = self.get_course_id(key)
+            course_module_id, module_name = self.get_course_final_grade_module(course_id)
+            self._course_resolutions[key] = {
+                'course_id': course_id,
+                'course_module_id': course_module_id,
+                'module_name': module_name,
+                'user_ids_by_email': self._get_enrolled_user_ids_by_email(course_id),
+                'roster_refreshed': False,
+            }
+        return self._course_resolutions[key]
+
+    def _get_moodle_user_id(self, course_resolution, user_email):
+        """
+        Return the Moodle user id of a learner enrolled in a resolved course.
+
+        The roster is downloaded again at most once per course, in case the learner enrolled after it was resolved.
+        """
+        user_ids_by_email = course_resolution['user_ids_by_email']
+        if user_email not in user_ids_by_email and not course_resolution['roster_refreshed']:
+            course_resolution['roster_refreshed'] = True
+            user_ids_by_email.update(self._get_enrolled_user_ids_by_email(course_resolution['course_id']))
+        user_id = user_ids_by_email.get(user_email)
+        if not user_id:
+            raise ClientError(
+                "MoodleAPIClient request failed: 404 User enrollment not found under user={} in course={}.".format(
+                    user_email,
+                    course_resolution['course_id']
+                ),
+                HTTPStatus.NOT_FOUND.value
+            )
+        return user_id
 
-        course_id = self.get_course_id(completion_data['courseID'])
-        course_module_id, module_name = self.get_course_final_grade_module(course_id)
-        moodle_user_id = self.get_creds_of_user_in_course(course_id, user_id)
+    def _update_grades(self, course_resolution, grades):
+        """
+        Post the final grades of several learners of a course in a single ``core_grades_update_grades`` call.
 
+        Args:
+            course_resolution (dict): The resolved course, see ``_get_course_resolution``.
+            grades (list): ``(moodle_user_id, grade)`` tuples, with grades as decimals between [0-1].
+        """
         params = {
             'wsfunction': 'core_grades_update_grades',
-            'source': module_name,
-            'courseid': course_id,
+            'source': course_resolution['module_name'],
+            'courseid': course_resolution['course_id'],
             'component': 'mod_assign',
-            'activityid': course_module_id,
+            'activityid': course_resolution['course_module_id'],
             'itemnumber': 0,
-            'grades[0][studentid]': moodle_user_id,
-            # The grade is exported as a decimal between [0-1]
-            'grades[0][grade]': completion_data['grade'] * self.enterprise_configuration.grade_scale
         }
+        for index, (moodle_user_id, grade) in enumerate(grades):
+            params[f'grades[{index}][studentid]'] = moodle_user_id
+            params[f'grades[{index}][grade]'] = grade * self.enterprise_configuration.grade_scale
+        return self._post(params)
+
+    @moodle_request_wrapper
+    def _wrapped_update_grades(self, course_resolution, grades):
+        """
+        Wrapped version of ``_update_grades`` which handles Moodle's error responses.
+        """
+        return self._update_grades(course_resolution, grades)
 
-        response = self._post(params)
+    @moodle_request_wrapper
+    def _wrapped_create_course_completion(self, user_id, payload):
+        """
+        Wrapped method to request and use Moodle course and user information in order
+        to post a final course grade for the user.
+        """
+        completion_data = json.loads(payload)
+
+        course_resolution = self._get_course_resolution(completion_data['courseID'])
+        course_module_id = course_resolution['course_module_id']
+        module_name = course_resolution['module_name']
+        moodle_user_id = self._get_moodle_user_id(course_resolution, user_id)
+
+        response = self._update_grades(course_resolution, [(moodle_user_id, completion_data['grade'])])
 
         if hasattr(response, 'status_code'):
             status_code = response.status_code
@@ -543,6 +619,61 @@ class MoodleAPIClient(IntegratedChannelApiClient):
         )
         return resp.status_code, resp.text
 
+    def create_course_completions(self, completions):
+        """
+        Send the course completion data of several learners to Moodle, with one grade update per course.
+
+        Args:
+            completions (list): ``(user_email, payload)`` tuples, as accepted by ``create_course_completion``.
+
+        Returns:
+            list: For each completion, either its ``(status_code, text)`` or the ``ClientError`` raised for it.
+        """
+        results = [None] * len(completions)
+        completions_by_course = {}
+        for index, (user_email, payload) in enumerate(completions):
+            completion_data = json.loads(payload)
+            completions_by_course.setdefault(completion_data['courseID'], []).append(
+                (index, user_email, completion_data['grade'])
+            )
+
+        for course_key, course_completions in completions_by_course.items():
+            try:
+                course_resolution = self._get_course_resolution(course_key)
+            except ClientError as error:
+                for index, __, __ in course_completions:
+                    results[index] = error
+                continue
+
+            indexes, grades = [], []
+            for index, user_email, grade in course_completions:
+                try:
+                    grades.append((self._get_moodle_user_id(course_resolution, user_email), grade))
+                    indexes.append(index)
+                except ClientError as error:
+                    results[index] = error
+            if not grades:
+                continue
+
+            try:
+                response = self._wrapped_update_grades(course_resolution, grades)
+                result = (response.status_code, response.text)
+            except ClientError as error:
+                result = error
+            LOGGER.info(
+                generate_formatted_log(
+                    channel_name=self.enterprise_configuration.channel_code(),
+                    enterprise_customer_uuid=self.enterprise_configuration.enterprise_customer.uuid,
+                    course_or_course_run_key=course_key,
+                    plugin_configuration_id=self.enterprise_configuration.id,
+                    message=f'Response for Moodle Create Course Completions Request for {len(grades)} learners: '
+                            f'{result} '
+                )
+            )
+            for index in indexes:
+                results[index] = result
+        return results
+
     @moodle_request_wrapper
     def delete_course_completion(self, user_id, payload):
         pass
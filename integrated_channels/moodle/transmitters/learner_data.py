@@ -12,6 +12,8 @@ class MoodleLearnerTransmitter(LearnerTransmitter):
     sent to Moodle.
     """
 
+    TRANSMIT_COMPLETIONS_IN_BULK = True
+
     def __init__(self, enterprise_configuration, client=MoodleAPIClient):
         """
         By default, use the ``MoodleAPIClient`` for learner data transmission to Moodle.
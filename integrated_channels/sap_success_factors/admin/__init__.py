@@ -59,6 +59,9 @@ class SAPSuccessFactorsEnterpriseCustomerConfigurationAdmin(DjangoObjectActions,
         "disable_learner_data_transmissions",
         "transmit_total_hours",
         "transmission_chunk_size",
+        "learner_data_transmission_concurrency",
+        "learner_data_transmission_rate_limit",
+        "learner_data_transmission_burst",
         "additional_locales",
         "catalogs_to_transmit",
         "display_name",
@@ -10,14 +10,22 @@ from http import HTTPStatus
 from urllib.parse import urljoin
 
 import requests
+from edx_django_utils.cache import get_cache_key
 from requests.exceptions import ConnectionError, Timeout  # pylint: disable=redefined-builtin
 
 from django.apps import apps
 from django.conf import settings
+from django.core.cache import cache
+from django.utils.encoding import force_bytes, force_str
 
 from integrated_channels.exceptions import ClientError
 from integrated_channels.integrated_channel.client import IntegratedChannelApiClient
-from integrated_channels.utils import generate_formatted_log, stringify_and_store_api_record
+from integrated_channels.utils import (
+    generate_formatted_log,
+    get_pooled_session,
+    parse_retry_after,
+    stringify_and_store_api_record,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +43,9 @@ class SAPSuccessFactorsAPIClient(IntegratedChannelApiClient):  # pylint: disable
     SESSION_TIMEOUT = getattr(settings, "ENTERPRISE_SAPSF_SESSION_TIMEOUT", 5)
     MAX_RETRIES = getattr(settings, "ENTERPRISE_SAPSF_MAX_RETRIES", 3)
     BACKOFF_FACTOR = getattr(settings, "ENTERPRISE_SAPSF_BACKOFF_FACTOR", 1)
+    # user tokens are refreshed this many seconds before SAP reports them as expired
+    USER_TOKEN_EXPIRY_MARGIN = getattr(settings, "ENTERPRISE_SAPSF_USER_TOKEN_EXPIRY_MARGIN", 60)
+    INACTIVE_LEARNERS_PAGE_SIZE = getattr(settings, "ENTERPRISE_SAPSF_INACTIVE_LEARNERS_PAGE_SIZE", 500)
 
     GENERIC_COURSE_COMPLETION_PATH = 'learning/odatav4/public/admin/learningevent-service/v1/OCNLearningEvents'
 
@@ -53,6 +64,8 @@ class SAPSuccessFactorsAPIClient(IntegratedChannelApiClient):  # pylint: disable
         self.IntegratedChannelAPIRequestLogs = apps.get_model(
             "integrated_channel", "IntegratedChannelAPIRequestLogs"
         )
+        # pooled keep-alive connections for the user-override posts, shared per SAP host
+        self.user_override_session = get_pooled_session(self.enterprise_configuration.sapsf_base_url)
 
     def get_oauth_access_token(self, client_id, client_secret, company_id, user_id, user_type, customer_uuid):
         """
@@ -296,11 +309,52 @@ class SAPSuccessFactorsAPIClient(IntegratedChannelApiClient):  # pylint: disable
 
         Raises: ClientError if error status code >=400 from SAPSF
         """
+        oauth_access_token, is_cached = self._get_user_access_token(sap_user_id)
+        response = self._post_with_user_token(oauth_access_token, url, payload)
+        if is_cached and response.status_code == HTTPStatus.UNAUTHORIZED.value:
+            # the cached token may have been revoked before its expiry, retry once with a fresh one
+            cache.delete(self._get_user_access_token_cache_key(sap_user_id))
+            oauth_access_token, __ = self._get_user_access_token(sap_user_id)
+            response = self._post_with_user_token(oauth_access_token, url, payload)
+
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS.value:
+            raise ClientError(
+                f'SAPSuccessFactorsAPIClient request failed with status {response.status_code}: {response.text}',
+                response.status_code,
+                retry_after=parse_retry_after(response),
+            )
+        if response.status_code >= 400:
+            raise ClientError(
+                'SAPSuccessFactorsAPIClient request failed with status {status_code}: {message}'.format(
+                    status_code=response.status_code,
+                    message=response.text
+                )
+            )
+        return response.status_code, response.text
+
+    def _get_user_access_token(self, sap_user_id):
+        """
+        Return a user-scoped OAuth access token for ``sap_user_id``, requesting one from SAP SuccessFactors only
+        when no unexpired token is found in the Django cache.
+
+        Tokens are shared through the cache by every client of the same configuration, across transmission runs
+        and workers. They are cached under a hashed key, encrypted with the configuration's secret field key,
+        until ``USER_TOKEN_EXPIRY_MARGIN`` seconds before SAP SuccessFactors reports them as expired.
+
+        Returns:
+            tuple: the access token and whether it was served from the cache.
+        """
+        fernet = self.enterprise_configuration._meta.get_field('decrypted_secret').fernet
+        cache_key = self._get_user_access_token_cache_key(sap_user_id)
+        cached_token = cache.get(cache_key)
+        if cached_token:
+            return force_str(fernet.decrypt(force_bytes(cached_token))), True
+
         SAPSuccessFactorsEnterpriseCustomerConfiguration = apps.get_model(
             'sap_success_factors',
             'SAPSuccessFactorsEnterpriseCustomerConfiguration'
         )
-        oauth_access_token, _ = self.get_oauth_access_token(
+        oauth_access_token, expires_at = self.get_oauth_access_token(
             self.enterprise_configuration.decrypted_key,
             self.enterprise_configuration.decrypted_secret,
             self.enterprise_configuration.sapsf_company_id,
@@ -308,8 +362,27 @@ class SAPSuccessFactorsAPIClient(IntegratedChannelApiClient):  # pylint: disable
             SAPSuccessFactorsEnterpriseCustomerConfiguration.USER_TYPE_USER,
             self.enterprise_configuration.enterprise_customer.uuid
         )
+        timeout = (expires_at - datetime.datetime.utcnow()).total_seconds() - self.USER_TOKEN_EXPIRY_MARGIN
+        if timeout > 0:
+            cache.set(cache_key, force_str(fernet.encrypt(force_bytes(oauth_access_token))), int(timeout))
+        return oauth_access_token, False
+
+    def _get_user_access_token_cache_key(self, sap_user_id):
+        """
+        Return the cache key of the user-scoped access token of ``sap_user_id`` for this configuration.
+        """
+        return get_cache_key(
+            resource='sapsf_user_access_token',
+            enterprise_configuration_id=self.enterprise_configuration.id,
+            sap_user_id=sap_user_id,
+        )
+
+    def _post_with_user_token(self, oauth_access_token, url, payload):
+        """
+        Post ``payload`` to ``url`` through the pooled session, authenticated with a user-scoped access token.
+        """
         start_time = time.time()
-        response = requests.post(
+        response = self.user_override_session.post(
             url,
             data=payload,
             headers={
@@ -328,15 +401,7 @@ class SAPSuccessFactorsAPIClient(IntegratedChannelApiClient):  # pylint: disable
             response_body=response.text,
             channel_name=self.enterprise_configuration.channel_code()
         )
-
-        if response.status_code >= 400:
-            raise ClientError(
-                'SAPSuccessFactorsAPIClient request failed with status {status_code}: {message}'.format(
-                    status_code=response.status_code,
-                    message=response.text
-                )
-            )
-        return response.status_code, response.text
+        return response
 
     def _call_post_with_session(self, url, payload):
         """
@@ -403,23 +468,44 @@ class SAPSuccessFactorsAPIClient(IntegratedChannelApiClient):  # pylint: disable
             }
         ]
         """
+        all_inactive_learners = []
+        for inactive_learners_page in self.iter_inactive_sap_learner_pages():
+            all_inactive_learners += inactive_learners_page
+        return all_inactive_learners
+
+    def iter_inactive_sap_learner_pages(self):
+        """
+        Yield the inactive learners of the SuccessFactors searchStudent API one page at a time, as they are fetched.
+
+        Iteration stops early, once the error is logged, if a page cannot be fetched.
+
+        Yields: List of inactive learners of a page, see ``get_inactive_sap_learners``.
+        """
         self._create_session()
         sap_search_student_url = '{sapsf_base_url}/{search_students_path}?$filter={search_filter}'.format(
             sapsf_base_url=self.enterprise_configuration.sapsf_base_url.rstrip('/'),
             search_students_path=self.global_sap_config.search_student_api_path.rstrip('/'),
             search_filter='criteria/isActive eq False&$select=studentID',
         )
-        all_inactive_learners = self._call_search_students_recursively(
-            sap_search_student_url,
-            all_inactive_learners=[],
-            page_size=500,
-            start_at=0
-        )
-        return all_inactive_learners
-
-    def _call_search_students_recursively(self, sap_search_student_url, all_inactive_learners, page_size, start_at):
+        start_at = 0
+        while True:
+            sap_inactive_learners = self._get_search_students_page(
+                sap_search_student_url,
+                page_size=self.INACTIVE_LEARNERS_PAGE_SIZE,
+                start_at=start_at,
+            )
+            if sap_inactive_learners is None:
+                return
+            yield sap_inactive_learners['value']
+            start_at += self.INACTIVE_LEARNERS_PAGE_SIZE
+            if sap_inactive_learners['@odata.count'] <= start_at:
+                return
+
+    def _get_search_students_page(self, sap_search_student_url, page_size, start_at):
         """
-        Make recursive GET calls to traverse the paginated API response for search students.
+        Make a GET call for a page of the paginated API response for search students.
+
+        Returns: The parsed response, or None if the page could not be fetched.
         """
         search_student_paginated_url = '{sap_search_student_url}&{pagination_criterion}'.format(
             sap_search_student_url=sap_search_student_url,
@@ -489,17 +575,4 @@ class SAPSuccessFactorsAPIClient(IntegratedChannelApiClient):  # pylint: disable
                 )
             return None
 
-        new_page_start_at = page_size + start_at
-        total_inactive_learners = sap_inactive_learners['@odata.count']
-        inactive_learners_on_page = sap_inactive_learners['value']
-
-        all_inactive_learners += inactive_learners_on_page
-        if total_inactive_learners > new_page_start_at:
-            return self._call_search_students_recursively(
-                sap_search_student_url,
-                all_inactive_learners,
-                page_size=page_size,
-                start_at=new_page_start_at,
-            )
-
-        return all_inactive_learners
+        return sap_inactive_learners
@@ -5,15 +5,19 @@ Learner data exporter for Enterprise Integrated Channel SAP SuccessFactors.
 from logging import getLogger
 
 from requests import RequestException
+from simple_history.utils import bulk_update_with_history
 
 from django.apps import apps
 from django.conf import settings
 
-from enterprise.models import EnterpriseCustomerUser, PendingEnterpriseCustomerUser
-from enterprise.tpa_pipeline import get_user_from_social_auth
+from enterprise import roles_api
+from enterprise.models import EnterpriseCustomerUser
+from enterprise.tpa_pipeline import get_users_from_social_auth
+from enterprise.utils import localized_utcnow
 from integrated_channels.catalog_service_utils import get_course_id_for_enrollment, get_course_run_for_enrollment
 from integrated_channels.exceptions import ClientError
 from integrated_channels.integrated_channel.exporters.learner_data import LearnerExporter
+from integrated_channels.lms_utils import RemoteIdResolver
 from integrated_channels.sap_success_factors.client import SAPSuccessFactorsAPIClient
 from integrated_channels.sap_success_factors.exporters.utils import is_sso_enabled_via_tpa_service
 from integrated_channels.utils import generate_formatted_log, parse_datetime_to_epoch_millis
@@ -28,6 +32,24 @@ class SapSuccessFactorsLearnerExporter(LearnerExporter):
 
     INCLUDE_GRADE_FOR_COMPLETION_AUDIT_CHECK = False
     remote_id_field_name = getattr(settings, 'SAP_THIRD_PARTY_AUTH_USER_ID_ATTRIBUTE', None)
+    remote_id_resolver = None
+
+    def prepare_enrollments_for_export(self, enrollments):
+        """
+        Resolve the SAP SuccessFactors user ids of all the learners to export at once.
+        """
+        enterprise_customer = self.enterprise_configuration.enterprise_customer
+        remote_id_field_name = None
+        if self.remote_id_field_name and is_sso_enabled_via_tpa_service(enterprise_customer):
+            remote_id_field_name = self.remote_id_field_name
+        self.remote_id_resolver = RemoteIdResolver(
+            enterprise_customer,
+            self.enterprise_configuration.idp_id,
+            remote_id_field_name,
+        )
+        self.remote_id_resolver.prefetch(
+            [enterprise_enrollment.enterprise_customer_user for enterprise_enrollment in enrollments]
+        )
 
     def get_learner_data_records(
             self,
@@ -48,7 +70,9 @@ class SapSuccessFactorsLearnerExporter(LearnerExporter):
         if completed_date is not None:
             sap_completed_timestamp = parse_datetime_to_epoch_millis(completed_date)
 
-        if self.remote_id_field_name and \
+        if self.remote_id_resolver is not None:
+            sapsf_user_id = self.remote_id_resolver.get_remote_id(enterprise_enrollment.enterprise_customer_user)
+        elif self.remote_id_field_name and \
                 is_sso_enabled_via_tpa_service(self.enterprise_configuration.enterprise_customer):
             LOGGER.info('Using remote_id_field_name for SAPSF user ID retrieval')
             sapsf_user_id = enterprise_enrollment.enterprise_customer_user.get_remote_id(
@@ -125,10 +149,10 @@ class SapSuccessFactorsLearnerManger:
         self.enterprise_configuration = enterprise_configuration
         self.client = client(enterprise_configuration) if client else None
 
-    def _get_inactive_learners(self):
-        """ Gets inactive learners list from the client or raises ClientError on failure. """
+    def _iter_inactive_learner_pages(self):
+        """ Yields pages of inactive learners from the client or raises ClientError on failure. """
         try:
-            sap_inactive_learners = self.client.get_inactive_sap_learners()
+            yield from self.client.iter_inactive_sap_learner_pages()
         except RequestException as exc:
             raise ClientError(
                 'SAPSuccessFactorsAPIClient request failed: {error} {message}'.format(
@@ -136,7 +160,6 @@ class SapSuccessFactorsLearnerManger:
                     message=str(exc)
                 )
             ) from exc
-        return sap_inactive_learners
 
     def _get_identity_providers(self):
         """ Logic check for getting an identity provider preflight validation, split out for unit testing."""
@@ -157,16 +180,24 @@ class SapSuccessFactorsLearnerManger:
 
     def unlink_learners(self):
         """
-        Iterate over each learner and unlink inactive SAP channel learners.
+        Iterate over each page of learners and unlink inactive SAP channel learners.
 
-        This method iterates over each enterprise learner and unlink learner
-        from the enterprise if the learner is marked inactive in the related
-        integrated channel.
+        This method iterates over the pages of learners marked inactive in the related integrated channel as they
+        are fetched, and unlinks the enterprise learners of each page in bulk.
         """
-        sap_inactive_learners = self._get_inactive_learners()
-
-        total_sap_inactive_learners = len(sap_inactive_learners) if sap_inactive_learners else 0
         enterprise_customer = self.enterprise_configuration.enterprise_customer
+        total_sap_inactive_learners = 0
+        providers = None
+        for sap_inactive_learners in self._iter_inactive_learner_pages():
+            if not sap_inactive_learners:
+                continue
+            if not total_sap_inactive_learners:
+                providers = self._get_identity_providers()
+            total_sap_inactive_learners += len(sap_inactive_learners)
+            if not providers:
+                break
+            self._unlink_inactive_learners(providers, sap_inactive_learners)
+
         LOGGER.info(
             generate_formatted_log(
                 self.enterprise_configuration.channel_code(),
@@ -177,26 +208,29 @@ class SapSuccessFactorsLearnerManger:
                 f'enterprise customer {enterprise_customer.name}'
             )
         )
-        if not sap_inactive_learners:
-            return None
 
-        providers = self._get_identity_providers()
-        if not providers:
-            return None
+    def _unlink_inactive_learners(self, providers, sap_inactive_learners):
+        """
+        Unlink the enterprise learners of a page of inactive SAP learners.
 
-        for sap_inactive_learner in sap_inactive_learners:
-            sap_student_id = sap_inactive_learner['studentID']
-            social_auth_user = get_user_from_social_auth(providers, sap_student_id, enterprise_customer)
-            if not social_auth_user:
-                continue
+        The learners are resolved with a single social auth query and unlinked with bulk updates.
+        """
+        enterprise_customer = self.enterprise_configuration.enterprise_customer
+        users_by_sap_student_id = get_users_from_social_auth(
+            providers,
+            [sap_inactive_learner['studentID'] for sap_inactive_learner in sap_inactive_learners],
+            enterprise_customer,
+        )
+        if not users_by_sap_student_id:
+            return
 
-            try:
-                # Unlink user email from related Enterprise Customer
-                EnterpriseCustomerUser.objects.unlink_user(
-                    enterprise_customer=enterprise_customer,
-                    user_email=social_auth_user.email,
-                )
-            except (EnterpriseCustomerUser.DoesNotExist, PendingEnterpriseCustomerUser.DoesNotExist):
+        enterprise_customer_users = list(EnterpriseCustomerUser.objects.filter(
+            enterprise_customer=enterprise_customer,
+            user_id__in={user.id for user in users_by_sap_student_id.values()},
+        ))
+        linked_user_ids = {enterprise_customer_user.user_id for enterprise_customer_user in enterprise_customer_users}
+        for sap_student_id, social_auth_user in users_by_sap_student_id.items():
+            if social_auth_user.id not in linked_user_ids:
                 LOGGER.info(
                     generate_formatted_log(
                         self.enterprise_configuration.channel_code(),
@@ -207,4 +241,33 @@ class SapSuccessFactorsLearnerManger:
                         f'is not linked with enterprise {enterprise_customer.name}'
                     )
                 )
-        return None
+        if not enterprise_customer_users:
+            return
+
+        unlinked_at = localized_utcnow()
+        for enterprise_customer_user in enterprise_customer_users:
+            enterprise_customer_user.linked = False
+            enterprise_customer_user.active = False
+            enterprise_customer_user.is_relinkable = True
+            enterprise_customer_user.modified = unlinked_at
+        bulk_update_with_history(
+            enterprise_customer_users,
+            EnterpriseCustomerUser,
+            ['linked', 'active', 'is_relinkable', 'modified'],
+        )
+        # bulk updates do not send the post_save signal removing the learner role of unlinked learners
+        roles_api.delete_learner_role_assignments(
+            [social_auth_user for social_auth_user in users_by_sap_student_id.values()
+             if social_auth_user.id in linked_user_ids],
+            enterprise_customer,
+        )
+        LOGGER.info(
+            generate_formatted_log(
+                self.enterprise_configuration.channel_code(),
+                self.enterprise_configuration.enterprise_customer.uuid,
+                None,
+                None,
+                f'Unlinked {len(enterprise_customer_users)} inactive SAP learners from '
+                f'enterprise customer {enterprise_customer.name}'
+            )
+        )
@@ -7,7 +7,10 @@ import itertools
 import json
 import math
 import re
+import threading
+import time
 from datetime import datetime, timedelta, timezone
+from http.cookiejar import DefaultCookiePolicy
 from itertools import islice
 from logging import getLogger
 from string import Formatter
@@ -15,8 +18,11 @@ from urllib.parse import urlparse
 
 import pytz
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from django.apps import apps
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import Q
 from django.utils.html import strip_tags
@@ -326,6 +332,133 @@ def log_exception(enterprise_configuration, msg, course_or_course_run_key=None):
     )
 
 
+class PooledSession(requests.Session):
+    """
+    A ``requests.Session`` mounting a connection-pooling, retrying adapter and applying a default timeout.
+
+    Sessions are shared between clients (see ``get_pooled_session``), so they never persist cookies and
+    callers must pass any credentials with each request.
+    """
+
+    # only idempotent methods are retried on these statuses, see ``Retry.DEFAULT_ALLOWED_METHODS``
+    RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+    def __init__(self, pool_size, max_retries, backoff_factor, timeout):
+        super().__init__()
+        self.timeout = timeout
+        self.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=self.RETRY_STATUS_CODES,
+                raise_on_status=False,
+            ),
+        )
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, *args, **kwargs)
+
+    def connection_metrics(self):
+        """
+        Return, per host, the number of requests sent and connections opened through this session's pools.
+        Every request beyond the opened connections reused a pooled connection.
+        """
+        metrics = {}
+        for adapter in {id(adapter): adapter for adapter in self.adapters.values()}.values():
+            pools = adapter.poolmanager.pools
+            for pool_key in pools.keys():
+                pool = pools.get(pool_key)
+                if pool is None:
+                    continue
+                host_metrics = metrics.setdefault(
+                    f'{pool.scheme}://{pool.host}:{pool.port}',
+                    {'requests': 0, 'connections': 0, 'reused': 0},
+                )
+                host_metrics['requests'] += pool.num_requests
+                host_metrics['connections'] += pool.num_connections
+                host_metrics['reused'] = max(host_metrics['requests'] - host_metrics['connections'], 0)
+        return metrics
+
+
+_POOLED_SESSIONS = {}
+_POOLED_SESSIONS_LOCK = threading.Lock()
+
+
+def get_pooled_session(base_url):
+    """
+    Return the ``PooledSession`` shared by every client of this worker process talking to ``base_url``'s host.
+
+    Pool size, timeout and retries are configured with the ``INTEGRATED_CHANNELS_HTTP_POOL_SIZE``,
+    ``INTEGRATED_CHANNELS_HTTP_TIMEOUT``, ``INTEGRATED_CHANNELS_HTTP_MAX_RETRIES`` and
+    ``INTEGRATED_CHANNELS_HTTP_BACKOFF_FACTOR`` settings.
+    """
+    parsed_url = urlparse(base_url or '')
+    session_key = f'{parsed_url.scheme}://{parsed_url.netloc}'
+    with _POOLED_SESSIONS_LOCK:
+        session = _POOLED_SESSIONS.get(session_key)
+        if session is None:
+            session = PooledSession(
+                pool_size=getattr(settings, 'INTEGRATED_CHANNELS_HTTP_POOL_SIZE', 10),
+                max_retries=getattr(settings, 'INTEGRATED_CHANNELS_HTTP_MAX_RETRIES', 3),
+                backoff_factor=getattr(settings, 'INTEGRATED_CHANNELS_HTTP_BACKOFF_FACTOR', 1),
+                timeout=getattr(settings, 'INTEGRATED_CHANNELS_HTTP_TIMEOUT', (10, 60)),
+            )
+            _POOLED_SESSIONS[session_key] = session
+    return session
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket limiting the rate of requests sent to an integrated channel.
+
+    Up to ``capacity`` requests may be sent back to back, after which ``acquire`` blocks so that no more than
+    ``rate`` requests are sent per second. A bucket without a rate never blocks.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = max(capacity or 1, 1)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Take a token from the bucket, waiting until one is available.
+        """
+        if not self.rate:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_seconds = (1 - self.tokens) / self.rate
+            time.sleep(wait_seconds)
+
+
+def parse_retry_after(response):
+    """
+    Return the number of seconds a ``Retry-After`` header of the response asks to wait, or None.
+
+    Only the delay-seconds form of the header is supported, an HTTP date is ignored.
+    """
+    retry_after = response.headers.get('Retry-After')
+    try:
+        return max(float(retry_after), 0)
+    except (TypeError, ValueError):
+        return None
+
+
 def refresh_session_if_expired(
     oauth_access_token_function,
     session=None,
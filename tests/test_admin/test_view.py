@@ -1730,8 +1730,8 @@ class TestEnterpriseCustomerManageLearnersViewPostBulkUpload(BaseTestEnterpriseC
         ]
 
         if valid_course_id:
+            # each distinct course is only validated once
             enrollment_instance.get_course_details.side_effect = [
-                fake_enrollment_api.get_course_details(course_id),
                 fake_enrollment_api.get_course_details(course_id),
                 fake_enrollment_api.get_course_details(second_course_id),
             ]
@@ -0,0 +1,168 @@
+"""
+Tests for the `edx-enterprise` api export module.
+"""
+
+import csv
+import json
+
+from pytest import mark
+from rest_framework.reverse import reverse
+
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from enterprise.api.export import (
+    flatten_row,
+    get_export_columns,
+    iterate_in_keyset_chunks,
+    serialize_in_chunks,
+    streaming_export_response,
+)
+from enterprise.api.v1.serializers import (
+    EnterpriseCourseEnrollmentReadOnlySerializer,
+    EnterpriseGroupMembershipExportSerializer,
+    EnterpriseGroupMembershipSerializer,
+    EnterpriseMembersSerializer,
+)
+from enterprise.models import EnterpriseCourseEnrollment, EnterpriseGroupMembership
+from test_utils import APITest, factories
+
+
+@mark.django_db
+class TestExportHelpers(TestCase):
+    """
+    Tests for the streaming export helpers.
+    """
+
+    def test_iterate_in_keyset_chunks(self):
+        enrollments = [factories.EnterpriseCourseEnrollmentFactory() for _ in range(5)]
+        queryset = EnterpriseCourseEnrollment.objects.order_by('-course_id')
+
+        with CaptureQueriesContext(connection) as queries:
+            chunks = list(iterate_in_keyset_chunks(queryset, chunk_size=2))
+
+        assert [[enrollment.pk for enrollment in chunk] for chunk in chunks] == [
+            [enrollments[0].pk, enrollments[1].pk],
+            [enrollments[2].pk, enrollments[3].pk],
+            [enrollments[4].pk],
+        ]
+        assert len(queries) == 3
+
+    def test_serialize_in_chunks(self):
+        enrollments = [factories.EnterpriseCourseEnrollmentFactory() for _ in range(3)]
+
+        rows = serialize_in_chunks(
+            EnterpriseCourseEnrollment.objects.all(),
+            EnterpriseCourseEnrollmentReadOnlySerializer,
+            chunk_size=2,
+        )
+
+        assert [row['course_id'] for row in rows] == [enrollment.course_id for enrollment in enrollments]
+
+    def test_flatten_row(self):
+        row = {'id': 1, 'member_details': {'user_email': 'bob@example.com', 'user': {'name': 'Bob'}}, 'tags': ['a']}
+
+        assert flatten_row(row) == {
+            'id': 1,
+            'member_details.user_email': 'bob@example.com',
+            'member_details.user.name': 'Bob',
+            'tags': '["a"]',
+        }
+
+    def test_get_export_columns(self):
+        assert get_export_columns(EnterpriseCourseEnrollmentReadOnlySerializer) == [
+            'enterprise_customer_user', 'course_id', 'unenrolled_at', 'created',
+        ]
+        assert get_export_columns(
+            EnterpriseMembersSerializer, nested_fields={'enterprise_customer_user': ('email', 'name')},
+        ) == ['enterprise_customer_user.email', 'enterprise_customer_user.name', 'enrollments']
+
+    def test_csv_export_keeps_columns_missing_from_first_row(self):
+        rows = [
+            {'id': 1, 'member_details': {'user_email': 'pending@example.com'}},
+            {'id': 2, 'member_details': {'user_email': 'bob@example.com', 'user_name': 'Bob'}},
+        ]
+
+        response = streaming_export_response(
+            iter(rows), 'csv', 'learners', ['id', 'member_details.user_email', 'member_details.user_name'],
+        )
+
+        assert list(csv.reader(b''.join(response.streaming_content).decode().splitlines())) == [
+            ['id', 'member_details.user_email', 'member_details.user_name'],
+            ['1', 'pending@example.com', ''],
+            ['2', 'bob@example.com', 'Bob'],
+        ]
+
+    def test_group_membership_export_serializer(self):
+        group = factories.EnterpriseGroupFactory()
+        linked_memberships = [
+            factories.EnterpriseGroupMembershipFactory(group=group, pending_enterprise_customer_user=None)
+            for _ in range(4)
+        ]
+        for _ in range(2):
+            factories.EnterpriseCourseEnrollmentFactory(
+                enterprise_customer_user=linked_memberships[0].enterprise_customer_user,
+            )
+        memberships = EnterpriseGroupMembership.objects.filter(group=group)
+
+        with CaptureQueriesContext(connection) as queries:
+            rows = list(serialize_in_chunks(
+                EnterpriseGroupMembershipExportSerializer.get_export_queryset(memberships),
+                EnterpriseGroupMembershipExportSerializer,
+                chunk_size=2,
+            ))
+
+        # a query per chunk, the last one being empty, and a query loading the users of each non empty chunk
+        assert len(queries) == 5
+        assert rows == EnterpriseGroupMembershipSerializer(memberships.order_by('pk'), many=True).data
+        assert sorted(row['enrollments'] for row in rows) == [0, 0, 0, 2]
+
+        factories.EnterpriseGroupMembershipFactory(group=group, enterprise_customer_user=None)
+        rows = serialize_in_chunks(
+            EnterpriseGroupMembershipExportSerializer.get_export_queryset(memberships),
+            EnterpriseGroupMembershipExportSerializer,
+            chunk_size=2,
+        )
+        assert list(rows) == EnterpriseGroupMembershipSerializer(memberships.order_by('pk'), many=True).data
+
+
+@mark.django_db
+class TestEnterpriseCourseEnrollmentExport(APITest):
+    """
+    Tests for streaming exports of the ``enterprise-course-enrollment`` API endpoint.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.user.is_staff = True
+        self.user.save()
+        self.enrollments = [factories.EnterpriseCourseEnrollmentFactory() for _ in range(3)]
+        self.url = settings.TEST_SERVER + reverse('enterprise-course-enrollment-list')
+
+    def test_export_csv(self):
+        response = self.client.get(self.url, {'export_format': 'csv'})
+
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'text/csv'
+        assert response['Content-Disposition'] == 'attachment; filename="enterprise_course_enrollments.csv"'
+        rows = list(csv.DictReader(b''.join(response.streaming_content).decode().splitlines()))
+        assert [row['course_id'] for row in rows] == [enrollment.course_id for enrollment in self.enrollments]
+        assert [int(row['enterprise_customer_user']) for row in rows] == [
+            enrollment.enterprise_customer_user_id for enrollment in self.enrollments
+        ]
+
+    def test_export_ndjson(self):
+        response = self.client.get(self.url, {'export_format': 'ndjson'})
+
+        assert response.status_code == 200
+        assert response['Content-Type'] == 'application/x-ndjson'
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        assert [row['course_id'] for row in rows] == [enrollment.course_id for enrollment in self.enrollments]
+
+    def test_export_unsupported_format(self):
+        response = self.client.get(self.url, {'export_format': 'xml'})
+
+        assert response.status_code == 400
+        assert 'export_format' in response.json()
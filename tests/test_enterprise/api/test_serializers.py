@@ -1,6 +1,7 @@
 """
 Tests for the `edx-enterprise` serializer module.
 """
+import csv
 import datetime
 import json
 from unittest.mock import Mock, patch
@@ -13,8 +14,11 @@ from rest_framework.reverse import reverse
 
 from django.conf import settings
 from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.db import connection
 from django.http import HttpRequest
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from enterprise.api.utils import CourseRunProgressStatuses
 from enterprise.api.v1.serializers import (
@@ -34,6 +38,7 @@ from enterprise.api.v1.serializers import (
 )
 from enterprise.constants import ENTERPRISE_ADMIN_ROLE, ENTERPRISE_LEARNER_ROLE
 from enterprise.models import (
+    AdminNotificationRead,
     EnterpriseCustomerBrandingConfiguration,
     EnterpriseCustomerSupportUsersView,
     SystemWideEnterpriseRole,
@@ -189,6 +194,99 @@ class TestEnterpriseCustomerSerializer(BaseSerializerTestWithEnterpriseRoleAssig
         serialized_auth_org_id = serializer.data['auth_org_id']
         self.assertEqual(serialized_auth_org_id, expected_auth_org_id)
 
+    def _create_enterprise_customer_with_related_objects(self, user):
+        """
+        Create an enterprise customer linked to the user, with a catalog, an identity provider and an integration.
+        """
+        enterprise_customer = factories.EnterpriseCustomerFactory()
+        factories.EnterpriseCustomerUserFactory(user_id=user.id, enterprise_customer=enterprise_customer)
+        factories.EnterpriseCustomerCatalogFactory(enterprise_customer=enterprise_customer)
+        factories.EnterpriseCustomerIdentityProviderFactory(enterprise_customer=enterprise_customer)
+        factories.SAPSuccessFactorsEnterpriseCustomerConfigurationFactory(
+            enterprise_customer=enterprise_customer,
+            active=True,
+        )
+        return enterprise_customer
+
+    def test_serialize_many_with_fixed_number_of_queries(self):
+        """
+        Serializing a page of enterprise customers costs the same number of queries whatever its size.
+        """
+        self.addCleanup(cache.clear)
+        today = datetime.date.today()
+        notification = factories.AdminNotificationFactory(
+            start_date=today - datetime.timedelta(days=1),
+            expiration_date=today + datetime.timedelta(days=1),
+        )
+        request = HttpRequest()
+        request.user = self.user_1
+        serialized_pages = []
+        queries_per_page = []
+        for page_size in (1, 3):
+            enterprise_customers = [
+                self._create_enterprise_customer_with_related_objects(self.user_1) for _ in range(page_size)
+            ]
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                serialized_pages.append(EnterpriseCustomerSerializer(
+                    enterprise_customers,
+                    many=True,
+                    context={'request': request},
+                ).data)
+            queries_per_page.append(len(queries))
+
+        assert queries_per_page[0] == queries_per_page[1]
+        for serialized_customer in serialized_pages[1]:
+            assert len(serialized_customer['enterprise_customer_catalogs']) == 1
+            assert len(serialized_customer['identity_providers']) == 1
+            assert serialized_customer['identity_provider'] == serialized_customer['identity_providers'][0][
+                'provider_id'
+            ]
+            assert [integration['channel_code'] for integration in serialized_customer['active_integrations']] == [
+                'SAP'
+            ]
+            assert serialized_customer['enterprise_notification_banner']['id'] == notification.id
+
+    def test_notification_banner_cached(self):
+        """
+        Once cached, notification banners cost no query until the notification is read or changed.
+        """
+        cache.clear()
+        self.addCleanup(cache.clear)
+        today = datetime.date.today()
+        notification = factories.AdminNotificationFactory(
+            start_date=today - datetime.timedelta(days=1),
+            expiration_date=today + datetime.timedelta(days=1),
+        )
+        enterprise_customer = factories.EnterpriseCustomerFactory()
+        enterprise_customer_user = factories.EnterpriseCustomerUserFactory(
+            user_id=self.user_1.id,
+            enterprise_customer=enterprise_customer,
+        )
+        request = HttpRequest()
+        request.user = self.user_1
+        serializer = EnterpriseCustomerSerializer(enterprise_customer, context={'request': request})
+        get_banners = serializer._get_notification_banners_by_enterprise_customer_uuid  # pylint: disable=protected-access
+
+        banners = get_banners([enterprise_customer], self.user_1.id)
+        assert banners[enterprise_customer.uuid]['id'] == notification.id
+        with self.assertNumQueries(0):
+            assert get_banners([enterprise_customer], self.user_1.id) == banners
+
+        AdminNotificationRead.objects.create(
+            enterprise_customer_user=enterprise_customer_user,
+            admin_notification=notification,
+            is_read=True,
+        )
+        assert get_banners([enterprise_customer], self.user_1.id)[enterprise_customer.uuid] == {'title': '', 'text': ''}
+
+        notification.is_active = False
+        notification.save()
+        for expected_queries in (1, 0):
+            with self.assertNumQueries(expected_queries):
+                banners = get_banners([enterprise_customer], self.user_1.id)
+            assert banners[enterprise_customer.uuid] == {'title': '', 'text': ''}
+
 
 @mark.django_db
 class TestEnterpriseGroupSerializer(APITest):
@@ -317,6 +415,48 @@ class TestEnterpriseCustomerMembersEndpointLearnersOnly(APITest):
         assert self.learner_user.id in returned_user_ids
         assert self.admin_user.id not in returned_user_ids
 
+    def test_export_returns_only_learners(self):
+        url = reverse('enterprise-customer-members', kwargs={'enterprise_uuid': str(self.enterprise_uuid)})
+        resp = self.client.get(url, {'export_format': 'csv'})
+        assert resp.status_code == 200
+
+        rows = list(csv.DictReader(b''.join(resp.streaming_content).decode().splitlines()))
+
+        assert [int(row['enterprise_customer_user.user_id']) for row in rows] == [self.learner_user.id]
+        assert [row['enrollments'] for row in rows] == ['0']
+
+    @patch('enterprise.api.v1.views.enterprise_customer_members.EXPORT_CHUNK_SIZE', 2)
+    def test_export_streams_learners_in_keyset_chunks(self):
+        enterprise_learner_role = SystemWideEnterpriseRole.objects.get(name=ENTERPRISE_LEARNER_ROLE)
+        joined = datetime.datetime(2024, 1, 1, tzinfo=pytz.UTC)
+        learners = [self.learner_user]
+        for days in (3, 1, 1, 2):
+            learner = factories.UserFactory(date_joined=joined + datetime.timedelta(days=days))
+            factories.EnterpriseCustomerUserFactory(
+                enterprise_customer=self.enterprise_customer, user_id=learner.id, linked=True, active=True,
+            )
+            SystemWideEnterpriseUserRoleAssignment.objects.get_or_create(
+                role=enterprise_learner_role, user=learner, enterprise_customer=self.enterprise_customer,
+            )
+            learners.append(learner)
+        url = reverse('enterprise-customer-members', kwargs={'enterprise_uuid': str(self.enterprise_uuid)})
+
+        with CaptureQueriesContext(connection) as queries:
+            resp = self.client.get(url, {'export_format': 'ndjson', 'sort_by': 'joined_org', 'is_reversed': True})
+            rows = [json.loads(line) for line in b''.join(resp.streaming_content).decode().splitlines()]
+
+        expected_learners = sorted(learners, key=lambda learner: (learner.date_joined, learner.id), reverse=True)
+        assert [row['enterprise_customer_user']['user_id'] for row in rows] == [
+            learner.id for learner in expected_learners
+        ]
+        # the test database has no auth_userprofile table, so only count the queries falling back without it
+        member_queries = [
+            query['sql'] for query in queries
+            if 'WITH users AS' in query['sql'] and 'auth_userprofile' not in query['sql']
+        ]
+        assert len(member_queries) == 3
+        assert all('LIMIT' in member_query for member_query in member_queries)
+
 
 @ddt.ddt
 @mark.django_db
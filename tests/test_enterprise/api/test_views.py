@@ -3,6 +3,7 @@ Tests for the `edx-enterprise` api module.
 """
 
 import copy
+import csv
 import json
 import logging
 import uuid
@@ -3144,7 +3145,11 @@ class TestEnterpriseCustomerCatalogs(BaseTestEnterpriseAPIViews):
         )
 
         mock_catalog_api_client.return_value = mock.Mock(
-            get_catalog_results=mock.Mock(return_value=search_results)
+            get_catalog_results=mock.Mock(return_value=search_results),
+            get_course_ids=mock.Mock(return_value={
+                course_run['key']: course_run['course']
+                for course_run in (fake_catalog_api.FAKE_COURSE_RUN, fake_catalog_api.FAKE_COURSE_RUN2)
+            }),
         )
 
         response = self.client.get(ENTERPRISE_CATALOGS_CONTAINS_CONTENT_ENDPOINT + '?' + urlencode(query_params, True))
@@ -3200,7 +3205,8 @@ class TestEnterpriseCustomerCatalogs(BaseTestEnterpriseAPIViews):
         )
 
         mock_catalog_api_client.return_value = mock.Mock(
-            get_catalog_results=mock.Mock(return_value={})
+            get_catalog_results=mock.Mock(return_value={}),
+            get_course_ids=mock.Mock(return_value={}),
         )
 
         response = self.client.get(ENTERPRISE_CATALOGS_CONTAINS_CONTENT_ENDPOINT + '?' + urlencode(query_params, True))
@@ -3227,6 +3233,83 @@ class TestEnterpriseCustomerCatalogs(BaseTestEnterpriseAPIViews):
         assert 'course_run_ids' in message
         assert response.status_code == 400
 
+    @mock.patch('enterprise.api_client.discovery.CourseCatalogApiServiceClient')
+    def test_enterprise_catalog_contains_content_items_cached(self, mock_catalog_api_client):
+        """
+        Ensure contains_content_items endpoint caches negative responses until the catalog is saved.
+        """
+        enterprise_customer = factories.EnterpriseCustomerFactory(uuid=FAKE_UUIDS[0])
+        enterprise_customer_catalog = factories.EnterpriseCustomerCatalogFactory(
+            uuid=FAKE_UUIDS[1],
+            enterprise_customer=enterprise_customer,
+        )
+        mock_catalog_api_client.return_value = mock.Mock(
+            get_catalog_results=mock.Mock(return_value={}),
+            get_course_ids=mock.Mock(return_value={}),
+        )
+        query_string = '?' + urlencode({'course_run_ids': ['fake2', 'fake1']}, True)
+
+        for _ in range(2):
+            response = self.client.get(ENTERPRISE_CATALOGS_CONTAINS_CONTENT_ENDPOINT + query_string)
+            assert self.load_json(response.content)['contains_content_items'] is False
+        assert mock_catalog_api_client.return_value.get_course_ids.call_count == 1
+
+        response = self.client.post(
+            ENTERPRISE_CATALOGS_CONTAINS_CONTENT_ENDPOINT,
+            data=json.dumps({'course_run_ids': ['fake1', 'fake2']}),
+            content_type='application/json',
+        )
+        assert self.load_json(response.content)['contains_content_items'] is False
+        assert mock_catalog_api_client.return_value.get_course_ids.call_count == 1
+
+        enterprise_customer_catalog.save()
+        self.client.get(ENTERPRISE_CATALOGS_CONTAINS_CONTENT_ENDPOINT + query_string)
+        assert mock_catalog_api_client.return_value.get_course_ids.call_count == 2
+
+    @ddt.data(
+        (False, {'course_run_ids': ['fake1', 'fake2']}),
+        (True, {'program_uuids': [fake_catalog_api.FAKE_SEARCH_ALL_PROGRAM_RESULT_1['uuid']]}),
+    )
+    @ddt.unpack
+    @mock.patch('enterprise.api_client.discovery.CourseCatalogApiServiceClient')
+    def test_enterprise_catalog_contains_content_items_post(self, contains_content_items, body,
+                                                            mock_catalog_api_client):
+        """
+        Ensure the POST variant of contains_content_items endpoint reads content items from the request body.
+        """
+        enterprise_customer = factories.EnterpriseCustomerFactory(uuid=FAKE_UUIDS[0])
+        factories.EnterpriseCustomerCatalogFactory(
+            uuid=FAKE_UUIDS[1],
+            enterprise_customer=enterprise_customer,
+            content_filter={'uuid': [fake_catalog_api.FAKE_SEARCH_ALL_PROGRAM_RESULT_1['uuid']]},
+            enterprise_catalog_query=None,
+        )
+        mock_catalog_api_client.return_value = mock.Mock(get_course_ids=mock.Mock(return_value={}))
+
+        response = self.client.post(
+            ENTERPRISE_CATALOGS_CONTAINS_CONTENT_ENDPOINT,
+            data=json.dumps(body),
+            content_type='application/json',
+        )
+
+        assert response.status_code == 200
+        assert self.load_json(response.content)['contains_content_items'] == contains_content_items
+
+    def test_enterprise_catalog_contains_content_items_post_no_content_items(self):
+        """
+        Ensure the POST variant of contains_content_items endpoint returns 400 when no content items are provided.
+        """
+        enterprise_customer = factories.EnterpriseCustomerFactory(uuid=FAKE_UUIDS[0])
+        factories.EnterpriseCustomerCatalogFactory(uuid=FAKE_UUIDS[1], enterprise_customer=enterprise_customer)
+
+        response = self.client.post(
+            ENTERPRISE_CATALOGS_CONTAINS_CONTENT_ENDPOINT,
+            data=json.dumps({'course_run_ids': []}),
+            content_type='application/json',
+        )
+
+        assert response.status_code == 400
+
     @ddt.data(
         (False, False, False, {}, {'detail': 'Not found.'}),
         (False, True, False, {'detail': 'Not found.'}, {'detail': 'Not found.'}),
@@ -3544,7 +3627,11 @@ class TestEnterpriseCustomerCatalogs(BaseTestEnterpriseAPIViews):
         )
 
         mock_catalog_api_client.return_value = mock.Mock(
-            get_catalog_results=mock.Mock(return_value=search_results)
+            get_catalog_results=mock.Mock(return_value=search_results),
+            get_course_ids=mock.Mock(return_value={
+                course_run['key']: course_run['course']
+                for course_run in (fake_catalog_api.FAKE_COURSE_RUN, fake_catalog_api.FAKE_COURSE_RUN2)
+            }),
         )
 
         response = self.client.get(ENTERPRISE_CUSTOMER_CONTAINS_CONTENT_ENDPOINT + '?' + urlencode(query_params, True))
@@ -5443,14 +5530,14 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
         },
     )
     @ddt.unpack
-    @mock.patch('enterprise.api.v1.views.enterprise_customer.get_best_mode_from_course_key')
+    @mock.patch('enterprise.api.v1.views.enterprise_customer.get_best_modes')
     @mock.patch('enterprise.api.v1.views.enterprise_customer.track_enrollment')
     @mock.patch("enterprise.models.EnterpriseCustomer.notify_enrolled_learners")
     def test_bulk_enrollment_in_bulk_courses_pending_licenses(
         self,
         mock_notify_task,
         mock_track_enroll,
-        mock_get_course_mode,
+        mock_get_course_modes,
         body,
         expected_code,
         expected_response,
@@ -5469,7 +5556,7 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
 
         permission = Permission.objects.get(name='Can add Enterprise Customer')
         self.user.user_permissions.add(permission)
-        mock_get_course_mode.return_value = VERIFIED_COURSE_MODE
+        mock_get_course_modes.side_effect = lambda course_keys: dict.fromkeys(course_keys, VERIFIED_COURSE_MODE)
 
         self.assertEqual(len(PendingEnrollment.objects.all()), 0)
         response = self.client.post(
@@ -5494,7 +5581,7 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
         # no notifications to be sent unless 'notify' specifically asked for in payload
         mock_notify_task.assert_not_called()
 
-    @mock.patch('enterprise.api.v1.views.enterprise_customer.get_best_mode_from_course_key')
+    @mock.patch('enterprise.api.v1.views.enterprise_customer.get_best_modes')
     @mock.patch('enterprise.api.v1.views.enterprise_customer.track_enrollment')
     @mock.patch('enterprise.models.EnterpriseCustomer.notify_enrolled_learners')
     @mock.patch('enterprise.utils.lms_update_or_create_enrollment')
@@ -5503,7 +5590,7 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
         mock_update_or_create_enrollment,
         mock_notify_task,
         mock_track_enroll,
-        mock_get_course_mode,
+        mock_get_course_modes,
     ):
         """
         Tests the bulk enrollment endpoint at enroll_learners_in_courses.
@@ -5522,7 +5609,7 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
 
         permission = Permission.objects.get(name='Can add Enterprise Customer')
         self.user.user_permissions.add(permission)
-        mock_get_course_mode.return_value = VERIFIED_COURSE_MODE
+        mock_get_course_modes.side_effect = lambda course_keys: dict.fromkeys(course_keys, VERIFIED_COURSE_MODE)
 
         self.assertEqual(len(PendingEnrollment.objects.all()), 0)
         body = {
@@ -5581,13 +5668,13 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
 
         assert mock_update_or_create_enrollment.call_count == 2
 
-    @mock.patch('enterprise.api.v1.views.enterprise_customer.get_best_mode_from_course_key')
+    @mock.patch('enterprise.api.v1.views.enterprise_customer.get_best_modes')
     @mock.patch('enterprise.utils.lms_update_or_create_enrollment')
     @mock.patch('enterprise.api.v1.views.enterprise_customer.track_enrollment', mock.MagicMock())
     def test_bulk_enrollment_force_enrollment(
         self,
         mock_update_or_create_enrollment,
-        mock_get_course_mode,
+        mock_get_course_modes,
     ):
         """
         Ensure bulk enrollment passes force_enrollment hints into lower level functions.
@@ -5604,7 +5691,7 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
 
         permission = Permission.objects.get(name='Can add Enterprise Customer')
         self.user.user_permissions.add(permission)
-        mock_get_course_mode.return_value = VERIFIED_COURSE_MODE
+        mock_get_course_modes.side_effect = lambda course_keys: dict.fromkeys(course_keys, VERIFIED_COURSE_MODE)
 
         self.assertEqual(len(PendingEnrollment.objects.all()), 0)
         body = {
@@ -5632,14 +5719,14 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
         assert mock_update_or_create_enrollment.mock_calls[0].kwargs['force_enrollment'] is False
         assert mock_update_or_create_enrollment.mock_calls[1].kwargs['force_enrollment'] is True
 
-    @mock.patch('enterprise.api.v1.views.enterprise_customer.get_best_mode_from_course_key')
+    @mock.patch('enterprise.api.v1.views.enterprise_customer.get_best_modes')
     @mock.patch('enterprise.api.v1.views.enterprise_customer.track_enrollment')
     @mock.patch('enterprise.models.EnterpriseCustomer.notify_enrolled_learners')
     def test_bulk_enrollment_in_bulk_courses_nonexisting_user_id(
         self,
         mock_notify_task,
         mock_track_enroll,
-        mock_get_course_mode,
+        mock_get_course_modes,
     ):
         """
         Tests the bulk enrollment endpoint at enroll_learners_in_courses.
@@ -5655,7 +5742,7 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
 
         permission = Permission.objects.get(name='Can add Enterprise Customer')
         self.user.user_permissions.add(permission)
-        mock_get_course_mode.return_value = VERIFIED_COURSE_MODE
+        mock_get_course_modes.side_effect = lambda course_keys: dict.fromkeys(course_keys, VERIFIED_COURSE_MODE)
 
         self.assertEqual(len(PendingEnrollment.objects.all()), 0)
         body = {
@@ -5706,13 +5793,13 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
     @ddt.unpack
     @mock.patch("enterprise.api.v1.views.enterprise_subsidy_fulfillment.enrollment_api")
     @mock.patch(
-        'enterprise.api.v1.views.enterprise_customer.get_best_mode_from_course_key'
+        'enterprise.api.v1.views.enterprise_customer.get_best_modes'
     )
     @mock.patch('enterprise.utils.lms_update_or_create_enrollment')
     def test_bulk_enrollment_enroll_after_cancel(
         self,
         mock_platform_enrollment,
-        mock_get_course_mode,
+        mock_get_course_modes,
         mock_update_or_create_enrollment,
         old_transaction_id,
         new_transaction_id,
@@ -5722,7 +5809,7 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
         results in expected state and payload.
         """
         mock_platform_enrollment.return_value = True
-        mock_get_course_mode.return_value = VERIFIED_COURSE_MODE
+        mock_get_course_modes.side_effect = lambda course_keys: dict.fromkeys(course_keys, VERIFIED_COURSE_MODE)
         # Needed for the cancel endpoint:
         mock_update_or_create_enrollment.update_enrollment.return_value = mock.Mock()
 
@@ -5825,12 +5912,12 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
         },
     )
     @ddt.unpack
-    @mock.patch('enterprise.api.v1.views.enterprise_customer.get_best_mode_from_course_key')
+    @mock.patch('enterprise.api.v1.views.enterprise_customer.get_best_modes')
     @mock.patch('enterprise.utils.lms_update_or_create_enrollment')
     def test_bulk_enrollment_includes_fulfillment_source_uuid(
         self,
-        mock_get_course_mode,
         mock_update_or_create_enrollment,
+        mock_get_course_modes,
         body,
         fulfillment_source,
     ):
@@ -5846,7 +5933,7 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
 
         permission = Permission.objects.get(name='Can add Enterprise Customer')
         user.user_permissions.add(permission)
-        mock_get_course_mode.return_value = VERIFIED_COURSE_MODE
+        mock_get_course_modes.side_effect = lambda course_keys: dict.fromkeys(course_keys, VERIFIED_COURSE_MODE)
 
         enrollment_url = reverse(
             'enterprise-customer-enroll-learners-in-courses',
@@ -5935,14 +6022,14 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
         },
     )
     @ddt.unpack
-    @mock.patch('enterprise.api.v1.views.enterprise_customer.get_best_mode_from_course_key')
+    @mock.patch('enterprise.api.v1.views.enterprise_customer.get_best_modes')
     @mock.patch('enterprise.api.v1.views.enterprise_customer.track_enrollment')
     @mock.patch("enterprise.models.EnterpriseCustomer.notify_enrolled_learners")
     def test_bulk_enrollment_with_notification(
         self,
         mock_notify_task,
         mock_track_enroll,
-        mock_get_course_mode,
+        mock_get_course_modes,
         body,
         expected_code,
         expected_response,
@@ -5961,7 +6048,7 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
 
         permission = Permission.objects.get(name='Can add Enterprise Customer')
         self.user.user_permissions.add(permission)
-        mock_get_course_mode.return_value = VERIFIED_COURSE_MODE
+        mock_get_course_modes.side_effect = lambda course_keys: dict.fromkeys(course_keys, VERIFIED_COURSE_MODE)
 
         self.assertEqual(len(PendingEnrollment.objects.all()), 0)
 
@@ -6009,8 +6096,8 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
         mock_notify_task.assert_has_calls(mock_calls, any_order=True)
 
     @mock.patch('enterprise.api.v1.views.enterprise_customer.enroll_subsidy_users_in_courses')
-    @mock.patch('enterprise.api.v1.views.enterprise_customer.get_best_mode_from_course_key')
-    def test_enroll_learners_in_courses_partial_failure(self, mock_get_course_mode, mock_enroll_user):
+    @mock.patch('enterprise.api.v1.views.enterprise_customer.get_best_modes')
+    def test_enroll_learners_in_courses_partial_failure(self, mock_get_course_modes, mock_enroll_user):
         """
         Tests that bulk users bulk enrollment endpoint properly handles partial failures.
         """
@@ -6043,7 +6130,7 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
             'failures': [{'email': 'xyz@test.com', 'course_run_key': course}]
         }
         mock_enroll_user.return_value = enrollment_response
-        mock_get_course_mode.return_value = VERIFIED_COURSE_MODE
+        mock_get_course_modes.side_effect = lambda course_keys: dict.fromkeys(course_keys, VERIFIED_COURSE_MODE)
 
         body = {
             'licenses_info': [
@@ -6130,12 +6217,12 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
     )
     @ddt.unpack
     @mock.patch('enterprise.content_metadata.api.EnterpriseCatalogApiClient')
-    @mock.patch('enterprise.api.v1.views.enterprise_customer.get_best_mode_from_course_key')
+    @mock.patch('enterprise.api.v1.views.enterprise_customer.get_best_modes')
     @mock.patch('enterprise.utils.lms_update_or_create_enrollment')
     def test_enroll_learners_in_courses_default_enrollment_realizations(
         self,
-        mock_get_course_mode,
         mock_update_or_create_enrollment,
+        mock_get_course_modes,
         mock_catalog_api_client,
         body,
         fulfillment_source,
@@ -6153,7 +6240,7 @@ class TestBulkEnrollment(BaseTestEnterpriseAPIViews):
 
         permission = Permission.objects.get(name='Can add Enterprise Customer')
         user.user_permissions.add(permission)
-        mock_get_course_mode.return_value = VERIFIED_COURSE_MODE
+        mock_get_course_modes.side_effect = lambda course_keys: dict.fromkeys(course_keys, VERIFIED_COURSE_MODE)
 
         # Create a new DefaultEnterpriseEnrollmentIntention
         enrollment_intention = create_mock_default_enterprise_enrollment_intention(
@@ -8477,6 +8564,41 @@ class TestEnterpriseGroupViewSet(APITest):
         statuses = [result.get('status') for result in response.json().get('results')]
         assert statuses.sort() == ['accepted', 'pending'].sort()
 
+    @mock.patch('enterprise.api.export.EXPORT_CHUNK_SIZE', 2)
+    def test_export_learners(self):
+        """
+        Test that the list learners endpoint streams every learner of the group when an export format is requested
+        """
+        group = EnterpriseGroupFactory(enterprise_customer=self.enterprise_customer)
+        url = settings.TEST_SERVER + reverse(
+            'enterprise-group-learners',
+            kwargs={'group_uuid': group.uuid},
+        )
+        pending_user_emails = sorted(
+            EnterpriseGroupMembershipFactory(
+                group=group,
+                pending_enterprise_customer_user=PendingEnterpriseCustomerUserFactory(),
+                enterprise_customer_user=None,
+            ).pending_enterprise_customer_user.user_email
+            for _ in range(3)
+        )
+
+        response = self.client.get(url, {'export_format': 'ndjson'})
+        assert response.streaming
+        assert response['Content-Type'] == 'application/x-ndjson'
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        assert sorted(row['member_details']['user_email'] for row in rows) == pending_user_emails
+
+        response = self.client.get(url, {'export_format': 'csv'})
+        assert response['Content-Disposition'] == f'attachment; filename="enterprise_group_{group.uuid}_learners.csv"'
+        rows = list(csv.DictReader(b''.join(response.streaming_content).decode().splitlines()))
+        assert sorted(row['member_details.user_email'] for row in rows) == pending_user_emails
+        # pending learners have no name, the column is still exported for the linked learners
+        assert all(row['member_details.user_name'] == '' for row in rows)
+
+        response = self.client.get(url, {'export_format': 'xlsx'})
+        assert response.status_code == 400
+
     def test_list_learners_bad_sort_by(self):
         """
         Test that the list learners endpoint properly validates sort by query params
@@ -9165,10 +9287,16 @@ class TestEnterpriseGroupViewSet(APITest):
                     self.enterprise_customer.uuid,
                     group_uuids[(x * 200):((x + 1) * 200)],
                     act_by_date,
-                    catalog_uuid
+                    catalog_uuid,
+                    invitation_run_id=mock.ANY,
                 )],
                 any_order=True,
             )
+        # every batch of a single request shares the same run id, so the catalog content count is fetched once
+        assert len({
+            call.kwargs['invitation_run_id']
+            for call in mock_send_group_membership_invitation_notification.call_args_list
+        }) == 1
 
     def test_add_no_non_member_learners_to_flex_group(self):
         """
@@ -9319,6 +9447,35 @@ class TestEnterpriseGroupViewSet(APITest):
         assert response.status_code == 201
         assert response.json() == 'Successfully updated learner record for learner email edx@exampl.com'
 
+    def test_update_pending_learner_status_refreshes_recent_action_sort(self):
+        """
+        Test that errored pending learners are ordered by their errored at time when sorting by recent action
+        """
+        url = settings.TEST_SERVER + reverse(
+            'enterprise-group-learners',
+            kwargs={'group_uuid': self.group_1.uuid},
+        )
+        errored_membership, pending_membership = [
+            EnterpriseGroupMembershipFactory(
+                group=self.group_1,
+                enterprise_customer_user=None,
+                pending_enterprise_customer_user__user_email=email,
+            )
+            for email in ('errored@example.com', 'pending@example.com')
+        ]
+
+        response = self.client.patch(url, data={'learner': 'errored@example.com', 'status': 'email_error'})
+        assert response.status_code == 201
+
+        errored_membership.refresh_from_db()
+        assert errored_membership.sortable_recent_action == errored_membership.errored_at
+        response = self.client.get(url + '?sort_by=recent_action&is_reversed=True')
+        returned_emails = [result['member_details']['user_email'] for result in response.json().get('results')]
+        assert returned_emails[:2] == [
+            errored_membership.pending_enterprise_customer_user.user_email,
+            pending_membership.pending_enterprise_customer_user.user_email,
+        ]
+
     @mock.patch('enterprise.tasks.send_group_membership_removal_notification.delay', return_value=mock.MagicMock())
     def test_successful_remove_all_learners_from_group(self, mock_send_group_membership_removal_notification):
         """
@@ -9342,6 +9499,7 @@ class TestEnterpriseGroupViewSet(APITest):
             self.enterprise_customer.uuid,
             [membership.uuid for membership in reversed(memberships_to_delete)],
             catalog_uuid,
+            invitation_run_id=mock.ANY,
         )
         for membership in memberships_to_delete:
             assert EnterpriseGroupMembership.all_objects.get(pk=membership.pk).status == 'removed'
@@ -9374,6 +9532,7 @@ class TestEnterpriseGroupViewSet(APITest):
             self.enterprise_customer.uuid,
             [membership.uuid for membership in reversed(memberships_to_delete)],
             catalog_uuid,
+            invitation_run_id=mock.ANY,
         )
         for membership in memberships_to_delete:
             assert EnterpriseGroupMembership.all_objects.get(pk=membership.pk).status == 'removed'
@@ -13,6 +13,7 @@ import responses
 from requests.exceptions import HTTPError
 
 from django.contrib import auth
+from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured, ObjectDoesNotExist
 
 from enterprise.api_client.discovery import CourseCatalogApiClient, CourseCatalogApiServiceClient
@@ -131,6 +132,59 @@ class TestCourseCatalogApi(CourseDiscoveryApiTestMixin, unittest.TestCase):
         self.get_data_mock.return_value = response
         assert self.api.get_course_run("any") == {}
 
+    def test_get_course_ids(self):
+        """
+        Verify get_course_ids resolves course run ids in bulk and caches the resolved course keys.
+        """
+        cache.clear()
+        self.get_data_mock.return_value = [
+            {'key': 'course-v1:edX+DemoX+Demo_Course', 'course': 'edX+DemoX'},
+            {'key': 'course-v1:edX+Other+T1', 'course': 'edX+Other'},
+        ]
+        expected_course_ids = {
+            'edX+DemoX': 'edX+DemoX',
+            'course-v1:edX+DemoX+Demo_Course': 'edX+DemoX',
+            'course-v1:edX+Other+T1': 'edX+Other',
+            'course-v1:edX+Missing+T1': None,
+        }
+
+        assert self.api.get_course_ids(list(expected_course_ids)) == expected_course_ids
+        assert self.get_data_mock.call_count == 1
+        resource, _ = self._get_important_parameters(self.get_data_mock)
+        assert resource == CourseCatalogApiClient.COURSE_RUNS_ENDPOINT
+        queried_keys = self.get_data_mock.call_args[1]['querystring']['keys'].split(',')
+        assert sorted(queried_keys) == [
+            'course-v1:edX+DemoX+Demo_Course', 'course-v1:edX+Missing+T1', 'course-v1:edX+Other+T1',
+        ]
+
+        # Resolved course runs are served from the cache, only the unresolved one is requested again.
+        self.get_data_mock.reset_mock()
+        self.get_data_mock.return_value = []
+        assert self.api.get_course_ids(list(expected_course_ids)) == expected_course_ids
+        assert self.get_data_mock.call_count == 1
+        assert self.get_data_mock.call_args[1]['querystring'] == {'keys': 'course-v1:edX+Missing+T1'}
+
+    def test_get_course_ids_batches_requests(self):
+        """
+        Verify get_course_ids splits large sets of course run ids into several requests.
+        """
+        cache.clear()
+        self.get_data_mock.return_value = []
+        course_run_ids = [
+            'course-v1:edX+DemoX+T{}'.format(index)
+            for index in range(CourseCatalogApiClient.COURSE_RUN_KEYS_BATCH_SIZE + 1)
+        ]
+
+        assert self.api.get_course_ids(course_run_ids) == {course_run_id: None for course_run_id in course_run_ids}
+        assert self.get_data_mock.call_count == 2
+
+    def test_get_course_ids_course_keys_only(self):
+        """
+        Verify get_course_ids does not call discovery when only course keys are given.
+        """
+        assert self.api.get_course_ids(['edX+DemoX']) == {'edX+DemoX': 'edX+DemoX'}
+        assert self.get_data_mock.call_count == 0
+
     @ddt.data(
         "course-v1:JediAcademy+AppliedTelekinesis+T1",
         "course-v1:TrantorAcademy+Psychohistory101+T1",
@@ -550,6 +550,54 @@ def test_get_remote_id():
     assert actual_response == "LukeIamYrFather"
 
 
+@responses.activate
+@mock.patch('enterprise.api_client.client.JwtBuilder', mock.Mock())
+@mock.patch.object(lms_api.ThirdPartyAuthApiClient, 'REMOTE_IDS_BATCH_SIZE', 2)
+def test_get_remote_ids():
+    provider_id = "DeathStar"
+    next_page_url = _url("third_party_auth", f"providers/{provider_id}/users?username=Han&page=2")
+    responses.add(
+        responses.GET,
+        _url("third_party_auth", f"providers/{provider_id}/users?username=Darth&username=Luke&page_size=2"),
+        match_querystring=True,
+        json={"results": [
+            {"username": "Darth", "remote_id": "LukeIamYrFather"},
+            {"username": "Darth", "remote_id": "JamesEarlJones"},
+            {"username": "Luke", "remote_id": "Skywalker"},
+        ]},
+    )
+    responses.add(
+        responses.GET,
+        _url("third_party_auth", f"providers/{provider_id}/users?username=Han&username=Leia&page_size=2"),
+        match_querystring=True,
+        json={"results": [{"username": "Han", "remote_id": "Solo"}], "next": next_page_url},
+    )
+    responses.add(
+        responses.GET,
+        next_page_url,
+        match_querystring=True,
+        json={"results": [{"username": "Leia", "remote_id": "Organa"}, {"username": "Obi-Wan", "remote_id": "Ben"}]},
+    )
+    client = lms_api.ThirdPartyAuthApiClient('staff-user-goes-here')
+    actual_response = client.get_remote_ids(provider_id, ["Darth", "Luke", "Han", "Leia", "Darth"])
+    assert actual_response == {"Darth": "LukeIamYrFather", "Luke": "Skywalker", "Han": "Solo", "Leia": "Organa"}
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+@mock.patch('enterprise.api_client.client.JwtBuilder', mock.Mock())
+def test_get_remote_ids_not_found():
+    provider_id = "DeathStar"
+    responses.add(
+        responses.GET,
+        _url("third_party_auth", f"providers/{provider_id}/users?username=Darth&page_size=1"),
+        match_querystring=True,
+        status=404,
+    )
+    client = lms_api.ThirdPartyAuthApiClient('staff-user-goes-here')
+    assert not client.get_remote_ids(provider_id, ["Darth"])
+
+
 @responses.activate
 @mock.patch('enterprise.api_client.client.JwtBuilder', mock.Mock())
 @pytest.mark.parametrize('status', (400, 500))
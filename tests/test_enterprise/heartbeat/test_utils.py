@@ -3,6 +3,7 @@ Validate the behavior of utils functions inside heartbeat module.
 """
 import json
 import unittest
+from unittest import mock
 
 import ddt
 import responses
@@ -10,8 +11,10 @@ from path import Path
 from requests.exceptions import ConnectionError, Timeout  # pylint: disable=redefined-builtin
 
 from django.conf import settings
+from django.core.cache import cache
 
-from enterprise.heartbeat.utils import Status, run_checks
+from enterprise.heartbeat.exceptions import LMSNotAvailable
+from enterprise.heartbeat.utils import HEARTBEAT_CHECK_TIMEOUT, Status, run_checks
 from test_utils.decorators import mock_api_response, mock_api_response_with_callback
 from test_utils.fake_heartbeat_responses import fake_health, fake_lms_heartbeat
 
@@ -22,6 +25,10 @@ class TestChecks(unittest.TestCase):
     Validate the behavior of service checks functions.
     """
 
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
     @mock_api_response(
         responses.GET,
         Path(settings.LMS_INTERNAL_ROOT_URL) / 'heartbeat',
@@ -54,6 +61,11 @@ class TestChecks(unittest.TestCase):
         assert response['status'] == Status.OK
         assert response['message'] == 'Service is up and running.'
         assert all(service['status'] == Status.OK for service in response['services'])
+        assert all(service['latency_ms'] >= 0 for service in response['services'])
+
+        # Probes within the cache timeout reuse the last status of each service.
+        assert run_checks() == (all_okay, response)
+        assert len(responses.calls) == 3
 
     @ddt.unpack
     @ddt.data(
@@ -129,3 +141,23 @@ class TestChecks(unittest.TestCase):
 
         # Run the tests
         _test_run_checks_errors()
+
+    def test_run_checks_only_reruns_expired_checks(self):
+        """
+        Validate that `run_checks` only calls the checks without a cached status, and passes them the check timeout.
+        """
+        check_lms = mock.Mock(__name__='check_lms', side_effect=LMSNotAvailable('Service is down.'))
+        check_discovery = mock.Mock(__name__='check_discovery', return_value=('Course Discovery', 'Service is up.'))
+
+        with mock.patch('enterprise.heartbeat.utils.CHECKS', (check_lms, check_discovery)):
+            run_checks()
+            cache.delete('enterprise.heartbeat.check_discovery')
+            all_okay, response = run_checks()
+
+        check_lms.assert_called_once_with(timeout=HEARTBEAT_CHECK_TIMEOUT)
+        assert check_discovery.call_count == 2
+        assert not all_okay
+        assert [(service['service'], service['status']) for service in response['services']] == [
+            ('Learning Management System (LMS)', Status.UNAVAILABLE),
+            ('Course Discovery', Status.OK),
+        ]
@@ -10,6 +10,7 @@ from path import Path
 from requests.exceptions import ConnectionError, Timeout  # pylint: disable=redefined-builtin
 
 from django.conf import settings
+from django.core.cache import cache
 from django.test import RequestFactory
 from django.urls import reverse
 
@@ -25,6 +26,10 @@ class TestHeartbeatViews(unittest.TestCase):
     Validate heartbeat views works as expected.
     """
 
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
     @mock_api_response(
         responses.GET,
         Path(settings.LMS_INTERNAL_ROOT_URL) / 'heartbeat',
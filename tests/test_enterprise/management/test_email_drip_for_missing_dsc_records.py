@@ -12,7 +12,8 @@ from django.core.management import call_command
 from django.test import TestCase
 from django.utils import timezone
 
-from consent.models import DataSharingConsent, ProxyDataSharingConsent
+from consent.models import DataSharingConsent
+from enterprise.models import EnterpriseCourseEnrollment
 from test_utils.factories import (
     EnterpriseCourseEnrollmentFactory,
     EnterpriseCustomerFactory,
@@ -81,8 +82,22 @@ class EmailDripForMissingDscRecordsCommandTests(TestCase):
         # creating enrollments for 10 days before.
         self.create_enrollments(num_learners=5, enrollment_time=now - timedelta(days=10))
 
+    def create_consents(self, course_id=None, past_num_days=1):
+        """
+        Create DataSharingConsent records for the enrollments created the given number of days ago.
+        """
+        for enrollment in EnterpriseCourseEnrollment.objects.filter(
+            created__date=timezone.now().date() - timedelta(days=past_num_days),
+        ):
+            DataSharingConsent.objects.create(
+                username=enrollment.enterprise_customer_user.username,
+                course_id=course_id or enrollment.course_id,
+                enterprise_customer=enrollment.enterprise_customer_user.enterprise_customer,
+                granted=True,
+            )
+
     @mock.patch(
-        'enterprise.management.commands.email_drip_for_missing_dsc_records.DataSharingConsent.objects.proxied_get'
+        'enterprise.management.commands.email_drip_for_missing_dsc_records.get_course_catalog_api_service_client'
     )
     @mock.patch('enterprise.management.commands.email_drip_for_missing_dsc_records.utils.track_event')
     @mock.patch('enterprise.management.commands.email_drip_for_missing_dsc_records.Command._get_course_properties')
@@ -92,16 +107,30 @@ class EmailDripForMissingDscRecordsCommandTests(TestCase):
             mock_is_course_accessed,
             mock_get_course_properties,
             mock_event_track,
-            mock_dsc_proxied_get
+            mock_catalog_api_service_client,
     ):
         """
         Test that email drip event is fired for missing DSC records
         """
+        mock_catalog_api_service_client.return_value.get_course_ids.side_effect = lambda course_runs: {
+            course_run: 'edX+DemoX' for course_run in course_runs
+        }
         mock_get_course_properties.return_value = 'test_url', 'test_course'
         mock_is_course_accessed.return_value = True
         # test when consent is present
+        self.create_consents()
+        with LogCapture(LOGGER_NAME) as log:
+            call_command(self.command)
+            self.assertEqual(mock_event_track.call_count, 0)
+            self.assertIn(
+                '[Absent DSC Email] Emails sent for [0] enrollments out of [3] enrollments.',
+                log.records[-1].message
+            )
+
+        # test when consent is present for the parent course of the enrolled course run
+        DataSharingConsent.objects.all().delete()
+        self.create_consents(course_id='edX+DemoX')
         with LogCapture(LOGGER_NAME) as log:
-            mock_dsc_proxied_get.return_value = DataSharingConsent()
             call_command(self.command)
             self.assertEqual(mock_event_track.call_count, 0)
             self.assertIn(
@@ -110,8 +139,8 @@ class EmailDripForMissingDscRecordsCommandTests(TestCase):
             )
 
         # test when consent is missing, with --no-commit param
+        DataSharingConsent.objects.all().delete()
         with LogCapture(LOGGER_NAME) as log:
-            mock_dsc_proxied_get.return_value = ProxyDataSharingConsent()
             call_command(self.command, '--no-commit')
             self.assertEqual(mock_event_track.call_count, 0)
             self.assertIn(
@@ -127,6 +156,11 @@ class EmailDripForMissingDscRecordsCommandTests(TestCase):
                 '[Absent DSC Email] Emails sent for [3] enrollments out of [3] enrollments.',
                 log.records[-1].message
             )
+            # course properties are resolved once per course, not once per enrollment
+            self.assertEqual(
+                mock_get_course_properties.call_count,
+                len({call.args[2]['course_id'] for call in mock_event_track.call_args_list}),
+            )
 
         mock_event_track.reset_mock()
 
@@ -128,6 +128,32 @@ class TestUserPostSaveSignalHandler(EmptyCacheMixin, unittest.TestCase):
             enterprise_customer=enterprise_customer_2, user_id=user.id
         ).count() == 1
 
+    def test_handle_user_post_save_syncs_group_membership_email(self):
+        membership = EnterpriseGroupMembershipFactory(pending_enterprise_customer_user=None)
+        user = membership.enterprise_customer_user.user
+        user.email = "jackie.chan@hollywood.com"
+        user.save()
+
+        parameters = {"instance": user, "created": False}
+        handle_user_post_save(mock.Mock(), **parameters)
+
+        membership = EnterpriseGroupMembership.all_objects.get(uuid=membership.uuid)
+        assert membership.sortable_member_email == "jackie.chan@hollywood.com"
+
+    def test_handle_user_post_save_syncs_group_membership_email_only_on_email_change(self):
+        membership = EnterpriseGroupMembershipFactory(pending_enterprise_customer_user=None)
+        user = membership.enterprise_customer_user.user
+        previous_email = EnterpriseGroupMembership.all_objects.get(uuid=membership.uuid).sortable_member_email
+        user.email = "jackie.chan@hollywood.com"
+
+        handle_user_post_save(mock.Mock(), instance=user, created=False, update_fields=frozenset(['last_login']))
+        membership = EnterpriseGroupMembership.all_objects.get(uuid=membership.uuid)
+        assert membership.sortable_member_email == previous_email
+
+        handle_user_post_save(mock.Mock(), instance=user, created=False, update_fields=frozenset(['email']))
+        membership = EnterpriseGroupMembership.all_objects.get(uuid=membership.uuid)
+        assert membership.sortable_member_email == "jackie.chan@hollywood.com"
+
     def test_handle_user_post_save_modified_user_not_linked(self):
         email = "jackie.chan@hollywood.com"
         user = UserFactory(id=1, email=email)
@@ -13,7 +13,7 @@ from freezegun import freeze_time
 from pytest import mark, raises
 
 from enterprise import constants
-from enterprise.api_client.braze import ENTERPRISE_BRAZE_ALIAS_LABEL
+from enterprise.api_client.braze import ENTERPRISE_BRAZE_ALIAS_LABEL, MAX_NUM_CAMPAIGN_RECIPIENTS
 from enterprise.constants import (
     BRAZE_ADMIN_INVITE_CAMPAIGN_SETTING,
     BRAZE_LEARNER_INVITE_CAMPAIGN_SETTING,
@@ -980,6 +980,85 @@ class TestEnterpriseTasks(unittest.TestCase):
             assert pending_membership.errored_at == localized_utcnow()
             assert pending_membership.recent_action == f"Errored: {errored_at.strftime('%B %d, %Y')}"
 
+    @mock.patch('enterprise.tasks.EnterpriseCatalogApiClient', return_value=mock.MagicMock())
+    @mock.patch('enterprise.tasks.BrazeAPIClient', return_value=mock.MagicMock())
+    def test_send_group_membership_invitation_notification_batches_recipients(
+        self,
+        mock_braze_api_client,
+        mock_enterprise_catalog_client,
+    ):
+        """
+        Verify group invitation emails are sent in batches of at most 50 recipients and only the memberships of
+        a failed batch are marked as errored.
+        """
+        memberships = [
+            EnterpriseGroupMembershipFactory(
+                group=self.enterprise_group,
+                pending_enterprise_customer_user=PendingEnterpriseCustomerUserFactory(
+                    enterprise_customer=self.enterprise_customer,
+                ),
+                enterprise_customer_user=None,
+            )
+            for _ in range(MAX_NUM_CAMPAIGN_RECIPIENTS + 5)
+        ]
+        mock_braze_api_client().create_recipient_no_external_id.side_effect = lambda email: email
+        mock_braze_api_client().send_campaign_message.side_effect = [
+            None,
+            BrazeClientError("Any thing that happens during email"),
+        ]
+        mock_enterprise_catalog_client().get_catalog_content_count.return_value = 5
+
+        with raises(BrazeClientError):
+            send_group_membership_invitation_notification(
+                self.enterprise_customer.uuid,
+                [membership.uuid for membership in memberships],
+                datetime.today(),
+                uuid.uuid4(),
+            )
+
+        recipient_batches = [
+            call.kwargs['recipients'] for call in mock_braze_api_client().send_campaign_message.call_args_list
+        ]
+        assert [len(recipients) for recipients in recipient_batches] == [MAX_NUM_CAMPAIGN_RECIPIENTS, 5]
+        mock_braze_api_client().create_braze_alias.assert_called_once()
+        errored_emails = set(
+            EnterpriseGroupMembership.objects.filter(
+                status=constants.GROUP_MEMBERSHIP_EMAIL_ERROR_STATUS,
+            ).values_list('pending_enterprise_customer_user__user_email', flat=True)
+        )
+        assert errored_emails == set(recipient_batches[1])
+
+    @mock.patch('enterprise.tasks.EnterpriseCatalogApiClient', return_value=mock.MagicMock())
+    @mock.patch('enterprise.tasks.BrazeAPIClient', return_value=mock.MagicMock())
+    def test_send_group_membership_notifications_share_catalog_content_count(
+        self,
+        mock_braze_api_client,
+        mock_enterprise_catalog_client,
+    ):
+        """
+        Verify the catalog content count is fetched once for all the notification tasks of a single run.
+        """
+        membership = EnterpriseGroupMembershipFactory(
+            group=self.enterprise_group,
+            pending_enterprise_customer_user=self.pending_enterprise_customer_user,
+            enterprise_customer_user=None,
+        )
+        mock_braze_api_client().create_recipient_no_external_id.side_effect = lambda email: email
+        mock_enterprise_catalog_client().get_catalog_content_count.return_value = 5
+        catalog_uuid = uuid.uuid4()
+        invitation_run_id = str(uuid.uuid4())
+        for _ in range(3):
+            send_group_membership_invitation_notification(
+                self.enterprise_customer.uuid,
+                [membership.uuid],
+                datetime.today(),
+                catalog_uuid,
+                invitation_run_id=invitation_run_id,
+            )
+
+        mock_enterprise_catalog_client().get_catalog_content_count.assert_called_once_with(catalog_uuid)
+        assert mock_braze_api_client().send_campaign_message.call_count == 3
+
     @mock.patch('enterprise.tasks.BrazeAPIClient', return_value=mock.MagicMock())
     def test_sso_configuration_oauth_orchestration_email(self, mock_braze_client):
         """
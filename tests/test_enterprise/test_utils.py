@@ -13,6 +13,7 @@ from urllib.parse import quote, urlencode
 # Third-party imports
 import ddt
 import pytest
+from edx_django_utils.cache import TieredCache
 from pytest import mark
 
 # Django imports
@@ -41,10 +42,12 @@ from enterprise.models import (
 from enterprise.utils import (
     batch_dict,
     enroll_subsidy_users_in_courses,
+    get_best_modes,
     get_default_invite_key_expiration_date,
     get_idiff_list,
     get_platform_logo_url,
     get_user_details,
+    invalidate_best_mode_cache,
     is_pending_user,
     localized_utcnow,
     parse_lms_api_datetime,
@@ -885,6 +888,34 @@ class TestUtils(unittest.TestCase):
         assert result is None
         mock_idp_config.get_user_details.assert_called_once()
 
+    @mock.patch('enterprise.utils.CourseMode')
+    def test_get_best_modes(self, mock_course_mode):
+        """
+        Test that get_best_modes resolves all the course runs in one query and caches each best mode.
+        """
+        TieredCache.dangerous_clear_all_tiers()
+        mock_course_mode.objects.filter.return_value = [
+            mock.Mock(course_id='course-v1:edX+DemoX+1T', slug='audit'),
+            mock.Mock(course_id='course-v1:edX+DemoX+1T', slug='verified'),
+            mock.Mock(course_id='course-v1:edX+Exec+1T', slug='unpaid-executive-education'),
+        ]
+        course_keys = ['course-v1:edX+DemoX+1T', 'course-v1:edX+Exec+1T', 'course-v1:edX+NoModes+1T']
+        expected_best_modes = {
+            'course-v1:edX+DemoX+1T': 'verified',
+            'course-v1:edX+Exec+1T': 'unpaid-executive-education',
+            'course-v1:edX+NoModes+1T': 'audit',
+        }
+
+        assert get_best_modes(course_keys + course_keys[:1]) == expected_best_modes
+        mock_course_mode.objects.filter.assert_called_once_with(course_id__in=course_keys)
+
+        assert get_best_modes(course_keys) == expected_best_modes
+        assert mock_course_mode.objects.filter.call_count == 1
+
+        invalidate_best_mode_cache('course-v1:edX+Exec+1T')
+        assert get_best_modes(course_keys) == expected_best_modes
+        mock_course_mode.objects.filter.assert_called_with(course_id__in=['course-v1:edX+Exec+1T'])
+
 
 class TestAdminInviteUtils(TestCase):
     """Tests for admin invite utility functions."""
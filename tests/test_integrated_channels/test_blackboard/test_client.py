@@ -642,6 +642,56 @@ class TestBlackboardApiClient(unittest.TestCase):
             self.learner_data_payload
         ) == (SUCCESSFUL_RESPONSE.status_code, expected_success_body)
 
+    def test_create_course_completions_resolves_each_course_once(self):
+        """
+        Test that submitting the completions of several learners looks up the Blackboard course, its grade column
+        and its paginated roster once, and then submits one grade per learner.
+        """
+        client = self._create_new_mock_client()
+        client._resolve_blackboard_course_id = unittest.mock.MagicMock(
+            name='_resolve_blackboard_course_id',
+            return_value=self.blackboard_course_id,
+        )
+        client._find_or_create_integrated_grade_column = unittest.mock.MagicMock(
+            name='_find_or_create_integrated_grade_column',
+            return_value=self.blackboard_grade_column_id,
+        )
+
+        def enrollments_page(emails, next_page=None):
+            page = unittest.mock.Mock(spec=Response)
+            page.status_code = 200
+            page.json.return_value = {
+                'results': [
+                    {'courseRoleId': 'Student', 'user': {'contact': {'email': email}}, 'userId': email}
+                    for email in emails
+                ],
+            }
+            if next_page:
+                page.json.return_value['paging'] = {'nextPage': next_page}
+            return page
+
+        client._create_session()
+        client.session.get = unittest.mock.MagicMock(
+            name='_get',
+            side_effect=[
+                enrollments_page(['learner1@example.com'], next_page='/enrollments?offset=1'),
+                enrollments_page(['learner2@example.com']),
+            ],
+        )
+        client.session.patch = unittest.mock.MagicMock(name='_patch', return_value=SUCCESSFUL_RESPONSE)
+
+        results = client.create_course_completions([
+            ('learner1@example.com', self.learner_data_payload),
+            ('learner2@example.com', self.learner_data_payload),
+        ])
+
+        assert [status_code for status_code, __ in results] == [SUCCESSFUL_RESPONSE.status_code] * 2
+        assert client._resolve_blackboard_course_id.call_count == 1
+        assert client._find_or_create_integrated_grade_column.call_count == 1
+        assert client.session.get.call_count == 2
+        assert client.session.get.call_args_list[1].args[0] == 'https://base.url/enrollments?offset=1'
+        assert client.session.patch.call_count == 2
+
     def test_content_customization_failure(self):
         """
         Test that when content customization for either update and create, fails, we
@@ -408,6 +408,113 @@ class TestCanvasApiClient(unittest.TestCase):
                 'is_assessment_grade'
             )
 
+    @mock.patch('integrated_channels.canvas.client.time.sleep')
+    def test_create_course_completions_posts_grades_per_assignment(self, mock_sleep):
+        """
+        Completions sharing a Canvas assignment are posted in one ``update_grades`` request whose progress is
+        polled, while Canvas users and assignments are resolved once per client.
+        """
+        other_email = 'other@test.com'
+        other_canvas_user_id = self.canvas_user_id + 1000
+        missing_email = 'missing@test.com'
+        missing_canvas_user_id = self.canvas_user_id + 2000
+        canvas_user_ids = {
+            self.canvas_email: self.canvas_user_id,
+            other_email: other_canvas_user_id,
+            missing_email: missing_canvas_user_id,
+        }
+        update_grades_url = \
+            "{base}/api/v1/courses/{course_id}/assignments/{assignment_id}/submissions/update_grades".format(
+                base=self.url_base,
+                course_id=self.canvas_course_id,
+                assignment_id=self.canvas_assignment_id,
+            )
+        progress_url = "{base}/api/v1/progress/1".format(base=self.url_base)
+
+        def completion_payload(email, grade):
+            return json.dumps({'courseID': self.course_id, 'grade': grade, 'userID': email})
+
+        with responses.RequestsMock() as rsps:
+            rsps.add(responses.POST, self.oauth_url, json=self._token_response(), status=200)
+            rsps.add(
+                responses.POST,
+                update_grades_url,
+                json={'id': 1, 'workflow_state': 'queued', 'url': progress_url},
+                status=200
+            )
+            rsps.add(responses.GET, progress_url, json={'id': 1, 'workflow_state': 'running'}, status=200)
+            rsps.add(responses.GET, progress_url, json={'id': 1, 'workflow_state': 'completed'}, status=200)
+
+            canvas_api_client = CanvasAPIClient(self.enterprise_config)
+            canvas_api_client._search_for_canvas_user_by_email = mock.MagicMock(  # pylint: disable=protected-access
+                side_effect=canvas_user_ids.get
+            )
+            canvas_api_client._get_canvas_user_courses_by_id = mock.MagicMock(  # pylint: disable=protected-access
+                side_effect=lambda user_id: [] if user_id == missing_canvas_user_id else [
+                    {'id': self.canvas_course_id, 'integration_id': self.course_id}
+                ]
+            )
+            canvas_api_client._handle_canvas_assignment_retrieval = mock.MagicMock(  # pylint: disable=protected-access
+                return_value=self.canvas_assignment_id
+            )
+
+            results = canvas_api_client.create_course_completions([
+                (self.canvas_email, completion_payload(self.canvas_email, 0.5)),
+                (missing_email, completion_payload(missing_email, 0.7)),
+                (other_email, completion_payload(other_email, 0.9)),
+            ])
+
+            assert json.loads(rsps.calls[1].request.body) == {
+                'grade_data': {
+                    str(self.canvas_user_id): {'posted_grade': 50.0},
+                    str(other_canvas_user_id): {'posted_grade': 90.0},
+                }
+            }
+            assert len(rsps.calls) == 4
+
+        assert results[0] == results[2] == (200, '{"id": 1, "workflow_state": "completed"}')
+        assert isinstance(results[1], ClientError)
+        assert results[1].status_code == 404
+        assert canvas_api_client._handle_canvas_assignment_retrieval.call_count == 1  # pylint: disable=protected-access
+        mock_sleep.assert_called_once()
+
+        # Lookups are reused for learners seen earlier in the run.
+        canvas_api_client._handle_canvas_assignment_submission = mock.MagicMock(  # pylint: disable=protected-access
+            return_value=mock.Mock(status_code=200, text='')
+        )
+        canvas_api_client._create_session = mock.MagicMock()  # pylint: disable=protected-access
+        canvas_api_client.create_course_completion(self.canvas_email, completion_payload(self.canvas_email, 1))
+        assert canvas_api_client._search_for_canvas_user_by_email.call_count == 3  # pylint: disable=protected-access
+        assert canvas_api_client._get_canvas_user_courses_by_id.call_count == 3  # pylint: disable=protected-access
+        assert canvas_api_client._handle_canvas_assignment_retrieval.call_count == 1  # pylint: disable=protected-access
+
+    @mock.patch('integrated_channels.canvas.client.time.sleep')
+    def test_bulk_assignment_submission_failed_progress(self, mock_sleep):
+        """
+        A failed Canvas progress job is surfaced as a ``ClientError``.
+        """
+        update_grades_url = \
+            "{base}/api/v1/courses/{course_id}/assignments/{assignment_id}/submissions/update_grades".format(
+                base=self.url_base,
+                course_id=self.canvas_course_id,
+                assignment_id=self.canvas_assignment_id,
+            )
+        progress_url = "{base}/api/v1/progress/1".format(base=self.url_base)
+        with responses.RequestsMock() as rsps:
+            rsps.add(responses.POST, self.oauth_url, json=self._token_response(), status=200)
+            rsps.add(responses.POST, update_grades_url, json={'url': progress_url}, status=200)
+            rsps.add(responses.GET, progress_url, json={'workflow_state': 'failed'}, status=200)
+
+            canvas_api_client = CanvasAPIClient(self.enterprise_config)
+            canvas_api_client._create_session()  # pylint: disable=protected-access
+            with pytest.raises(ClientError):
+                canvas_api_client._handle_canvas_bulk_assignment_submission(  # pylint: disable=protected-access
+                    self.canvas_course_id,
+                    self.canvas_assignment_id,
+                    {self.canvas_user_id: 100},
+                )
+        mock_sleep.assert_not_called()
+
     def test_create_client_session_with_oauth_access_key(self):
         """ Test instantiating the client will fetch and set the session's oauth access key"""
         with responses.RequestsMock() as rsps:
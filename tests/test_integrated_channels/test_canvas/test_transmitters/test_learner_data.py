@@ -79,23 +79,22 @@ class TestCanvasLearnerDataTransmitter(unittest.TestCase):
         self.assessment_reporting_mock = assessment_reporting_mock.start()
         self.addCleanup(assessment_reporting_mock.stop)
 
-        create_course_completion_mock = mock.patch(
-            'integrated_channels.canvas.client.CanvasAPIClient.create_course_completion'
+        create_course_completions_mock = mock.patch(
+            'integrated_channels.canvas.client.CanvasAPIClient.create_course_completions'
         )
 
-        self.create_course_completion_mock = create_course_completion_mock.start()
-        self.addCleanup(create_course_completion_mock.stop)
+        self.create_course_completions_mock = create_course_completions_mock.start()
+        self.addCleanup(create_course_completions_mock.stop)
 
     def test_transmit_success(self):
         """
         Learner data completion transmission is successful and the payload is saved with the appropriate data.
         """
-        self.create_course_completion_mock.return_value = 200, '{"success":"true"}'
+        self.create_course_completions_mock.return_value = [(200, '{"success":"true"}')]
 
         self.transmitter.transmit(self.completion_exporter([self.completion_payload]))
-        self.create_course_completion_mock.assert_called_with(
-            self.completion_payload.canvas_user_email,
-            self.completion_payload.serialize()
+        self.create_course_completions_mock.assert_called_once_with(
+            [(self.completion_payload.canvas_user_email, self.completion_payload.serialize())]
         )
         assert self.completion_payload.status == '200'
         assert self.completion_payload.error_message == ''
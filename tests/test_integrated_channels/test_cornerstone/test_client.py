@@ -60,3 +60,54 @@ class TestCornerstoneApiClient(unittest.TestCase):
         assert IntegratedChannelAPIRequestLogs.objects.count() == 1
         assert len(responses.calls) == 1
         assert output == (200, '"{}"')
+
+    @responses.activate
+    def test_create_course_completions_batches_by_callback(self):
+        """
+        ``create_course_completions`` should post completions sharing a callback URL and session token together,
+        in batches of at most ``COMPLETION_BATCH_SIZE`` elements, and map each element's result back.
+        """
+        cornerstone_api_client = CornerstoneAPIClient(self.csod_config)
+        cornerstone_api_client.COMPLETION_BATCH_SIZE = 2
+
+        def completion(user_guid, callback_url, course_id='edX+DemoX'):
+            payload = {
+                "data": {
+                    "userGuid": user_guid,
+                    "sessionToken": "dummy_session_token",
+                    "callbackUrl": callback_url,
+                    "courseId": course_id,
+                }
+            }
+            return user_guid, json.dumps(payload)
+
+        first_url = f"{self.cornerstone_base_url}first_callback?sessionToken=dummy_session_token"
+        second_url = f"{self.cornerstone_base_url}second_callback?sessionToken=dummy_session_token"
+        responses.add(responses.POST, first_url, json=[{"id": "a"}, {"id": "b"}], status=200)
+        responses.add(responses.POST, first_url, json={}, status=200)
+        responses.add(responses.POST, second_url, json={}, status=400)
+
+        output = cornerstone_api_client.create_course_completions([
+            completion('a', 'first_callback'),
+            completion('c', 'second_callback', course_id='edX+OtherX'),
+            completion('b', 'first_callback'),
+            completion('d', 'first_callback'),
+        ])
+
+        assert len(responses.calls) == 3
+        assert [element['userGuid'] for element in json.loads(responses.calls[0].request.body)] == ['a', 'b']
+        assert [element['userGuid'] for element in json.loads(responses.calls[1].request.body)] == ['d']
+        assert output == [
+            (200, json.dumps({"id": "a"})),
+            (400, '{}'),
+            (200, json.dumps({"id": "b"})),
+            (200, '{}'),
+        ]
+        course_key_model = apps.get_model('cornerstone', 'CornerstoneCourseKey')
+        external_course_id = course_key_model.objects.get(internal_course_id='edX+DemoX').external_course_id
+        assert json.loads(responses.calls[2].request.body)[0]['courseId'] == \
+            course_key_model.objects.get(internal_course_id='edX+OtherX').external_course_id
+        assert {element['courseId'] for element in json.loads(responses.calls[0].request.body)} == {
+            external_course_id
+        }
+        assert IntegratedChannelAPIRequestLogs.objects.count() == 3
@@ -160,7 +160,7 @@ class TestCornerstoneLearnerExporter(unittest.TestCase):
         assert exporter.get_learner_data_records(enterprise_course_enrollment) is None
 
     @responses.activate
-    @mock.patch('integrated_channels.cornerstone.client.requests.post')
+    @mock.patch('integrated_channels.utils.PooledSession.post')
     @mock.patch('integrated_channels.integrated_channel.exporters.learner_data.get_course_certificate')
     @mock.patch('integrated_channels.integrated_channel.exporters.learner_data.get_course_details')
     @mock.patch('integrated_channels.integrated_channel.exporters.learner_data.is_course_completed')
@@ -227,7 +227,7 @@ class TestCornerstoneLearnerExporter(unittest.TestCase):
 
     @responses.activate
     @mock.patch('integrated_channels.cornerstone.utils.uuid4')
-    @mock.patch('integrated_channels.cornerstone.client.requests.post')
+    @mock.patch('integrated_channels.utils.PooledSession.post')
     @mock.patch('integrated_channels.integrated_channel.exporters.learner_data.get_course_certificate')
     @mock.patch('integrated_channels.integrated_channel.exporters.learner_data.get_course_details')
     @mock.patch('integrated_channels.integrated_channel.exporters.learner_data.is_course_completed')
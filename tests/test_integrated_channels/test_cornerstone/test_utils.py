@@ -10,10 +10,11 @@ from pytest import mark
 from django.test import RequestFactory
 
 from integrated_channels.cornerstone.models import (
+    CornerstoneCourseKey,
     CornerstoneEnterpriseCustomerConfiguration,
     CornerstoneLearnerDataTransmissionAudit,
 )
-from integrated_channels.cornerstone.utils import create_cornerstone_learner_data
+from integrated_channels.cornerstone.utils import create_cornerstone_learner_data, get_or_create_key_pairs
 from test_utils.factories import EnterpriseCustomerCatalogFactory, EnterpriseCustomerFactory, UserFactory
 
 
@@ -165,3 +166,15 @@ class TestCornerstoneUtils(unittest.TestCase):
         records = CornerstoneLearnerDataTransmissionAudit.objects.all()
         assert records.count() == 2
         self._assert_learner_data_transmission_audit(records[1], user, course_id, csod_params)
+
+    @mark.django_db
+    def test_get_or_create_key_pairs(self):
+        """ test existing course key mappings are reused and missing ones are created """
+        existing = CornerstoneCourseKey.objects.create(internal_course_id='edX+DemoX', external_course_id='existing')
+
+        key_mappings = get_or_create_key_pairs(['edX+DemoX', 'edX+NewX', 'edX+NewX', None])
+
+        assert set(key_mappings) == {'edX+DemoX', 'edX+NewX'}
+        assert key_mappings['edX+DemoX'].external_course_id == existing.external_course_id
+        assert key_mappings['edX+NewX'] == CornerstoneCourseKey.objects.get(internal_course_id='edX+NewX')
+        assert CornerstoneCourseKey.objects.count() == 2
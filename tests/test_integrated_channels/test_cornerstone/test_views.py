@@ -3,6 +3,7 @@ Tests for Cornerstone views.
 """
 
 import datetime
+import json
 from unittest import mock
 
 import responses
@@ -16,7 +17,10 @@ from django.utils.http import http_date
 
 from enterprise.constants import IC_CREATE_ACTION
 from enterprise.utils import get_enterprise_worker_user
-from integrated_channels.integrated_channel.models import ContentMetadataItemTransmission
+from integrated_channels.integrated_channel.models import (
+    ContentMetadataItemTransmission,
+    IntegratedChannelAPIRequestLogs,
+)
 from test_utils import APITest, factories
 from test_utils.fake_catalog_api import get_fake_content_metadata, get_fake_content_metadata_for_create_w_program
 from test_utils.fake_enterprise_api import EnterpriseMockMixin
@@ -262,3 +266,52 @@ class TestCornerstoneCoursesListView(APITest, EnterpriseMockMixin):
         # empty
         assert not response.data
         assert not ContentMetadataItemTransmission.objects.filter(marked_for__isnull=False)
+
+    def test_course_list_count_pages_through_pending_items(self):
+        """
+        Each poll returns at most ``count`` items, least recently modified first, and leaves the rest for the
+        following polls. Only the ids of the pulled items are stored on the request log.
+        """
+        worker_user = get_enterprise_worker_user()
+        exporter = self.config.get_content_metadata_exporter(worker_user)
+        content_ids = []
+        for x in range(3):
+            content_item = factories.ContentMetadataItemTransmissionFactory(
+                content_id=f"course-v{x}:edX+DemoX+Demo_Course",
+                enterprise_customer=self.config.enterprise_customer,
+                plugin_configuration_id=self.config.id,
+                integrated_channel_code=self.config.channel_code(),
+                marked_for='create' if x else 'update',
+            )
+            content_item.channel_metadata = exporter._transform_item(  # pylint: disable=protected-access
+                content_item.channel_metadata,
+                action=IC_CREATE_ACTION,
+            )
+            content_item.save()
+            content_ids.append(content_item.channel_metadata['ID'])
+
+        url = '{path}?ciid={customer_uuid}&count=2'.format(
+            path=self.course_list_url,
+            customer_uuid=self.enterprise_customer_catalog.enterprise_customer.uuid
+        )
+        first_poll = self.client.get(url)
+        self.assertEqual(first_poll.status_code, status.HTTP_200_OK)
+        assert sorted(item['ID'] for item in first_poll.data) == sorted(content_ids[:2])
+        assert ContentMetadataItemTransmission.objects.filter(marked_for__isnull=False).count() == 1
+
+        second_poll = self.client.get(url)
+        assert [item['ID'] for item in second_poll.data] == content_ids[2:]
+        assert not self.client.get(url).data
+
+        api_logs = IntegratedChannelAPIRequestLogs.objects.filter(
+            enterprise_customer_configuration_id=self.config.id,
+        ).order_by('id')
+        assert json.loads(api_logs[1].response_body) == content_ids[2:]
+
+    def test_course_list_invalid_count(self):
+        url = '{path}?ciid={customer_uuid}&count=all'.format(
+            path=self.course_list_url,
+            customer_uuid=self.enterprise_customer_catalog.enterprise_customer.uuid
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
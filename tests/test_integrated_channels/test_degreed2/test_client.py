@@ -506,6 +506,92 @@ class TestDegreed2ApiClient(unittest.TestCase):
         assert status_code == 200
         assert response_body == '"{}"'
 
+    @responses.activate
+    @mock.patch('integrated_channels.degreed2.client.Degreed2APIClient.fetch_degreed_course_id')
+    def test_update_content_metadata_uses_exported_skills(self, mock_fetch_degreed_course_id):
+        """
+        ``update_content_metadata`` should assign the skill names carried in the payload without querying the
+        enterprise catalog, and should not send them as a course attribute.
+        """
+        mock_fetch_degreed_course_id.return_value = 'a_course_id'
+        enterprise_config = factories.Degreed2EnterpriseCustomerConfigurationFactory()
+        degreed_api_client = Degreed2APIClient(enterprise_config)
+        payload = json.loads(create_course_payload())
+        payload['courses'][0]['skill-names'] = ['Supply Chain']
+
+        responses.add(
+            responses.POST,
+            degreed_api_client.get_oauth_url(),
+            json=self.expected_token_response_body,
+            status=200
+        )
+        responses.add(
+            responses.PATCH,
+            f'{degreed_api_client.get_courses_url()}/a_course_id',
+            json='{}',
+            status=200
+        )
+        responses.add(
+            responses.PATCH,
+            degreed_api_client.get_course_skills_url('a_course_id'),
+            json='{}',
+            status=201
+        )
+        status_code, __ = degreed_api_client.update_content_metadata(json.dumps(payload).encode('utf-8'))
+
+        assert status_code == 200
+        assert len(responses.calls) == 3
+        assert 'skill-names' not in json.loads(responses.calls[1].request.body)['data']['attributes']
+        assert json.loads(responses.calls[2].request.body) == ['Supply Chain']
+
+    @responses.activate
+    def test_prefetch_degreed_course_ids(self):
+        """
+        ``prefetch_degreed_course_ids`` should page through the course listing once and serve later
+        ``fetch_degreed_course_id`` calls from the cache.
+        """
+        enterprise_config = factories.Degreed2EnterpriseCustomerConfigurationFactory()
+        degreed_api_client = Degreed2APIClient(enterprise_config)
+        first_page_url = f'{degreed_api_client.get_courses_url()}?limit=1000'
+        second_page_url = f'{degreed_api_client.get_courses_url()}?limit=1000&next=abc'
+        responses.add(
+            responses.POST,
+            degreed_api_client.get_oauth_url(),
+            json=self.expected_token_response_body,
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            first_page_url,
+            json={
+                'data': [
+                    {'id': 'degreed_id_1', 'attributes': {'external-id': 'edX+Prefetch1'}},
+                    {'id': 'degreed_id_2', 'attributes': {'external-id': None}},
+                ],
+                'links': {'next': second_page_url},
+            },
+            status=200,
+            match_querystring=True,
+        )
+        responses.add(
+            responses.GET,
+            second_page_url,
+            json={
+                'data': [{'id': 'degreed_id_3', 'attributes': {'external-id': 'edX+Prefetch3'}}],
+                'links': {},
+            },
+            status=200,
+            match_querystring=True,
+        )
+
+        assert degreed_api_client.prefetch_degreed_course_ids() == 2
+        assert degreed_api_client.prefetch_degreed_course_ids() == 0
+        assert len(responses.calls) == 3
+
+        assert degreed_api_client.fetch_degreed_course_id('edX+Prefetch1') == 'degreed_id_1'
+        assert degreed_api_client.fetch_degreed_course_id('edX+Prefetch3') == 'degreed_id_3'
+        assert len(responses.calls) == 3
+
     @responses.activate
     @mock.patch('integrated_channels.degreed2.client.Degreed2APIClient.fetch_degreed_course_id')
     @mock.patch('enterprise.api_client.client.JwtBuilder', mock.Mock())
@@ -529,3 +529,12 @@ class TestDegreed2ContentMetadataExporter(unittest.TestCase, EnterpriseMockMixin
             },
         }
         assert exporter.transform_video_url(content_metadata_item) == 'http://www.youtube.com/watch?v=3_yD_cEKoCk'
+
+    def test_transform_skill_names(self):
+        exporter = Degreed2ContentMetadataExporter('fake-user', self.config)
+        content_metadata_item = {
+            "content_type": "course",
+            "skill_names": ["Supply Chain", "Logistics"],
+        }
+        assert exporter.transform_skill_names(content_metadata_item) == ["Supply Chain", "Logistics"]
+        assert exporter.transform_skill_names({"content_type": "course"}) == []
@@ -3,7 +3,9 @@ Tests for the base integrated channel API client.
 """
 
 import unittest
+from unittest import mock
 
+from integrated_channels.exceptions import ClientError
 from integrated_channels.integrated_channel.client import IntegratedChannelApiClient
 
 
@@ -26,6 +28,23 @@ class TestIntegratedChannelApiClient(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             IntegratedChannelApiClient('fake-config').create_course_completion('fake-user', 'fake-payload')
 
+    def test_create_course_completions(self):
+        """
+        The ``create_course_completions`` method sends each completion with ``create_course_completion`` by default,
+        returning the ``ClientError`` of the completions which failed.
+        """
+        client = IntegratedChannelApiClient('fake-config')
+        client_error = ClientError('fake-error', 400)
+        with mock.patch.object(
+            client, 'create_course_completion', side_effect=[(200, 'fake-body'), client_error],
+        ) as mock_create_course_completion:
+            results = client.create_course_completions([('user-1', 'payload-1'), ('user-2', 'payload-2')])
+
+        assert results == [(200, 'fake-body'), client_error]
+        assert mock_create_course_completion.call_args_list == [
+            mock.call('user-1', 'payload-1'), mock.call('user-2', 'payload-2'),
+        ]
+
     def test_delete_course_completion(self):
         """
         The ``delete_course_completion`` method isn't implemented at the base, and should raise ``NotImplementedError``.
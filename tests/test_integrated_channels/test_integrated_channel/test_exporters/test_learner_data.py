@@ -283,6 +283,7 @@ class TestLearnerExporter(unittest.TestCase):
         assert learner_data[0].completed_timestamp is None
         assert learner_data[0].grade == LearnerExporter.GRADE_INCOMPLETE
 
+    @mock.patch('integrated_channels.lms_utils.ThirdPartyAuthApiClient')
     @mock.patch('enterprise.models.EnrollmentApiClient')
     @mock.patch('integrated_channels.integrated_channel.exporters.learner_data.get_single_user_grade')
     @mock.patch('integrated_channels.integrated_channel.exporters.learner_data.get_course_details')
@@ -292,7 +293,8 @@ class TestLearnerExporter(unittest.TestCase):
             mock_get_course_certificate,
             mock_get_course_details,
             mock_get_single_user_grade,
-            mock_enrollment_api
+            mock_enrollment_api,
+            mock_tpa_client,
     ):
         # SSO/SAP-specific behaviour and the Generic config doesnt depend on it
         self.config = factories.SAPSuccessFactorsEnterpriseCustomerConfigurationFactory(
@@ -310,7 +312,7 @@ class TestLearnerExporter(unittest.TestCase):
         )
 
         # No SSO user attached
-        self.tpa_client.get_remote_id.return_value = None
+        mock_tpa_client.return_value.get_remote_ids.return_value = {}
 
         # no certificate found
         mock_get_course_certificate.return_value = None
@@ -2,6 +2,7 @@
 Tests for the base learner data transmitter.
 """
 
+import threading
 import unittest
 from unittest import mock
 from unittest.mock import MagicMock, Mock
@@ -9,6 +10,7 @@ from unittest.mock import MagicMock, Mock
 import ddt
 from pytest import mark
 
+from integrated_channels.exceptions import ClientError
 from integrated_channels.integrated_channel.exporters.learner_data import LearnerExporter
 from integrated_channels.integrated_channel.tasks import transmit_single_learner_data
 from integrated_channels.integrated_channel.transmitters.learner_data import LearnerTransmitter
@@ -45,6 +47,7 @@ class TestLearnerDataTransmitter(unittest.TestCase):
         If you add any settings to the ChannelSettingsMixin, add a test here for the common default value
         """
         assert LearnerTransmitter(self.enterprise_config).INCLUDE_GRADE_FOR_COMPLETION_AUDIT_CHECK is True
+        assert LearnerTransmitter(self.enterprise_config).TRANSMIT_COMPLETIONS_IN_BULK is False
 
     def test_transmit_single_learner_data_signal_kwargs(self):
         """
@@ -113,6 +116,107 @@ class TestLearnerDataTransmitter(unittest.TestCase):
         )
         self.learner_transmitter.process_transmission_error.assert_called_once()
 
+    @staticmethod
+    def _completion_records(*records):
+        """
+        Return mocked learner data records for the given ``(enterprise_course_enrollment_id, course_id)`` pairs.
+        """
+        completion_records = []
+        for enrollment_id, course_id in records:
+            record = MagicMock()
+            record.course_completed = True
+            record.enterprise_course_enrollment_id = enrollment_id
+            record.course_id = course_id
+            record.user_id = f'user-{enrollment_id}'
+            record.serialize = Mock(return_value=f'{enrollment_id}:{course_id}')
+            completion_records.append(record)
+        return completion_records
+
+    @mock.patch('integrated_channels.integrated_channel.transmitters.'
+                'learner_data.LearnerExporterUtility.lms_user_id_for_ent_course_enrollment_id')
+    @mock.patch('integrated_channels.integrated_channel.transmitters.learner_data.is_already_transmitted')
+    def test_transmit_concurrently(self, is_already_tx, mock_lms_id):
+        """
+        Completions are sent from a thread pool when the configuration allows it, and the record by course run is
+        only sent for enrollments whose record by course key failed.
+        """
+        mock_lms_id.return_value = 'abc'
+        is_already_tx.return_value = False
+        self.enterprise_config.learner_data_transmission_concurrency = 2
+        records = self._completion_records((1, 'edX+DemoX'), (1, 'course-v1:edX+DemoX+1T'), (2, 'edX+Other'))
+        failing_payloads = {'1:edX+DemoX'}
+        self.learner_transmitter.client.create_course_completion = Mock(
+            side_effect=lambda remote_id, payload: (404, 'missing') if payload in failing_payloads else (200, 'ok')
+        )
+        exporter = MagicMock()
+        exporter.export = MagicMock(return_value=records)
+        self.learner_transmitter.process_transmission_error = Mock()
+
+        self.learner_transmitter.transmit(exporter, remote_user_id='user_id')
+
+        sent_payloads = sorted(
+            call.args[1] for call in self.learner_transmitter.client.create_course_completion.call_args_list
+        )
+        assert sent_payloads == ['1:course-v1:edX+DemoX+1T', '1:edX+DemoX', '2:edX+Other']
+        assert [record.status for record in records] == ['404', '200', '200']
+        assert [record.is_transmitted for record in records] == [False, True, True]
+        self.learner_transmitter.process_transmission_error.assert_called_once()
+
+    @mock.patch('integrated_channels.integrated_channel.transmitters.learner_data.connection')
+    @mock.patch('integrated_channels.integrated_channel.transmitters.'
+                'learner_data.LearnerExporterUtility.lms_user_id_for_ent_course_enrollment_id')
+    @mock.patch('integrated_channels.integrated_channel.transmitters.learner_data.is_already_transmitted')
+    def test_transmit_concurrently_closes_worker_connections_once(self, is_already_tx, mock_lms_id, mock_connection):
+        """
+        The database connection of each worker thread is closed once when the pool shuts down, not after each call.
+        """
+        mock_lms_id.return_value = 'abc'
+        is_already_tx.return_value = False
+        self.enterprise_config.learner_data_transmission_concurrency = 2
+        records = self._completion_records(*((enrollment_id, 'edX+DemoX') for enrollment_id in range(6)))
+        sending_threads, closing_threads = set(), []
+        self.learner_transmitter.client.create_course_completion = Mock(
+            side_effect=lambda remote_id, payload: sending_threads.add(threading.get_ident()) or (200, 'ok')
+        )
+        mock_connection.close.side_effect = lambda: closing_threads.append(threading.get_ident())
+        exporter = MagicMock()
+        exporter.export = MagicMock(return_value=records)
+
+        self.learner_transmitter.transmit(exporter, remote_user_id='user_id')
+
+        assert self.learner_transmitter.client.create_course_completion.call_count == 6
+        assert len(closing_threads) == len(set(closing_threads))
+        assert sending_threads <= set(closing_threads)
+        assert threading.get_ident() not in closing_threads
+
+    @mock.patch('integrated_channels.integrated_channel.transmitters.learner_data.time.sleep')
+    @mock.patch('integrated_channels.integrated_channel.transmitters.'
+                'learner_data.LearnerExporterUtility.lms_user_id_for_ent_course_enrollment_id')
+    @mock.patch('integrated_channels.integrated_channel.transmitters.learner_data.is_already_transmitted')
+    def test_transmit_concurrently_retries_rate_limited_calls(self, is_already_tx, mock_lms_id, mock_sleep):
+        """
+        A completion rejected with a 429 is retried after the delay asked by the integrated channel, or after an
+        exponential backoff when none was given.
+        """
+        mock_lms_id.return_value = 'abc'
+        is_already_tx.return_value = False
+        self.enterprise_config.learner_data_transmission_concurrency = 2
+        records = self._completion_records((1, 'edX+DemoX'))
+        self.learner_transmitter.client.create_course_completion = Mock(side_effect=[
+            ClientError('slow down', 429, retry_after=7),
+            (429, 'slow down'),
+            (200, 'ok'),
+        ])
+        exporter = MagicMock()
+        exporter.export = MagicMock(return_value=records)
+
+        self.learner_transmitter.transmit(exporter, remote_user_id='user_id')
+
+        assert self.learner_transmitter.client.create_course_completion.call_count == 3
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [7, 2]
+        assert records[0].status == '200'
+        assert records[0].is_transmitted is True
+
     def test_learner_data_transmission_feature_flag(self):
         """
         Test that a customer's configuration can disable learner data transmissions
@@ -309,8 +309,10 @@ class TestMoodleApiClient(unittest.TestCase):
         client.get_course_final_grade_module = unittest.mock.MagicMock(name='_get_final_grade_module')
         client.get_course_final_grade_module.return_value = self.moodle_module_id, self.moodle_module_name
 
-        client.get_creds_of_user_in_course = unittest.mock.MagicMock(name='get_user_in_course')
-        client.get_creds_of_user_in_course.return_value = self.moodle_user_id
+        client._get_enrolled_user_ids_by_email = unittest.mock.MagicMock(  # pylint: disable=protected-access
+            name='_get_enrolled_user_ids_by_email',
+            return_value={self.user_email: self.moodle_user_id},
+        )
 
         # The base transmitter expects the create course completion response to be a tuple of (code, body)
         assert client.create_course_completion(self.user_email, self.learner_data_payload) == (
@@ -345,8 +347,10 @@ class TestMoodleApiClient(unittest.TestCase):
         client.get_course_final_grade_module = unittest.mock.MagicMock(name='_get_final_grade_module')
         client.get_course_final_grade_module.return_value = self.moodle_module_id, self.moodle_module_name
 
-        client.get_creds_of_user_in_course = unittest.mock.MagicMock(name='get_user_in_course')
-        client.get_creds_of_user_in_course.return_value = self.moodle_user_id
+        client._get_enrolled_user_ids_by_email = unittest.mock.MagicMock(  # pylint: disable=protected-access
+            name='_get_enrolled_user_ids_by_email',
+            return_value={self.user_email: self.moodle_user_id},
+        )
 
         # The base transmitter expects the create course completion response to be a tuple of (code, body)
         assert client.create_course_completion(self.user_email, self.learner_data_payload) == (
@@ -367,6 +371,53 @@ class TestMoodleApiClient(unittest.TestCase):
 
         client._post.assert_called_once_with(expected_params)  # pylint: disable=protected-access
 
+    def test_create_course_completions_resolves_each_course_once(self):
+        """
+        Test that completions are grouped into one multi-row grade update per course, and that the course,
+        its final grade module and its roster are resolved once per course for the lifetime of the client.
+        """
+        client = MoodleAPIClient(self.enterprise_config)
+        client._post = unittest.mock.MagicMock(name='_post', return_value=SUCCESSFUL_RESPONSE)  # pylint: disable=protected-access
+        client.get_course_id = unittest.mock.MagicMock(name='get_course_id', side_effect=lambda key: f'{key}-id')
+        client.get_course_final_grade_module = unittest.mock.MagicMock(
+            name='get_course_final_grade_module',
+            return_value=(self.moodle_module_id, self.moodle_module_name),
+        )
+        client._get_enrolled_user_ids_by_email = unittest.mock.MagicMock(  # pylint: disable=protected-access
+            name='_get_enrolled_user_ids_by_email',
+            return_value={'learner1@example.com': 1, 'learner2@example.com': 2},
+        )
+        completions = [
+            ('learner1@example.com', '{"courseID": "course-a", "grade": 0.5}'),
+            ('learner2@example.com', '{"courseID": "course-a", "grade": 1.0}'),
+            ('learner1@example.com', '{"courseID": "course-b", "grade": 0.25}'),
+            ('unenrolled@example.com', '{"courseID": "course-b", "grade": 0.75}'),
+        ]
+
+        results = client.create_course_completions(completions)
+        client.create_course_completions(completions[:2])
+
+        assert results[:3] == [(SUCCESSFUL_RESPONSE.status_code, SUCCESSFUL_RESPONSE.text)] * 3
+        assert isinstance(results[3], ClientError)
+        assert results[3].status_code == 404
+        assert client.get_course_id.call_count == 2
+        assert client.get_course_final_grade_module.call_count == 2
+        # course-b's roster is downloaded again once, for the learner missing from it
+        assert client._get_enrolled_user_ids_by_email.call_count == 3  # pylint: disable=protected-access
+        client._post.assert_any_call({  # pylint: disable=protected-access
+            'wsfunction': 'core_grades_update_grades',
+            'source': self.moodle_module_name,
+            'courseid': 'course-a-id',
+            'component': 'mod_assign',
+            'activityid': self.moodle_module_id,
+            'itemnumber': 0,
+            'grades[0][studentid]': 1,
+            'grades[0][grade]': 50.0,
+            'grades[1][studentid]': 2,
+            'grades[1][grade]': 100.0,
+        })
+        assert client._post.call_count == 3  # pylint: disable=protected-access
+
     @responses.activate
     def test_get_course_final_grade_module_custom_name(self):
         """
@@ -389,8 +440,10 @@ class TestMoodleApiClient(unittest.TestCase):
             status=200,
         )
 
-        client.get_creds_of_user_in_course = unittest.mock.MagicMock(name='get_user_in_course')
-        client.get_creds_of_user_in_course.return_value = self.moodle_user_id
+        client._get_enrolled_user_ids_by_email = unittest.mock.MagicMock(  # pylint: disable=protected-access
+            name='_get_enrolled_user_ids_by_email',
+            return_value={self.user_email: self.moodle_user_id},
+        )
 
         # The base transmitter expects the create course completion response to be a tuple of (code, body)
         assert IntegratedChannelAPIRequestLogs.objects.count() == 0
@@ -1,6 +1,7 @@
 """
 Tests for Moodle learner data transmissions.
 """
+import copy
 import datetime
 import unittest
 from unittest import mock
@@ -8,6 +9,7 @@ from unittest.mock import Mock
 
 from pytest import mark
 
+from integrated_channels.exceptions import ClientError
 from integrated_channels.integrated_channel.exporters.learner_data import LearnerExporter
 from integrated_channels.integrated_channel.transmitters.learner_data import LearnerTransmitter
 from integrated_channels.moodle.models import MoodleLearnerDataTransmissionAudit
@@ -54,12 +56,12 @@ class TestMoodleLearnerDataTransmitter(unittest.TestCase):
             export=mock.MagicMock(return_value=iter(payloads))
         )
         # Mocks
-        create_course_completion_mock = mock.patch(
-            'integrated_channels.moodle.client.MoodleAPIClient.create_course_completion'
+        create_course_completions_mock = mock.patch(
+            'integrated_channels.moodle.client.MoodleAPIClient.create_course_completions'
         )
 
-        self.create_course_completion_mock = create_course_completion_mock.start()
-        self.addCleanup(create_course_completion_mock.stop)
+        self.create_course_completions_mock = create_course_completions_mock.start()
+        self.addCleanup(create_course_completions_mock.stop)
 
         self.learner_transmitter = LearnerTransmitter(self.enterprise_config)
 
@@ -67,15 +69,45 @@ class TestMoodleLearnerDataTransmitter(unittest.TestCase):
         """
         Learner data transmission is successful and the payload is saved with the appropriate data.
         """
-        self.create_course_completion_mock.return_value = 200, '{"success":"true"}'
+        self.create_course_completions_mock.return_value = [(200, '{"success":"true"}')]
 
         transmitter = learner_data.MoodleLearnerTransmitter(self.enterprise_config)
 
         transmitter.transmit(self.exporter([self.payload]))
-        self.create_course_completion_mock.assert_called_with(self.payload.moodle_user_email, self.payload.serialize())
+        self.create_course_completions_mock.assert_called_once_with(
+            [(self.payload.moodle_user_email, self.payload.serialize())]
+        )
         assert self.payload.status == '200'
         assert self.payload.error_message == ''
 
+    def test_transmit_course_run_after_failed_course_key(self):
+        """
+        The completion by course run of an enrollment is only sent, in a later request, if the one by course key
+        failed.
+        """
+        course_key_payload = copy.copy(self.payload)
+        course_key_payload.course_id = 'edX+DemoX'
+        other_enrollment_payload = copy.copy(self.payload)
+        other_enrollment_payload.enterprise_course_enrollment_id = 6
+        self.create_course_completions_mock.side_effect = [
+            [ClientError('Course key "edX+DemoX" not found in Moodle.', 404), (200, '')],
+            [(200, '')],
+        ]
+
+        transmitter = learner_data.MoodleLearnerTransmitter(self.enterprise_config)
+        transmitter.transmit(self.exporter([course_key_payload, self.payload, other_enrollment_payload]))
+
+        assert self.create_course_completions_mock.call_args_list == [
+            mock.call([
+                (course_key_payload.moodle_user_email, course_key_payload.serialize()),
+                (other_enrollment_payload.moodle_user_email, other_enrollment_payload.serialize()),
+            ]),
+            mock.call([(self.payload.moodle_user_email, self.payload.serialize())]),
+        ]
+        assert course_key_payload.status == '404'
+        assert self.payload.status == '200'
+        assert other_enrollment_payload.status == '200'
+
     @mock.patch("integrated_channels.integrated_channel.models.LearnerDataTransmissionAudit")
     def test_incomplete_progress_learner_data_transmission(self, learner_data_transmission_audit_mock):
         """
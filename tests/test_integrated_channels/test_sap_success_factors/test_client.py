@@ -16,6 +16,8 @@ import responses
 from freezegun import freeze_time
 from pytest import mark, raises
 
+from django.core.cache import cache
+
 from integrated_channels.exceptions import ClientError
 from integrated_channels.sap_success_factors.client import SAPSuccessFactorsAPIClient
 from integrated_channels.sap_success_factors.models import (
@@ -36,6 +38,7 @@ class TestSAPSuccessFactorsAPIClient(unittest.TestCase):
 
     def setUp(self):
         super().setUp()
+        cache.clear()
         self.oauth_api_path = "learning/oauth-api/rest/v1/token"
         self.completion_status_api_path = "learning/odatav4/public/admin/ocn/v1/current-user/item/learning-event"
         self.course_api_path = "learning/odatav4/public/admin/ocn/v1/OcnCourses"
@@ -208,6 +211,87 @@ class TestSAPSuccessFactorsAPIClient(unittest.TestCase):
 
         assert len(responses.calls) == 2
 
+    @responses.activate
+    def test_completion_user_token_reused_until_expiry(self):
+        """
+        User-scoped tokens are fetched once per learner and reused until they expire or are rejected.
+        """
+        oauth_url = self.url_base + self.oauth_api_path
+        completion_url = self.url_base + self.completion_status_api_path
+        responses.add(responses.POST, oauth_url, json=self.expected_token_response_body, status=200)
+        responses.add(responses.POST, completion_url, json={}, status=200)
+
+        sap_client = SAPSuccessFactorsAPIClient(self.enterprise_config)
+        sap_client.create_course_completion('learner_one', json.dumps(self.completion_payload))
+        sap_client.create_course_completion('learner_one', json.dumps(self.completion_payload))
+        sap_client.create_course_completion('learner_two', json.dumps(self.completion_payload))
+        assert [call.request.url for call in responses.calls] == [
+            oauth_url, completion_url, completion_url, oauth_url, completion_url,
+        ]
+
+        # A token rejected before its expiry is replaced once.
+        responses.replace(responses.POST, completion_url, json={}, status=401)
+        with pytest.raises(ClientError):
+            sap_client.create_course_completion('learner_one', json.dumps(self.completion_payload))
+        assert [call.request.url for call in responses.calls[5:]] == [completion_url, oauth_url, completion_url]
+
+        # Expired tokens are refreshed.
+        responses.replace(responses.POST, completion_url, json={}, status=200)
+        with freeze_time(datetime.datetime.utcnow() + datetime.timedelta(seconds=self.expires_in)):
+            sap_client.create_course_completion('learner_two', json.dumps(self.completion_payload))
+        assert [call.request.url for call in responses.calls[8:]] == [oauth_url, completion_url]
+
+    @responses.activate
+    def test_completion_user_token_shared_across_clients(self):
+        """
+        User-scoped tokens are cached encrypted under a hashed key, and reused by later clients of the configuration.
+        """
+        oauth_url = self.url_base + self.oauth_api_path
+        completion_url = self.url_base + self.completion_status_api_path
+        responses.add(responses.POST, oauth_url, json=self.expected_token_response_body, status=200)
+        responses.add(responses.POST, completion_url, json={}, status=200)
+
+        SAPSuccessFactorsAPIClient(self.enterprise_config).create_course_completion(
+            'learner_one', json.dumps(self.completion_payload)
+        )
+        SAPSuccessFactorsAPIClient(self.enterprise_config).create_course_completion(
+            'learner_one', json.dumps(self.completion_payload)
+        )
+        assert [call.request.url for call in responses.calls] == [oauth_url, completion_url, completion_url]
+        assert responses.calls[2].request.headers['Authorization'] == 'Bearer {}'.format(self.access_token)
+
+        cache_key = SAPSuccessFactorsAPIClient(self.enterprise_config)._get_user_access_token_cache_key(  # pylint: disable=protected-access
+            'learner_one'
+        )
+        assert 'learner_one' not in cache_key
+        cached_token = cache.get(cache_key)
+        assert cached_token and self.access_token not in cached_token
+
+    @responses.activate
+    def test_completion_rate_limited(self):
+        """
+        A rate limited completion raises a ClientError carrying the Retry-After delay asked by SAP SuccessFactors.
+        """
+        responses.add(
+            responses.POST,
+            self.url_base + self.oauth_api_path,
+            json=self.expected_token_response_body,
+            status=200
+        )
+        responses.add(
+            responses.POST,
+            self.url_base + self.completion_status_api_path,
+            json={},
+            status=429,
+            headers={'Retry-After': '12'},
+        )
+
+        sap_client = SAPSuccessFactorsAPIClient(self.enterprise_config)
+        with pytest.raises(ClientError) as client_error:
+            sap_client.create_course_completion('learner_one', json.dumps(self.completion_payload))
+        assert client_error.value.status_code == 429
+        assert client_error.value.retry_after == 12
+
     @responses.activate
     @ddt.data('create_content_metadata', 'update_content_metadata', 'delete_content_metadata')
     def test_content_import(self, client_method):
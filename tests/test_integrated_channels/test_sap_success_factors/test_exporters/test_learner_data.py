@@ -146,6 +146,43 @@ class TestSAPSuccessFactorLearnerDataExporter(unittest.TestCase):
         assert enterprise_enrollment.enterprise_customer_user.get_remote_id.call_count == 2
         assert learner_data_records_1.id == learner_data_records_2.id
 
+    @mock.patch('integrated_channels.lms_utils.get_enterprise_worker_user', Mock())
+    @mock.patch('integrated_channels.lms_utils.ThirdPartyAuthApiClient')
+    @mock.patch('integrated_channels.sap_success_factors.exporters.learner_data.get_course_id_for_enrollment')
+    @mock.patch('integrated_channels.sap_success_factors.exporters.learner_data.get_course_run_for_enrollment')
+    def test_remote_ids_resolved_in_bulk(
+            self,
+            mock_get_course_run_for_enrollment,
+            mock_get_course_id_for_enrollment,
+            mock_third_party_auth_client,
+    ):
+        """
+        The SAP user ids of all the exported learners are requested at once, before building their records.
+        """
+        mock_get_course_run_for_enrollment.return_value = MagicMock()
+        mock_get_course_id_for_enrollment.return_value = 'test:id'
+        self.enterprise_config.idp_id = 'sap-idp'
+        other_enterprise_customer_user = EnterpriseCustomerUserFactory(enterprise_customer=self.enterprise_customer)
+        other_enrollment = EnterpriseCourseEnrollmentFactory(enterprise_customer_user=other_enterprise_customer_user)
+        get_remote_ids = mock_third_party_auth_client.return_value.get_remote_ids
+        get_remote_ids.return_value = {self.enterprise_customer_user.username: 'sap-user'}
+        exporter = SapSuccessFactorsLearnerExporter(UserFactory(), self.enterprise_config)
+
+        exporter.prepare_enrollments_for_export([self.enterprise_course_enrollment, other_enrollment])
+        records = exporter.get_learner_data_records(self.enterprise_course_enrollment)
+        missing_records = exporter.get_learner_data_records(other_enrollment)
+
+        get_remote_ids.assert_called_once()
+        identity_provider, usernames, remote_id_field_name = get_remote_ids.call_args.args
+        assert identity_provider == 'sap-idp'
+        assert sorted(usernames) == sorted([
+            self.enterprise_customer_user.username,
+            other_enterprise_customer_user.username,
+        ])
+        assert remote_id_field_name is None
+        assert records[0].sapsf_user_id == 'sap-user'
+        assert missing_records is None
+
     def test_override_of_default_channel_settings(self):
         """
         If you override any settings to the ChannelSettingsMixin, add a test here for those
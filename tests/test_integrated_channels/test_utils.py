@@ -12,6 +12,8 @@ from unittest.mock import MagicMock, PropertyMock
 import ddt
 from pytest import raises
 
+from django.test import override_settings
+
 from enterprise.utils import parse_lms_api_datetime
 from integrated_channels import utils
 
@@ -382,3 +384,61 @@ class TestIntegratedChannelsUtils(unittest.TestCase):
             "Customer", 123, "/endpoint", data_list, 1.23, 200, "response", 'integrated_channel_name'
         )
         assert stringified_list == json.dumps(data_list)
+
+    def test_get_pooled_session_shared_per_host(self):
+        """
+        One pooled session is shared per scheme and host, and applies the configured defaults.
+        """
+        with override_settings(INTEGRATED_CHANNELS_HTTP_POOL_SIZE=4, INTEGRATED_CHANNELS_HTTP_TIMEOUT=(1, 2)):
+            session = utils.get_pooled_session('https://pooled-one.example.com/some/path')
+        assert session is utils.get_pooled_session('https://pooled-one.example.com/other')
+        assert session is not utils.get_pooled_session('https://pooled-two.example.com/')
+        assert session.timeout == (1, 2)
+        assert session.adapters['https://']._pool_maxsize == 4  # pylint: disable=protected-access
+
+        with mock.patch('requests.Session.request') as mock_request:
+            session.get('https://pooled-one.example.com/')
+            session.get('https://pooled-one.example.com/', timeout=5)
+        assert mock_request.call_args_list[0][1]['timeout'] == (1, 2)
+        assert mock_request.call_args_list[1][1]['timeout'] == 5
+
+    def test_pooled_session_connection_metrics(self):
+        """
+        Connection metrics report, per host, the requests sent and the connections they reused.
+        """
+        session = utils.PooledSession(pool_size=2, max_retries=0, backoff_factor=0, timeout=1)
+        assert not session.connection_metrics()
+
+        pool = session.adapters['https://'].poolmanager.connection_from_url('https://metrics.example.com/')
+        pool.num_requests = 5
+        pool.num_connections = 2
+        assert session.connection_metrics() == {
+            'https://metrics.example.com:443': {'requests': 5, 'connections': 2, 'reused': 3},
+        }
+
+    @mock.patch('integrated_channels.utils.time')
+    def test_token_bucket(self, mock_time):
+        """
+        A token bucket lets a burst of requests through, then waits for tokens to be refilled at its rate.
+        """
+        clock = [100.0]
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        mock_time.sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+
+        bucket = utils.TokenBucket(rate=2, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+        assert not mock_time.sleep.called
+        bucket.acquire()
+        mock_time.sleep.assert_called_once_with(0.5)
+
+        unlimited_bucket = utils.TokenBucket(rate=None)
+        for __ in range(5):
+            unlimited_bucket.acquire()
+        mock_time.sleep.assert_called_once()
+
+    @ddt.data(('5', 5.0), ('-1', 0), ('Wed, 21 Oct 2015 07:28:00 GMT', None), (None, None))
+    @ddt.unpack
+    def test_parse_retry_after(self, header, expected_seconds):
+        response = MagicMock(headers={'Retry-After': header} if header is not None else {})
+        assert utils.parse_retry_after(response) == expected_seconds
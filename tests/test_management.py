@@ -25,6 +25,7 @@ from django.contrib import auth
 from django.core.management import call_command
 from django.core.management.base import CommandError
 from django.db.models import signals
+from django.db.models.query import QuerySet
 from django.test.utils import override_settings
 from django.utils.dateparse import parse_datetime
 
@@ -59,7 +60,6 @@ from integrated_channels.integrated_channel.models import (
     IntegratedChannelAPIRequestLogs,
     OrphanedContentTransmissions,
 )
-from integrated_channels.sap_success_factors.client import SAPSuccessFactorsAPIClient
 from integrated_channels.sap_success_factors.exporters.learner_data import SapSuccessFactorsLearnerManger
 from integrated_channels.sap_success_factors.models import (
     SAPSuccessFactorsEnterpriseCustomerConfiguration,
@@ -1199,7 +1199,7 @@ class TestUnlinkSAPLearnersManagementCommand(unittest.TestCase, EnterpriseMockMi
     @freeze_time(NOW)
     @mock.patch('integrated_channels.sap_success_factors.client.SAPSuccessFactorsAPIClient.get_oauth_access_token')
     @mock.patch('integrated_channels.sap_success_factors.client.SAPSuccessFactorsAPIClient.update_content_metadata')
-    @mock.patch('integrated_channels.sap_success_factors.exporters.learner_data.get_user_from_social_auth')
+    @mock.patch('integrated_channels.sap_success_factors.exporters.learner_data.get_users_from_social_auth')
     @mock.patch('enterprise.utils.get_identity_provider')
     def test_unlink_inactive_sap_learners_task_success(
             self,
@@ -1207,7 +1207,7 @@ class TestUnlinkSAPLearnersManagementCommand(unittest.TestCase, EnterpriseMockMi
             inactive_sap_learners,
             unlinked_sap_learners,
             get_identity_provider_mock,
-            get_user_from_social_auth_mock,
+            get_users_from_social_auth_mock,
             sapsf_update_content_metadata_mock,
             sapsf_get_oauth_access_token_mock,
     ):
@@ -1225,12 +1225,11 @@ class TestUnlinkSAPLearnersManagementCommand(unittest.TestCase, EnterpriseMockMi
         enterprise_catalog_uuid = str(self.enterprise_customer.enterprise_customer_catalogs.first().uuid)
         self.mock_enterprise_customer_catalogs(enterprise_catalog_uuid)
 
-        def mock_get_user_social_auth(*args):
-            """DRY method to raise exception for invalid users."""
-            uname = args[1]
-            return User.objects.filter(username=uname).first()
+        def mock_get_users_social_auth(*args):
+            """DRY method to skip invalid users."""
+            return {user.username: user for user in User.objects.filter(username__in=args[1])}
 
-        get_user_from_social_auth_mock.side_effect = mock_get_user_social_auth
+        get_users_from_social_auth_mock.side_effect = mock_get_users_social_auth
         get_identity_provider_mock.return_value = mock.MagicMock(backend_name='tpa_saml', provider_id='saml-default')
 
         # Now mock SAPSF searchStudent call for learners with pagination
@@ -1259,18 +1258,13 @@ class TestUnlinkSAPLearnersManagementCommand(unittest.TestCase, EnterpriseMockMi
         with mock.patch.object(SAPSuccessFactorsEnterpriseCustomerConfiguration,
                                'unlink_inactive_learners',
                                wraps=self.sapsf.unlink_inactive_learners) as mock_unlink_inactive_learners:
-            get_inactive_learners_fx = SapSuccessFactorsLearnerManger(self.sapsf).client.get_inactive_sap_learners
-            spy = ReturnValueSpy(get_inactive_learners_fx)  # create a spy to store the return value when called
-            # Send in our spy to use instead:
-            with mock.patch.object(SAPSuccessFactorsAPIClient,
-                                   'get_inactive_sap_learners',
-                                   wraps=spy) as mock_get_inactive_learners:
-                call_command('unlink_inactive_sap_learners')
-                # Verify that management command uses the correct SAP config object
-                mock_unlink_inactive_learners.assert_any_call()
-                # Verify that when we DID try to unlink the inactive learners, inactive learners were found to unlink:
-                mock_get_inactive_learners.assert_any_call()
-                assert len(spy.return_values[0]) == len(inactive_sap_learners)
+            call_command('unlink_inactive_sap_learners')
+            # Verify that management command uses the correct SAP config object
+            mock_unlink_inactive_learners.assert_any_call()
+            # Verify that the inactive learners were resolved page by page, as the pages were fetched:
+            assert [
+                list(resolve_call.args[1]) for resolve_call in get_users_from_social_auth_mock.call_args_list
+            ] == [[inactive_learner] for inactive_learner in inactive_sap_learners]
 
         # Now verify that only inactive SAP learners have been unlinked
         for unlinked_sap_learner_username in unlinked_sap_learners:
@@ -1349,28 +1343,27 @@ class TestUnlinkSAPLearnersManagementCommand(unittest.TestCase, EnterpriseMockMi
             get_providers_fx = SapSuccessFactorsLearnerManger(self.sapsf)._get_identity_providers  # pylint: disable=protected-access
             provider_spy = ReturnValueSpy(get_providers_fx)  # create a spy to store the return value when called
 
-            get_inactive_learners_fx = SapSuccessFactorsLearnerManger(self.sapsf).client.get_inactive_sap_learners
-            spy = ReturnValueSpy(get_inactive_learners_fx)  # create a spy to store the return value when called
-            # Send in our spies to use instead:
-            with mock.patch.object(SAPSuccessFactorsAPIClient,
-                                   'get_inactive_sap_learners',
-                                   wraps=spy) as mock_get_inactive_learners:
-                with mock.patch.object(SapSuccessFactorsLearnerManger,
-                                       '_get_identity_providers',
-                                       wraps=provider_spy) as mock_get_providers:
+            # Send in our spy to use instead:
+            with mock.patch.object(SapSuccessFactorsLearnerManger,
+                                   '_get_identity_providers',
+                                   wraps=provider_spy) as mock_get_providers:
+                with mock.patch(
+                    'integrated_channels.sap_success_factors.exporters.learner_data.get_users_from_social_auth'
+                ) as mock_get_users_from_social_auth:
 
                     call_command('unlink_inactive_sap_learners')
                     # Verify that management command uses the correct SAP config object
                     mock_unlink_inactive_learners.assert_any_call()
-                    # Verify that when we DID try to unlink the inactive learners,
-                    #  1 inactive learner (with config name self.user.username)
-                    # was found to unlink
-                    mock_get_inactive_learners.assert_any_call()
-                    assert spy.return_values[0][0]['studentID'] == self.user.username
+                    # Verify that the inactive learner was fetched from SAP
+                    assert [
+                        call.request.url for call in responses.calls
+                        if call.request.url.startswith(self.sap_search_student_url)
+                    ] == [self.search_student_paginated_url]
 
                     # Verify that we checked and then detected that an Enterprise has no associated identity provider:
                     mock_get_providers.assert_any_call()
                     assert provider_spy.return_values[0] is None
+                    mock_get_users_from_social_auth.assert_not_called()
 
     @responses.activate
     @freeze_time(NOW)
@@ -1761,6 +1754,88 @@ class TestBackfillLearnerRoleAssignmentsCommand(unittest.TestCase):
         for ecu in EnterpriseCustomerUser.objects.all():
             assert SystemWideEnterpriseUserRoleAssignment.objects.filter(user=ecu.user).exists()
 
+    def test_user_role_assignments_created_set_based(self):
+        """
+        Verify that the set-based mode creates the missing User Role Assignments, resuming after ``--start-pk``.
+        """
+        linked_ecus = list(EnterpriseCustomerUser.objects.order_by('pk'))
+        checkpoint_pk = linked_ecus[39].pk
+
+        def has_learner_role(ecu):
+            return SystemWideEnterpriseUserRoleAssignment.objects.filter(
+                user_id=ecu.user_id,
+                role=roles_api.learner_role(),
+                enterprise_customer=ecu.enterprise_customer,
+            ).exists()
+
+        assigned_before_checkpoint = [has_learner_role(ecu) for ecu in linked_ecus[:40]]
+
+        call_command(
+            'backfill_learner_role_assignments',
+            '--set-based',
+            '--start-pk',
+            str(checkpoint_pk),
+            '--batch-sleep',
+            '0',
+            '--batch-limit',
+            '10',
+        )
+
+        assert [has_learner_role(ecu) for ecu in linked_ecus[:40]] == assigned_before_checkpoint
+        assert all(has_learner_role(ecu) for ecu in linked_ecus[40:])
+
+        call_command(
+            'backfill_learner_role_assignments',
+            '--set-based',
+            '--batch-sleep',
+            '0',
+            '--batch-limit',
+            '10',
+        )
+
+        assert SystemWideEnterpriseUserRoleAssignment.objects.filter(
+            enterprise_customer=self.alpha_customer
+        ).count() == 30
+        assert SystemWideEnterpriseUserRoleAssignment.objects.filter(
+            enterprise_customer=self.beta_customer
+        ).count() == 50
+
+    def test_user_role_assignments_set_based_counts_created_rows(self):
+        """
+        Verify that the set-based mode only counts the User Role Assignments it created, not the conflicting ones.
+        """
+        missing_count = 90 - 10 - SystemWideEnterpriseUserRoleAssignment.objects.count()
+        raced_ecu = EnterpriseCustomerUser.objects.exclude(
+            user_id__in=SystemWideEnterpriseUserRoleAssignment.objects.values('user_id'),
+        ).order_by('pk').first()
+        count = QuerySet.count
+        raced = []
+
+        def racing_count(queryset):
+            # another process assigns one of the missing roles after the batch was looked up
+            if queryset.model is SystemWideEnterpriseUserRoleAssignment and not raced:
+                raced.append(SystemWideEnterpriseUserRoleAssignment.objects.create(
+                    user_id=raced_ecu.user_id,
+                    role=roles_api.learner_role(),
+                    enterprise_customer=raced_ecu.enterprise_customer,
+                ))
+            return count(queryset)
+
+        with mock.patch.object(QuerySet, 'count', racing_count):
+            with LogCapture(level=logging.INFO) as log_capture:
+                call_command(
+                    'backfill_learner_role_assignments',
+                    '--set-based',
+                    '--batch-sleep',
+                    '0',
+                    '--batch-limit',
+                    '100',
+                )
+
+        assert SystemWideEnterpriseUserRoleAssignment.objects.count() == 80
+        assert raced
+        assert 'Assigned {} learner roles in'.format(missing_count - 1) in str(log_capture)
+
     def cleanup_test_objects(self):
         """
         Helper to delete all instances of role assignments, ECUs, Enterprise customers, and Users.
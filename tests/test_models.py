@@ -27,10 +27,12 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.files import File
 from django.core.files.storage import Storage
+from django.db import connection
 from django.db.utils import IntegrityError
 from django.http import QueryDict
 from django.test import override_settings
 from django.test.testcases import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from consent.errors import InvalidProxyConsent
@@ -42,6 +44,7 @@ from enterprise.constants import (
     ENTERPRISE_ADMIN_ROLE,
     ENTERPRISE_LEARNER_ROLE,
     ENTERPRISE_OPERATOR_ROLE,
+    EnterpriseCustomerUserLinkOutcomes,
 )
 from enterprise.errors import LinkUserToEnterpriseError
 from enterprise.models import (
@@ -759,6 +762,132 @@ class TestEnterpriseCustomerUserManager(unittest.TestCase):
         )
         assert learner_with_ent1.active is False
 
+    def test_get_links_by_emails(self):
+        enterprise_customer = factories.EnterpriseCustomerFactory()
+        linked_user = factories.UserFactory(email="linked@example.com")
+        existing_link = factories.EnterpriseCustomerUserFactory(
+            user_id=linked_user.id,
+            enterprise_customer=enterprise_customer,
+        )
+        existing_pending_link = factories.PendingEnterpriseCustomerUserFactory(
+            user_email="pending@example.com",
+            enterprise_customer=enterprise_customer,
+        )
+        factories.UserFactory(email="unlinked@example.com")
+
+        links = EnterpriseCustomerUser.objects.get_links_by_emails(
+            ["linked@example.com", "pending@example.com", "unlinked@example.com", "unknown@example.com"],
+            enterprise_customer,
+        )
+
+        assert links == {"linked@example.com": existing_link, "pending@example.com": existing_pending_link}
+
+    def test_link_users(self):
+        """
+        Emails of existing users are linked, relinked or left linked, and other emails get pending links.
+        """
+        enterprise_customer = factories.EnterpriseCustomerFactory()
+        other_enterprise_customer = factories.EnterpriseCustomerFactory()
+        new_user = factories.UserFactory(email="new@example.com")
+        linked_user = factories.UserFactory(email="linked@example.com")
+        unlinked_user = factories.UserFactory(email="unlinked@example.com")
+        not_relinkable_user = factories.UserFactory(email="not_relinkable@example.com")
+        factories.EnterpriseCustomerUserFactory(enterprise_customer=enterprise_customer, user_id=linked_user.id)
+        factories.EnterpriseCustomerUserFactory(
+            enterprise_customer=enterprise_customer, user_id=unlinked_user.id, active=False, linked=False,
+        )
+        factories.EnterpriseCustomerUserFactory(
+            enterprise_customer=enterprise_customer,
+            user_id=not_relinkable_user.id,
+            active=False,
+            linked=False,
+            is_relinkable=False,
+        )
+        factories.EnterpriseCustomerUserFactory(enterprise_customer=other_enterprise_customer, user_id=new_user.id)
+        factories.PendingEnterpriseCustomerUserFactory(
+            enterprise_customer=enterprise_customer, user_email="already_pending@example.com",
+        )
+
+        outcomes = EnterpriseCustomerUser.all_objects.link_users(enterprise_customer, [
+            "new@example.com",
+            "linked@example.com",
+            "unlinked@example.com",
+            "not_relinkable@example.com",
+            "pending@example.com",
+            "already_pending@example.com",
+        ])
+
+        assert outcomes == {
+            "new@example.com": EnterpriseCustomerUserLinkOutcomes.LINKED,
+            "linked@example.com": EnterpriseCustomerUserLinkOutcomes.ALREADY_LINKED,
+            "unlinked@example.com": EnterpriseCustomerUserLinkOutcomes.LINKED,
+            "not_relinkable@example.com": EnterpriseCustomerUserLinkOutcomes.NOT_RELINKABLE,
+            "pending@example.com": EnterpriseCustomerUserLinkOutcomes.PENDING,
+            "already_pending@example.com": EnterpriseCustomerUserLinkOutcomes.PENDING,
+        }
+        linked_user_ids = {new_user.id, linked_user.id, unlinked_user.id}
+        assert set(EnterpriseCustomerUser.objects.filter(
+            enterprise_customer=enterprise_customer, active=True,
+        ).values_list('user_id', flat=True)) == linked_user_ids
+        assert not EnterpriseCustomerUser.all_objects.get(
+            enterprise_customer=enterprise_customer, user_id=not_relinkable_user.id,
+        ).linked
+        assert EnterpriseCustomerUser.objects.get(
+            enterprise_customer=other_enterprise_customer, user_id=new_user.id,
+        ).active is False
+        assert set(PendingEnterpriseCustomerUser.objects.filter(
+            enterprise_customer=enterprise_customer,
+        ).values_list('user_email', flat=True)) == {"pending@example.com", "already_pending@example.com"}
+        assert linked_user_ids <= set(SystemWideEnterpriseUserRoleAssignment.objects.filter(
+            enterprise_customer=enterprise_customer, role=roles_api.learner_role(),
+        ).values_list('user_id', flat=True))
+        assert EnterpriseCustomerUser.history.filter(user_id=new_user.id, history_type='+').exists()
+
+    @ddt.data(True, False)
+    def test_unlink_users(self, is_relinkable):
+        """
+        Linked and pending emails are unlinked, and other emails are reported as not found.
+        """
+        enterprise_customer = factories.EnterpriseCustomerFactory()
+        other_enterprise_customer = factories.EnterpriseCustomerFactory()
+        linked_user = factories.UserFactory(email="linked@example.com")
+        unlinked_user = factories.UserFactory(email="unlinked@example.com")
+        factories.EnterpriseCustomerUserFactory(enterprise_customer=enterprise_customer, user_id=linked_user.id)
+        factories.EnterpriseCustomerUserFactory(enterprise_customer=other_enterprise_customer, user_id=linked_user.id)
+        factories.EnterpriseCustomerUserFactory(
+            enterprise_customer=enterprise_customer, user_id=unlinked_user.id, active=False, linked=False,
+        )
+        factories.PendingEnterpriseCustomerUserFactory(
+            enterprise_customer=enterprise_customer, user_email="pending@example.com",
+        )
+
+        outcomes = EnterpriseCustomerUser.objects.unlink_users(enterprise_customer, [
+            "linked@example.com",
+            "unlinked@example.com",
+            "pending@example.com",
+            "unknown@example.com",
+        ], is_relinkable)
+
+        assert outcomes == {
+            "linked@example.com": EnterpriseCustomerUserLinkOutcomes.UNLINKED,
+            "unlinked@example.com": EnterpriseCustomerUserLinkOutcomes.NOT_FOUND,
+            "pending@example.com": EnterpriseCustomerUserLinkOutcomes.UNLINKED,
+            "unknown@example.com": EnterpriseCustomerUserLinkOutcomes.NOT_FOUND,
+        }
+        unlinked_link = EnterpriseCustomerUser.all_objects.get(
+            enterprise_customer=enterprise_customer, user_id=linked_user.id,
+        )
+        assert unlinked_link.linked is False
+        assert unlinked_link.active is False
+        assert unlinked_link.is_relinkable == is_relinkable
+        assert EnterpriseCustomerUser.objects.filter(
+            enterprise_customer=other_enterprise_customer, user_id=linked_user.id,
+        ).exists()
+        assert not PendingEnterpriseCustomerUser.objects.filter(enterprise_customer=enterprise_customer).exists()
+        assert not SystemWideEnterpriseUserRoleAssignment.objects.filter(
+            enterprise_customer=enterprise_customer, role=roles_api.learner_role(), user=linked_user,
+        ).exists()
+
 
 @mark.django_db
 @ddt.ddt
@@ -2941,6 +3070,92 @@ class TestEnterpriseGroupMembership(unittest.TestCase):
         assert EnterpriseGroupMembership.all_objects.count() == 1
         assert EnterpriseGroupMembership.available_objects.count() == 0
 
+    def test_sortable_fields_set_on_save(self):
+        """
+        Test the denormalized sortable columns follow the membership user and most recent action on save.
+        """
+        pending_user = factories.PendingEnterpriseCustomerUserFactory(user_email='pending@example.com')
+        membership = factories.EnterpriseGroupMembershipFactory(
+            enterprise_customer_user=None,
+            pending_enterprise_customer_user=pending_user,
+        )
+        assert membership.sortable_member_email == 'pending@example.com'
+        assert membership.sortable_recent_action == membership.created
+
+        enterprise_customer_user = factories.EnterpriseCustomerUserFactory()
+        membership.enterprise_customer_user = enterprise_customer_user
+        membership.activated_at = membership.created + timedelta(days=1)
+        membership.save()
+        membership.refresh_from_db()
+        assert membership.sortable_member_email == enterprise_customer_user.user_email
+        assert membership.sortable_recent_action == membership.activated_at
+
+    def test_refresh_sortable_fields(self):
+        """
+        Test ``refresh_sortable_fields`` recomputes the denormalized columns after queryset updates.
+        """
+        membership = factories.EnterpriseGroupMembershipFactory(pending_enterprise_customer_user=None)
+        errored_at = membership.created + timedelta(days=2)
+        memberships = EnterpriseGroupMembership.all_objects.filter(uuid=membership.uuid)
+        memberships.update(errored_at=errored_at, sortable_member_email=None)
+
+        assert EnterpriseGroupMembership.refresh_sortable_fields(memberships) == 1
+        membership.refresh_from_db()
+        assert membership.sortable_member_email == membership.enterprise_customer_user.user_email
+        assert membership.sortable_recent_action == errored_at
+
+    def test_refresh_sortable_fields_updates_without_self_subquery(self):
+        """
+        Test ``refresh_sortable_fields`` fetches the membership keys before updating them in batches, as MySQL
+        rejects an update filtered by a subquery on the updated table.
+        """
+        group = factories.EnterpriseGroupFactory()
+        for _ in range(3):
+            factories.EnterpriseGroupMembershipFactory(group=group, enterprise_customer_user=None)
+        memberships = EnterpriseGroupMembership.all_objects.filter(group=group)
+        memberships.update(sortable_member_email=None)
+
+        with mock.patch.object(EnterpriseGroupMembership, 'SORTABLE_FIELDS_REFRESH_BATCH_SIZE', 2):
+            with CaptureQueriesContext(connection) as queries:
+                assert EnterpriseGroupMembership.refresh_sortable_fields(memberships) == 3
+
+        membership_table = EnterpriseGroupMembership._meta.db_table
+        update_queries = [query['sql'] for query in queries if query['sql'].startswith('UPDATE')]
+        assert len(update_queries) == 2
+        for update_query in update_queries:
+            assert f'FROM "{membership_table}"' not in update_query
+        assert not memberships.filter(sortable_member_email=None).exists()
+
+    def test_get_all_learners_search_and_sort(self):
+        """
+        Test group members are searched and sorted in the database on the denormalized columns.
+        """
+        group = factories.EnterpriseGroupFactory()
+        memberships = [
+            factories.EnterpriseGroupMembershipFactory(
+                group=group,
+                enterprise_customer_user=None,
+                pending_enterprise_customer_user=factories.PendingEnterpriseCustomerUserFactory(
+                    enterprise_customer=group.enterprise_customer,
+                    user_email=email,
+                ),
+            )
+            for email in ('carol@example.com', 'alice@example.com', 'bob@test.com')
+        ]
+
+        members = group.get_all_learners(sort_by='member_details')
+        assert [member.sortable_member_email for member in members] == [
+            'alice@example.com', 'bob@test.com', 'carol@example.com',
+        ]
+        recent_actions = [
+            member.sortable_recent_action
+            for member in group.get_all_learners(sort_by='recent_action', desc_order=True)
+        ]
+        assert len(recent_actions) == len(memberships)
+        assert recent_actions == sorted(recent_actions, reverse=True)
+        members = group.get_all_learners(user_query='example', sort_by='member_details')
+        assert [member.sortable_member_email for member in members] == ['alice@example.com', 'carol@example.com']
+
 
 @mark.django_db
 @ddt.ddt
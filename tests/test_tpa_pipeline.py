@@ -17,6 +17,10 @@ from enterprise.models import EnterpriseCustomerUser
 from enterprise.tpa_pipeline import (
     enterprise_associate_by_email,
     get_enterprise_customer_for_running_pipeline,
+    get_identity_provider_descriptors,
+    get_user_from_social_auth,
+    get_user_social_auth,
+    get_users_from_social_auth,
     handle_enterprise_logistration,
 )
 from test_utils.factories import (
@@ -290,6 +294,97 @@ class TestTpaPipeline(unittest.TestCase):
             fake_registry.get_from_pipeline.return_value = provider
             assert get_enterprise_customer_for_running_pipeline(self.request, 'pipeline') is None
 
+    @mock.patch('enterprise.tpa_pipeline.UserSocialAuth')
+    @mock.patch('enterprise.tpa_pipeline.get_identity_provider')
+    def test_get_users_from_social_auth(self, mock_get_identity_provider, mock_user_social_auth):
+        """
+        Test that many remote ids are resolved with a single query, preferring the default IDP's social auth.
+        """
+        EnterpriseCustomerIdentityProviderFactory(
+            provider_id='saml-default', enterprise_customer=self.customer, default_provider=True,
+        )
+        mock_get_identity_provider.side_effect = lambda provider_id: mock.MagicMock(
+            backend_name='tpa-saml', provider_id=provider_id,
+        )
+        default_user, other_user, only_user = UserFactory(), UserFactory(), UserFactory()
+        mock_filter = mock_user_social_auth.objects.select_related.return_value.filter
+        mock_filter.return_value = [
+            mock.MagicMock(provider='tpa-saml', uid='der_slug:shared', user=other_user),
+            mock.MagicMock(provider='tpa-saml', uid='default:shared', user=default_user),
+            mock.MagicMock(provider='tpa-saml', uid='der_slug:only', user=only_user),
+            mock.MagicMock(provider='other-backend', uid='default:unknown', user=other_user),
+        ]
+
+        users = get_users_from_social_auth(
+            self.customer.identity_providers, ['shared', 'only', 'missing'], self.customer,
+        )
+
+        assert users == {'shared': default_user, 'only': only_user}
+        mock_filter.assert_called_once_with(
+            provider__in={'tpa-saml'},
+            uid__in={
+                f'{slug}:{remote_id}'
+                for slug in ('der_slug', 'default') for remote_id in ('shared', 'only', 'missing')
+            },
+        )
+
+    @mock.patch('enterprise.tpa_pipeline.get_identity_provider')
+    def test_get_identity_provider_descriptors(self, mock_get_identity_provider):
+        """
+        Test that identity provider descriptors are cached per enterprise customer until one of its IDPs changes.
+        """
+        mock_get_identity_provider.side_effect = lambda provider_id: mock.MagicMock(
+            backend_name='tpa-saml', provider_id=provider_id,
+        )
+
+        descriptors = get_identity_provider_descriptors(self.customer)
+        assert get_identity_provider_descriptors(self.customer) == descriptors
+        assert descriptors == {'provider_slug': ('tpa-saml', 'der_slug', False)}
+        assert mock_get_identity_provider.call_count == 1
+
+        EnterpriseCustomerIdentityProviderFactory(
+            provider_id='saml-default', enterprise_customer=self.customer, default_provider=True,
+        )
+        assert get_identity_provider_descriptors(self.customer) == {
+            'provider_slug': ('tpa-saml', 'der_slug', False),
+            'saml-default': ('tpa-saml', 'default', True),
+        }
+        assert mock_get_identity_provider.call_count == 3
+
+    @mock.patch('enterprise.tpa_pipeline.UserSocialAuth')
+    @mock.patch('enterprise.tpa_pipeline.get_identity_provider')
+    def test_get_user_from_social_auth(self, mock_get_identity_provider, mock_user_social_auth):
+        """
+        Test that a single remote id is resolved with a single query.
+        """
+        mock_get_identity_provider.side_effect = lambda provider_id: mock.MagicMock(
+            backend_name='tpa-saml', provider_id=provider_id,
+        )
+        mock_filter = mock_user_social_auth.objects.select_related.return_value.filter
+        mock_filter.return_value = [mock.MagicMock(provider='tpa-saml', uid='der_slug:1234', user=self.user)]
+
+        assert get_user_from_social_auth(self.customer.identity_providers, 1234, self.customer) == self.user
+        mock_filter.assert_called_once_with(provider__in={'tpa-saml'}, uid__in={'der_slug:1234'})
+
+    @mock.patch('enterprise.tpa_pipeline.UserSocialAuth')
+    @mock.patch('enterprise.tpa_pipeline.get_identity_provider')
+    def test_get_user_social_auth(self, mock_get_identity_provider, mock_user_social_auth):
+        """
+        Test that the social auth entry of the default IDP is preferred.
+        """
+        EnterpriseCustomerIdentityProviderFactory(
+            provider_id='saml-default', enterprise_customer=self.customer, default_provider=True,
+        )
+        mock_get_identity_provider.side_effect = lambda provider_id: mock.MagicMock(
+            backend_name='tpa-saml', provider_id=provider_id,
+        )
+        other_social_auth = mock.MagicMock(provider='tpa-saml', uid='der_slug:1234')
+        default_social_auth = mock.MagicMock(provider='tpa-saml', uid='default:1234')
+        mock_user_social_auth.objects.filter.return_value = [other_social_auth, default_social_auth]
+
+        assert get_user_social_auth(self.user, self.customer) == default_social_auth
+        mock_user_social_auth.objects.filter.assert_called_once_with(provider__in={'tpa-saml'}, user=self.user)
+
     def test_enterprise_logistration_validates_sso_orchestration_config(self):
         """
         Test that an enterprise logistration flow validates the customer's sso integration config.
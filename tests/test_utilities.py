@@ -14,15 +14,19 @@ from pytest import mark, raises
 
 from django.core import mail
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.forms.models import model_to_dict
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from enterprise import utils, validators
 from enterprise.models import (
+    EnterpriseCourseEnrollment,
     EnterpriseCustomer,
     EnterpriseCustomerBrandingConfiguration,
     EnterpriseCustomerIdentityProvider,
     EnterpriseCustomerUser,
+    EnterpriseEnrollmentSource,
     PendingEnterpriseCustomerUser,
 )
 from enterprise.utils import (
@@ -2019,3 +2023,64 @@ class TestValidateEmailToLink(unittest.TestCase):
                 validators.validate_pgp_key(key)
         else:
             validators.validate_pgp_key(key)
+
+
+@mark.django_db
+class TestEnrollUsersInCourse(unittest.TestCase):
+    """
+    Tests for :method:`enroll_users_in_course`.
+    """
+
+    def setUp(self):
+        """
+        Set up test environment.
+        """
+        super().setUp()
+        self.enterprise_customer = EnterpriseCustomerFactory()
+        self.users = [UserFactory() for __ in range(3)]
+        for user in self.users:
+            EnterpriseCustomerUserFactory(enterprise_customer=self.enterprise_customer, user_id=user.id)
+
+    @mock.patch('enterprise.utils.track_enrollment')
+    @mock.patch('enterprise.api_client.lms.EnrollmentApiClient')
+    def test_enroll_users_in_course_shares_lookups(self, mock_enrollment_client, mock_track_enrollment):
+        """
+        Test that the enrollment client, the enterprise customer users and the enrollment source are looked up once.
+        """
+        course_id = 'course-v1:edX+DemoX+Demo_Course'
+        unregistered_email = FAKER.email()  # pylint: disable=no-member
+
+        with CaptureQueriesContext(connection) as queries:
+            successes, pending, failures = utils.enroll_users_in_course(
+                enterprise_customer=self.enterprise_customer,
+                course_id=course_id,
+                course_mode='audit',
+                emails=[user.email for user in self.users] + [unregistered_email],
+            )
+
+        assert sorted(user.id for user in successes) == sorted(user.id for user in self.users)
+        assert [pending_user.user_email for pending_user in pending] == [unregistered_email]
+        assert not failures
+        mock_enrollment_client.assert_called_once_with()
+        assert mock_enrollment_client.return_value.enroll_user_in_course.call_count == len(self.users)
+        assert mock_track_enrollment.call_count == len(self.users)
+
+        customer_user_table = EnterpriseCustomerUser._meta.db_table
+        enrollment_source_table = EnterpriseEnrollmentSource._meta.db_table
+        customer_user_lookups = [
+            query for query in queries.captured_queries
+            if query['sql'].startswith('SELECT') and 'FROM "{}"'.format(customer_user_table) in query['sql']
+        ]
+        enrollment_source_lookups = [
+            query for query in queries.captured_queries
+            if query['sql'].startswith('SELECT') and 'FROM "{}"'.format(enrollment_source_table) in query['sql']
+        ]
+        assert len(customer_user_lookups) == 1
+        assert len(enrollment_source_lookups) == 2  # one for the enrollments, one for the pending enrollment
+
+        manual_source = EnterpriseEnrollmentSource.get_source(EnterpriseEnrollmentSource.MANUAL)
+        assert EnterpriseCourseEnrollment.objects.filter(
+            enterprise_customer_user__enterprise_customer=self.enterprise_customer,
+            course_id=course_id,
+            source=manual_source,
+        ).count() == len(self.users)